@@ -1,9 +1,18 @@
 """
-Core Module - TokenProviderProtocol 정의
+Core Module - 모듈 간 공유 정의
 
-mcp_outlook이 session.AuthManager를 직접 의존하지 않도록 추상화.
+- TokenProviderProtocol: mcp_outlook이 session.AuthManager를 직접 의존하지 않도록 추상화
+- file_sniffer: 매직 바이트 기반 파일 형식 판별 (mcp_file_handler, mcp_outlook 공용)
+- metrics: 도구 / Graph 엔드포인트별 히스토그램 (Prometheus text, /health/metrics)
+- tracing: 요청 ID + span 트리 (JSONL / OTLP 내보내기, `python -m core.tracing summary`)
+- structured_log: 핫 패스 구조화 로깅 (큐 핸들러, 샘플링 / rate limit, 작업별 요약 이벤트)
+- stream_workers: Streamable HTTP 서버 멀티 워커 실행 (aiohttp 의존, 필요한 곳에서 직접 import)
+- bench: 프로필별 부하 테스트 하네스 (로컬 Graph 스텁, stdio / REST / stream 드라이버, 기준선 비교)
+- tool_manifest: 도구 정의 YAML → JSON 매니페스트 (생성된 서버와 생성기 공용)
+- lazy_service: 생성된 서버의 서비스 모듈 import / 생성을 첫 사용까지 지연
 """
 
 from .protocols import TokenProviderProtocol
+from .file_sniffer import sniff_bytes, sniff_file, sniff_stream
 
-__all__ = ['TokenProviderProtocol']
+__all__ = ['TokenProviderProtocol', 'sniff_bytes', 'sniff_file', 'sniff_stream']
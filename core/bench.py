@@ -0,0 +1,1138 @@
+"""
+Bench - 생성된 MCP 서버 부하 테스트 / 벤치마크 하네스 (로컬 Graph 스텁)
+
+create_mcp_project.py / scaffold_generator.py 가 프로필마다 만드는
+mcp_<profile>/benchmarks/bench_<profile>.py 가 이 모듈의 main() 을 호출한다.
+
+- GraphStub: 별도 스레드의 aiohttp 서버로 띄우는 Graph 대역
+  지연 / 지터, 429 + Retry-After 주입, 메일함 / 일정 / 드라이브 / OneNote / To Do / Teams 합성 데이터,
+  $top / $skip 페이지와 nextLink, $batch
+- 서버 프로세스의 aiohttp 요청 중 https://graph.microsoft.com 으로 가는 것만 스텁으로 우회
+  (작업 디렉터리의 sitecustomize.py → redirect_graph, 멀티 워커 자식 프로세스에도 적용)
+- 토큰: 작업 디렉터리 auth.db 에 만료되지 않은 벤치 사용자 토큰을 넣고 cwd / DB_PATH 로 지정
+- 드라이버: stdio (JSON-RPC 줄 단위, 요청 파이프라이닝), REST (POST /mcp/v1), stream (MCP SDK 세션)
+- 결과: 처리량, 지연 p50/p95/p99, 서버 peak RSS (프로세스 트리 VmHWM), 호출당 Graph 요청 수
+- 기준선(baseline JSON) 저장 / 비교 → 임계값을 넘는 회귀가 있으면 종료 코드 1
+
+사용법 (생성된 하네스):
+    python mcp_outlook/benchmarks/bench_outlook.py                        # 전체 프로토콜, 기준선 비교
+    python mcp_outlook/benchmarks/bench_outlook.py --protocols rest --concurrency 16 --requests 400
+    python mcp_outlook/benchmarks/bench_outlook.py --latency-ms 50 --throttle 0.05 --save-baseline
+
+스텁만 띄우기 (실제 서버를 수동으로 붙여 볼 때):
+    python -m core.bench stub --port 8765 --latency-ms 20
+"""
+
+import argparse
+import asyncio
+import base64
+import contextlib
+import json
+import logging
+import os
+import random
+import re
+import shutil
+import socket
+import sys
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import Counter, deque
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode
+
+GRAPH_ORIGIN = "https://graph.microsoft.com"
+BENCH_USER = "bench@example.com"
+PROTOCOLS = ("stdio", "rest", "stream")
+
+# 기본 부하 대상에서 제외하는 도구 이름 (쓰기 / 로컬 저장 / 테스트용)
+WRITE_TOOL_PATTERN = re.compile(
+    r"(send|delete|remove|create|update|move|upload|reply|forward|write|patch|download|save|^test)", re.I
+)
+
+_SITECUSTOMIZE = '''# core.bench 가 만든 파일: Graph 요청을 로컬 스텁으로 우회
+import os
+
+if os.environ.get("MCP_BENCH_GRAPH_URL"):
+    from core.bench import redirect_graph
+
+    redirect_graph(os.environ["MCP_BENCH_GRAPH_URL"])
+'''
+
+
+# ============================================================
+# Graph 우회 (서버 프로세스 안에서 실행)
+# ============================================================
+
+def redirect_graph(base_url: str) -> None:
+    """aiohttp.ClientSession 요청 중 Graph 로 가는 URL 의 origin 을 base_url 로 교체"""
+    import aiohttp
+
+    original = aiohttp.ClientSession._request
+    if getattr(original, "_bench_redirect", False):
+        return
+    base_url = base_url.rstrip("/")
+
+    async def _request(self, method, str_or_url, *args, **kwargs):
+        url = str(str_or_url)
+        if url.startswith(GRAPH_ORIGIN):
+            str_or_url = base_url + url[len(GRAPH_ORIGIN):]
+        return await original(self, method, str_or_url, *args, **kwargs)
+
+    _request._bench_redirect = True
+    _request._bench_original = original
+    aiohttp.ClientSession._request = _request
+
+
+def restore_graph() -> None:
+    """redirect_graph 해제 (같은 프로세스에서 스텁을 쓴 테스트 정리용)"""
+    import aiohttp
+
+    original = getattr(aiohttp.ClientSession._request, "_bench_original", None)
+    if original is not None:
+        aiohttp.ClientSession._request = original
+
+
+# ============================================================
+# 합성 데이터
+# ============================================================
+
+_EPOCH = datetime(2024, 6, 3, 9, 0, tzinfo=timezone.utc)
+
+
+def _ts(index: int, hours: int = 1) -> str:
+    return (_EPOCH - timedelta(hours=index * hours)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _message(index: int, user: str) -> Dict[str, Any]:
+    sender = f"sender{index % 23}@example.com"
+    return {
+        "id": f"msg-{index:05d}",
+        "conversationId": f"conv-{index // 3:05d}",
+        "subject": f"[Project {index % 17}] weekly report {index}",
+        "from": {"emailAddress": {"name": f"Sender {index % 23}", "address": sender}},
+        "sender": {"emailAddress": {"name": f"Sender {index % 23}", "address": sender}},
+        "toRecipients": [{"emailAddress": {"name": "Bench User", "address": user}}],
+        "ccRecipients": [],
+        "receivedDateTime": _ts(index),
+        "sentDateTime": _ts(index),
+        "hasAttachments": index % 3 == 0,
+        "isRead": index % 4 != 0,
+        "importance": "high" if index % 11 == 0 else "normal",
+        "parentFolderId": "inbox",
+        "bodyPreview": "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 2,
+        "body": {"contentType": "html", "content": "<p>" + "Lorem ipsum dolor sit amet. " * 20 + "</p>"},
+        "webLink": f"https://outlook.office.com/mail/msg-{index:05d}",
+    }
+
+
+def _attachment(index: int, parent: str) -> Dict[str, Any]:
+    content = f"attachment {index} of {parent}\n".encode() * 64
+    return {
+        "@odata.type": "#microsoft.graph.fileAttachment",
+        "id": f"att-{index:03d}",
+        "name": f"report-{index}.txt",
+        "contentType": "text/plain",
+        "size": len(content),
+        "isInline": False,
+        "lastModifiedDateTime": _ts(index),
+        "contentBytes": base64.b64encode(content).decode(),
+    }
+
+
+def _event(index: int, user: str) -> Dict[str, Any]:
+    start = _EPOCH + timedelta(hours=index * 5)
+    return {
+        "id": f"evt-{index:05d}",
+        "subject": f"Meeting {index % 13}: sprint sync {index}",
+        "start": {"dateTime": start.strftime("%Y-%m-%dT%H:%M:%S.0000000"), "timeZone": "UTC"},
+        "end": {"dateTime": (start + timedelta(minutes=30)).strftime("%Y-%m-%dT%H:%M:%S.0000000"), "timeZone": "UTC"},
+        "location": {"displayName": f"Room {index % 7}"},
+        "organizer": {"emailAddress": {"name": "Bench User", "address": user}},
+        "attendees": [{"type": "required", "emailAddress": {"address": f"attendee{index % 5}@example.com"},
+                       "status": {"response": "accepted"}}],
+        "isAllDay": False,
+        "isCancelled": False,
+        "showAs": "busy",
+        "bodyPreview": "Agenda: status, blockers, next steps",
+        "webLink": f"https://outlook.office.com/calendar/evt-{index:05d}",
+    }
+
+
+def _drive_item(index: int, parent: str) -> Dict[str, Any]:
+    item = {
+        "id": f"item-{index:05d}",
+        "name": f"document-{index}.txt" if index % 5 else f"folder-{index}",
+        "size": 1024 * (index % 50 + 1),
+        "createdDateTime": _ts(index, 24),
+        "lastModifiedDateTime": _ts(index),
+        "webUrl": f"https://contoso-my.sharepoint.com/item-{index:05d}",
+        "eTag": f"etag-{index}",
+        "parentReference": {"driveId": "drive-00000", "id": parent, "path": "/drive/root:"},
+    }
+    if index % 5:
+        item["file"] = {"mimeType": "text/plain"}
+        item["@microsoft.graph.downloadUrl"] = f"{GRAPH_ORIGIN}/v1.0/drive/items/item-{index:05d}/content"
+    else:
+        item["folder"] = {"childCount": 10}
+    return item
+
+
+def _named(prefix: str, label: str) -> Callable[[int, str], Dict[str, Any]]:
+    def factory(index: int, _parent: str) -> Dict[str, Any]:
+        return {
+            "id": f"{prefix}-{index:05d}",
+            "displayName": f"{label} {index}",
+            "createdDateTime": _ts(index, 24),
+            "lastModifiedDateTime": _ts(index),
+        }
+    return factory
+
+
+def _page(index: int, _parent: str) -> Dict[str, Any]:
+    return {
+        "id": f"page-{index:05d}",
+        "title": f"Notes {index}",
+        "createdDateTime": _ts(index, 24),
+        "lastModifiedDateTime": _ts(index),
+        "contentUrl": f"{GRAPH_ORIGIN}/v1.0/me/onenote/pages/page-{index:05d}/content",
+        "parentSection": {"id": "section-00000", "displayName": "Section 0"},
+    }
+
+
+def _task(index: int, _parent: str) -> Dict[str, Any]:
+    return {
+        "id": f"task-{index:05d}",
+        "title": f"Follow up {index}",
+        "status": "completed" if index % 4 == 0 else "notStarted",
+        "importance": "normal",
+        "createdDateTime": _ts(index, 24),
+        "dueDateTime": {"dateTime": _ts(-index, 24), "timeZone": "UTC"},
+    }
+
+
+def _chat_message(index: int, _parent: str) -> Dict[str, Any]:
+    return {
+        "id": f"chatmsg-{index:05d}",
+        "createdDateTime": _ts(index),
+        "from": {"user": {"id": f"user-{index % 9}", "displayName": f"Member {index % 9}"}},
+        "body": {"contentType": "html", "content": f"<p>update {index}</p>"},
+    }
+
+
+# 컬렉션 세그먼트 → 항목 생성기 (messages 는 상위 경로에 chats/channels 가 있으면 채팅 메시지)
+COLLECTIONS: Dict[str, Callable[[int, str], Dict[str, Any]]] = {
+    "messages": lambda index, user: _message(index, user),
+    "attachments": _attachment,
+    "events": lambda index, user: _event(index, user),
+    "calendarView": lambda index, user: _event(index, user),
+    "instances": lambda index, user: _event(index, user),
+    "calendars": _named("cal", "Calendar"),
+    "mailFolders": _named("folder", "Folder"),
+    "childFolders": _named("folder", "Folder"),
+    "contacts": _named("contact", "Contact"),
+    "children": _drive_item,
+    "items": _drive_item,
+    "drives": _named("drive", "Drive"),
+    "notebooks": _named("notebook", "Notebook"),
+    "sections": _named("section", "Section"),
+    "sectionGroups": _named("sectiongroup", "Section group"),
+    "pages": _page,
+    "lists": _named("list", "Tasks"),
+    "tasks": _task,
+    "teams": _named("team", "Team"),
+    "joinedTeams": _named("team", "Team"),
+    "channels": _named("channel", "Channel"),
+    "chats": _named("chat", "Chat"),
+    "members": _named("member", "Member"),
+    "replies": _chat_message,
+}
+
+# 컬렉션별 전체 항목 수 (그 외는 --items)
+_COLLECTION_SIZES = {"attachments": 2, "calendars": 3, "drives": 2, "notebooks": 3, "sections": 5,
+                     "lists": 3, "teams": 3, "joinedTeams": 3, "channels": 5, "members": 8}
+
+
+class GraphStub:
+    """로컬 Graph 대역 (별도 스레드의 이벤트 루프에서 aiohttp 서버 실행)"""
+
+    def __init__(self, latency_ms: float = 20.0, jitter_ms: float = 5.0, throttle: float = 0.0,
+                 retry_after: int = 1, items: int = 100, seed: int = 7):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.throttle = throttle
+        self.retry_after = retry_after
+        self.items = items
+        self.rng = random.Random(seed)
+        self.stats: Counter = Counter()
+        self.routes: Counter = Counter()
+        self.url = ""
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._runner = None
+
+    # ---------- 라우팅 ----------
+
+    def _collection(self, segments: List[str]) -> Optional[int]:
+        for pos in range(len(segments) - 1, -1, -1):
+            if segments[pos] in COLLECTIONS:
+                return pos
+        return None
+
+    def _list(self, name: str, path: str, query: Dict[str, str], owner: str) -> Dict[str, Any]:
+        total = _COLLECTION_SIZES.get(name, self.items)
+        top = max(1, min(int(query.get("$top", 10) or 10), 999))
+        skip = max(0, int(query.get("$skip", 0) or 0))
+        factory = _chat_message if name == "messages" and ("/chats/" in path or "/channels/" in path) \
+            else COLLECTIONS[name]
+        body: Dict[str, Any] = {"value": [factory(index, owner) for index in range(skip, min(total, skip + top))]}
+        if query.get("$count", "").lower() == "true":
+            body["@odata.count"] = total
+        if skip + top < total:
+            body["@odata.nextLink"] = f"{GRAPH_ORIGIN}{path}?" + urlencode({**query, "$skip": skip + top})
+        return body
+
+    def route(self, method: str, path: str, query: Dict[str, str],
+              body: Any = None) -> Tuple[int, Any, Dict[str, str]]:
+        """(status, body, headers) — body 가 bytes / str 이면 그대로, 그 외는 JSON"""
+        segments = [s for s in path.split("/") if s]
+        if segments and segments[0] in ("v1.0", "beta"):
+            segments = segments[1:]
+        owner = segments[1] if len(segments) > 1 and segments[0] == "users" else BENCH_USER
+        pos = self._collection(segments)
+        name = segments[pos] if pos is not None else (segments[-1] if segments else "")
+        self.routes[f"{method} {name}"] += 1
+
+        if pos is None:
+            if method == "GET" and segments and segments[-1] == "root":
+                return 200, {**_drive_item(0, "drive-00000"), "id": "root", "name": "root"}, {}
+            if method == "GET" and (not segments or segments[-1] in ("me", owner) or segments[0] == "me"):
+                return 200, {"id": "user-00000", "mail": owner, "userPrincipalName": owner,
+                             "displayName": "Bench User"}, {}
+            if method == "GET":
+                return 200, {"value": []}, {}
+            return 202, {}, {}
+
+        tail = segments[pos + 1:]
+        index = int(re.sub(r"\D", "", tail[0]) or 0) % 100000 if tail else 0
+        if not tail:
+            if method == "GET":
+                return 200, self._list(name, path, query, owner), {}
+            created = {**COLLECTIONS[name](self.items, owner), **(body if isinstance(body, dict) else {})}
+            return 201, created, {}
+        if len(tail) == 1:
+            if method == "DELETE":
+                return 204, b"", {}
+            item = COLLECTIONS[name](index, owner)
+            item["id"] = tail[0]
+            if method in ("PATCH", "PUT") and isinstance(body, dict):
+                item.update(body)
+            return 200, item, {}
+        if tail[1] in ("content", "$value"):
+            if method in ("PUT", "POST"):
+                return 201, _drive_item(index, "root"), {}
+            if name == "pages":
+                return 200, f"<html><body><h1>Notes {index}</h1>" + "<p>text</p>" * 50 + "</body></html>", \
+                    {"Content-Type": "text/html"}
+            return 200, f"content of {tail[0]}\n".encode() * 256, {"Content-Type": "application/octet-stream"}
+        if tail[1] == "createUploadSession":
+            expires = (datetime.now(timezone.utc) + timedelta(hours=1)).isoformat()
+            return 200, {"uploadUrl": f"{GRAPH_ORIGIN}/_upload/{tail[0]}", "expirationDateTime": expires}, {}
+        # 항목 하위 동작 (send / move / copy / forward ...)
+        return (202, {}, {}) if method == "POST" else (200, COLLECTIONS[name](index, owner), {})
+
+    def _throttled(self) -> bool:
+        return self.throttle > 0 and self.rng.random() < self.throttle
+
+    def _throttle_body(self) -> Dict[str, Any]:
+        return {"error": {"code": "TooManyRequests", "message": "Too many requests (bench stub)"}}
+
+    def _batch(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        responses = []
+        for request in (body or {}).get("requests", []):
+            self.stats["batch_subrequests"] += 1
+            if self._throttled():
+                self.stats["throttled"] += 1
+                responses.append({"id": request.get("id"), "status": 429,
+                                  "headers": {"Retry-After": str(self.retry_after)}, "body": self._throttle_body()})
+                continue
+            url = request.get("url", "")
+            path, _, query = url.partition("?")
+            status, payload, headers = self.route(request.get("method", "GET").upper(),
+                                                  "/" + path.lstrip("/"), dict(parse_qsl(query)), request.get("body"))
+            if isinstance(payload, bytes):
+                payload = base64.b64encode(payload).decode()
+            responses.append({"id": request.get("id"), "status": status, "headers": headers, "body": payload})
+        return {"responses": responses}
+
+    # ---------- aiohttp ----------
+
+    async def _handle(self, request):
+        from aiohttp import web
+
+        self.stats["requests"] += 1
+        delay = self.latency_ms + (self.rng.uniform(0, self.jitter_ms) if self.jitter_ms else 0.0)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+        if self._throttled():
+            self.stats["throttled"] += 1
+            return web.json_response(self._throttle_body(), status=429,
+                                     headers={"Retry-After": str(self.retry_after)})
+
+        body: Any = None
+        if request.can_read_body:
+            raw = await request.read()
+            self.stats["request_bytes"] += len(raw)
+            if "json" in (request.content_type or ""):
+                with contextlib.suppress(ValueError):
+                    body = json.loads(raw or b"null")
+        if request.path.endswith("/$batch"):
+            status, payload, headers = 200, self._batch(body), {}
+        elif request.path.startswith("/_upload/"):
+            status, payload, headers = 201, _drive_item(0, "root"), {}
+        else:
+            status, payload, headers = self.route(request.method, request.path, dict(request.query), body)
+
+        if isinstance(payload, (bytes, str)):
+            data = payload.encode() if isinstance(payload, str) else payload
+            self.stats["response_bytes"] += len(data)
+            return web.Response(body=data, status=status, headers=headers)
+        data = json.dumps(payload).encode()
+        self.stats["response_bytes"] += len(data)
+        return web.Response(body=data, status=status, content_type="application/json", headers=headers)
+
+    async def _start(self, host: str, port: int) -> None:
+        from aiohttp import web
+
+        app = web.Application(client_max_size=1024 ** 3)
+        app.router.add_route("*", "/{tail:.*}", self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound = self._runner.addresses[0][1]
+        self.url = f"http://{host}:{bound}"
+
+    def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """별도 스레드에서 서버 시작, 기본 URL 반환 (클라이언트 부하와 같은 루프를 쓰지 않도록)"""
+        started = threading.Event()
+        errors: List[BaseException] = []
+
+        def run() -> None:
+            self._loop = asyncio.new_event_loop()
+            try:
+                self._loop.run_until_complete(self._start(host, port))
+            except BaseException as e:  # noqa: BLE001 - 시작 실패는 호출한 스레드로 전달
+                errors.append(e)
+                started.set()
+                return
+            started.set()
+            self._loop.run_forever()
+            self._loop.run_until_complete(self._runner.cleanup())
+            self._loop.close()
+
+        self._thread = threading.Thread(target=run, name="graph-stub", daemon=True)
+        self._thread.start()
+        started.wait(30)
+        if errors:
+            raise errors[0]
+        return self.url
+
+    def stop(self) -> None:
+        if self._loop is not None and self._thread is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(10)
+            self._loop = None
+
+    def reset_stats(self) -> None:
+        self.stats.clear()
+        self.routes.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {**dict(self.stats), "routes": dict(self.routes.most_common(10))}
+
+
+# ============================================================
+# 도구 선택 / 인자 생성
+# ============================================================
+
+def _sample_value(name: str, schema: Dict[str, Any], user_email: str) -> Any:
+    if "default" in schema and "email" not in name.lower():
+        return schema["default"]
+    if schema.get("enum"):
+        return schema["enum"][0]
+    kind = schema.get("type", "string")
+    lowered = name.lower()
+    if kind == "object":
+        return sample_arguments(schema, user_email, required_only=True)
+    if kind == "array":
+        return [_sample_value(name.rstrip("s"), schema.get("items") or {"type": "string"}, user_email)]
+    if kind == "integer" or kind == "number":
+        return max(schema.get("minimum", 10), 1) if "top" in lowered or "limit" in lowered else \
+            schema.get("minimum", 1)
+    if kind == "boolean":
+        return False
+    if "email" in lowered or lowered in ("user", "user_id", "owner"):
+        return user_email
+    if "date" in lowered or "time" in lowered:
+        days = 30 if lowered.endswith(("from", "start")) else 0
+        return (_EPOCH - timedelta(days=days)).strftime("%Y-%m-%d")
+    if lowered.endswith("id") or lowered.endswith("ids"):
+        return "bench-00001"
+    return "bench"
+
+
+def sample_arguments(schema: Dict[str, Any], user_email: str = BENCH_USER,
+                     required_only: bool = True) -> Dict[str, Any]:
+    """inputSchema 로 호출 인자 생성 (필수 속성 + 이메일 속성은 항상 벤치 사용자로)"""
+    properties = schema.get("properties") or {}
+    required = set(schema.get("required") or [])
+    arguments = {}
+    for name, prop in properties.items():
+        if name in required or not required_only or "email" in name.lower():
+            arguments[name] = _sample_value(name, prop or {}, user_email)
+    return arguments
+
+
+def select_tools(tools: List[Dict[str, Any]], names: Optional[List[str]] = None,
+                 scenarios: Optional[Dict[str, Dict[str, Any]]] = None) -> List[Tuple[str, Dict[str, Any]]]:
+    """(도구 이름, 인자) 목록 — names 가 없으면 쓰기 계열 이름을 뺀 전체"""
+    scenarios = scenarios or {}
+    by_name = {tool["name"]: tool for tool in tools}
+    if names:
+        missing = [name for name in names if name not in by_name]
+        if missing:
+            raise ValueError(f"Unknown tools: {', '.join(missing)}")
+        chosen = [by_name[name] for name in names]
+    else:
+        chosen = [tool for tool in tools if not WRITE_TOOL_PATTERN.search(tool["name"])]
+    return [(tool["name"], {**sample_arguments(tool.get("inputSchema") or {}), **scenarios.get(tool["name"], {})})
+            for tool in chosen]
+
+
+def _tool_failed(result: Dict[str, Any]) -> Optional[str]:
+    """tools/call 결과에서 오류 메시지 추출 (isError, 또는 success=false / status=error 본문)"""
+    texts = [c.get("text", "") for c in result.get("content") or [] if isinstance(c, dict)]
+    if result.get("isError"):
+        return (texts[0] if texts else "isError")[:200]
+    if texts:
+        with contextlib.suppress(ValueError, TypeError):
+            payload = json.loads(texts[0])
+            if isinstance(payload, dict) and (payload.get("success") is False or payload.get("status") == "error"):
+                return str(payload.get("error") or payload.get("message") or "tool reported failure")[:200]
+    return None
+
+
+# ============================================================
+# 서버 프로세스 / 프로토콜 드라이버
+# ============================================================
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def project_root(start: Path) -> Path:
+    """core/bench.py 가 있는 저장소 루트 (생성된 하네스 위치에서 위로 탐색)"""
+    for candidate in [start, *start.parents]:
+        if (candidate / "core" / "bench.py").exists():
+            return candidate
+    raise FileNotFoundError(f"core/bench.py not found above {start}")
+
+
+def prepare_workdir(workdir: Path, root: Path) -> None:
+    """sitecustomize.py + 벤치 사용자 토큰이 든 database/auth.db"""
+    (workdir / "sitecustomize.py").write_text(_SITECUSTOMIZE, encoding="utf-8")
+    (workdir / "database").mkdir(exist_ok=True)
+    if str(root) not in sys.path:
+        sys.path.insert(0, str(root))
+    from session.auth_database import AuthDatabase
+
+    session_logger = logging.getLogger("session")
+    level = session_logger.level
+    session_logger.setLevel(logging.WARNING)
+    try:
+        db = AuthDatabase(str(workdir / "database" / "auth.db"))
+        db.save_user(BENCH_USER, {"id": "user-00000", "displayName": "Bench User"})
+        db.save_token(BENCH_USER, {
+            "access_token": "bench-access-token",
+            "refresh_token": "bench-refresh-token",
+            "expires_at": (datetime.now(timezone.utc) + timedelta(days=1)).isoformat(),
+            "scope": "https://graph.microsoft.com/.default",
+        })
+    finally:
+        session_logger.setLevel(level)
+
+
+def server_env(workdir: Path, root: Path, stub_url: str, port: Optional[int] = None,
+               stream_workers: int = 1) -> Dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(workdir), str(root), env.get("PYTHONPATH", "")]))
+    env["MCP_BENCH_GRAPH_URL"] = stub_url
+    env["DB_PATH"] = str(workdir / "database" / "auth.db")
+    env.setdefault("MCP_LOG_LEVEL", "WARNING")
+    env["PYTHONUNBUFFERED"] = "1"
+    if port is not None:
+        env["MCP_SERVER_PORT"] = str(port)
+    env["MCP_STREAM_WORKERS"] = str(stream_workers)
+    return env
+
+
+def _descendants(pid: int) -> List[int]:
+    parents: Dict[int, List[int]] = {}
+    for entry in os.listdir("/proc"):
+        if entry.isdigit():
+            with contextlib.suppress(OSError, IndexError, ValueError):
+                with open(f"/proc/{entry}/stat") as f:
+                    ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+                parents.setdefault(ppid, []).append(int(entry))
+    found, stack = [], [pid]
+    while stack:
+        current = stack.pop()
+        found.append(current)
+        stack.extend(parents.get(current, []))
+    return found
+
+
+def peak_rss_mb(pid: int) -> Optional[float]:
+    """서버 프로세스 트리의 peak RSS 합 (Linux VmHWM, 그 외 psutil 이 있으면 현재 RSS)"""
+    if os.path.isdir("/proc"):
+        total_kb = 0
+        for child in _descendants(pid):
+            with contextlib.suppress(OSError):
+                with open(f"/proc/{child}/status") as f:
+                    for line in f:
+                        if line.startswith("VmHWM:"):
+                            total_kb += int(line.split()[1])
+        return round(total_kb / 1024, 1) if total_kb else None
+    try:
+        import psutil
+    except ImportError:
+        return None
+    with contextlib.suppress(Exception):
+        process = psutil.Process(pid)
+        processes = [process, *process.children(recursive=True)]
+        return round(sum(p.memory_info().rss for p in processes) / 1024 ** 2, 1)
+    return None
+
+
+class _Driver(ABC):
+    """서버 프로세스 1개 + 프로토콜 클라이언트"""
+
+    protocol = ""
+
+    def __init__(self, script: Path, workdir: Path, env: Dict[str, str], timeout: float):
+        self.script = script
+        self.workdir = workdir
+        self.env = env
+        self.timeout = timeout
+        self.proc: Optional[asyncio.subprocess.Process] = None
+        self.log = open(workdir / f"server_{self.protocol}.log", "ab")
+
+    @property
+    def pid(self) -> int:
+        return self.proc.pid
+
+    async def _spawn(self, **kwargs) -> None:
+        self.proc = await asyncio.create_subprocess_exec(
+            sys.executable, str(self.script), cwd=str(self.workdir), env=self.env,
+            stderr=self.log, **kwargs
+        )
+
+    async def _wait_healthy(self, port: int) -> None:
+        import aiohttp
+
+        deadline = time.monotonic() + 90
+        async with aiohttp.ClientSession() as session:
+            while True:
+                with contextlib.suppress(aiohttp.ClientError, asyncio.TimeoutError):
+                    async with session.get(f"http://127.0.0.1:{port}/health",
+                                           timeout=aiohttp.ClientTimeout(total=2)) as response:
+                        if response.status == 200:
+                            return
+                if self.proc.returncode is not None or time.monotonic() > deadline:
+                    raise RuntimeError(f"{self.protocol} server did not start (see {self.log.name})")
+                await asyncio.sleep(0.2)
+
+    @abstractmethod
+    async def start(self) -> None:
+        """서버 프로세스 시작 후 요청을 받을 수 있을 때까지 대기"""
+        pass
+
+    @abstractmethod
+    def client(self):
+        """부하 워커 1개가 쓰는 클라이언트 (async context manager, call(name, args) → 오류 또는 None)"""
+        pass
+
+    async def list_tools(self) -> List[Dict[str, Any]]:
+        async with self.client() as client:
+            return await client.list_tools()
+
+    async def stop(self) -> None:
+        if self.proc is not None and self.proc.returncode is None:
+            with contextlib.suppress(ProcessLookupError):
+                self.proc.terminate()
+            try:
+                await asyncio.wait_for(self.proc.wait(), 15)
+            except asyncio.TimeoutError:
+                self.proc.kill()
+                await self.proc.wait()
+        self.log.close()
+
+
+class _JsonRpcClient(ABC):
+    """JSON-RPC 결과 해석 공통 (stdio / REST)"""
+
+    @abstractmethod
+    async def request(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """JSON-RPC 요청 1개를 보내고 응답 메시지 반환"""
+        pass
+
+    async def list_tools(self) -> List[Dict[str, Any]]:
+        response = await self.request("tools/list", {})
+        return response.get("result", {}).get("tools", [])
+
+    async def call(self, name: str, arguments: Dict[str, Any]) -> Optional[str]:
+        response = await self.request("tools/call", {"name": name, "arguments": arguments})
+        if "error" in response:
+            return str(response["error"].get("message", response["error"]))[:200]
+        return _tool_failed(response.get("result") or {})
+
+
+class StdioDriver(_JsonRpcClient, _Driver):
+    """stdin/stdout 줄 단위 JSON-RPC (여러 워커의 요청을 한 파이프에 id 로 다중화)"""
+
+    protocol = "stdio"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pending: Dict[int, asyncio.Future] = {}
+        self.next_id = 0
+        self.reader: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        await self._spawn(stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE, limit=64 * 1024 ** 2)
+        self.reader = asyncio.create_task(self._read())
+        await asyncio.wait_for(self.request("initialize", {
+            "protocolVersion": "2024-11-05", "capabilities": {}, "clientInfo": {"name": "bench", "version": "1.0"},
+        }), 90)
+        await self._send({"jsonrpc": "2.0", "method": "notifications/initialized"})
+
+    async def _read(self) -> None:
+        while True:
+            line = await self.proc.stdout.readline()
+            if not line:
+                break
+            with contextlib.suppress(ValueError):
+                message = json.loads(line)
+                future = self.pending.pop(message.get("id"), None)
+                if future is not None and not future.done():
+                    future.set_result(message)
+        for future in self.pending.values():
+            if not future.done():
+                future.set_exception(RuntimeError("stdio server exited"))
+
+    async def _send(self, message: Dict[str, Any]) -> None:
+        self.proc.stdin.write(json.dumps(message).encode() + b"\n")
+        await self.proc.stdin.drain()
+
+    async def request(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        self.next_id += 1
+        request_id = self.next_id
+        future = asyncio.get_running_loop().create_future()
+        self.pending[request_id] = future
+        await self._send({"jsonrpc": "2.0", "id": request_id, "method": method, "params": params})
+        try:
+            return await asyncio.wait_for(future, self.timeout)
+        finally:
+            self.pending.pop(request_id, None)
+
+    @contextlib.asynccontextmanager
+    async def client(self):
+        yield self
+
+    async def stop(self) -> None:
+        if self.proc is not None and self.proc.stdin and not self.proc.stdin.is_closing():
+            self.proc.stdin.close()
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self.proc.wait(), 5)
+        if self.reader is not None:
+            self.reader.cancel()
+        await super().stop()
+
+
+class RestDriver(_JsonRpcClient, _Driver):
+    """POST /mcp/v1 (aiohttp 세션 1개를 워커들이 공유)"""
+
+    protocol = "rest"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.port = int(self.env["MCP_SERVER_PORT"])
+        self.session = None
+        self.next_id = 0
+
+    async def start(self) -> None:
+        import aiohttp
+
+        await self._spawn(stdout=self.log)
+        await self._wait_healthy(self.port)
+        self.session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=0),
+                                             timeout=aiohttp.ClientTimeout(total=self.timeout))
+        await self.request("initialize", {"protocolVersion": "2024-11-05", "capabilities": {},
+                                          "clientInfo": {"name": "bench", "version": "1.0"}})
+
+    async def request(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        self.next_id += 1
+        payload = {"jsonrpc": "2.0", "id": self.next_id, "method": method, "params": params}
+        async with self.session.post(f"http://127.0.0.1:{self.port}/mcp/v1", json=payload) as response:
+            return await response.json()
+
+    @contextlib.asynccontextmanager
+    async def client(self):
+        yield self
+
+    async def stop(self) -> None:
+        if self.session is not None:
+            await self.session.close()
+        await super().stop()
+
+
+class _StreamClient:
+    def __init__(self, session, timeout: float):
+        self.session = session
+        self.timeout = timedelta(seconds=timeout)
+
+    async def list_tools(self) -> List[Dict[str, Any]]:
+        result = await self.session.list_tools()
+        return [tool.model_dump(by_alias=True, exclude_none=True) for tool in result.tools]
+
+    async def call(self, name: str, arguments: Dict[str, Any]) -> Optional[str]:
+        result = await self.session.call_tool(name, arguments, read_timeout_seconds=self.timeout)
+        return _tool_failed(result.model_dump(by_alias=True, exclude_none=True))
+
+
+class StreamDriver(_Driver):
+    """Streamable HTTP (/mcp) — 워커마다 자기 MCP 세션 (멀티 워커면 세션 고정 프록시 경유)"""
+
+    protocol = "stream"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.port = int(self.env["MCP_SERVER_PORT"])
+
+    async def start(self) -> None:
+        await self._spawn(stdout=self.log)
+        await self._wait_healthy(self.port)
+
+    @contextlib.asynccontextmanager
+    async def client(self):
+        from mcp import ClientSession
+        from mcp.client.streamable_http import streamablehttp_client
+
+        async with streamablehttp_client(f"http://127.0.0.1:{self.port}/mcp", timeout=self.timeout) as (
+                read_stream, write_stream, _):
+            async with ClientSession(read_stream, write_stream) as session:
+                await session.initialize()
+                yield _StreamClient(session, self.timeout)
+
+
+DRIVERS = {"stdio": StdioDriver, "rest": RestDriver, "stream": StreamDriver}
+
+
+# ============================================================
+# 부하 실행 / 집계
+# ============================================================
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+async def run_load(driver: _Driver, jobs: List[Tuple[str, Dict[str, Any]]],
+                   concurrency: int) -> Tuple[List[Tuple[str, float, Optional[str]]], float]:
+    """jobs 를 concurrency 개 워커로 소진 → ([(도구, 초, 오류)], 경과 초)"""
+    queue = deque(jobs)
+    samples: List[Tuple[str, float, Optional[str]]] = []
+
+    async def worker() -> None:
+        async with driver.client() as client:
+            while queue:
+                name, arguments = queue.popleft()
+                started = time.perf_counter()
+                try:
+                    error = await client.call(name, arguments)
+                except Exception as e:  # noqa: BLE001 - 호출 실패는 오류로 집계
+                    error = f"{type(e).__name__}: {e}"[:200]
+                samples.append((name, time.perf_counter() - started, error))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(max(1, min(concurrency, len(jobs))))))
+    return samples, time.perf_counter() - started
+
+
+def summarize(samples: List[Tuple[str, float, Optional[str]]], elapsed: float,
+              graph: Dict[str, Any], rss_mb: Optional[float]) -> Dict[str, Any]:
+    latencies = sorted(seconds * 1000 for _, seconds, _ in samples)
+    errors = sum(1 for _, _, error in samples if error)
+    per_tool: Dict[str, Dict[str, Any]] = {}
+    for name in dict.fromkeys(name for name, _, _ in samples):
+        tool_samples = [s for s in samples if s[0] == name]
+        tool_latencies = sorted(seconds * 1000 for _, seconds, _ in tool_samples)
+        tool_errors = [error for _, _, error in tool_samples if error]
+        per_tool[name] = {
+            "calls": len(tool_samples),
+            "errors": len(tool_errors),
+            "p50_ms": round(percentile(tool_latencies, 0.50), 1),
+            "p95_ms": round(percentile(tool_latencies, 0.95), 1),
+            "first_error": tool_errors[0] if tool_errors else None,
+        }
+    calls = len(samples)
+    return {
+        "calls": calls,
+        "errors": errors,
+        "error_rate": round(errors / calls, 4) if calls else 0.0,
+        "duration_s": round(elapsed, 3),
+        "throughput_rps": round(calls / elapsed, 2) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 0.50), 1),
+        "p95_ms": round(percentile(latencies, 0.95), 1),
+        "p99_ms": round(percentile(latencies, 0.99), 1),
+        "max_ms": round(latencies[-1], 1) if latencies else 0.0,
+        "peak_rss_mb": rss_mb,
+        "graph_calls_per_call": round(graph.get("requests", 0) / calls, 2) if calls else 0.0,
+        "graph": graph,
+        "tools": per_tool,
+    }
+
+
+async def bench_protocol(protocol: str, script: Path, workdir: Path, root: Path, stub: GraphStub,
+                         settings: Dict[str, Any], tool_names: Optional[List[str]],
+                         scenarios: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    port = None if protocol == "stdio" else _free_port()
+    workers = settings["stream_workers"] if protocol == "stream" else 1
+    env = server_env(workdir, root, stub.url, port, workers)
+    driver = DRIVERS[protocol](script, workdir, env, settings["timeout"])
+    await driver.start()
+    try:
+        tools = select_tools(await driver.list_tools(), tool_names, scenarios)
+        if not tools:
+            raise RuntimeError("no tools selected (all tool names look like write operations; use --tools)")
+        rotation = [tools[index % len(tools)] for index in range(settings["warmup"] + settings["requests"])]
+        if settings["warmup"]:
+            await run_load(driver, rotation[:settings["warmup"]], settings["concurrency"])
+        stub.reset_stats()
+        samples, elapsed = await run_load(driver, rotation[settings["warmup"]:], settings["concurrency"])
+        return summarize(samples, elapsed, stub.snapshot(), peak_rss_mb(driver.pid))
+    finally:
+        await driver.stop()
+
+
+# ============================================================
+# 기준선
+# ============================================================
+
+# 지표 → 값이 커지면 나쁜지 (True) / 작아지면 나쁜지 (False)
+_HIGHER_IS_WORSE = {"throughput_rps": False, "p50_ms": True, "p95_ms": True, "peak_rss_mb": True,
+                    "graph_calls_per_call": True}
+_COMPARED_SETTINGS = ("concurrency", "requests", "latency_ms", "jitter_ms", "throttle", "items", "tools",
+                      "stream_workers")
+
+
+def compare_to_baseline(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Any],
+                        threshold: float, rss_threshold: float) -> List[str]:
+    """임계값을 넘는 회귀 목록 (설정이 다르면 비교하지 않음)"""
+    regressions = []
+    for protocol, current in results.items():
+        previous = baseline.get("results", {}).get(protocol)
+        if not previous or "error" in current:
+            continue
+        for metric, higher_is_worse in _HIGHER_IS_WORSE.items():
+            before, after = previous.get(metric), current.get(metric)
+            if not before or after is None:
+                continue
+            limit = rss_threshold if metric == "peak_rss_mb" else threshold
+            change = (after - before) / before
+            if (change > limit) if higher_is_worse else (change < -limit):
+                regressions.append(f"{protocol} {metric}: {round(before, 2)} -> {after} "
+                                   f"({change:+.0%}, limit {limit:.0%})")
+        if current.get("error_rate", 0) > previous.get("error_rate", 0) + 0.01:
+            regressions.append(f"{protocol} error_rate: {previous.get('error_rate', 0)} -> {current['error_rate']}")
+    return regressions
+
+
+def _baseline_record(profile: str, settings: Dict[str, Any], results: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        "profile": profile,
+        "saved_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "python": sys.version.split()[0],
+        "cpus": os.cpu_count(),
+        "settings": {key: settings[key] for key in _COMPARED_SETTINGS},
+        "results": {protocol: {key: value for key, value in result.items() if key not in ("graph", "tools")}
+                    for protocol, result in results.items() if "error" not in result},
+    }
+
+
+# ============================================================
+# 출력 / CLI
+# ============================================================
+
+def _print_report(results: Dict[str, Dict[str, Any]], verbose: bool) -> None:
+    print(f"  {'protocol':<8} {'calls/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>7} "
+          f"{'graph/call':>10} {'peak RSS MB':>11}")
+    for protocol, result in results.items():
+        if "error" in result:
+            print(f"  {protocol:<8} FAILED: {result['error']}")
+            continue
+        rss = result["peak_rss_mb"] if result["peak_rss_mb"] is not None else "n/a"
+        print(f"  {protocol:<8} {result['throughput_rps']:9.1f} {result['p50_ms']:8.1f} {result['p95_ms']:8.1f} "
+              f"{result['p99_ms']:8.1f} {result['errors']:>7} {result['graph_calls_per_call']:>10} {rss:>11}")
+        for name, tool in result["tools"].items():
+            if verbose or tool["errors"]:
+                line = f"    {name:<34} calls={tool['calls']} errors={tool['errors']} " \
+                       f"p50={tool['p50_ms']}ms p95={tool['p95_ms']}ms"
+                print(line + (f"  first error: {tool['first_error']}" if tool["first_error"] else ""))
+
+
+def build_parser(profile: str) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=f"Load test / benchmark for the {profile} MCP server "
+                                                 "against a local Graph stub")
+    parser.add_argument("--protocols", default=",".join(PROTOCOLS), help="Comma-separated: stdio,rest,stream")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent tool calls (stream: MCP sessions)")
+    parser.add_argument("--requests", type=int, default=200, help="Timed tools/call requests per protocol")
+    parser.add_argument("--warmup", type=int, default=10, help="Untimed calls before measuring")
+    parser.add_argument("--tools", default="", help="Comma-separated tool names (default: read-only looking tools)")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Graph stub latency per request")
+    parser.add_argument("--jitter-ms", type=float, default=5.0, help="Uniform extra latency 0..N ms")
+    parser.add_argument("--throttle", type=float, default=0.0, help="Fraction of Graph requests answered 429")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds on injected 429s")
+    parser.add_argument("--items", type=int, default=100, help="Synthetic items per mailbox/calendar/drive list")
+    parser.add_argument("--stream-workers", type=int, default=1, help="MCP_STREAM_WORKERS for the stream server")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Per-call timeout in seconds")
+    parser.add_argument("--baseline", default="", help="Baseline JSON path (default: next to the harness)")
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed throughput/latency regression")
+    parser.add_argument("--rss-threshold", type=float, default=0.20, help="Allowed peak RSS regression")
+    parser.add_argument("--json", default="", help="Write full results to this file")
+    parser.add_argument("--keep-workdir", action="store_true", help="Keep the temp dir (server logs, auth.db)")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Per-tool lines for every protocol")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None, profile: str = "", servers: Optional[Dict[str, Path]] = None,
+         baseline_path: Optional[Path] = None, scenarios: Optional[Dict[str, Dict[str, Any]]] = None,
+         tools: Optional[List[str]] = None) -> int:
+    """생성된 하네스 진입점 (반환값: 0 정상, 1 회귀 또는 실행 실패)"""
+    args = build_parser(profile).parse_args(argv)
+    # 클라이언트 라이브러리의 요청별 INFO 로그가 보고서를 덮지 않도록
+    for name in ("httpx", "mcp.client"):
+        logging.getLogger(name).setLevel(logging.WARNING)
+    servers = {protocol: Path(path) for protocol, path in (servers or {}).items()}
+    protocols = [p.strip() for p in args.protocols.split(",") if p.strip()]
+    unknown = [p for p in protocols if p not in PROTOCOLS]
+    if unknown:
+        print(f"[ERROR] Unknown protocols: {', '.join(unknown)}")
+        return 1
+    tool_names = [t.strip() for t in args.tools.split(",") if t.strip()] or list(tools or [])
+    settings = {
+        "concurrency": args.concurrency, "requests": args.requests, "warmup": args.warmup,
+        "latency_ms": args.latency_ms, "jitter_ms": args.jitter_ms, "throttle": args.throttle,
+        "items": args.items, "tools": sorted(tool_names), "stream_workers": args.stream_workers,
+        "timeout": args.timeout,
+    }
+    root = project_root(Path(next(iter(servers.values()), Path.cwd())).resolve().parent)
+    stub = GraphStub(args.latency_ms, args.jitter_ms, args.throttle, args.retry_after, args.items)
+    workdir = Path(tempfile.mkdtemp(prefix=f"bench_{profile}_"))
+    print(f"profile={profile} concurrency={args.concurrency} requests={args.requests} "
+          f"graph latency={args.latency_ms}+{args.jitter_ms}ms throttle={args.throttle} items={args.items} "
+          f"cpus={os.cpu_count()}")
+
+    results: Dict[str, Dict[str, Any]] = {}
+    try:
+        prepare_workdir(workdir, root)
+        stub.start()
+        for protocol in protocols:
+            script = servers.get(protocol)
+            if script is None or not script.exists():
+                print(f"  [SKIP] {protocol}: no server file ({script})")
+                continue
+            try:
+                results[protocol] = asyncio.run(bench_protocol(
+                    protocol, script, workdir, root, stub, settings, tool_names or None, scenarios or {}))
+            except Exception as e:  # noqa: BLE001 - 프로토콜별 실패는 보고 후 계속
+                results[protocol] = {"error": f"{type(e).__name__}: {e}"}
+    finally:
+        stub.stop()
+        if args.keep_workdir:
+            print(f"  workdir kept: {workdir}")
+        else:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    _print_report(results, args.verbose)
+    if args.json:
+        Path(args.json).write_text(json.dumps({"profile": profile, "settings": settings, "results": results},
+                                              ensure_ascii=False, indent=2), encoding="utf-8")
+
+    failed = any("error" in result for result in results.values()) or not results
+    baseline_file = Path(args.baseline) if args.baseline else baseline_path
+    if baseline_file is None:
+        return 1 if failed else 0
+    if args.save_baseline:
+        if failed:
+            print("[ERROR] Not saving baseline: some protocols failed")
+            return 1
+        baseline_file.write_text(json.dumps(_baseline_record(profile, settings, results), indent=2) + "\n",
+                                 encoding="utf-8")
+        print(f"[OK] Baseline saved: {baseline_file}")
+        return 0
+    if not baseline_file.exists():
+        print(f"[INFO] No baseline yet ({baseline_file.name}); run with --save-baseline to store one")
+        return 1 if failed else 0
+
+    baseline = json.loads(baseline_file.read_text(encoding="utf-8"))
+    current = {key: settings[key] for key in _COMPARED_SETTINGS}
+    if baseline.get("settings") != current:
+        print(f"[WARN] Settings differ from baseline {baseline_file.name}; not compared")
+        return 1 if failed else 0
+    regressions = compare_to_baseline(results, baseline, args.threshold, args.rss_threshold)
+    for regression in regressions:
+        print(f"  [REGRESSION] {regression}")
+    if not regressions:
+        print(f"[OK] Within thresholds of baseline {baseline_file.name} ({baseline.get('saved_at', '?')})")
+    return 1 if (regressions or failed) else 0
+
+
+def _serve_stub(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Run the local Graph stub")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--jitter-ms", type=float, default=5.0)
+    parser.add_argument("--throttle", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=int, default=1)
+    parser.add_argument("--items", type=int, default=100)
+    args = parser.parse_args(argv)
+
+    stub = GraphStub(args.latency_ms, args.jitter_ms, args.throttle, args.retry_after, args.items)
+    url = stub.start(args.host, args.port)
+    print(f"Graph stub on {url} (point servers at it with MCP_BENCH_GRAPH_URL={url} "
+          f"and core.bench.redirect_graph)")
+    try:
+        while True:
+            time.sleep(5)
+            print(f"  {stub.snapshot()}")
+    except KeyboardInterrupt:
+        stub.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "stub":
+        sys.exit(_serve_stub(sys.argv[2:]))
+    print("usage: python -m core.bench stub [--port N --latency-ms MS --throttle F --items N]")
+    sys.exit(2)
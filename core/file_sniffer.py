@@ -0,0 +1,224 @@
+"""
+File Sniffer - 매직 바이트 기반 파일 형식 판별
+
+확장자와 무관하게 파일 앞부분(및 OLE 디렉터리 / ZIP 중앙 디렉터리)을 읽어
+형식을 판별한다. 외부 의존성이 없으므로 mcp_file_handler와 mcp_outlook이 공유한다.
+
+판별 결과(kind):
+    pdf, hwp, doc, xls, ppt, ole, docx, xlsx, pptx, zip,
+    png, jpeg, gif, bmp, tiff
+
+사용 예시:
+    sniff_file("/tmp/report.doc")      # 'hwp' (이름만 .doc인 한글 문서)
+    sniff_bytes(attachment_bytes)      # 'pdf'
+"""
+
+import io
+import os
+import struct
+import zipfile
+from functools import lru_cache
+from typing import BinaryIO, Optional
+
+# 판별에 읽는 앞부분 크기 (PDF는 앞에 BOM/공백이 붙는 경우가 있음)
+SNIFF_BYTES = 1024
+
+UTF8_BOM = b"\xef\xbb\xbf"
+# PDF 공백 문자 (PDF 1.7 7.2.2: NUL, HT, LF, FF, CR, SP)
+PDF_WHITESPACE = b"\x00\t\n\x0c\r "
+
+OLE_SIGNATURE = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+
+# OLE 디렉터리 체인에서 읽는 최대 섹터 수 (512B 섹터면 항목 64개)
+OLE_MAX_DIR_SECTORS = 16
+ZIP_SIGNATURE = b"PK\x03\x04"
+
+_SIGNATURES = (
+    (b"%PDF-", "pdf"),
+    (b"\x89PNG\r\n\x1a\n", "png"),
+    (b"\xff\xd8\xff", "jpeg"),
+    (b"GIF87a", "gif"),
+    (b"GIF89a", "gif"),
+    (b"II*\x00", "tiff"),
+    (b"MM\x00*", "tiff"),
+)
+
+# BMP DIB 헤더 크기 ("BM" 두 글자만으로는 텍스트와 구분되지 않음)
+_BMP_DIB_HEADER_SIZES = (12, 40, 52, 56, 64, 108, 124)
+
+# OLE 스트림 이름 → 형식 (앞선 항목 우선)
+_OLE_STREAMS = (
+    ("FileHeader", "hwp"),
+    ("WordDocument", "doc"),
+    ("Workbook", "xls"),
+    ("Book", "xls"),
+    ("PowerPoint Document", "ppt"),
+)
+
+# OOXML 파트 경로 접두사 → 형식
+_ZIP_PARTS = (
+    ("word/", "docx"),
+    ("xl/", "xlsx"),
+    ("ppt/", "pptx"),
+)
+
+# 판별 결과별 대표 확장자
+KIND_EXTENSIONS = {
+    "pdf": ".pdf",
+    "hwp": ".hwp",
+    "doc": ".doc",
+    "xls": ".xls",
+    "ppt": ".ppt",
+    "docx": ".docx",
+    "xlsx": ".xlsx",
+    "pptx": ".pptx",
+    "png": ".png",
+    "jpeg": ".jpg",
+    "gif": ".gif",
+    "bmp": ".bmp",
+    "tiff": ".tif",
+}
+
+
+def _ole_next_sector(stream: BinaryIO, header: bytes, sector_size: int, sector: int,
+                     fat_sectors: dict) -> int:
+    """FAT에서 다음 섹터 번호 조회 (헤더 DIFAT 109개 범위 밖이면 -1)"""
+    per_fat_sector = sector_size // 4
+    fat_index = sector // per_fat_sector
+    if fat_index >= 109:
+        return -1
+    fat_sector = struct.unpack_from("<i", header, 0x4C + 4 * fat_index)[0]
+    if fat_sector < 0:
+        return -1
+    if fat_sector not in fat_sectors:
+        stream.seek((fat_sector + 1) * sector_size)
+        fat_sectors[fat_sector] = stream.read(sector_size)
+    fat = fat_sectors[fat_sector]
+    offset = (sector % per_fat_sector) * 4
+    if offset + 4 > len(fat):
+        return -1
+    return struct.unpack_from("<i", fat, offset)[0]
+
+
+def _ole_kind(stream: BinaryIO, header: bytes) -> str:
+    """OLE 디렉터리 체인(최대 OLE_MAX_DIR_SECTORS 섹터)의 스트림 이름으로 문서 종류 판별"""
+    if len(header) < 512:
+        return "ole"
+    sector_shift = struct.unpack_from("<H", header, 0x1E)[0]
+    sector = struct.unpack_from("<i", header, 0x30)[0]
+    if sector_shift not in (9, 12) or sector < 0:
+        return "ole"
+
+    sector_size = 1 << sector_shift
+    names = set()
+    fat_sectors: dict = {}
+    visited = set()
+    # 512B 섹터에는 디렉터리 항목이 4개뿐이라 스트림이 뒤쪽 섹터에 있는 경우가 흔함
+    while sector >= 0 and sector not in visited and len(visited) < OLE_MAX_DIR_SECTORS:
+        visited.add(sector)
+        stream.seek((sector + 1) * sector_size)
+        directory = stream.read(sector_size)
+        for offset in range(0, len(directory) - 127, 128):
+            name_length = struct.unpack_from("<H", directory, offset + 64)[0]
+            if 2 <= name_length <= 64:
+                names.add(directory[offset:offset + name_length - 2].decode("utf-16-le", "ignore"))
+        if any(stream_name in names for stream_name, _ in _OLE_STREAMS):
+            break
+        sector = _ole_next_sector(stream, header, sector_size, sector, fat_sectors)
+
+    for stream_name, kind in _OLE_STREAMS:
+        if stream_name in names:
+            return kind
+    return "ole"
+
+
+def _zip_kind(stream: BinaryIO) -> str:
+    """ZIP 중앙 디렉터리의 파트 경로로 OOXML 종류 판별"""
+    try:
+        with zipfile.ZipFile(stream) as archive:
+            names = archive.namelist()
+    except (zipfile.BadZipFile, OSError, ValueError):
+        return "zip"
+
+    for prefix, kind in _ZIP_PARTS:
+        if any(name.startswith(prefix) for name in names):
+            return kind
+    return "zip"
+
+
+def sniff_stream(stream: BinaryIO) -> Optional[str]:
+    """
+    탐색 가능한 바이너리 스트림의 형식 판별
+
+    Args:
+        stream: seek 가능한 바이너리 스트림
+
+    Returns:
+        형식 문자열 또는 판별 불가 시 None
+    """
+    stream.seek(0)
+    header = stream.read(SNIFF_BYTES)
+
+    if header.startswith(OLE_SIGNATURE):
+        return _ole_kind(stream, header)
+    if header.startswith(ZIP_SIGNATURE):
+        return _zip_kind(stream)
+    for signature, kind in _SIGNATURES:
+        if header.startswith(signature):
+            return kind
+    if (header.startswith(b"BM") and len(header) >= 18 and header[6:10] == b"\x00" * 4
+            and struct.unpack_from("<I", header, 14)[0] in _BMP_DIB_HEADER_SIZES):
+        return "bmp"
+    if _is_padded_pdf(header):
+        return "pdf"
+    return None
+
+
+def _is_padded_pdf(header: bytes) -> bool:
+    """BOM / 공백 뒤에 %PDF- 헤더가 오는지 (본문 중간의 %PDF- 문자열은 무시)"""
+    if header.startswith(UTF8_BOM):
+        header = header[len(UTF8_BOM):]
+    return header.lstrip(PDF_WHITESPACE).startswith(b"%PDF-")
+
+
+def sniff_bytes(content: bytes) -> Optional[str]:
+    """
+    메모리의 파일 내용 형식 판별
+
+    Args:
+        content: 파일 내용
+
+    Returns:
+        형식 문자열 또는 None
+    """
+    try:
+        return sniff_stream(io.BytesIO(content))
+    except (struct.error, ValueError):
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _sniff_file_cached(path: str, mtime_ns: int, size: int) -> Optional[str]:
+    """(경로, 수정 시각, 크기) 단위로 캐시되는 파일 판별"""
+    try:
+        with open(path, "rb") as f:
+            return sniff_stream(f)
+    except (OSError, struct.error, ValueError):
+        return None
+
+
+def sniff_file(path: str) -> Optional[str]:
+    """
+    파일 형식 판별 (경로, 수정 시각, 크기가 같으면 캐시된 결과 사용)
+
+    Args:
+        path: 파일 경로
+
+    Returns:
+        형식 문자열 또는 파일이 없거나 판별 불가 시 None
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return _sniff_file_cached(os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
@@ -0,0 +1,53 @@
+"""
+Lazy Service - 서비스 클래스 지연 import / 생성
+
+생성된 MCP 서버는 모듈 import 시점에 서비스 인스턴스 변수(mail_service 등)를 만들지만,
+실제 서비스 모듈(Graph 클라이언트, 변환기, pydantic 모델 스택)의 import와 생성은
+첫 속성 접근(startup 훅의 initialize() 또는 첫 tools/call)까지 미룬다.
+서버 모듈 import(tools/list 응답, 테스트, 생성기 검증)는 서비스 스택을 불러오지 않는다.
+
+사용 예시:
+    mail_service = LazyService("mcp_outlook.outlook_service", "MailService")
+    await mail_service.initialize()          # 여기서 import + MailService() 생성
+    mail_service.loaded                      # True
+"""
+
+import importlib
+import threading
+from typing import Any
+
+
+class LazyService:
+    """첫 속성 접근 시 module_path.class_name()을 import / 생성하고 이후 모든 속성을 위임"""
+
+    def __init__(self, module_path: str, class_name: str):
+        self._module_path = module_path
+        self._class_name = class_name
+        self._instance: Any = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        """서비스 인스턴스가 이미 생성되었는지 여부"""
+        return self._instance is not None
+
+    def get(self) -> Any:
+        """서비스 인스턴스 반환 (최초 호출 시 한 번만 import / 생성)"""
+        instance = self._instance
+        if instance is None:
+            with self._lock:
+                if self._instance is None:
+                    module = importlib.import_module(self._module_path)
+                    self._instance = getattr(module, self._class_name)()
+                instance = self._instance
+        return instance
+
+    def __getattr__(self, name: str) -> Any:
+        # 자체 속성은 __dict__에서 먼저 찾으므로 여기 오면 __init__ 전(copy/pickle 등)이다
+        if name.startswith("__") or name in ("_module_path", "_class_name", "_instance", "_lock"):
+            raise AttributeError(name)
+        return getattr(self.get(), name)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.loaded else "not loaded"
+        return f"<LazyService {self._module_path}.{self._class_name} ({state})>"
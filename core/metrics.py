@@ -0,0 +1,459 @@
+"""
+Metrics - 도구 / Graph API 호출 계측 (Prometheus text format)
+
+생성된 MCP 서버(Jinja 템플릿)와 Graph*Query 클라이언트가 공유하는 경량 계측 계층.
+외부 의존성 없이 고정 버킷 히스토그램(bisect + 증가)만 사용하므로 운영 환경에서도 켜 둘 수 있다.
+MCP_METRICS=0 이면 기록하지 않는다.
+
+기록 항목:
+    mcp_tool_calls_total{tool,outcome}           도구 호출 수 (ok / error)
+    mcp_tool_duration_seconds{tool}              도구 전체 처리 시간
+    mcp_tool_phase_seconds{tool,phase}           auth / network / postprocess 분할
+    mcp_tool_graph_calls{tool}                   호출 1회당 Graph 요청 수
+    mcp_tool_response_bytes{tool}                도구 응답 크기
+    mcp_graph_requests_total{method,endpoint,status}
+    mcp_graph_request_seconds{method,endpoint}   요청 시작 ~ 응답 헤더
+    mcp_graph_response_bytes_total{method,endpoint}
+
+endpoint 라벨은 사용자/ID/경로 세그먼트를 {user}, {id}, {path} 로 바꾼 URL 템플릿이다.
+network 시간은 도구 호출 중 Graph 요청 구간(요청 시작 ~ 본문 수신)의 합집합이라
+병렬 페이지 요청이 겹쳐도 벽시계 기준으로 계산되고, postprocess 는 나머지 시간이다.
+
+사용 예시:
+    # 생성된 서버 (tools/call)
+    with track_tool(tool_name) as invocation:
+        result = await handler(arguments)
+        invocation.record_response(text, result)
+
+    # Graph*Query 클라이언트
+    with track_auth():
+        token = await self.token_provider.validate_and_refresh_token(user_email)
+    async with aiohttp.ClientSession(trace_configs=graph_trace_configs()) as session:
+        ...
+
+    # /health/metrics
+    PlainTextResponse(render_metrics(), media_type=PROMETHEUS_CONTENT_TYPE)
+"""
+
+import os
+import re
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+METRICS_ENABLED = os.environ.get("MCP_METRICS", "1").strip().lower() not in ("0", "false", "off", "no")
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+BYTES_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+# 라벨 조합이 폭증해도 메모리가 늘지 않도록 패밀리당 시계열 수 제한
+MAX_SERIES = 2000
+_OVERFLOW_LABEL = "_other_"
+
+
+class Histogram:
+    """고정 버킷 히스토그램"""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # 마지막 칸은 +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """버킷 내 선형 보간으로 분위수 추정 (Prometheus histogram_quantile 과 같은 방식)"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            if cumulative + bucket_count >= rank and bucket_count:
+                if index == len(self.buckets):
+                    return float(self.buckets[-1])
+                lower = self.buckets[index - 1] if index else 0.0
+                upper = self.buckets[index]
+                return lower + (upper - lower) * (rank - cumulative) / bucket_count
+            cumulative += bucket_count
+        return float(self.buckets[-1])
+
+
+class Counter:
+    """단조 증가 카운터"""
+
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount: float = 1) -> None:
+        self.value += amount
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _format_labels(pairs: Sequence[Tuple[str, str]]) -> str:
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape_label(value)}"' for name, value in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == int(value):
+        return str(int(value))
+    return repr(float(value))
+
+
+class MetricFamily:
+    """이름 + 라벨 이름이 같은 시계열 묶음"""
+
+    def __init__(self, name: str, help_text: str, kind: str, labelnames: Sequence[str],
+                 buckets: Optional[Sequence[float]] = None):
+        self.name = name
+        self.help = help_text
+        self.kind = kind
+        self.labelnames = tuple(labelnames)
+        self.buckets = buckets
+        self.series: Dict[Tuple[str, ...], Any] = {}
+
+    def labels(self, *values: str):
+        series = self.series.get(values)
+        if series is None:
+            if len(self.series) >= MAX_SERIES:
+                values = (_OVERFLOW_LABEL,) * len(self.labelnames)
+                series = self.series.get(values)
+                if series is not None:
+                    return series
+            series = Histogram(self.buckets) if self.kind == "histogram" else Counter()
+            self.series[values] = series
+        return series
+
+    def render(self, lines: List[str]) -> None:
+        if not self.series:
+            return
+        lines.append(f"# HELP {self.name} {self.help}")
+        lines.append(f"# TYPE {self.name} {self.kind}")
+        for values, series in sorted(self.series.items()):
+            pairs = list(zip(self.labelnames, values))
+            if self.kind == "counter":
+                lines.append(f"{self.name}{_format_labels(pairs)} {_format_value(series.value)}")
+                continue
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, series.counts):
+                cumulative += bucket_count
+                lines.append(f"{self.name}_bucket{_format_labels(pairs + [('le', _format_value(bound))])} {cumulative}")
+            lines.append(f"{self.name}_bucket{_format_labels(pairs + [('le', '+Inf')])} {series.count}")
+            lines.append(f"{self.name}_sum{_format_labels(pairs)} {_format_value(series.sum)}")
+            lines.append(f"{self.name}_count{_format_labels(pairs)} {series.count}")
+
+
+class MetricsRegistry:
+    """프로세스 전역 메트릭 저장소"""
+
+    def __init__(self):
+        self._families: Dict[str, MetricFamily] = {}
+
+    def _family(self, name: str, help_text: str, kind: str, labelnames: Sequence[str],
+                buckets: Optional[Sequence[float]] = None) -> MetricFamily:
+        family = self._families.get(name)
+        if family is None:
+            family = MetricFamily(name, help_text, kind, labelnames, buckets)
+            self._families[name] = family
+        return family
+
+    def histogram(self, name: str, help_text: str, labelnames: Sequence[str],
+                  buckets: Sequence[float] = LATENCY_BUCKETS) -> MetricFamily:
+        return self._family(name, help_text, "histogram", labelnames, buckets)
+
+    def counter(self, name: str, help_text: str, labelnames: Sequence[str]) -> MetricFamily:
+        return self._family(name, help_text, "counter", labelnames)
+
+    def get(self, name: str) -> Optional[MetricFamily]:
+        return self._families.get(name)
+
+    def reset(self) -> None:
+        for family in self._families.values():
+            family.series.clear()
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for family in self._families.values():
+            family.render(lines)
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+REGISTRY = MetricsRegistry()
+
+TOOL_CALLS = REGISTRY.counter("mcp_tool_calls_total", "Tool invocations by outcome", ("tool", "outcome"))
+TOOL_DURATION = REGISTRY.histogram("mcp_tool_duration_seconds", "Tool invocation wall time", ("tool",))
+TOOL_PHASE = REGISTRY.histogram("mcp_tool_phase_seconds", "Tool wall time split into auth, network and postprocess",
+                                ("tool", "phase"))
+TOOL_GRAPH_CALLS = REGISTRY.histogram("mcp_tool_graph_calls", "Graph API requests per tool invocation", ("tool",),
+                                      COUNT_BUCKETS)
+TOOL_RESPONSE_BYTES = REGISTRY.histogram("mcp_tool_response_bytes", "Tool response payload size", ("tool",),
+                                         BYTES_BUCKETS)
+GRAPH_REQUESTS = REGISTRY.counter("mcp_graph_requests_total", "Graph API requests by status",
+                                  ("method", "endpoint", "status"))
+GRAPH_SECONDS = REGISTRY.histogram("mcp_graph_request_seconds", "Graph API time to response headers",
+                                   ("method", "endpoint"))
+GRAPH_BYTES = REGISTRY.counter("mcp_graph_response_bytes_total", "Graph API response body bytes",
+                               ("method", "endpoint"))
+
+
+def render_metrics() -> str:
+    """Prometheus text format (exposition format 0.0.4)"""
+    return REGISTRY.render()
+
+
+def write_metrics_file(path: str) -> bool:
+    """node_exporter textfile collector 용 파일로 저장 (STDIO 서버처럼 HTTP가 없는 경우)"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(render_metrics())
+        os.replace(tmp_path, path)
+        return True
+    except OSError:
+        return False
+
+
+def relabel_metrics(text: str, label: str, value: str, seen_meta: Optional[set] = None) -> List[str]:
+    """다른 프로세스의 메트릭 텍스트에 라벨 추가 (멀티 워커 집계용, HELP/TYPE 은 한 번만)"""
+    seen_meta = seen_meta if seen_meta is not None else set()
+    extra = f'{label}="{_escape_label(value)}"'
+    lines = []
+    for line in text.splitlines():
+        if not line:
+            continue
+        if line.startswith("#"):
+            if line not in seen_meta:
+                seen_meta.add(line)
+                lines.append(line)
+            continue
+        name_part, _, sample = line.rpartition(" ")
+        if name_part.endswith("}"):
+            lines.append(f"{name_part[:-1]},{extra}}} {sample}")
+        else:
+            lines.append(f"{name_part}{{{extra}}} {sample}")
+    return lines
+
+
+def _text_bytes(text: str) -> int:
+    return len(text) if text.isascii() else len(text.encode("utf-8"))
+
+
+def payload_bytes(payload: Any) -> int:
+    """도구 응답 크기 (str/bytes, MCP content 블록 목록, {"content": [...]} 지원)"""
+    if payload is None:
+        return 0
+    if isinstance(payload, str):
+        return _text_bytes(payload)
+    if isinstance(payload, (bytes, bytearray)):
+        return len(payload)
+    if isinstance(payload, dict):
+        return payload_bytes(payload.get("content")) if "content" in payload else 0
+    if isinstance(payload, (list, tuple)):
+        total = 0
+        for item in payload:
+            text = item.get("text") if isinstance(item, dict) else getattr(item, "text", None)
+            if isinstance(text, str):
+                total += _text_bytes(text)
+        return total
+    return 0
+
+
+# ============================================================
+# Tool invocation tracking
+# ============================================================
+
+class ToolInvocation:
+    """도구 호출 1회의 측정값 (contextvar 로 Graph 클라이언트와 공유)"""
+
+    __slots__ = ("tool", "started", "auth_seconds", "graph_calls", "spans", "response_bytes", "failed")
+
+    def __init__(self, tool: str):
+        self.tool = tool
+        self.started = time.perf_counter()
+        self.auth_seconds = 0.0
+        self.graph_calls = 0
+        self.spans: List[List[float]] = []  # Graph 요청 [시작, 끝]
+        self.response_bytes: Optional[int] = None
+        self.failed = False
+
+    def record_response(self, payload: Any, result: Any = None) -> None:
+        """응답 크기 기록 (result 가 {"status": "error"} 이면 error 로 집계)"""
+        self.response_bytes = payload_bytes(payload)
+        if isinstance(result, dict) and result.get("status") == "error":
+            self.failed = True
+
+    def fail(self) -> None:
+        self.failed = True
+
+    def network_seconds(self) -> float:
+        """겹치는 Graph 요청 구간을 합쳐 계산한 벽시계 시간"""
+        total = 0.0
+        current_start = current_end = None
+        for start, end in sorted(self.spans):
+            if current_end is None or start > current_end:
+                if current_end is not None:
+                    total += current_end - current_start
+                current_start, current_end = start, end
+            elif end > current_end:
+                current_end = end
+        if current_end is not None:
+            total += current_end - current_start
+        return total
+
+    def finish(self) -> None:
+        total = time.perf_counter() - self.started
+        network = self.network_seconds()
+        tool = self.tool
+        TOOL_CALLS.labels(tool, "error" if self.failed else "ok").inc()
+        TOOL_DURATION.labels(tool).observe(total)
+        TOOL_PHASE.labels(tool, "auth").observe(self.auth_seconds)
+        TOOL_PHASE.labels(tool, "network").observe(network)
+        TOOL_PHASE.labels(tool, "postprocess").observe(max(0.0, total - self.auth_seconds - network))
+        TOOL_GRAPH_CALLS.labels(tool).observe(self.graph_calls)
+        if self.response_bytes is not None:
+            TOOL_RESPONSE_BYTES.labels(tool).observe(self.response_bytes)
+
+
+_CURRENT_TOOL: ContextVar[Optional[ToolInvocation]] = ContextVar("mcp_current_tool", default=None)
+
+
+def current_tool() -> Optional[ToolInvocation]:
+    return _CURRENT_TOOL.get()
+
+
+@contextmanager
+def track_tool(tool_name: str) -> Iterator[ToolInvocation]:
+    """도구 호출 측정 (예외가 전파되면 error 로 기록)"""
+    invocation = ToolInvocation(tool_name)
+    token = _CURRENT_TOOL.set(invocation)
+    try:
+        yield invocation
+    except BaseException:
+        invocation.failed = True
+        raise
+    finally:
+        _CURRENT_TOOL.reset(token)
+        if METRICS_ENABLED:
+            invocation.finish()
+
+
+@contextmanager
+def track_auth() -> Iterator[None]:
+    """토큰 획득/갱신 시간을 현재 도구 호출의 auth 구간으로 기록"""
+    invocation = _CURRENT_TOOL.get()
+    if invocation is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        invocation.auth_seconds += time.perf_counter() - started
+
+
+# ============================================================
+# Graph API request tracking (aiohttp TraceConfig)
+# ============================================================
+
+_GRAPH_VERSION_SEGMENTS = ("v1.0", "beta")
+_DRIVE_PATH = re.compile(r"root:.*?(:|$)")
+_ID_CHARS = re.compile(r"[0-9=\-_]")
+
+
+def graph_endpoint(path: str) -> str:
+    """Graph URL 경로를 낮은 카디널리티의 템플릿으로 변환
+
+    /v1.0/users/a@b.com/messages/AAMkAD...= -> /users/{user}/messages/{id}
+    """
+    path = _DRIVE_PATH.sub(lambda m: "root:{path}" + m.group(1), path)
+    segments = []
+    previous = ""
+    for segment in path.split("/"):
+        if not segment or segment in _GRAPH_VERSION_SEGMENTS:
+            continue
+        if previous == "users":
+            segment = "{user}"
+        elif "(" in segment:
+            segment = segment.split("(", 1)[0] + "(...)"
+        elif "@" in segment or segment.isdigit() or (len(segment) >= 16 and _ID_CHARS.search(segment)):
+            segment = "{id}"
+        segments.append(segment)
+        previous = segment
+    return "/" + "/".join(segments)
+
+
+async def _on_request_start(_session, ctx, params) -> None:
+    ctx.started = time.perf_counter()
+    ctx.endpoint = graph_endpoint(params.url.path)
+    ctx.span = None
+    invocation = _CURRENT_TOOL.get()
+    if invocation is not None:
+        invocation.graph_calls += 1
+        ctx.span = [ctx.started, ctx.started]
+        invocation.spans.append(ctx.span)
+
+
+async def _on_request_end(_session, ctx, params) -> None:
+    now = time.perf_counter()
+    GRAPH_SECONDS.labels(params.method, ctx.endpoint).observe(now - ctx.started)
+    GRAPH_REQUESTS.labels(params.method, ctx.endpoint, str(params.response.status)).inc()
+    if ctx.span is not None:
+        ctx.span[1] = now
+
+
+async def _on_response_chunk(_session, ctx, params) -> None:
+    # ClientResponse.read() (json()/text() 포함)가 본문 수신 완료 시 호출
+    GRAPH_BYTES.labels(params.method, ctx.endpoint).inc(len(params.chunk))
+    if ctx.span is not None:
+        ctx.span[1] = time.perf_counter()
+
+
+async def _on_request_exception(_session, ctx, params) -> None:
+    GRAPH_REQUESTS.labels(params.method, ctx.endpoint, "exception").inc()
+    if ctx.span is not None:
+        ctx.span[1] = time.perf_counter()
+
+
+_TRACE_CONFIGS: Optional[list] = None
+
+
+def graph_trace_configs() -> list:
+    """aiohttp.ClientSession(trace_configs=...) 인자
+
+    메트릭(MCP_METRICS=0 이면 제외)과 요청 tracing(core.tracing, exporter 가 없으면 no-op) TraceConfig.
+    """
+    global _TRACE_CONFIGS
+    if _TRACE_CONFIGS is None:
+        import aiohttp
+
+        from .tracing import http_trace_config
+
+        configs = []
+        if METRICS_ENABLED:
+            trace_config = aiohttp.TraceConfig()  # 요청마다 SimpleNamespace ctx
+            trace_config.on_request_start.append(_on_request_start)
+            trace_config.on_request_end.append(_on_request_end)
+            trace_config.on_response_chunk_received.append(_on_response_chunk)
+            trace_config.on_request_exception.append(_on_request_exception)
+            trace_config.freeze()
+            configs.append(trace_config)
+        configs.append(http_trace_config())
+        _TRACE_CONFIGS = configs
+    return _TRACE_CONFIGS
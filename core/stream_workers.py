@@ -0,0 +1,456 @@
+"""
+Stream Workers - Streamable HTTP 서버 멀티 프로세스 실행 (세션 고정 프록시)
+
+`StreamableHTTPSessionManager`는 세션(Mcp-Session-Id)을 프로세스 메모리에 보관하므로
+uvicorn --workers 처럼 요청을 아무 워커에 분배하면 세션이 깨진다.
+이 모듈은 같은 서버 스크립트를 워커 프로세스로 N개 다시 실행하고(각자 unix 소켓,
+AF_UNIX가 없으면 루프백 포트), 앞단의 aiohttp 프록시가 요청을 워커로 전달한다.
+
+라우팅:
+    - Mcp-Session-Id 없는 요청(initialize): 세션/진행 중 요청이 가장 적은 워커
+    - 응답의 Mcp-Session-Id 헤더로 세션 → 워커 매핑을 학습
+    - 이후 같은 세션 요청은 항상 같은 워커로 전달 (SSE 응답은 그대로 스트리밍)
+    - DELETE 성공 / 워커 404 / 워커 재시작 / 장시간 미사용 시 매핑 제거
+
+/health 는 모든 워커의 /health 를 모아 워커별 pid, 세션 수, 요청/오류 수와 함께 반환하고,
+/health/metrics 는 워커별 Prometheus 메트릭에 worker 라벨을 붙여 합친다.
+토큰은 워커 간 공유 SQLite(auth.db, WAL 모드)에 저장되므로 별도 공유 캐시는 없다.
+
+사용 예시 (생성된 server_stream.py 의 run()):
+    bind = worker_bind()
+    if bind:                                   # 프록시가 띄운 워커
+        uvicorn.run(app, **bind)
+    elif workers > 1:
+        run_stream_workers(workers, host, port)
+    else:
+        uvicorn.run(app, host=host, port=port)
+"""
+
+import asyncio
+import json
+import logging
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+from aiohttp import web
+
+from core.metrics import PROMETHEUS_CONTENT_TYPE, relabel_metrics
+
+logger = logging.getLogger(__name__)
+
+# 워커 프로세스 환경 변수 (프록시가 설정)
+WORKER_SOCKET_ENV = "MCP_STREAM_WORKER_SOCKET"
+WORKER_PORT_ENV = "MCP_STREAM_WORKER_PORT"
+WORKER_INDEX_ENV = "MCP_STREAM_WORKER_INDEX"
+
+SESSION_HEADER = "mcp-session-id"
+
+# StreamableHTTPSessionManager 기본 session_idle_timeout 과 같게 맞춤
+SESSION_IDLE_TIMEOUT = 1800.0
+WORKER_START_TIMEOUT = 60.0
+WORKER_STOP_TIMEOUT = 10.0
+
+# 프록시가 그대로 전달하지 않는 hop-by-hop 헤더
+_HOP_HEADERS = frozenset({
+    "connection", "keep-alive", "proxy-authenticate", "proxy-authorization",
+    "te", "trailers", "transfer-encoding", "upgrade", "content-length",
+})
+
+_SESSION_NOT_FOUND = json.dumps({
+    "jsonrpc": "2.0",
+    "id": "server-error",
+    "error": {"code": -32600, "message": "Session not found"},
+})
+
+
+def worker_bind() -> Optional[Dict[str, Any]]:
+    """프록시가 띄운 워커라면 uvicorn.run() 바인딩 인자, 아니면 None"""
+    socket_path = os.environ.get(WORKER_SOCKET_ENV)
+    if socket_path:
+        return {"uds": socket_path}
+    port = os.environ.get(WORKER_PORT_ENV)
+    if port:
+        return {"host": "127.0.0.1", "port": int(port)}
+    return None
+
+
+def worker_index() -> Optional[int]:
+    """워커 번호 (단일 프로세스 실행이면 None)"""
+    index = os.environ.get(WORKER_INDEX_ENV)
+    return int(index) if index else None
+
+
+def _worker_command() -> List[str]:
+    """현재 프로세스와 같은 명령 (python -m 실행도 유지)"""
+    orig_argv = getattr(sys, "orig_argv", None)
+    if orig_argv:
+        return [sys.executable, *orig_argv[1:]]
+    return [sys.executable, *sys.argv]
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class _Worker:
+    """워커 프로세스 하나와 그 워커로 가는 HTTP 연결, 요청 통계"""
+
+    def __init__(self, index: int, socket_dir: Optional[str]):
+        self.index = index
+        self.socket_path = os.path.join(socket_dir, f"worker{index}.sock") if socket_dir else None
+        self.port = None if socket_dir else _free_port()
+        self.process: Optional[subprocess.Popen] = None
+        self.client: Optional[aiohttp.ClientSession] = None
+        self.restarts = 0
+        self.sessions = 0
+        self.inflight = 0
+        self.requests = 0
+        self.errors = 0
+        self.busy_seconds = 0.0
+
+    @property
+    def base_url(self) -> str:
+        if self.socket_path:
+            return "http://worker"
+        return f"http://127.0.0.1:{self.port}"
+
+    @property
+    def alive(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+
+    def start(self) -> None:
+        env = dict(os.environ)
+        env[WORKER_INDEX_ENV] = str(self.index)
+        if self.socket_path:
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+            env[WORKER_SOCKET_ENV] = self.socket_path
+        else:
+            env[WORKER_PORT_ENV] = str(self.port)
+        self.process = subprocess.Popen(_worker_command(), env=env)
+
+        if self.client is None:
+            connector = aiohttp.UnixConnector(path=self.socket_path) if self.socket_path else aiohttp.TCPConnector()
+            self.client = aiohttp.ClientSession(
+                connector=connector,
+                auto_decompress=False,
+                timeout=aiohttp.ClientTimeout(total=None, sock_connect=10),
+            )
+
+    async def wait_ready(self, timeout: float = WORKER_START_TIMEOUT) -> bool:
+        """워커 /health 가 응답할 때까지 대기"""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if not self.alive:
+                return False
+            try:
+                async with self.client.get(f"{self.base_url}/health") as resp:
+                    if resp.status == 200:
+                        return True
+            except (aiohttp.ClientError, OSError):
+                pass
+            await asyncio.sleep(0.2)
+        return False
+
+    async def metrics(self) -> Optional[str]:
+        try:
+            async with self.client.get(f"{self.base_url}/health/metrics", timeout=aiohttp.ClientTimeout(total=5)) as resp:
+                if resp.status == 200:
+                    return await resp.text()
+        except (aiohttp.ClientError, asyncio.TimeoutError, OSError):
+            pass
+        return None
+
+    async def health(self) -> Optional[Dict[str, Any]]:
+        try:
+            async with self.client.get(f"{self.base_url}/health", timeout=aiohttp.ClientTimeout(total=5)) as resp:
+                if resp.status == 200:
+                    return await resp.json()
+        except (aiohttp.ClientError, asyncio.TimeoutError, OSError, ValueError):
+            pass
+        return None
+
+    def stop(self) -> None:
+        if self.alive:
+            self.process.terminate()
+
+    def wait_stopped(self, timeout: float = WORKER_STOP_TIMEOUT) -> None:
+        if self.process is None:
+            return
+        try:
+            self.process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+
+    async def close(self) -> None:
+        if self.client is not None:
+            await self.client.close()
+            self.client = None
+        if self.socket_path and os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+
+class StreamWorkerProxy:
+    """세션 고정 프록시 + 워커 감시 (재시작)"""
+
+    def __init__(self, workers: int, session_idle_timeout: float = SESSION_IDLE_TIMEOUT):
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        self._socket_dir = tempfile.mkdtemp(prefix="mcp-stream-") if hasattr(socket, "AF_UNIX") else None
+        self.workers = [_Worker(index, self._socket_dir) for index in range(workers)]
+        self.session_idle_timeout = session_idle_timeout
+        # session id -> (worker, last seen monotonic time)
+        self._sessions: Dict[str, List[Any]] = {}
+        self._next_worker = 0
+        self._stopping = False
+        self._started_at = time.time()
+
+    # ------------------------------------------------------------
+    # Session routing
+    # ------------------------------------------------------------
+
+    def _pick_worker(self) -> _Worker:
+        """새 세션: 세션 + 진행 중 요청이 가장 적은 워커 (동률이면 라운드 로빈)"""
+        count = len(self.workers)
+        candidates = [self.workers[(self._next_worker + offset) % count] for offset in range(count)]
+        alive = [worker for worker in candidates if worker.alive] or candidates
+        worker = min(alive, key=lambda w: w.sessions + w.inflight)
+        self._next_worker = (worker.index + 1) % count
+        return worker
+
+    def _bind_session(self, session_id: str, worker: _Worker) -> None:
+        entry = self._sessions.get(session_id)
+        if entry is None:
+            self._sessions[session_id] = [worker, time.monotonic()]
+            worker.sessions += 1
+        else:
+            entry[1] = time.monotonic()
+
+    def _drop_session(self, session_id: str) -> None:
+        entry = self._sessions.pop(session_id, None)
+        if entry is not None:
+            entry[0].sessions -= 1
+
+    def _drop_worker_sessions(self, worker: _Worker) -> None:
+        for session_id in [sid for sid, entry in self._sessions.items() if entry[0] is worker]:
+            self._drop_session(session_id)
+
+    def _prune_idle_sessions(self) -> None:
+        """워커 쪽 idle timeout 으로 사라진 세션 매핑 정리"""
+        cutoff = time.monotonic() - self.session_idle_timeout
+        for session_id in [sid for sid, entry in self._sessions.items() if entry[1] < cutoff]:
+            self._drop_session(session_id)
+
+    # ------------------------------------------------------------
+    # HTTP handlers
+    # ------------------------------------------------------------
+
+    async def handle_proxy(self, request: web.Request) -> web.StreamResponse:
+        session_id = request.headers.get(SESSION_HEADER)
+        if session_id:
+            entry = self._sessions.get(session_id)
+            if entry is None:
+                return web.Response(status=404, text=_SESSION_NOT_FOUND, content_type="application/json")
+            worker = entry[0]
+            entry[1] = time.monotonic()
+        else:
+            worker = self._pick_worker()
+
+        headers = {k: v for k, v in request.headers.items() if k.lower() not in _HOP_HEADERS}
+        body = await request.read()
+
+        worker.inflight += 1
+        worker.requests += 1
+        started = time.perf_counter()
+        response: Optional[web.StreamResponse] = None
+        try:
+            async with worker.client.request(
+                request.method,
+                f"{worker.base_url}{request.rel_url}",
+                headers=headers,
+                data=body or None,
+                allow_redirects=False,
+            ) as upstream:
+                new_session_id = upstream.headers.get(SESSION_HEADER)
+                if new_session_id and upstream.status < 400:
+                    self._bind_session(new_session_id, worker)
+                if session_id and (upstream.status == 404 or (request.method == "DELETE" and upstream.status < 300)):
+                    self._drop_session(session_id)
+                if upstream.status >= 500:
+                    worker.errors += 1
+
+                response = web.StreamResponse(status=upstream.status, reason=upstream.reason)
+                for key, value in upstream.headers.items():
+                    if key.lower() not in _HOP_HEADERS:
+                        response.headers.add(key, value)
+                await response.prepare(request)
+                # SSE 스트림은 받은 청크를 그대로 전달
+                try:
+                    async for chunk in upstream.content.iter_any():
+                        await response.write(chunk)
+                    await response.write_eof()
+                except ConnectionResetError:
+                    pass  # 클라이언트가 먼저 연결을 닫음 (예: GET SSE 스트림 종료)
+                return response
+        except (aiohttp.ClientError, OSError) as e:
+            worker.errors += 1
+            logger.warning(f"Worker {worker.index} request failed: {e}")
+            if response is not None and response.prepared:
+                return response  # 응답 도중 워커 연결이 끊김
+            return web.json_response({"status": "error", "error": f"worker {worker.index} unavailable"}, status=502)
+        finally:
+            worker.inflight -= 1
+            worker.busy_seconds += time.perf_counter() - started
+
+    async def handle_health(self, _request: web.Request) -> web.Response:
+        """모든 워커 /health 집계"""
+        healths = await asyncio.gather(*(worker.health() for worker in self.workers))
+        summary: Dict[str, Any] = {}
+        worker_reports = []
+        for worker, health in zip(self.workers, healths):
+            if health and not summary:
+                # 서버 공통 정보(server, protocol, tool_count ...)는 첫 번째 정상 워커 기준
+                summary.update({k: v for k, v in health.items() if k not in ("pid", "worker", "uptime_seconds")})
+            worker_reports.append({
+                "index": worker.index,
+                "pid": worker.process.pid if worker.process else None,
+                "alive": worker.alive,
+                "healthy": health is not None,
+                "restarts": worker.restarts,
+                "sessions": worker.sessions,
+                "inflight": worker.inflight,
+                "requests": worker.requests,
+                "errors": worker.errors,
+                "busy_seconds": round(worker.busy_seconds, 3),
+                "health": health,
+            })
+
+        healthy = sum(1 for report in worker_reports if report["healthy"])
+        summary.update({
+            "status": "healthy" if healthy == len(self.workers) else ("degraded" if healthy else "unhealthy"),
+            "mode": "multi-worker",
+            "pid": os.getpid(),
+            "uptime_seconds": round(time.time() - self._started_at, 1),
+            "workers_total": len(self.workers),
+            "workers_healthy": healthy,
+            "sessions": len(self._sessions),
+            "requests": sum(worker.requests for worker in self.workers),
+            "errors": sum(worker.errors for worker in self.workers),
+            "workers": worker_reports,
+        })
+        return web.json_response(summary, status=200 if healthy else 503)
+
+    async def handle_metrics(self, _request: web.Request) -> web.Response:
+        """모든 워커 /health/metrics 를 worker 라벨을 붙여 합치고 프록시 통계 추가"""
+        texts = await asyncio.gather(*(worker.metrics() for worker in self.workers))
+        seen_meta: set = set()
+        lines: List[str] = []
+        for worker, text in zip(self.workers, texts):
+            if text:
+                lines.extend(relabel_metrics(text, "worker", str(worker.index), seen_meta))
+
+        proxy_metrics = (
+            ("mcp_proxy_requests_total", "counter", "Requests forwarded to each worker", "requests"),
+            ("mcp_proxy_errors_total", "counter", "Forwarding errors and 5xx responses per worker", "errors"),
+            ("mcp_proxy_busy_seconds_total", "counter", "Time spent forwarding requests per worker", "busy_seconds"),
+            ("mcp_proxy_sessions", "gauge", "MCP sessions pinned to each worker", "sessions"),
+            ("mcp_proxy_inflight", "gauge", "In-flight requests per worker", "inflight"),
+            ("mcp_proxy_worker_restarts_total", "counter", "Worker process restarts", "restarts"),
+        )
+        for name, kind, help_text, attribute in proxy_metrics:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for worker in self.workers:
+                lines.append(f'{name}{{worker="{worker.index}"}} {getattr(worker, attribute)}')
+        return web.Response(text="\n".join(lines) + "\n", headers={"Content-Type": PROMETHEUS_CONTENT_TYPE})
+
+    # ------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------
+
+    async def start_workers(self) -> None:
+        for worker in self.workers:
+            worker.start()
+        ready = await asyncio.gather(*(worker.wait_ready() for worker in self.workers))
+        for worker, ok in zip(self.workers, ready):
+            if not ok:
+                logger.warning(f"Worker {worker.index} did not become ready")
+
+    async def monitor(self, interval: float = 1.0) -> None:
+        """죽은 워커 재시작 (그 워커의 세션 매핑은 제거), 오래된 세션 매핑 정리"""
+        while not self._stopping:
+            await asyncio.sleep(interval)
+            for worker in self.workers:
+                if self._stopping or worker.alive:
+                    continue
+                code = worker.process.returncode if worker.process else None
+                logger.warning(f"Worker {worker.index} exited (code {code}), restarting")
+                self._drop_worker_sessions(worker)
+                worker.restarts += 1
+                worker.start()
+                await worker.wait_ready()
+            self._prune_idle_sessions()
+
+    async def stop_workers(self) -> None:
+        self._stopping = True
+        for worker in self.workers:
+            worker.stop()
+        await asyncio.gather(*(asyncio.to_thread(worker.wait_stopped) for worker in self.workers))
+        for worker in self.workers:
+            await worker.close()
+        if self._socket_dir:
+            try:
+                os.rmdir(self._socket_dir)
+            except OSError:
+                pass
+
+    def build_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/health", self.handle_health)
+        app.router.add_get("/health/metrics", self.handle_metrics)
+        app.router.add_route("*", "/{tail:.*}", self.handle_proxy)
+        return app
+
+    async def serve(self, host: str, port: int) -> None:
+        """워커 시작 → 프록시 서비스 → SIGINT/SIGTERM 시 워커 종료"""
+        await self.start_workers()
+        runner = web.AppRunner(self.build_app(), access_log=None)
+        await runner.setup()
+        site = web.TCPSite(runner, host, port)
+        await site.start()
+        logger.info(f"Multi-worker proxy listening on {host}:{port} with {len(self.workers)} workers")
+
+        stop_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop_event.set)
+            except (NotImplementedError, RuntimeError):
+                pass  # Windows: KeyboardInterrupt 로 종료
+
+        monitor_task = asyncio.create_task(self.monitor())
+        try:
+            await stop_event.wait()
+        finally:
+            monitor_task.cancel()
+            await runner.cleanup()
+            await self.stop_workers()
+
+
+def run_stream_workers(workers: int, host: str, port: int) -> None:
+    """현재 서버 스크립트를 workers 개의 워커로 실행하고 host:port 에서 세션 고정 프록시 제공"""
+    proxy = StreamWorkerProxy(workers)
+    try:
+        asyncio.run(proxy.serve(host, port))
+    except KeyboardInterrupt:
+        pass
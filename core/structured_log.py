@@ -0,0 +1,307 @@
+"""
+Structured Log - 핫 패스용 구조화 로깅 (큐 기반 비동기 출력 + 샘플링 + rate limit)
+
+페이지/배치/청크/첨부파일마다 print() 하던 진행 로그를 대체한다.
+- 기록은 QueueHandler 로 큐에 넣기만 하고, 실제 출력(stderr / 파일)은 QueueListener 스레드가 수행
+  → 요청 처리 경로에서 동기 쓰기가 없고, STDIO 서버의 stdout(프로토콜 스트림)에는 절대 쓰지 않음
+- 항목(item) 이벤트: DEBUG 는 샘플링, 모든 레벨은 이벤트 이름별 초당 개수 제한
+- 작업(operation) 1회당 요약 이벤트 1개: duration_ms, 누적 카운터, 억제된 항목 수, request_id
+
+환경 변수:
+    MCP_LOG_LEVEL    기본 INFO (DEBUG 면 항목 이벤트도 출력)
+    MCP_LOG_FORMAT   text (기본) | json
+    MCP_LOG_FILE     추가로 기록할 파일 경로
+    MCP_LOG_SAMPLE   DEBUG 항목 이벤트 샘플링 비율 (기본 1.0)
+    MCP_LOG_RATE     이벤트 이름별 초당 최대 항목 이벤트 수 (기본 20)
+
+사용 예시:
+    log = get_logger(__name__)
+
+    with log.operation("mail.fetch_pages", pages=num_pages) as op:
+        op.item("page", page=1, retrieved=150)                       # DEBUG, 샘플링 + rate limit
+        op.item("page_failed", level=logging.WARNING, page=2, status=429)
+        op.count("emails", 150)
+    # → INFO mail.fetch_pages outcome=ok pages=3 emails=450 duration_ms=812.3 request_id=...
+
+    log.event("metadata.load_failed", level=logging.WARNING, error=str(e))
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
+
+from .tracing import current_request_id
+
+ROOT_LOGGER = "mcp"
+
+_DEFAULT_RATE = 20.0
+_QUEUE_SIZE = 10000
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def _format_value(value: Any) -> str:
+    if isinstance(value, float):
+        return f"{value:.1f}" if abs(value) >= 10 else f"{value:.3g}"
+    text = str(value)
+    return f'"{text}"' if (" " in text or not text) else text
+
+
+class StructuredFormatter(logging.Formatter):
+    """event + fields 를 text(key=value) 또는 JSON 한 줄로 출력"""
+
+    def __init__(self, fmt: str = "text"):
+        super().__init__()
+        self.json = fmt == "json"
+
+    def format(self, record: logging.LogRecord) -> str:
+        event = getattr(record, "event", None) or record.getMessage()
+        fields = getattr(record, "fields", None) or {}
+        if self.json:
+            payload = {
+                "ts": round(record.created, 3),
+                "level": record.levelname,
+                "logger": record.name,
+                "event": event,
+                **fields,
+            }
+            if record.exc_info:
+                payload["exc"] = self.formatException(record.exc_info)
+            return json.dumps(payload, ensure_ascii=False, default=str)
+
+        parts = [self.formatTime(record), record.levelname, record.name, event]
+        parts.extend(f"{key}={_format_value(value)}" for key, value in fields.items())
+        line = " ".join(parts)
+        if record.exc_info:
+            line += "\n" + self.formatException(record.exc_info)
+        return line
+
+
+class _DropQueueHandler(logging.handlers.QueueHandler):
+    """큐가 가득 차면 블로킹 대신 버림 (개수는 dropped 에 기록)"""
+
+    def __init__(self, log_queue: "queue.Queue"):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 포맷은 리스너 스레드에서 수행 (event/fields 는 그대로 전달)
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class RateLimiter:
+    """토큰 버킷 (초당 rate 개, 최대 burst 개 누적)"""
+
+    __slots__ = ("rate", "burst", "tokens", "updated")
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+
+    def allow(self) -> bool:
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return True
+        return False
+
+
+_LOCK = threading.Lock()
+_LISTENER: Optional[logging.handlers.QueueListener] = None
+_QUEUE_HANDLER: Optional[_DropQueueHandler] = None
+_SAMPLE_RATE = 1.0
+_ITEM_RATE = _DEFAULT_RATE
+_LIMITERS: Dict[str, RateLimiter] = {}
+
+
+def configure_logging(level: Optional[str] = None, fmt: Optional[str] = None, log_file: Optional[str] = None,
+                      sample_rate: Optional[float] = None, item_rate: Optional[float] = None,
+                      stream: Any = None) -> logging.Logger:
+    """'mcp' 로거에 큐 핸들러 설치 (다시 호출하면 설정 교체, 인자를 생략하면 환경 변수 사용)"""
+    global _LISTENER, _QUEUE_HANDLER, _SAMPLE_RATE, _ITEM_RATE
+    with _LOCK:
+        root = logging.getLogger(ROOT_LOGGER)
+        if _LISTENER is not None:
+            _LISTENER.stop()
+            root.removeHandler(_QUEUE_HANDLER)
+
+        level = (level or os.environ.get("MCP_LOG_LEVEL", "INFO")).upper()
+        formatter = StructuredFormatter(fmt or os.environ.get("MCP_LOG_FORMAT", "text"))
+        log_file = log_file if log_file is not None else os.environ.get("MCP_LOG_FILE", "")
+        _SAMPLE_RATE = sample_rate if sample_rate is not None else _env_float("MCP_LOG_SAMPLE", 1.0)
+        _ITEM_RATE = item_rate if item_rate is not None else _env_float("MCP_LOG_RATE", _DEFAULT_RATE)
+        _LIMITERS.clear()
+
+        # stdout 은 STDIO 프로토콜 스트림일 수 있으므로 항상 stderr
+        handlers = [logging.StreamHandler(stream or sys.stderr)]
+        if log_file:
+            handlers.append(logging.FileHandler(log_file, encoding="utf-8"))
+        for handler in handlers:
+            handler.setFormatter(formatter)
+
+        log_queue: "queue.Queue" = queue.Queue(_QUEUE_SIZE)
+        _QUEUE_HANDLER = _DropQueueHandler(log_queue)
+        _LISTENER = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=False)
+        _LISTENER.start()
+
+        root.addHandler(_QUEUE_HANDLER)
+        root.setLevel(getattr(logging, level, logging.INFO))
+        root.propagate = False
+        return root
+
+
+def flush_logging() -> None:
+    """큐에 남은 기록을 모두 출력 (리스너 재시작)"""
+    with _LOCK:
+        if _LISTENER is not None:
+            _LISTENER.stop()
+            _LISTENER.start()
+
+
+def _shutdown() -> None:
+    if _LISTENER is not None:
+        _LISTENER.stop()
+
+
+atexit.register(_shutdown)
+
+
+class Operation:
+    """작업 1회 (페이지 조회, 배치 조회, 업로드 등)의 항목 이벤트 + 요약
+
+    생성부터 finish() 까지 현재 작업(contextvar)으로 등록되어, 하위 함수가 자기 로거로 남긴
+    항목 이벤트가 억제되어도 이 작업의 items_suppressed 로 집계된다.
+    """
+
+    __slots__ = ("logger", "name", "fields", "counters", "started", "failed", "suppressed", "token")
+
+    def __init__(self, logger: "StructuredLogger", name: str, fields: Dict[str, Any]):
+        self.logger = logger
+        self.name = name
+        self.fields = fields
+        self.counters: Dict[str, float] = {}
+        self.started = time.perf_counter()
+        self.failed: Optional[str] = None
+        self.suppressed = 0
+        self.token = _CURRENT_OPERATION.set(self)
+
+    def item(self, event: str, level: int = logging.DEBUG, **fields: Any) -> None:
+        """항목 이벤트 '<작업>.<event>' (DEBUG 는 샘플링, 모든 레벨은 rate limit)"""
+        self.logger.item(f"{self.name}.{event}", level, **fields)
+
+    def count(self, key: str, amount: float = 1) -> None:
+        self.counters[key] = self.counters.get(key, 0) + amount
+
+    def set(self, **fields: Any) -> None:
+        self.fields.update(fields)
+
+    def fail(self, reason: Any) -> None:
+        self.failed = str(reason)[:200]
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def finish(self) -> None:
+        """요약 이벤트 1개 기록 (with 블록을 쓰지 않는 경우 직접 호출)"""
+        if self.token is None:
+            return
+        try:
+            _CURRENT_OPERATION.reset(self.token)
+        except ValueError:
+            # 다른 context 에서 종료 (작업이 Task 경계를 넘은 경우)
+            pass
+        self.token = None
+        summary = {"outcome": "error" if self.failed else "ok", **self.fields, **self.counters,
+                   "duration_ms": round(self.elapsed() * 1000, 1)}
+        if self.suppressed:
+            summary["items_suppressed"] = self.suppressed
+        if self.failed:
+            summary["error"] = self.failed
+        self.logger.event(self.name, logging.WARNING if self.failed else logging.INFO, **summary)
+
+    def __enter__(self) -> "Operation":
+        return self
+
+    def __exit__(self, exc_type, exc, _tb) -> bool:
+        if exc is not None and self.failed is None:
+            self.fail(f"{exc_type.__name__}: {exc}")
+        self.finish()
+        return False
+
+
+_CURRENT_OPERATION: ContextVar[Optional[Operation]] = ContextVar("mcp_log_operation", default=None)
+
+
+def current_operation() -> Optional[Operation]:
+    return _CURRENT_OPERATION.get()
+
+
+class StructuredLogger:
+    """logging.Logger 래퍼 (event + fields, request_id 자동 첨부)"""
+
+    __slots__ = ("logger",)
+
+    def __init__(self, logger: logging.Logger):
+        self.logger = logger
+
+    def event(self, event: str, level: int = logging.INFO, exc_info: Any = None, **fields: Any) -> bool:
+        if not self.logger.isEnabledFor(level):
+            return False
+        request_id = current_request_id()
+        if request_id:
+            fields["request_id"] = request_id
+        self.logger.log(level, event, exc_info=exc_info, extra={"event": event, "fields": fields})
+        return True
+
+    def item(self, event: str, level: int = logging.DEBUG, **fields: Any) -> bool:
+        """샘플링 / rate limit 을 거치는 이벤트 (기록했으면 True, 억제 수는 현재 작업에 집계)"""
+        if not self.logger.isEnabledFor(level):
+            return False
+        sampled_out = level < logging.WARNING and _SAMPLE_RATE < 1.0 and random.random() >= _SAMPLE_RATE
+        if not sampled_out:
+            limiter = _LIMITERS.get(event)
+            if limiter is None:
+                limiter = _LIMITERS.setdefault(event, RateLimiter(_ITEM_RATE))
+            if limiter.allow():
+                return self.event(event, level, **fields)
+        operation = _CURRENT_OPERATION.get()
+        if operation is not None:
+            operation.suppressed += 1
+        return False
+
+    def operation(self, name: str, **fields: Any) -> Operation:
+        """작업 시작 (with 블록 또는 finish() 로 요약 이벤트 기록)"""
+        return Operation(self, name, fields)
+
+
+def get_logger(name: str) -> StructuredLogger:
+    """'mcp.<name>' 구조화 로거 (첫 호출 시 configure_logging)"""
+    if _LISTENER is None:
+        configure_logging()
+    if name != ROOT_LOGGER and not name.startswith(ROOT_LOGGER + "."):
+        name = f"{ROOT_LOGGER}.{name}"
+    return StructuredLogger(logging.getLogger(name))
@@ -0,0 +1,136 @@
+"""
+Tool Manifest - tool_definition_templates.yaml 사전 컴파일
+
+YAML 파싱 + boolean 스키마 변환 결과를 YAML 옆의 JSON 매니페스트
+(tool_definition_templates.manifest.json)에 저장해 서버 시작 시에는 json.loads만 수행한다.
+매니페스트는 YAML 내용 해시로 검증되며 YAML이 바뀌면 다시 만들어진다.
+생성된 MCP 서버와 서버 생성기(generate_universal_server.py)가 같은 모듈을 import한다.
+
+사용 예시:
+    tools = load_tool_manifest(yaml_path)     # 서버 시작 / hot reload
+    refresh_tool_manifest(yaml_path)          # 생성기: 없거나 오래된 매니페스트만 다시 작성
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+TOOL_MANIFEST_VERSION = 1
+TOOL_MANIFEST_SUFFIX = ".manifest.json"
+
+
+def _convert_boolean_schema_to_enabled_disabled(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert boolean type properties to enabled/disabled enum for OpenAI compatibility.
+
+    OpenAI API does not support boolean type in function parameters.
+    This converts at runtime:
+        type: boolean, default: true  -> type: string, enum: ["enabled", "disabled"], default: "enabled"
+        type: boolean, default: false -> type: string, enum: ["enabled", "disabled"], default: "disabled"
+    """
+    if not isinstance(schema, dict):
+        return schema
+
+    result = dict(schema)
+
+    if 'properties' in result:
+        new_properties = {}
+        for prop_name, prop_def in result['properties'].items():
+            if isinstance(prop_def, dict) and prop_def.get('type') == 'boolean':
+                new_prop = dict(prop_def)
+                new_prop['type'] = 'string'
+                new_prop['enum'] = ['enabled', 'disabled']
+                if 'default' in new_prop:
+                    new_prop['default'] = 'enabled' if new_prop['default'] else 'disabled'
+                new_properties[prop_name] = new_prop
+            elif isinstance(prop_def, dict) and prop_def.get('type') == 'object':
+                new_properties[prop_name] = _convert_boolean_schema_to_enabled_disabled(prop_def)
+            else:
+                new_properties[prop_name] = prop_def
+        result['properties'] = new_properties
+
+    return result
+
+
+def tool_manifest_path(yaml_path: Path) -> Path:
+    """Manifest file stored next to the YAML"""
+    return yaml_path.with_name(yaml_path.stem + TOOL_MANIFEST_SUFFIX)
+
+
+def _parse_tool_yaml(data: bytes) -> List[Dict[str, Any]]:
+    """Parse tool definitions YAML and convert boolean schemas"""
+    import yaml  # only needed when the manifest is missing or stale
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    tools = (yaml.load(data, Loader=loader) or {}).get("tools", [])
+
+    # Convert boolean types to enabled/disabled for OpenAI compatibility
+    for tool in tools:
+        if 'inputSchema' in tool:
+            tool['inputSchema'] = _convert_boolean_schema_to_enabled_disabled(tool['inputSchema'])
+    return tools
+
+
+def _read_tool_manifest(yaml_path: Path, digest: str) -> Optional[List[Dict[str, Any]]]:
+    """Return manifest tools if the manifest matches the YAML content, else None"""
+    try:
+        manifest = json.loads(tool_manifest_path(yaml_path).read_bytes())
+    except (OSError, ValueError):
+        return None
+    if manifest.get("version") != TOOL_MANIFEST_VERSION or manifest.get("source_sha1") != digest:
+        return None
+    return manifest.get("tools")
+
+
+def _write_tool_manifest(yaml_path: Path, digest: str, tools: List[Dict[str, Any]]) -> bool:
+    """Write the manifest atomically; False if tools have no exact JSON form or the directory is read-only"""
+    try:
+        text = json.dumps({
+            "version": TOOL_MANIFEST_VERSION,
+            "source": yaml_path.name,
+            "source_sha1": digest,
+            "tools": tools
+        }, ensure_ascii=False)
+    except (TypeError, ValueError):
+        return False
+    # e.g. YAML dates or non-string keys would not load back identically
+    if json.loads(text)["tools"] != tools:
+        return False
+
+    manifest_path = tool_manifest_path(yaml_path)
+    tmp_path = manifest_path.with_name(f"{manifest_path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(text, encoding="utf-8")
+        os.replace(tmp_path, manifest_path)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        return False
+    return True
+
+
+def load_tool_manifest(yaml_path: Path) -> List[Dict[str, Any]]:
+    """Load tools from the manifest, rebuilding it from the YAML when stale"""
+    data = yaml_path.read_bytes()
+    digest = hashlib.sha1(data).hexdigest()
+    tools = _read_tool_manifest(yaml_path, digest)
+    if tools is None:
+        tools = _parse_tool_yaml(data)
+        _write_tool_manifest(yaml_path, digest, tools)
+    return tools
+
+
+def refresh_tool_manifest(yaml_path: Path) -> bool:
+    """Rebuild the manifest if it is missing or stale
+
+    Returns:
+        True if the manifest was written
+    """
+    data = yaml_path.read_bytes()
+    digest = hashlib.sha1(data).hexdigest()
+    if _read_tool_manifest(yaml_path, digest) is not None:
+        return False
+    return _write_tool_manifest(yaml_path, digest, _parse_tool_yaml(data))
@@ -0,0 +1,679 @@
+"""
+Tracing - 요청 단위 span 계측 (서비스 → Graph 클라이언트 → Graph HTTP)
+
+도구 호출 1회(요청)마다 요청 ID(contextvar)를 발급하고, 그 안에서 열린 span 을
+부모-자식 트리로 모은 뒤 루트 span 이 끝나면 한 번에 내보낸다.
+asyncio Task 는 생성 시점의 context 를 복사하므로 gather() 로 나눈 병렬 요청도
+호출한 span 의 자식으로 기록된다.
+
+exporter (둘 다 없으면 span 은 만들지 않고 요청 ID 만 발급):
+    MCP_TRACE_FILE           span 1개 = JSON 1줄로 추가 기록 (멀티 워커도 같은 파일 공유 가능)
+    MCP_TRACE_OTLP_ENDPOINT  OTLP/HTTP JSON 수집기 (예: http://127.0.0.1:4318 → /v1/traces)
+    MCP_TRACE_SERVICE        service.name (생성된 서버는 서버 이름으로 설정)
+    MCP_TRACE_MIN_MS         루트 span 이 이 시간보다 짧은 요청은 버림 (기본 0)
+
+내보내기는 백그라운드 스레드에서 수행하므로 이벤트 루프를 막지 않는다.
+
+사용 예시:
+    # 생성된 서버 (tools/call)
+    with trace_request(f"tools/call {tool_name}", tool=tool_name):
+        result = await handler(arguments)
+
+    # 서비스 / 클라이언트 메서드
+    @traced()
+    async def batch_fetch_by_ids(self, ...): ...
+
+    # 임의 구간
+    with span("base64.decode", bytes=len(content_bytes)):
+        file_content = base64.b64decode(content_bytes)
+
+    # Graph HTTP 요청 span 은 core.metrics.graph_trace_configs() 에 포함된 TraceConfig 가 기록
+
+CLI:
+    python -m core.tracing summary traces.jsonl --top 5       # 느린 요청 flame 요약
+    python -m core.tracing collector --port 4318 --output traces.jsonl   # OTLP 수집기 대용
+"""
+
+import atexit
+import functools
+import inspect
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+_EXPORT_QUEUE_SIZE = 1000
+_OTLP_TIMEOUT = 5.0
+_MAX_ATTR_LENGTH = 200
+
+
+def _new_id(nbytes: int) -> str:
+    return os.urandom(nbytes).hex()
+
+
+class Span:
+    """실행 구간 1개 (시작/끝은 perf_counter, 기록 시 epoch 로 변환)"""
+
+    __slots__ = ("trace", "span_id", "parent_id", "name", "kind", "wall_start", "start", "end", "attrs", "error")
+
+    def __init__(self, trace: "_Trace", name: str, parent_id: Optional[str], attrs: Dict[str, Any],
+                 kind: str = "internal"):
+        self.trace = trace
+        self.span_id = _new_id(8)
+        self.parent_id = parent_id
+        self.name = name
+        self.kind = kind
+        self.wall_start = time.time()
+        self.start = time.perf_counter()
+        self.end: Optional[float] = None
+        self.attrs = attrs
+        self.error: Optional[str] = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attrs[key] = value
+
+    def record_error(self, error: Any) -> None:
+        self.error = str(error)[:_MAX_ATTR_LENGTH] or type(error).__name__
+
+    def finish(self) -> None:
+        if self.end is None:
+            self.end = time.perf_counter()
+            self.trace.spans.append(self)
+
+    def to_record(self) -> Dict[str, Any]:
+        end = self.end if self.end is not None else time.perf_counter()
+        record = {
+            "trace_id": self.trace.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "start": round(self.wall_start, 6),
+            "duration_ms": round((end - self.start) * 1000, 3),
+            "status": "error" if self.error else "ok",
+            "service": _SERVICE_NAME,
+            "pid": os.getpid(),
+            "attrs": {key: _attr_value(value) for key, value in self.attrs.items()},
+        }
+        if self.error:
+            record["error"] = self.error
+        return record
+
+
+class _Trace:
+    """요청 1개의 span 모음 (루트 span 종료 시 내보냄)"""
+
+    __slots__ = ("trace_id", "spans")
+
+    def __init__(self, trace_id: str):
+        self.trace_id = trace_id
+        self.spans: List[Span] = []
+
+
+def _attr_value(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    text = str(value)
+    return text if len(text) <= _MAX_ATTR_LENGTH else text[:_MAX_ATTR_LENGTH] + "..."
+
+
+_REQUEST_ID: ContextVar[Optional[str]] = ContextVar("mcp_request_id", default=None)
+_CURRENT_SPAN: ContextVar[Optional[Span]] = ContextVar("mcp_current_span", default=None)
+
+
+def current_request_id() -> Optional[str]:
+    """현재 요청 ID (trace_request 밖이면 None)"""
+    return _REQUEST_ID.get()
+
+
+def current_span() -> Optional[Span]:
+    return _CURRENT_SPAN.get()
+
+
+def set_span_attribute(key: str, value: Any) -> None:
+    """현재 span 에 속성 추가 (tracing 이 꺼져 있으면 무시)"""
+    active = _CURRENT_SPAN.get()
+    if active is not None:
+        active.attrs[key] = value
+
+
+def record_span_error(error: Any) -> None:
+    """현재 span 을 error 로 표시 (예외를 잡아 응답으로 바꾸는 경우)"""
+    active = _CURRENT_SPAN.get()
+    if active is not None:
+        active.record_error(error)
+
+
+# ============================================================
+# Exporters
+# ============================================================
+
+class JsonlSpanExporter:
+    """span 을 JSON Lines 파일에 추가 (요청 1개 = write 1회)"""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def export(self, records: List[Dict[str, Any]]) -> None:
+        data = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(data)
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": "" if value is None else str(value)}
+
+
+def to_otlp(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """JSONL span 레코드 → OTLP/HTTP JSON (ExportTraceServiceRequest)"""
+    by_service: Dict[str, List[Dict[str, Any]]] = {}
+    for record in records:
+        start_ns = int(record["start"] * 1e9)
+        span_json = {
+            "traceId": record["trace_id"],
+            "spanId": record["span_id"],
+            "name": record["name"],
+            "kind": 3 if record.get("kind") == "client" else 1,  # SPAN_KIND_CLIENT / INTERNAL
+            "startTimeUnixNano": str(start_ns),
+            "endTimeUnixNano": str(start_ns + int(record["duration_ms"] * 1e6)),
+            "attributes": [{"key": key, "value": _otlp_value(value)} for key, value in record.get("attrs", {}).items()],
+            "status": {"code": 2, "message": record.get("error", "")} if record.get("status") == "error" else {"code": 1},
+        }
+        if record.get("parent_id"):
+            span_json["parentSpanId"] = record["parent_id"]
+        by_service.setdefault(record.get("service", "mcp"), []).append(span_json)
+
+    return {"resourceSpans": [{
+        "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": service}}]},
+        "scopeSpans": [{"scope": {"name": "core.tracing"}, "spans": spans}],
+    } for service, spans in by_service.items()]}
+
+
+def from_otlp(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """OTLP/HTTP JSON → JSONL span 레코드 (collector 대용 / summary 입력용)"""
+    records = []
+    for resource_spans in payload.get("resourceSpans", []):
+        service = "mcp"
+        for attr in resource_spans.get("resource", {}).get("attributes", []):
+            if attr.get("key") == "service.name":
+                service = attr.get("value", {}).get("stringValue", service)
+        for scope_spans in resource_spans.get("scopeSpans", []):
+            for span_json in scope_spans.get("spans", []):
+                start_ns = int(span_json.get("startTimeUnixNano", 0))
+                end_ns = int(span_json.get("endTimeUnixNano", start_ns))
+                attrs = {}
+                for attr in span_json.get("attributes", []):
+                    value = attr.get("value", {})
+                    if "intValue" in value:
+                        attrs[attr["key"]] = int(value["intValue"])
+                    else:
+                        attrs[attr["key"]] = next(iter(value.values()), None)
+                status = span_json.get("status", {})
+                record = {
+                    "trace_id": span_json.get("traceId"),
+                    "span_id": span_json.get("spanId"),
+                    "parent_id": span_json.get("parentSpanId") or None,
+                    "name": span_json.get("name", ""),
+                    "kind": "client" if span_json.get("kind") == 3 else "internal",
+                    "start": start_ns / 1e9,
+                    "duration_ms": (end_ns - start_ns) / 1e6,
+                    "status": "error" if status.get("code") == 2 else "ok",
+                    "service": service,
+                    "attrs": attrs,
+                }
+                if status.get("code") == 2:
+                    record["error"] = status.get("message", "")
+                records.append(record)
+    return records
+
+
+class OtlpSpanExporter:
+    """OTLP/HTTP JSON 으로 POST (OpenTelemetry Collector, Jaeger, `collector` CLI 등)"""
+
+    def __init__(self, endpoint: str):
+        endpoint = endpoint.rstrip("/")
+        self.url = endpoint if endpoint.endswith("/v1/traces") else endpoint + "/v1/traces"
+
+    def export(self, records: List[Dict[str, Any]]) -> None:
+        import urllib.request
+
+        body = json.dumps(to_otlp(records)).encode("utf-8")
+        request = urllib.request.Request(self.url, data=body, headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(request, timeout=_OTLP_TIMEOUT) as response:
+            response.read()
+
+
+class _ExportWorker:
+    """exporter 호출을 담당하는 데몬 스레드 (큐가 차면 요청 단위로 버림)"""
+
+    def __init__(self):
+        self.queue: "queue.Queue[Optional[List[Dict[str, Any]]]]" = queue.Queue(maxsize=_EXPORT_QUEUE_SIZE)
+        self.dropped = 0
+        self.failed = 0
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def submit(self, records: List[Dict[str, Any]]) -> None:
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="mcp-trace-export", daemon=True)
+                    self._thread.start()
+        try:
+            self.queue.put_nowait(records)
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self) -> None:
+        while True:
+            records = self.queue.get()
+            try:
+                if records:
+                    for exporter in list(_EXPORTERS):
+                        try:
+                            exporter.export(records)
+                        except Exception as e:
+                            self.failed += 1
+                            if self.failed <= 3:
+                                print(f"[tracing] {type(exporter).__name__} export failed: {e}", file=sys.stderr)
+            finally:
+                self.queue.task_done()
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """대기 중인 span 을 모두 내보낼 때까지 대기"""
+        deadline = time.monotonic() + timeout
+        while self.queue.unfinished_tasks:
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+
+_EXPORTERS: List[Any] = []
+_WORKER = _ExportWorker()
+_SERVICE_NAME = os.environ.get("MCP_TRACE_SERVICE", "mcp")
+_MIN_ROOT_MS = float(os.environ.get("MCP_TRACE_MIN_MS", "0") or 0)
+
+
+def configure(service_name: Optional[str] = None, trace_file: Optional[str] = None,
+              otlp_endpoint: Optional[str] = None, min_duration_ms: Optional[float] = None) -> bool:
+    """exporter 설정 (인자를 생략하면 환경 변수 사용). exporter 가 하나라도 있으면 True"""
+    global _SERVICE_NAME, _MIN_ROOT_MS
+    if service_name:
+        _SERVICE_NAME = os.environ.get("MCP_TRACE_SERVICE") or service_name
+    if min_duration_ms is not None:
+        _MIN_ROOT_MS = min_duration_ms
+    trace_file = trace_file if trace_file is not None else os.environ.get("MCP_TRACE_FILE", "")
+    otlp_endpoint = otlp_endpoint if otlp_endpoint is not None else os.environ.get("MCP_TRACE_OTLP_ENDPOINT", "")
+
+    exporters: List[Any] = []
+    if trace_file:
+        exporters.append(JsonlSpanExporter(trace_file))
+    if otlp_endpoint:
+        exporters.append(OtlpSpanExporter(otlp_endpoint))
+    _EXPORTERS[:] = exporters
+    return bool(exporters)
+
+
+def tracing_enabled() -> bool:
+    return bool(_EXPORTERS)
+
+
+def flush(timeout: float = 5.0) -> bool:
+    return _WORKER.flush(timeout)
+
+
+def _export_trace(trace: _Trace, root: Span) -> None:
+    if _MIN_ROOT_MS and (root.end - root.start) * 1000 < _MIN_ROOT_MS:
+        return
+    _WORKER.submit([finished.to_record() for finished in trace.spans])
+
+
+# ============================================================
+# Span API
+# ============================================================
+
+def start_span(name: str, attrs: Optional[Dict[str, Any]] = None, kind: str = "internal") -> Optional[Span]:
+    """현재 span 의 자식 span 생성 (contextvar 는 바꾸지 않음, tracing 이 꺼져 있으면 None)"""
+    if not _EXPORTERS:
+        return None
+    parent = _CURRENT_SPAN.get()
+    if parent is not None:
+        return Span(parent.trace, name, parent.span_id, attrs or {}, kind)
+    return Span(_Trace(_REQUEST_ID.get() or _new_id(16)), name, None, attrs or {}, kind)
+
+
+def end_span(active: Span) -> None:
+    """span 종료 (루트 span 이면 요청 전체를 내보냄)"""
+    active.finish()
+    if active.parent_id is None:
+        _export_trace(active.trace, active)
+
+
+@contextmanager
+def span(name: str, **attrs: Any) -> Iterator[Optional[Span]]:
+    """with 블록 구간을 현재 span 의 자식으로 기록 (예외는 error 로 기록 후 전파)"""
+    active = start_span(name, attrs)
+    if active is None:
+        yield None
+        return
+    token = _CURRENT_SPAN.set(active)
+    try:
+        yield active
+    except BaseException as e:
+        active.record_error(e)
+        raise
+    finally:
+        _CURRENT_SPAN.reset(token)
+        end_span(active)
+
+
+@contextmanager
+def trace_request(name: str, request_id: Optional[str] = None, **attrs: Any) -> Iterator[str]:
+    """요청 1개의 루트 span + 요청 ID (tracing 이 꺼져 있어도 요청 ID 는 발급)"""
+    request_id = request_id or _new_id(16)
+    id_token = _REQUEST_ID.set(request_id)
+    try:
+        if not _EXPORTERS:
+            yield request_id
+            return
+        active = Span(_Trace(request_id), name, None, attrs)
+        span_token = _CURRENT_SPAN.set(active)
+        try:
+            yield request_id
+        except BaseException as e:
+            active.record_error(e)
+            raise
+        finally:
+            _CURRENT_SPAN.reset(span_token)
+            end_span(active)
+    finally:
+        _REQUEST_ID.reset(id_token)
+
+
+def traced(name: Optional[str] = None, **attrs: Any) -> Callable:
+    """함수/메서드 호출을 span 으로 기록하는 데코레이터 (기본 이름: Class.method)
+
+    async 함수가 {"success": False} / {"status": "error"} 를 반환하면 error 로 표시한다.
+    """
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if not _EXPORTERS:
+                    return await func(*args, **kwargs)
+                with span(span_name, **attrs) as active:
+                    result = await func(*args, **kwargs)
+                    if active is not None and isinstance(result, dict) and (result.get("success") is False or result.get("status") == "error"):
+                        active.error = str(result.get("error") or result.get("message") or "failed")[:_MAX_ATTR_LENGTH]
+                    return result
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _EXPORTERS:
+                return func(*args, **kwargs)
+            with span(span_name, **attrs):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+# ============================================================
+# Graph HTTP spans (aiohttp TraceConfig, core.metrics.graph_trace_configs 에 포함)
+# ============================================================
+
+async def _on_request_start(_session, ctx, params) -> None:
+    ctx.trace_span = None
+    if not _EXPORTERS:
+        return
+    from .metrics import graph_endpoint
+
+    endpoint = graph_endpoint(params.url.path)
+    ctx.trace_span = start_span(f"{params.method} {endpoint}",
+                                {"http.method": params.method, "http.endpoint": endpoint}, kind="client")
+
+
+async def _on_request_end(_session, ctx, params) -> None:
+    active = getattr(ctx, "trace_span", None)
+    if active is None:
+        return
+    status = params.response.status
+    active.attrs["http.status_code"] = status
+    if status >= 400:
+        active.error = f"HTTP {status}"
+    active.finish()
+
+
+async def _on_response_chunk(_session, ctx, params) -> None:
+    # 본문 수신까지 span 을 연장 (finish 이후에도 루트가 끝나기 전이면 반영됨)
+    active = getattr(ctx, "trace_span", None)
+    if active is not None:
+        active.attrs["http.response_bytes"] = active.attrs.get("http.response_bytes", 0) + len(params.chunk)
+        active.end = time.perf_counter()
+
+
+async def _on_request_exception(_session, ctx, params) -> None:
+    active = getattr(ctx, "trace_span", None)
+    if active is not None:
+        active.record_error(params.exception)
+        active.finish()
+
+
+def http_trace_config():
+    """Graph HTTP 요청을 client span 으로 기록하는 aiohttp.TraceConfig"""
+    import aiohttp
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(_on_request_start)
+    trace_config.on_request_end.append(_on_request_end)
+    trace_config.on_response_chunk_received.append(_on_response_chunk)
+    trace_config.on_request_exception.append(_on_request_exception)
+    trace_config.freeze()
+    return trace_config
+
+
+# ============================================================
+# CLI: flame-style summary / OTLP collector stand-in
+# ============================================================
+
+def load_spans(path: str) -> Dict[str, List[Dict[str, Any]]]:
+    """JSONL 파일 → trace_id 별 span 목록"""
+    traces: Dict[str, List[Dict[str, Any]]] = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            traces.setdefault(record.get("trace_id", ""), []).append(record)
+    return traces
+
+
+def _trace_root(records: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    span_ids = {record["span_id"] for record in records}
+    roots = [record for record in records if not record.get("parent_id") or record["parent_id"] not in span_ids]
+    return max(roots, key=lambda record: record["duration_ms"]) if roots else None
+
+
+def _self_times(records: List[Dict[str, Any]]) -> Dict[str, float]:
+    """span 별 자기 시간 = 길이 - 자식 구간 합집합 (병렬 자식은 겹친 부분을 한 번만 뺌)"""
+    children: Dict[str, List[Dict[str, Any]]] = {}
+    for record in records:
+        children.setdefault(record.get("parent_id") or "", []).append(record)
+    result = {}
+    for record in records:
+        intervals = sorted((c["start"], c["start"] + c["duration_ms"] / 1000) for c in children.get(record["span_id"], []))
+        covered = 0.0
+        current_start = current_end = None
+        for start, end in intervals:
+            if current_end is None or start > current_end:
+                if current_end is not None:
+                    covered += current_end - current_start
+                current_start, current_end = start, end
+            else:
+                current_end = max(current_end, end)
+        if current_end is not None:
+            covered += current_end - current_start
+        result[record["span_id"]] = max(0.0, record["duration_ms"] - covered * 1000)
+    return result
+
+
+def render_flame(records: List[Dict[str, Any]], width: int = 40, max_depth: int = 12) -> List[str]:
+    """trace 1개를 들여쓴 트리 + 타임라인 막대로 표시"""
+    root = _trace_root(records)
+    if root is None:
+        return []
+    children: Dict[str, List[Dict[str, Any]]] = {}
+    for record in records:
+        if record is not root:
+            children.setdefault(record.get("parent_id") or "", []).append(record)
+    total_ms = max(root["duration_ms"], 1e-6)
+    lines = []
+
+    def walk(record: Dict[str, Any], depth: int) -> None:
+        offset = int((record["start"] - root["start"]) * 1000 / total_ms * width)
+        offset = min(max(offset, 0), width - 1)
+        length = max(1, min(width - offset, round(record["duration_ms"] / total_ms * width)))
+        bar = " " * offset + "█" * length + " " * (width - offset - length)
+        marker = " !" if record.get("status") == "error" else ""
+        detail = record.get("attrs", {}).get("http.status_code")
+        detail = f" [{detail}]" if detail is not None else ""
+        lines.append(f"  {record['duration_ms']:9.1f} ms |{bar}| {'  ' * depth}{record['name']}{detail}{marker}")
+        if depth >= max_depth:
+            return
+        for child in sorted(children.get(record["span_id"], []), key=lambda r: r["start"]):
+            walk(child, depth + 1)
+
+    walk(root, 0)
+    return lines
+
+
+def summarize(path: str, top: int = 5, name_filter: str = "", width: int = 40) -> str:
+    """가장 느린 요청 top 개의 flame 트리 + span 이름별 자기 시간 순위"""
+    traces = load_spans(path)
+    rows = []
+    for records in traces.values():
+        root = _trace_root(records)
+        if root is not None and name_filter in root["name"]:
+            rows.append((root["duration_ms"], root, records))
+    rows.sort(key=lambda row: row[0], reverse=True)
+    if not rows:
+        return f"No traces in {path}" + (f" matching '{name_filter}'" if name_filter else "")
+
+    out = [f"{len(rows)} traces in {path}; slowest {min(top, len(rows))}:"]
+    by_name: Dict[str, List[float]] = {}
+    for index, (duration, root, records) in enumerate(rows[:top], 1):
+        started = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(root["start"]))
+        out.append("")
+        out.append(f"[{index}] {duration:.1f} ms  {root['name']}  request={root['trace_id']}  "
+                   f"{started}  spans={len(records)}")
+        out.extend(render_flame(records, width))
+        self_times = _self_times(records)
+        for record in records:
+            stats = by_name.setdefault(record["name"], [0.0, 0.0, 0])
+            stats[0] += self_times[record["span_id"]]
+            stats[1] += record["duration_ms"]
+            stats[2] += 1
+
+    out.append("")
+    out.append(f"Self time by span (top {min(top, len(rows))} traces):")
+    out.append(f"  {'self ms':>10} {'total ms':>10} {'count':>6}  name")
+    for span_name, (self_ms, total_ms, count) in sorted(by_name.items(), key=lambda item: item[1][0], reverse=True)[:15]:
+        out.append(f"  {self_ms:10.1f} {total_ms:10.1f} {count:6d}  {span_name}")
+    return "\n".join(out)
+
+
+def run_collector(host: str, port: int, output: str) -> None:
+    """OTLP/HTTP JSON 수집기 대용: POST /v1/traces 를 JSONL 로 저장"""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    exporter = JsonlSpanExporter(output)
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            if self.path.rstrip("/") != "/v1/traces":
+                self.send_error(404)
+                return
+            try:
+                payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+                records = from_otlp(payload)
+            except ValueError:
+                self.send_error(400, "OTLP JSON expected")
+                return
+            with lock:
+                exporter.export(records)
+            body = b"{}"
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *_args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    print(f"OTLP/HTTP collector on http://{host}:{port}/v1/traces -> {output}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="python -m core.tracing", description="MCP request tracing tools")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    summary_parser = sub.add_parser("summary", help="Flame-style summary of the slowest traced requests")
+    summary_parser.add_argument("file", help="JSONL span file (MCP_TRACE_FILE or collector output)")
+    summary_parser.add_argument("--top", type=int, default=5, help="Number of slowest requests to show")
+    summary_parser.add_argument("--name", default="", help="Only requests whose root span name contains this")
+    summary_parser.add_argument("--width", type=int, default=40, help="Timeline bar width")
+
+    collector_parser = sub.add_parser("collector", help="OTLP/HTTP JSON collector stand-in writing JSONL")
+    collector_parser.add_argument("--host", default="127.0.0.1")
+    collector_parser.add_argument("--port", type=int, default=4318)
+    collector_parser.add_argument("--output", default="traces.jsonl")
+
+    args = parser.parse_args(argv)
+    if args.command == "summary":
+        if not os.path.exists(args.file):
+            print(f"File not found: {args.file}", file=sys.stderr)
+            return 1
+        print(summarize(args.file, args.top, args.name, args.width))
+    else:
+        run_collector(args.host, args.port, args.output)
+    return 0
+
+
+configure()
+atexit.register(flush, 2.0)
+
+if __name__ == "__main__":
+    sys.exit(main())
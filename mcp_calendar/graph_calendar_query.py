@@ -17,6 +17,7 @@ from typing import Dict, Any, List, Optional, Union, TYPE_CHECKING
 from datetime import datetime
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.metrics import graph_trace_configs, track_auth
 
 if TYPE_CHECKING:
     from core.protocols import TokenProviderProtocol
@@ -231,7 +232,8 @@ class GraphCalendarQuery:
         """
         try:
             # TokenProvider handles all token caching and refresh logic
-            access_token = await self.token_provider.validate_and_refresh_token(user_email)
+            with track_auth():
+                access_token = await self.token_provider.validate_and_refresh_token(user_email)
 
             if not access_token:
                 print(f"Failed to get access token for {user_email}")
@@ -272,7 +274,7 @@ class GraphCalendarQuery:
             응답 데이터
         """
         try:
-            async with aiohttp.ClientSession() as session:
+            async with aiohttp.ClientSession(trace_configs=graph_trace_configs()) as session:
                 headers = {
                     "Authorization": f"Bearer {access_token}",
                     "Content-Type": "application/json",
@@ -315,7 +317,7 @@ class GraphCalendarQuery:
             응답 데이터
         """
         try:
-            async with aiohttp.ClientSession() as session:
+            async with aiohttp.ClientSession(trace_configs=graph_trace_configs()) as session:
                 headers = {
                     "Authorization": f"Bearer {access_token}",
                     "Content-Type": "application/json",
@@ -363,7 +365,7 @@ class GraphCalendarQuery:
             응답 데이터
         """
         try:
-            async with aiohttp.ClientSession() as session:
+            async with aiohttp.ClientSession(trace_configs=graph_trace_configs()) as session:
                 headers = {
                     "Authorization": f"Bearer {access_token}",
                     "Content-Type": "application/json",
@@ -410,7 +412,7 @@ class GraphCalendarQuery:
             응답 데이터
         """
         try:
-            async with aiohttp.ClientSession() as session:
+            async with aiohttp.ClientSession(trace_configs=graph_trace_configs()) as session:
                 headers = {
                     "Authorization": f"Bearer {access_token}",
                     "Content-Type": "application/json",
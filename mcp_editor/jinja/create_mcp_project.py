@@ -12,6 +12,13 @@ from typing import Dict, Any, Optional
 import argparse
 import sys
 
+try:
+    from generate_universal_server import write_benchmark_harness
+except ImportError:
+    # Fallback if running from different directory
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from generate_universal_server import write_benchmark_harness
+
 
 class MCPProjectCreator:
     """MCP 프로젝트 생성기"""
@@ -116,11 +123,20 @@ class MCPProjectCreator:
             self._create_env_example(project_dir, service_name)
             result["created_files"].append(str(project_dir / ".env.example"))
 
-            # 12. MCP 에디터 템플릿 파일 생성
+            # 12. 부하 테스트 / 벤치마크 하네스 생성 (로컬 Graph 스텁)
+            bench_file, written = self._create_benchmark(project_dir, service_name)
+            if written:
+                result["created_dirs"].append(str(bench_file.parent))
+                result["created_files"].append(str(bench_file))
+                print(f"[OK] Created benchmark harness: {bench_file.relative_to(self.base_dir)}")
+            else:
+                print(f"[SKIP] Benchmark harness exists: {bench_file.relative_to(self.base_dir)}")
+
+            # 13. MCP 에디터 템플릿 파일 생성
             self._create_editor_template(service_name)
             print(f"[OK] Created mcp_editor template file")
 
-            # 13. generate_editor_config.py 실행하여 editor_config.json 업데이트
+            # 14. generate_editor_config.py 실행하여 editor_config.json 업데이트
             self._run_generate_editor_config()
             print(f"[OK] Updated mcp_editor/editor_config.json via generate_editor_config.py")
 
@@ -136,6 +152,7 @@ class MCPProjectCreator:
             print(f"  6. Use MCP Web Editor to define tools:")
             print(f"     cd mcp_editor && python tool_editor_web.py")
             print(f"  7. Run server: cd mcp_server && python run.py")
+            print(f"  8. Benchmark generated servers: python benchmarks/bench_{service_name}.py")
 
         except Exception as e:
             error_msg = f"Error creating project: {str(e)}"
@@ -853,6 +870,14 @@ LOG_LEVEL=INFO
         except Exception as e:
             print(f"[WARN] Warning: Failed to run generate_editor_config.py: {str(e)}")
 
+    def _create_benchmark(self, project_dir: Path, service_name: str, force: bool = False):
+        """benchmarks/bench_<service>.py 생성 (기존 파일은 force 일 때만 덮어씀, 기존 프로필 재생성에도 사용)
+
+        Returns:
+            (하네스 경로, 기록 여부)
+        """
+        return write_benchmark_harness(project_dir, service_name, "create_mcp_project.py", force=force)
+
     def _create_editor_template(self, service_name: str):
         """MCP 에디터 템플릿 파일 생성"""
         template_dir = self.base_dir / "mcp_editor" / f"mcp_{service_name}"
@@ -882,6 +907,8 @@ Examples:
   %(prog)s calendar --port 8090
   %(prog)s weather --description "Weather service for MCP" --author "John Doe"
   %(prog)s database --port 8100 --no-types
+  %(prog)s outlook --benchmark-only --base-dir ../..
+  %(prog)s outlook --benchmark-only --force --base-dir ../..
         """
     )
 
@@ -916,6 +943,17 @@ Examples:
         help="Base directory for project creation (default: parent directory if run from jinja/)"
     )
 
+    parser.add_argument(
+        "--benchmark-only",
+        action="store_true",
+        help="Only (re)generate benchmarks/bench_<service>.py for an existing project"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Overwrite an existing benchmark harness (edited SCENARIOS / TOOLS are lost)"
+    )
+
     args = parser.parse_args()
 
     # 서비스 이름 검증
@@ -926,6 +964,20 @@ Examples:
     # 프로젝트 생성
     creator = MCPProjectCreator(args.base_dir)
 
+    if args.benchmark_only:
+        project_dir = creator.base_dir / f"mcp_{args.service_name.lower()}"
+        if not project_dir.is_dir():
+            print(f"[ERROR] Project not found: {project_dir}")
+            sys.exit(1)
+        bench_file, written = creator._create_benchmark(project_dir, args.service_name.lower(), force=args.force)
+        if written:
+            print(f"[OK] Created benchmark harness: {bench_file}")
+        elif args.force:
+            print(f"[OK] Benchmark harness unchanged: {bench_file}")
+        else:
+            print(f"[SKIP] Benchmark harness exists (use --force to overwrite): {bench_file}")
+        sys.exit(0)
+
     try:
         result = creator.create_project(
             service_name=args.service_name.lower(),
@@ -3,18 +3,27 @@
 Universal MCP server generator using registry data
 Generates server.py from registry JSON files and universal template
 """
+import copy
+import hashlib
 import json
 import os
+import pickle
 import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 
 SCRIPT_DIR = Path(__file__).resolve().parent  # mcp_editor/jinja/
 EDITOR_DIR = SCRIPT_DIR.parent                 # mcp_editor/
 PROJECT_ROOT = Path(os.environ.get("MCP_EDITOR_ROOT", EDITOR_DIR.parent))  # Connector_auth/
 EDITOR_CONFIG_PATH = EDITOR_DIR / "editor_config.json"
+DEFAULT_TEMPLATE_PATH = SCRIPT_DIR / "python" / "universal_server_template.jinja2"
+TEMPLATE_CACHE_DIR = EDITOR_DIR / ".cache" / "jinja"  # 컴파일된 템플릿 바이트코드
+PROTOCOLS = ['rest', 'stdio', 'stream']
 
 
 def load_editor_config() -> Dict[str, Any]:
@@ -1047,6 +1056,369 @@ def prepare_context(registry: Dict[str, Any], tools: List[Dict[str, Any]], serve
     return context
 
 
+# =============================================================================
+# Generation Engine (cached templates, shared inputs, parallel targets)
+# =============================================================================
+
+_ENVIRONMENTS: Dict[str, Environment] = {}
+_ENVIRONMENTS_LOCK = threading.Lock()
+
+
+def _raise_error(message):
+    """Template filter to raise errors during template rendering"""
+    raise ValueError(message)
+
+
+def get_template_environment(template_dir: str) -> Environment:
+    """Return the cached Jinja2 Environment for a template directory
+
+    템플릿은 프로세스당 한 번만 컴파일되고, 바이트코드는 TEMPLATE_CACHE_DIR에
+    저장되어 CLI / 웹 에디터 / 워커 프로세스가 함께 재사용한다.
+    템플릿 파일이 수정되면 auto_reload로 다시 컴파일된다.
+    """
+    template_dir = os.path.abspath(template_dir)
+    with _ENVIRONMENTS_LOCK:
+        env = _ENVIRONMENTS.get(template_dir)
+        if env is None:
+            bytecode_cache = None
+            try:
+                TEMPLATE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                bytecode_cache = FileSystemBytecodeCache(str(TEMPLATE_CACHE_DIR))
+            except OSError as e:
+                print(f"[WARN] Template bytecode cache disabled: {e}")
+            env = Environment(loader=FileSystemLoader(template_dir), bytecode_cache=bytecode_cache)
+            env.filters['raise_error'] = _raise_error
+            _ENVIRONMENTS[template_dir] = env
+        return env
+
+
+def render_template_file(template_path: str, context: Dict[str, Any]) -> str:
+    """Render a template file with the cached Environment"""
+    env = get_template_environment(os.path.dirname(template_path))
+    return env.get_template(os.path.basename(template_path)).render(**context)
+
+
+def write_if_changed(output_path: str, content: str) -> bool:
+    """Write content only when its hash differs from the existing file
+
+    내용이 같으면 파일을 건드리지 않으므로 mtime 기반 서버 재시작이 발생하지 않는다.
+
+    Returns:
+        True if the file was written
+    """
+    data = content.encode('utf-8')
+    try:
+        with open(output_path, 'rb') as f:
+            if hashlib.sha256(f.read()).digest() == hashlib.sha256(data).digest():
+                return False
+    except OSError:
+        pass
+
+    output_dir = os.path.dirname(output_path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    tmp_path = f"{output_path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, output_path)
+    return True
+
+
+def server_yaml_path(server_name: str, profile_name: Optional[str] = None) -> Path:
+    """Resolve the tool definitions YAML a generated server loads (same order as _load_mcp_tools)"""
+    yaml_path = PROJECT_ROOT / "mcp_editor" / f"mcp_{profile_name or server_name}" / "tool_definition_templates.yaml"
+    if not yaml_path.exists():
+        yaml_path = PROJECT_ROOT / "mcp_editor" / f"mcp_{server_name}" / "tool_definition_templates.yaml"
+    return yaml_path
+
+
+def write_tool_manifest(yaml_path: str) -> bool:
+    """Build the precompiled tool manifest next to a tool definitions YAML if missing or stale
+
+    서버는 시작 시 YAML 대신 이 매니페스트(JSON)를 읽는다.
+
+    Returns:
+        True if the manifest was written
+    """
+    yaml_path = Path(yaml_path)
+    if not yaml_path.exists():
+        return False
+    if str(PROJECT_ROOT) not in sys.path:
+        sys.path.insert(0, str(PROJECT_ROOT))
+    from core.tool_manifest import refresh_tool_manifest
+
+    return refresh_tool_manifest(yaml_path)
+
+
+def benchmark_tool_names(server_name: str) -> List[str]:
+    """Read-only tool names of a profile for the benchmark harness TOOLS list
+
+    core.bench 와 같은 기준(WRITE_TOOL_PATTERN)으로 쓰기 계열 도구는 뺀다.
+    도구 정의가 아직 없으면 빈 목록 (하네스가 실행 시 tools/list 로 고름).
+    """
+    yaml_path = server_yaml_path(server_name)
+    if not yaml_path.exists():
+        return []
+    if str(PROJECT_ROOT) not in sys.path:
+        sys.path.insert(0, str(PROJECT_ROOT))
+    from core.bench import WRITE_TOOL_PATTERN
+
+    return [tool['name'] for tool in load_tool_definitions(str(yaml_path))
+            if isinstance(tool, dict) and tool.get('name') and not WRITE_TOOL_PATTERN.search(tool['name'])]
+
+
+def write_benchmark_harness(server_dir: Path, server_name: str, generator: str,
+                            force: bool = False) -> Tuple[Path, bool]:
+    """Create benchmarks/bench_<server>.py from python/benchmark_harness.jinja2
+
+    하네스는 SCENARIOS / TOOLS 를 직접 고쳐 쓰는 파일이므로 이미 있으면 건너뛰고,
+    force=True 이면 다시 렌더링해 내용이 달라진 경우에만 덮어쓴다.
+
+    Returns:
+        (harness path, True if the file was written)
+    """
+    bench_file = Path(server_dir) / "benchmarks" / f"bench_{server_name}.py"
+    if bench_file.exists() and not force:
+        return bench_file, False
+
+    env = Environment(loader=FileSystemLoader(str(SCRIPT_DIR / "python")))
+    content = env.get_template("benchmark_harness.jinja2").render(
+        server_name=server_name,
+        server_title=f"{server_name.replace('_', ' ').title()} MCP Server",
+        baseline_file=f"baseline_{server_name}.json",
+        generator=generator,
+        tools=benchmark_tool_names(server_name),
+    )
+    written = write_if_changed(str(bench_file), content)
+    if written:
+        bench_file.chmod(0o755)
+    return bench_file, written
+
+
+def server_output_path(server_name: str, protocol: str, output: Optional[str] = None, protocol_count: int = 1) -> str:
+    """Resolve the output file for a protocol
+
+    Args:
+        server_name: Server name
+        protocol: 'rest', 'stdio' or 'stream'
+        output: Output directory or file (default: mcp_{server}/mcp_server/)
+        protocol_count: Number of protocols generated into the same output
+    """
+    filename = f'server_{protocol}.py'
+    if not output:
+        return str(PROJECT_ROOT / f"mcp_{server_name}" / "mcp_server" / filename)
+
+    output_base = Path(output)
+    # Output is a directory - generate filename automatically
+    if output_base.suffix == '' or output_base.is_dir():
+        return str(output_base / filename)
+    # Output is a file path
+    if protocol_count == 1:
+        return output
+    # Multiple protocols but single file specified - append protocol
+    return str(output_base.parent / f'{output_base.stem}_{protocol}{output_base.suffix}')
+
+
+class ServerGenerationEngine:
+    """Generate server files for many profile/protocol targets
+
+    - editor_config.json은 엔진 생성 시 한 번만 로드
+    - registry / tool definitions / Jinja2 context는 프로필당 한 번만 만들어
+      rest / stdio / stream 렌더링에 공유
+    - 템플릿은 get_template_environment()의 캐시된 Environment 사용
+    - 여러 프로필은 워커 프로세스에서 병렬 생성
+    - 렌더링 결과 해시가 기존 파일과 같으면 쓰지 않음
+
+    Target dict keys:
+        server_name, registry_path, tools_path, output_path, protocol_type,
+        port (default 8080), profile_name (default server_name),
+        template_path (default DEFAULT_TEMPLATE_PATH),
+        context (optional prebuilt context, e.g. merged servers)
+    """
+
+    def __init__(self, workers: Optional[int] = None, editor_config: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            workers: Worker processes for multi-profile runs (None: CPU count, 1: in-process)
+            editor_config: Preloaded editor_config.json contents
+        """
+        self.workers = workers
+        self.editor_config = editor_config if editor_config is not None else load_editor_config()
+        self._registries: Dict[str, Dict[str, Any]] = {}
+        self._tools: Dict[str, List[Dict[str, Any]]] = {}
+        self._contexts: Dict[tuple, Dict[str, Any]] = {}
+
+    def load_registry(self, registry_path: str) -> Dict[str, Any]:
+        if registry_path not in self._registries:
+            self._registries[registry_path] = load_registry(registry_path)
+        return self._registries[registry_path]
+
+    def load_tools(self, tools_path: str) -> List[Dict[str, Any]]:
+        if tools_path not in self._tools:
+            self._tools[tools_path] = load_tool_definitions(tools_path)
+        return self._tools[tools_path]
+
+    def build_context(self, server_name: str, registry_path: str, tools_path: str,
+                      port: int = 8080, profile_name: Optional[str] = None) -> Dict[str, Any]:
+        """Build the protocol-independent context for a profile (cached)"""
+        profile_name = profile_name or server_name
+        key = (server_name, profile_name, registry_path, tools_path, port)
+        if key not in self._contexts:
+            service_paths = resolve_service_paths(profile_name, self.editor_config)
+            tools = self.load_tools(tools_path)
+            self._contexts[key] = prepare_context(
+                self.load_registry(registry_path), tools, server_name,
+                extract_internal_args_from_tools(tools), None,
+                extract_service_factors_from_tools(tools),
+                profile_name=profile_name, port=port,
+                base_profile=service_paths.get('base_profile'),
+                base_service_paths=service_paths if service_paths.get('is_derived') else None
+            )
+        return self._contexts[key]
+
+    def render_target(self, target: Dict[str, Any]) -> Dict[str, Any]:
+        """Render and write a single target
+
+        Returns:
+            {"server_name", "protocol", "output_path", "changed", "error"}
+        """
+        result = {
+            'server_name': target['server_name'],
+            'protocol': target['protocol_type'],
+            'output_path': target['output_path'],
+            'changed': False,
+            'error': None
+        }
+        try:
+            base_context = target.get('context') or self.build_context(
+                target['server_name'], target['registry_path'], target['tools_path'],
+                target.get('port', 8080), target.get('profile_name')
+            )
+            # 템플릿이 context를 수정하므로(unique_services.update) 프로토콜마다 복사본 사용
+            context = copy.deepcopy(base_context)
+            context['protocol_type'] = target['protocol_type']
+
+            template_path = str(target.get('template_path') or DEFAULT_TEMPLATE_PATH)
+            rendered = render_template_file(template_path, context)
+            result['changed'] = write_if_changed(target['output_path'], rendered)
+        except Exception as e:
+            result['error'] = f"{type(e).__name__}: {e}"
+        return result
+
+    def _render_group(self, targets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return [self.render_target(target) for target in targets]
+
+    def generate(self, targets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Generate all targets, one worker process per profile group
+
+        Returns:
+            Result dicts in target order (see render_target)
+        """
+        groups: Dict[tuple, List[int]] = {}
+        for index, target in enumerate(targets):
+            key = (target['server_name'], target.get('profile_name'), target.get('registry_path'),
+                   target.get('tools_path'), target.get('port', 8080), id(target.get('context')))
+            groups.setdefault(key, []).append(index)
+        group_indexes = list(groups.values())
+
+        workers = self.workers or os.cpu_count() or 1
+        workers = min(workers, len(group_indexes))
+
+        grouped_results = None
+        if workers > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    grouped_results = list(executor.map(
+                        _render_target_group,
+                        [self.editor_config] * len(group_indexes),
+                        [[targets[i] for i in indexes] for indexes in group_indexes]
+                    ))
+            except (BrokenProcessPool, pickle.PicklingError, AttributeError, OSError) as e:
+                print(f"[WARN] Parallel generation unavailable ({e}), generating in-process")
+
+        if grouped_results is None:
+            grouped_results = [self._render_group([targets[i] for i in indexes]) for indexes in group_indexes]
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(targets)
+        for indexes, group_results in zip(group_indexes, grouped_results):
+            for index, result in zip(indexes, group_results):
+                results[index] = result
+
+        for result in results:
+            if result['error']:
+                print(f"  [ERROR] {result['output_path']}: {result['error']}")
+            elif result['changed']:
+                print(f"  [OK] Generated: {result['output_path']}")
+            else:
+                print(f"  [SKIP] Unchanged: {result['output_path']}")
+
+        # Precompiled tool manifests (one per YAML, shared by all protocols)
+        manifest_paths = {
+            server_yaml_path(target['server_name'], target.get('profile_name'))
+            for target, result in zip(targets, results) if not result['error']
+        }
+        for yaml_path in sorted(manifest_paths):
+            try:
+                if write_tool_manifest(yaml_path):
+                    print(f"  [OK] Tool manifest: {yaml_path.with_name(yaml_path.stem + '.manifest.json')}")
+            except Exception as e:
+                print(f"  [WARN] Tool manifest not written for {yaml_path}: {e}")
+        return results
+
+
+def _render_target_group(editor_config: Dict[str, Any], targets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Worker entry point: render one profile's targets with shared inputs"""
+    return ServerGenerationEngine(workers=1, editor_config=editor_config)._render_group(targets)
+
+
+def generate_all_servers(
+    profiles: Optional[List[str]] = None,
+    protocol: str = 'all',
+    workers: Optional[int] = None,
+    template_path: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """Regenerate servers for all (or selected) editor_config profiles in parallel
+
+    Args:
+        profiles: Profile names (default: all non-merged profiles in editor_config.json)
+        protocol: 'rest', 'stdio', 'stream' or 'all'
+        workers: Worker processes (None: CPU count)
+        template_path: Jinja2 template (default: universal template)
+
+    Returns:
+        Result dicts (see ServerGenerationEngine.render_target)
+    """
+    engine = ServerGenerationEngine(workers=workers)
+    protocols = PROTOCOLS if protocol == 'all' else [protocol]
+
+    targets = []
+    for profile_name in profiles or list(engine.editor_config.keys()):
+        profile_config = engine.editor_config.get(profile_name, {})
+        if profile_config.get('is_merged'):
+            print(f"  Skipping {profile_name}: merged profile (use the merge command)")
+            continue
+
+        registry_path = find_registry_file(profile_name)
+        tools_path = find_tools_file(profile_name)
+        if not registry_path or not tools_path:
+            print(f"  Skipping {profile_name}: {'registry' if not registry_path else 'tool definitions'} not found")
+            continue
+
+        for proto in protocols:
+            targets.append({
+                'server_name': profile_name,
+                'profile_name': profile_name,
+                'registry_path': registry_path,
+                'tools_path': tools_path,
+                'output_path': server_output_path(profile_name, proto),
+                'protocol_type': proto,
+                'port': profile_config.get('port', 8080),
+                'template_path': template_path,
+            })
+
+    return engine.generate(targets)
+
+
 def generate_server(
     template_path: str,
     output_path: str,
@@ -1055,8 +1427,9 @@ def generate_server(
     server_name: str,
     protocol_type: str = 'rest',
     port: int = 8080,
-    profile_name: str = None
-):
+    profile_name: str = None,
+    engine: Optional[ServerGenerationEngine] = None
+) -> bool:
     """Generate server.py from registry and template
 
     Args:
@@ -1068,18 +1441,22 @@ def generate_server(
         protocol_type: Protocol type ('rest', 'stdio', 'stream')
         port: Server port number (default: 8080)
         profile_name: Profile name (defaults to server_name if not provided)
+        engine: Engine whose loaded inputs are reused across calls (e.g. one per protocol)
+
+    Returns:
+        True if output_path was written, False if its content was unchanged
     """
     # Set profile_name to server_name if not provided
     if profile_name is None:
         profile_name = server_name
 
     # Load editor_config and resolve service paths for derived profiles
-    print(f"Loading editor_config.json...")
-    editor_config = load_editor_config()
-    service_paths = resolve_service_paths(profile_name, editor_config)
+    if engine is None:
+        print(f"Loading editor_config.json...")
+        engine = ServerGenerationEngine()
+    service_paths = resolve_service_paths(profile_name, engine.editor_config)
 
     base_profile = service_paths.get('base_profile')
-    base_service_paths = service_paths if service_paths.get('is_derived') else None
 
     if base_profile:
         print(f"  - Derived profile detected: {profile_name} (base: {base_profile})")
@@ -1099,18 +1476,14 @@ def generate_server(
         for f in service_files:
             print(f"      - {f}")
 
-    # Load registry and tools
+    # Load registry and tools (cached by the engine)
     print(f"Loading registry from: {registry_path}")
-    registry = load_registry(registry_path)
-
     print(f"Loading tool definitions from: {tools_path}")
-    tools = load_tool_definitions(tools_path)
+    tools = engine.load_tools(tools_path)
 
     # Extract service factors from mcp_service_factors in tool definitions
     print(f"Extracting service factors from mcp_service_factors...")
     service_factors = extract_service_factors_from_tools(tools)
-    internal_args = extract_internal_args_from_tools(tools)  # Legacy format for backward compatibility
-
     if service_factors:
         print(f"  - Extracted service factors for {len(service_factors)} tools")
         for tool_name, factors in service_factors.items():
@@ -1120,38 +1493,29 @@ def generate_server(
     else:
         print("  - No service factors found in mcp_service_factors")
 
-    # Prepare context
-    context = prepare_context(
-        registry, tools, server_name, internal_args, protocol_type, service_factors,
-        profile_name=profile_name, port=port,
-        base_profile=base_profile, base_service_paths=base_service_paths
-    )
-
-    # Setup Jinja2
-    template_dir = os.path.dirname(template_path)
-    env = Environment(loader=FileSystemLoader(template_dir))
+    # Prepare context (shared by all protocols of this profile)
+    context = copy.deepcopy(engine.build_context(server_name, registry_path, tools_path, port, profile_name))
+    context['protocol_type'] = protocol_type
 
-    # Add custom filter to raise errors during template rendering
-    def raise_error(message):
-        raise ValueError(message)
-    env.filters['raise_error'] = raise_error
+    # Render template with the cached Jinja2 environment
+    rendered = render_template_file(template_path, context)
 
-    template = env.get_template(os.path.basename(template_path))
+    # Write output only if the rendered content changed
+    changed = write_if_changed(output_path, rendered)
 
-    # Render template
-    rendered = template.render(**context)
-
-    # Create output directory if needed
-    output_dir = os.path.dirname(output_path)
-    if output_dir:
-        os.makedirs(output_dir, exist_ok=True)
-
-    # Write output
-    with open(output_path, 'w') as f:
-        f.write(rendered)
+    # Precompiled tool manifest next to the YAML the server loads
+    yaml_path = server_yaml_path(server_name, profile_name)
+    try:
+        if write_tool_manifest(yaml_path):
+            print(f"[OK] Tool manifest: {yaml_path.with_name(yaml_path.stem + '.manifest.json')}")
+    except Exception as e:
+        print(f"[WARN] Tool manifest not written for {yaml_path}: {e}")
 
     # Print summary
-    print(f"\n[OK] Generated {output_path} successfully!")
+    if changed:
+        print(f"\n[OK] Generated {output_path} successfully!")
+    else:
+        print(f"\n[SKIP] {output_path} is up to date (content unchanged)")
     print(f"\n[STATS] Summary:")
     print(f"  - Server: {server_name}")
     print(f"  - Protocol: {protocol_type}")
@@ -1168,6 +1532,8 @@ def generate_server(
         impl = tool.get('implementation', {})
         print(f"  - {tool.get('name', 'unknown')} -> {impl.get('class_name', '?')}.{impl.get('method', '?')}()")
 
+    return changed
+
 
 def find_registry_file(server_name: str) -> Optional[str]:
     """Find registry file for a given server"""
@@ -1657,62 +2023,50 @@ def generate_merged_server(
     # Step 5: Generate server files
     print("\n[INFO] Step 5: Generating server files...")
 
-    protocols_to_generate = ['rest', 'stdio', 'stream'] if protocol == 'all' else [protocol]
-    template_path = str(SCRIPT_DIR / "python" / "universal_server_template.jinja2")
+    protocols_to_generate = PROTOCOLS if protocol == 'all' else [protocol]
 
+    # Prepare context once for all protocols
     success_count = 0
-    for proto in protocols_to_generate:
-        output_path = str(merged_server_dir / f"server_{proto}.py")
-
-        try:
-            # Prepare context for merged server
-            service_factors = extract_service_factors_from_tools(merged_tools)
-            internal_args = extract_internal_args_from_tools(merged_tools)
-
-            context = prepare_context(
-                merged_registry,
-                merged_tools,
-                merged_name,
-                internal_args,
-                proto,
-                service_factors,
-                profile_name=merged_name,
-                port=port,
-                base_profile=None,
-                base_service_paths=None
-            )
-
-            # Override type_info with multi-profile types
-            context['type_info']['type_locations'] = type_locations
-
-            # Add merged server metadata
-            context['is_merged_server'] = True
-            context['source_profiles'] = source_profiles
-
-            # Setup Jinja2
-            template_dir = os.path.dirname(template_path)
-            env = Environment(loader=FileSystemLoader(template_dir))
-
-            def raise_error(message):
-                raise ValueError(message)
-            env.filters['raise_error'] = raise_error
+    try:
+        service_factors = extract_service_factors_from_tools(merged_tools)
+        internal_args = extract_internal_args_from_tools(merged_tools)
+
+        context = prepare_context(
+            merged_registry,
+            merged_tools,
+            merged_name,
+            internal_args,
+            None,
+            service_factors,
+            profile_name=merged_name,
+            port=port,
+            base_profile=None,
+            base_service_paths=None
+        )
 
-            template = env.get_template(os.path.basename(template_path))
+        # Override type_info with multi-profile types
+        context['type_info']['type_locations'] = type_locations
 
-            # Render template
-            rendered = template.render(**context)
+        # Add merged server metadata
+        context['is_merged_server'] = True
+        context['source_profiles'] = source_profiles
 
-            # Write output
-            with open(output_path, 'w') as f:
-                f.write(rendered)
+        engine = ServerGenerationEngine(workers=1)
+        results = engine.generate([
+            {
+                'server_name': merged_name,
+                'output_path': str(merged_server_dir / f"server_{proto}.py"),
+                'protocol_type': proto,
+                'context': context,
+            }
+            for proto in protocols_to_generate
+        ])
+        success_count = sum(1 for result in results if not result['error'])
 
-            print(f"  [OK] Generated: {output_path}")
-            success_count += 1
-
-        except Exception as e:
-            print(f"  [ERROR] Failed to generate {proto}: {e}")
-            import traceback
-            traceback.print_exc()
+    except Exception as e:
+        print(f"  [ERROR] Failed to prepare merged server context: {e}")
+        import traceback
+        traceback.print_exc()
 
     # Step 6: Print summary
     print(f"\n{'='*60}")
@@ -1758,7 +2112,7 @@ if __name__ == "__main__":
     generate_parser.add_argument("--registry", help="Path to registry JSON file (auto-detected if not specified)")
     generate_parser.add_argument("--tools", help="Path to tool definitions file (auto-detected if not specified)")
     generate_parser.add_argument("--template", help="Path to Jinja2 template",
-                                  default=str(SCRIPT_DIR / "python" / "universal_server_template.jinja2"))
+                                  default=str(DEFAULT_TEMPLATE_PATH))
     generate_parser.add_argument("--output", help="Output path for generated server.py")
 
     # =========================================================================
@@ -1773,6 +2127,15 @@ if __name__ == "__main__":
     merge_parser.add_argument("--prefix", choices=['auto', 'always', 'none'], default='auto',
                               help="Tool name prefix mode: auto=on conflict, always=always add, none=no prefix (default: auto)")
 
+    # =========================================================================
+    # Generate-all command
+    # =========================================================================
+    all_parser = subparsers.add_parser('generate-all', help='Regenerate all profiles in parallel')
+    all_parser.add_argument("--profiles", help="Comma-separated profiles (default: all in editor_config.json)")
+    all_parser.add_argument("--protocol", choices=['rest', 'stdio', 'stream', 'all'], default='all',
+                            help="Protocol type (default: all)")
+    all_parser.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+
     # For backward compatibility: if no subcommand, treat first arg as server_name
     args, unknown = parser.parse_known_args()
 
@@ -1787,7 +2150,7 @@ if __name__ == "__main__":
             legacy_parser.add_argument("--protocol", choices=['rest', 'stdio', 'stream', 'all'], default='rest')
             legacy_parser.add_argument("--registry", help="Path to registry JSON file")
             legacy_parser.add_argument("--tools", help="Path to tool definitions file")
-            legacy_parser.add_argument("--template", default=str(SCRIPT_DIR / "python" / "universal_server_template.jinja2"))
+            legacy_parser.add_argument("--template", default=str(DEFAULT_TEMPLATE_PATH))
             legacy_parser.add_argument("--output", help="Output path for generated server.py")
             args = legacy_parser.parse_args()
             args.command = 'generate'
@@ -1818,6 +2181,19 @@ if __name__ == "__main__":
 
         sys.exit(0 if success else 1)
 
+    # =========================================================================
+    # Handle GENERATE-ALL command
+    # =========================================================================
+    if args.command == 'generate-all':
+        profiles = [p.strip() for p in args.profiles.split(',')] if args.profiles else None
+        results = generate_all_servers(profiles, protocol=args.protocol, workers=args.workers)
+
+        failed = [r for r in results if r['error']]
+        changed = sum(1 for r in results if r['changed'])
+        print(f"\n[INFO] {len(results)} targets: {changed} written, "
+              f"{len(results) - changed - len(failed)} unchanged, {len(failed)} failed")
+        sys.exit(1 if failed else 0)
+
     # =========================================================================
     # Handle GENERATE command
     # =========================================================================
@@ -1837,7 +2213,7 @@ if __name__ == "__main__":
 
     # Generate all protocols or specific one
     if args.protocol == 'all':
-        protocols_to_generate = ['rest', 'stdio', 'stream']
+        protocols_to_generate = PROTOCOLS
     else:
         protocols_to_generate = [args.protocol]
 
@@ -1845,41 +2221,15 @@ if __name__ == "__main__":
     success_count = 0
     failed_protocols = []
 
+    # Inputs and the compiled template are shared by all protocols
+    engine = ServerGenerationEngine()
+
     for protocol in protocols_to_generate:
         # Always use universal template for all protocols
-        template_path = args.template or str(SCRIPT_DIR / "python" / "universal_server_template.jinja2")
-
-        # Determine output path
-        if args.output:
-            output_base = Path(args.output)
-            # Check if output is a directory or file
-            if output_base.suffix == '' or output_base.is_dir():
-                # Output is a directory - generate filename automatically
-                if protocol == 'rest':
-                    filename = 'server_rest.py'  # Changed for consistency
-                else:
-                    filename = f'server_{protocol}.py'
-                output_path = str(output_base / filename)
-            else:
-                # Output is a file path
-                if len(protocols_to_generate) == 1:
-                    output_path = args.output
-                else:
-                    # Multiple protocols but single file specified - append protocol
-                    base = output_base.stem
-                    ext = output_base.suffix
-                    if protocol == 'rest':
-                        filename = f'{base}_rest{ext}'
-                    else:
-                        filename = f'{base}_{protocol}{ext}'
-                    output_path = str(output_base.parent / filename)
-        else:
-            # Default: mcp_{server}/mcp_server/server_{protocol}.py
-            if protocol == 'rest':
-                filename = 'server_rest.py'  # Changed for consistency
-            else:
-                filename = f'server_{protocol}.py'
-            output_path = str(PROJECT_ROOT / f"mcp_{args.server_name}" / "mcp_server" / filename)
+        template_path = args.template or str(DEFAULT_TEMPLATE_PATH)
+
+        # Determine output path (default: mcp_{server}/mcp_server/server_{protocol}.py)
+        output_path = server_output_path(args.server_name, protocol, args.output, len(protocols_to_generate))
 
         # Generate server
         try:
@@ -1893,7 +2243,8 @@ if __name__ == "__main__":
                 tools_path=tools_path,
                 template_path=template_path,
                 output_path=output_path,
-                protocol_type=protocol
+                protocol_type=protocol,
+                engine=engine
             )
             success_count += 1
         except Exception as e:
@@ -9,6 +9,14 @@ from pathlib import Path
 from typing import Dict, Any, Optional
 from jinja2 import Environment, FileSystemLoader
 import shutil
+import sys
+
+try:
+    from generate_universal_server import write_benchmark_harness
+except ImportError:
+    # Fallback if running from different directory
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from generate_universal_server import write_benchmark_harness
 
 
 class MCPServerScaffold:
@@ -220,6 +228,15 @@ MCP_TOOLS: List[Dict[str, Any]] = [
             self._create_server_template(server_name)
             print(f"[OK] Created Jinja2 template")
 
+            # 11. Create load-test / benchmark harness (local Graph stub)
+            bench_file, written = self._create_benchmark(server_dir, server_name)
+            if written:
+                result["created_dirs"].append(str(bench_file.parent))
+                result["created_files"].append(str(bench_file))
+                print(f"[OK] Created: {bench_file}")
+            else:
+                print(f"[SKIP] Exists: {bench_file}")
+
             print("\n" + "=" * 60)
             print(f"[OK] Successfully created MCP server: {server_name}")
             print(f"\nNext steps:")
@@ -228,6 +245,7 @@ MCP_TOOLS: List[Dict[str, Any]] = [
             print(f"  3. pip install fastapi uvicorn pydantic")
             print(f"  4. Edit tools via: cd ../../mcp_editor && ./run_tool_editor.sh")
             print(f"  5. Select '{server_name}' profile in web editor")
+            print(f"  6. Benchmark generated servers: python mcp_{server_name}/benchmarks/bench_{server_name}.py")
 
         except Exception as e:
             error_msg = f"Error creating server: {str(e)}"
@@ -266,6 +284,16 @@ MCP_TOOLS: List[Dict[str, Any]] = [
         with open(config_file, 'w') as f:
             json.dump(config, f, indent=2)
 
+    def _create_benchmark(self, server_dir: Path, server_name: str, force: bool = False):
+        """Create benchmarks/bench_<server>.py from the shared harness template
+
+        An existing harness is kept unless force is set.
+
+        Returns:
+            (harness path, True if the file was written)
+        """
+        return write_benchmark_harness(server_dir, server_name, "scaffold_generator.py", force=force)
+
     def _create_server_template(self, server_name: str):
         """Create a Jinja2 template for server.py generation"""
         template_file = self.jinja_dir / f"{server_name}_server_template.jinja2"
@@ -13,6 +13,7 @@ Structure:
 - registry.py: Scanner and TypeExtractor registries (factory pattern)
 - base.py: Common utilities (Language enum, detect_language, etc.)
 - scanner.py: Unified scanner with re-exports from language-specific modules
+- scan_cache.py: Persistent per-file cache of parsed scan results
 - config_generator.py: Editor configuration generator
 - meta_registry.py: Service metadata registry
 - python/: Python-specific modules
@@ -75,6 +76,7 @@ from .scanner import (
     get_services_map,
     export_services_to_json,
 )
+from .scan_cache import ScanCache, get_scan_cache
 
 # Type extraction modules (for direct access)
 from .python import types as extract_types
@@ -150,6 +152,9 @@ __all__ = [
     "scan_codebase_for_mcp_services",
     "get_services_map",
     "export_services_to_json",
+    # Scan cache
+    "ScanCache",
+    "get_scan_cache",
     # Type extraction modules
     "extract_types",
     "extract_types_js",
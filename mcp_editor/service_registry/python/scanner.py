@@ -10,6 +10,8 @@ Functions:
 - _default_to_value: Convert AST default value to JSON-serializable value
 - _extract_parameters: Extract parameter info from function definition
 - signature_from_parameters: Build signature string from parameters
+- imports_from_tree: Map imported names to their source module
+- find_mcp_services_in_python_tree: Find @mcp_service functions in a parsed module
 - find_mcp_services_in_python_file: Find all @mcp_service decorated functions
 
 Classes:
@@ -32,6 +34,8 @@ __all__ = [
     "_extract_parameters",
     "signature_from_parameters",
     "MCPServiceExtractor",
+    "imports_from_tree",
+    "find_mcp_services_in_python_tree",
     "find_mcp_services_in_python_file",
 ]
 
@@ -262,16 +266,40 @@ class MCPServiceExtractor(ast.NodeVisitor):
         return re.sub("([a-z0-9])([A-Z])", r"\1_\2", s1).lower()
 
 
+def imports_from_tree(tree: ast.AST) -> Dict[str, str]:
+    """Map imported names to their source module in a parsed module.
+
+    e.g., {"FilterParams": "outlook_types", "Optional": "typing"}
+    """
+    imports: Dict[str, str] = {}
+
+    for node in ast.walk(tree):
+        # from module import name1, name2
+        if isinstance(node, ast.ImportFrom):
+            module = node.module or ""
+            for alias in node.names:
+                imports[alias.asname or alias.name] = module
+
+        # import module
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                imports[alias.asname or alias.name] = alias.name
+
+    return imports
+
+
+def find_mcp_services_in_python_tree(tree: ast.AST, file_path: str) -> Dict[str, Dict[str, Any]]:
+    """Find all @mcp_service decorated functions in an already parsed module."""
+    extractor = MCPServiceExtractor(file_path)
+    extractor.visit(tree)
+    return extractor.services
+
+
 def find_mcp_services_in_python_file(file_path: str) -> Dict[str, Dict[str, Any]]:
     """Find all @mcp_service decorated functions in a Python file."""
     try:
         content = Path(file_path).read_text(encoding="utf-8")
-        tree = ast.parse(content)
-
-        extractor = MCPServiceExtractor(file_path)
-        extractor.visit(tree)
-
-        return extractor.services
+        return find_mcp_services_in_python_tree(ast.parse(content), file_path)
     except Exception as exc:  # pragma: no cover - defensive logging
         print(f"Error parsing {file_path}: {exc}")
         return {}
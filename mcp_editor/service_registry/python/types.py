@@ -251,7 +251,19 @@ def extract_class_properties(file_path: str) -> Dict[str, Dict[str, Any]]:
     with open(file_path, "r", encoding="utf-8") as f:
         source = f.read()
 
-    tree = ast.parse(source)
+    return extract_class_properties_from_tree(ast.parse(source), file_path)
+
+
+def extract_class_properties_from_tree(tree: ast.AST, file_path: str) -> Dict[str, Dict[str, Any]]:
+    """Extract BaseModel class properties from an already parsed module.
+
+    Args:
+        tree: Parsed module AST
+        file_path: Source file path recorded in the result
+
+    Returns:
+        Same structure as extract_class_properties()
+    """
     classes_info: Dict[str, Dict[str, Any]] = {}
 
     for node in ast.walk(tree):
@@ -0,0 +1,254 @@
+"""
+Scan Cache - Persistent per-file cache of parsed scanner results.
+
+Each source file is parsed once and everything the registry pipeline needs
+from it is stored together:
+
+- Python: @mcp_service services, import table, class locations, BaseModel
+  properties (one ast.parse for all four)
+- JavaScript/TypeScript: JSDoc and esprima services
+
+Entries are keyed by absolute path and validated by (mtime_ns, size). When the
+stat changes, the content hash decides whether the file really changed
+(e.g. touched or checked out again) before it is re-parsed, so regenerating
+registries or opening the editor on an unchanged tree only costs one stat
+call per file.
+
+Usage:
+    cache = get_scan_cache()
+    entries = cache.refresh(paths, workers=4)   # parse stale files in parallel
+    entry = cache.get("/path/to/outlook_types.py")
+    cache.save()
+
+The cache file defaults to mcp_editor/.cache/scan_cache.json and can be moved
+with the MCP_SCAN_CACHE environment variable.
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from .base import Language, detect_language
+from .python.scanner import find_mcp_services_in_python_tree, imports_from_tree
+from .python.types import extract_class_properties_from_tree
+from .javascript.scanner import (
+    ESPRIMA_AVAILABLE,
+    find_jsdoc_mcp_services_in_js_file,
+    find_mcp_services_in_js_file,
+)
+
+__all__ = [
+    "SCAN_CACHE_VERSION",
+    "DEFAULT_CACHE_PATH",
+    "ScanCache",
+    "get_scan_cache",
+    "parse_source_file",
+]
+
+# Bump when the shape of parsed results changes
+SCAN_CACHE_VERSION = 1
+
+SCAN_CACHE_ENV = "MCP_SCAN_CACHE"
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parent.parent / ".cache" / "scan_cache.json"
+
+
+def parse_source_file(file_path: str) -> Dict[str, Any]:
+    """Parse a source file into a cache entry payload.
+
+    Top-level so it can run in worker processes.
+
+    Args:
+        file_path: Absolute path to a .py/.js/.mjs/.ts/.tsx file
+
+    Returns:
+        Payload with "sha1" and language-specific results; "error" is set if
+        the file could not be read or parsed
+    """
+    try:
+        data = Path(file_path).read_bytes()
+    except OSError as exc:
+        return {"error": str(exc), "services": {}}
+
+    payload: Dict[str, Any] = {"sha1": hashlib.sha1(data).hexdigest()}
+    language = detect_language(file_path)
+
+    if language == Language.PYTHON:
+        payload.update(services={}, imports={}, classes={}, models={})
+        try:
+            tree = ast.parse(data.decode("utf-8"))
+        except Exception as exc:
+            print(f"Error parsing {file_path}: {exc}")
+            payload["error"] = str(exc)
+            return payload
+
+        payload["services"] = find_mcp_services_in_python_tree(tree, file_path)
+        payload["imports"] = imports_from_tree(tree)
+        payload["classes"] = {
+            node.name: node.lineno for node in ast.walk(tree) if isinstance(node, ast.ClassDef)
+        }
+        payload["models"] = extract_class_properties_from_tree(tree, file_path)
+
+    elif language in (Language.JAVASCRIPT, Language.TYPESCRIPT):
+        payload["jsdoc_services"] = find_jsdoc_mcp_services_in_js_file(file_path)
+        payload["esprima_services"] = find_mcp_services_in_js_file(file_path)
+
+    return payload
+
+
+class ScanCache:
+    """Persistent (path, mtime, size, content hash) keyed cache of parsed files."""
+
+    def __init__(self, cache_path: Optional[str] = None, persist: bool = True):
+        """
+        Args:
+            cache_path: JSON file to load/save (default: MCP_SCAN_CACHE or DEFAULT_CACHE_PATH)
+            persist: False keeps the cache in memory only
+        """
+        self.cache_path = Path(cache_path or os.environ.get(SCAN_CACHE_ENV) or DEFAULT_CACHE_PATH)
+        self.persist = persist
+        self.stats = {"hits": 0, "rehashed": 0, "parsed": 0}
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._loaded = not persist
+        self._dirty = False
+        self._lock = threading.RLock()
+
+    def _load(self) -> None:
+        """Load the cache file once (ignored if missing, corrupt or outdated)."""
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if data.get("version") != SCAN_CACHE_VERSION or data.get("esprima") != ESPRIMA_AVAILABLE:
+            return
+        self._entries = data.get("files", {})
+
+    def save(self) -> None:
+        """Write the cache file atomically if anything changed."""
+        with self._lock:
+            if not self.persist or not self._dirty:
+                return
+            output = {
+                "version": SCAN_CACHE_VERSION,
+                "esprima": ESPRIMA_AVAILABLE,
+                "files": self._entries,
+            }
+            try:
+                self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.cache_path.with_suffix(".tmp")
+                tmp_path.write_text(json.dumps(output, ensure_ascii=False, default=str), encoding="utf-8")
+                os.replace(tmp_path, self.cache_path)
+                self._dirty = False
+            except OSError as exc:
+                print(f"Warning: Could not write scan cache {self.cache_path}: {exc}")
+
+    def _is_fresh(self, entry: Optional[Dict[str, Any]], stat: os.stat_result) -> bool:
+        return (
+            entry is not None
+            and entry.get("mtime_ns") == stat.st_mtime_ns
+            and entry.get("size") == stat.st_size
+        )
+
+    def _store(self, key: str, stat: os.stat_result, payload: Dict[str, Any]) -> Dict[str, Any]:
+        entry = dict(payload, mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+        self._entries[key] = entry
+        self._dirty = True
+        return entry
+
+    def refresh(self, paths: Iterable[str], workers: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+        """Return up-to-date entries for the given files, parsing only what changed.
+
+        Args:
+            paths: Source file paths
+            workers: Parse stale files in this many worker processes (None/1: in-process)
+
+        Returns:
+            Dictionary of the given path string to its entry (unreadable files omitted)
+        """
+        with self._lock:
+            self._load()
+            result: Dict[str, Dict[str, Any]] = {}
+            to_parse: List[tuple] = []
+
+            for path in paths:
+                key = os.path.abspath(path)
+                try:
+                    stat = os.stat(key)
+                except OSError:
+                    continue
+                entry = self._entries.get(key)
+
+                if self._is_fresh(entry, stat):
+                    self.stats["hits"] += 1
+                    result[path] = entry
+                    continue
+
+                # Stat changed: same content only needs the new stat recorded
+                if entry is not None and entry.get("sha1"):
+                    try:
+                        digest = hashlib.sha1(Path(key).read_bytes()).hexdigest()
+                    except OSError:
+                        continue
+                    if digest == entry["sha1"]:
+                        self.stats["rehashed"] += 1
+                        result[path] = self._store(key, stat, entry)
+                        continue
+
+                to_parse.append((path, key, stat))
+
+            if workers and workers > 1 and len(to_parse) > 1:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    payloads = list(executor.map(parse_source_file, [key for _, key, _ in to_parse]))
+            else:
+                payloads = [parse_source_file(key) for _, key, _ in to_parse]
+
+            for (path, key, stat), payload in zip(to_parse, payloads):
+                if "sha1" not in payload:
+                    continue
+                self.stats["parsed"] += 1
+                result[path] = self._store(key, stat, payload)
+
+            return result
+
+    def get(self, path: str) -> Optional[Dict[str, Any]]:
+        """Return the up-to-date entry for a single file (None if unreadable)."""
+        return self.refresh([path]).get(path)
+
+    def prune(self, base_dir: str, seen: Iterable[str]) -> None:
+        """Drop entries under base_dir that were not seen and no longer exist."""
+        prefix = os.path.join(os.path.abspath(base_dir), "")
+        seen_keys = {os.path.abspath(path) for path in seen}
+        with self._lock:
+            for key in [k for k in self._entries if k.startswith(prefix) and k not in seen_keys]:
+                if not os.path.exists(key):
+                    del self._entries[key]
+                    self._dirty = True
+
+    def clear(self) -> None:
+        """Forget all entries (the file is rewritten on the next save)."""
+        with self._lock:
+            self._loaded = True
+            self._entries = {}
+            self._dirty = True
+
+
+_default_cache: Optional[ScanCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_scan_cache() -> ScanCache:
+    """Return the process-wide persistent scan cache."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ScanCache()
+        return _default_cache
@@ -16,6 +16,8 @@ Core functionality:
 - Function signature extraction (parameters, types, defaults)
 - Decorator metadata extraction (server_name, tool_name, etc.)
 - JSON export for web editor consumption
+- Persistent scan cache: unchanged files are never re-read or re-parsed
+  (see scan_cache.py)
 
 This module serves as the main entry point and re-exports functionality from:
 - scanner_base: Common utilities (Language, detect_language, etc.)
@@ -25,7 +27,6 @@ This module serves as the main entry point and re-exports functionality from:
 
 from __future__ import annotations
 
-import ast
 import json
 import os
 from datetime import datetime
@@ -77,9 +78,10 @@ from .javascript.scanner import (
 )
 
 # Type extractor modules
-from .python import types as extract_types
 from .javascript import types as extract_types_js
 
+from .scan_cache import ScanCache, get_scan_cache
+
 
 # =============================================================================
 # Public API - Re-export all for backward compatibility
@@ -147,6 +149,37 @@ def find_mcp_services_in_file(file_path: str) -> Dict[str, Dict[str, Any]]:
         return {}
 
 
+def _walk_source_files(
+    base_dir: str,
+    extensions: List[str],
+    skip_parts: tuple[str, ...],
+    exclude_examples: bool,
+) -> Dict[str, List[str]]:
+    """Collect source files for all extensions in a single directory walk.
+
+    Returns:
+        Dictionary of extension to sorted file paths
+    """
+    found: Dict[str, List[str]] = {ext: [] for ext in extensions}
+    if _should_skip(Path(base_dir), skip_parts):
+        return found
+
+    for root, dirs, files in os.walk(base_dir):
+        dirs[:] = [d for d in dirs if d not in skip_parts]
+        for name in files:
+            ext = os.path.splitext(name)[1]
+            if ext not in found:
+                continue
+            file_str = os.path.join(root, name)
+            if exclude_examples and "example" in file_str.lower():
+                continue
+            found[ext].append(file_str)
+
+    for paths in found.values():
+        paths.sort()
+    return found
+
+
 def scan_codebase_for_mcp_services(
     base_dir: str,
     server_name: Optional[str] = None,
@@ -154,6 +187,8 @@ def scan_codebase_for_mcp_services(
     skip_parts: tuple[str, ...] = DEFAULT_SKIP_PARTS,
     languages: Optional[List[str]] = None,
     include_jsdoc_pattern: bool = True,
+    workers: Optional[int] = None,
+    cache: Optional[ScanCache] = None,
 ) -> Dict[str, Dict[str, Any]]:
     """Scan a codebase recursively for @mcp_service decorated functions.
 
@@ -165,11 +200,14 @@ def scan_codebase_for_mcp_services(
         languages: List of languages to scan ("python", "javascript", "typescript")
                    If None, scans all supported languages
         include_jsdoc_pattern: Also scan for JSDoc @mcp_service comments in JS files
+        workers: Parse changed files in this many worker processes
+        cache: Scan cache to use (default: the persistent process-wide cache)
 
     Returns:
         Dictionary of service name to service info
     """
     all_services: Dict[str, Dict[str, Any]] = {}
+    cache = cache or get_scan_cache()
 
     # Determine which file extensions to scan
     extensions = []
@@ -184,35 +222,31 @@ def scan_codebase_for_mcp_services(
         if "typescript" in languages:
             extensions.extend([".ts", ".tsx"])
 
-    # Scan files for each extension
+    files_by_ext = _walk_source_files(base_dir, extensions, skip_parts, exclude_examples)
+    all_files = [file_str for ext in extensions for file_str in files_by_ext[ext]]
+    entries = cache.refresh(all_files, workers=workers)
+
+    # Merge in extension order so name collisions resolve as before
     for ext in extensions:
-        pattern = f"*{ext}"
-        for source_file in Path(base_dir).rglob(pattern):
-            if _should_skip(source_file, skip_parts):
+        for file_str in files_by_ext[ext]:
+            entry = entries.get(file_str)
+            if entry is None:
                 continue
-            if exclude_examples and "example" in str(source_file).lower():
-                continue
-
-            file_str = str(source_file)
 
-            # For Python: Use AST-based decorator scanning
+            # For Python: AST-based decorator scanning
             if ext == ".py":
-                services = find_mcp_services_in_python_file(file_str)
-            # For JavaScript/TypeScript: Use JSDoc scanning
-            elif ext in (".js", ".mjs", ".ts", ".tsx"):
+                services = dict(entry.get("services", {}))
+            # For JavaScript/TypeScript: JSDoc scanning
+            else:
                 services = {}
                 # JSDoc pattern scanning (primary method for JS)
                 if include_jsdoc_pattern:
-                    jsdoc_services = find_jsdoc_mcp_services_in_js_file(file_str)
-                    services.update(jsdoc_services)
-                # Also try esprima decorator-based scanning (if available)
-                esprima_services = find_mcp_services_in_js_file(file_str)
+                    services.update(entry.get("jsdoc_services", {}))
+                # Also esprima decorator-based scanning (if available)
                 # Merge, preferring JSDoc if both exist
-                for name, info in esprima_services.items():
+                for name, info in entry.get("esprima_services", {}).items():
                     if name not in services:
                         services[name] = info
-            else:
-                services = {}
 
             if server_name:
                 services = {
@@ -220,8 +254,13 @@ def scan_codebase_for_mcp_services(
                     if info.get("metadata", {}).get("server_name") == server_name
                 }
 
-            all_services.update(services)
+            # Cached entries are shared: hand out copies carrying the scanned path
+            all_services.update(
+                {name: {**info, "file": file_str} for name, info in services.items()}
+            )
 
+    cache.prune(base_dir, all_files)
+    cache.save()
     return all_services
 
 
@@ -247,30 +286,12 @@ def _parse_imports(file_path: str) -> Dict[str, str]:
         Dictionary mapping class/module names to their import source.
         e.g., {"FilterParams": "outlook_types", "Optional": "typing"}
     """
-    imports: Dict[str, str] = {}
-
-    try:
-        content = Path(file_path).read_text(encoding="utf-8")
-        tree = ast.parse(content)
-
-        for node in ast.walk(tree):
-            # from module import name1, name2
-            if isinstance(node, ast.ImportFrom):
-                module = node.module or ""
-                for alias in node.names:
-                    name = alias.asname or alias.name
-                    imports[name] = module
-
-            # import module
-            elif isinstance(node, ast.Import):
-                for alias in node.names:
-                    name = alias.asname or alias.name
-                    imports[name] = alias.name
-
-    except Exception as exc:
-        print(f"Warning: Could not parse imports from {file_path}: {exc}")
-
-    return imports
+    entry = get_scan_cache().get(file_path)
+    if entry is None or "error" in entry:
+        reason = entry.get("error") if entry else "file not readable"
+        print(f"Warning: Could not parse imports from {file_path}: {reason}")
+        return {}
+    return dict(entry.get("imports", {}))
 
 
 def _resolve_module_to_file(module_name: str, source_file: str) -> Optional[str]:
@@ -345,15 +366,9 @@ def resolve_class_file(class_name: str, source_file: str) -> Optional[str]:
         Absolute path to the file containing the class definition, or None
     """
     # First, check if class is defined in the same file
-    try:
-        content = Path(source_file).read_text(encoding="utf-8")
-        tree = ast.parse(content)
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef) and node.name == class_name:
-                return str(Path(source_file).resolve())
-    except Exception:
-        pass
+    entry = get_scan_cache().get(source_file)
+    if entry and class_name in entry.get("classes", {}):
+        return str(Path(source_file).resolve())
 
     # Parse imports and find where the class comes from
     imports = _parse_imports(source_file)
@@ -408,14 +423,17 @@ def collect_referenced_types(
                 print(f"  Warning: Could not find definition for class '{class_name}'")
                 continue
 
-            # Extract class properties using extract_types module
-            try:
-                class_info = extract_types.extract_single_class(class_file, class_name)
-                if class_info:
-                    referenced_types[class_name] = class_info
-                    print(f"  Extracted {len(class_info.get('properties', []))} properties from {class_name}")
-            except Exception as exc:
-                print(f"  Warning: Could not extract properties from '{class_name}': {exc}")
+            # Class properties were extracted when the file was parsed
+            class_entry = get_scan_cache().get(class_file)
+            if class_entry is None or "error" in class_entry:
+                reason = class_entry.get("error") if class_entry else "file not readable"
+                print(f"  Warning: Could not extract properties from '{class_name}': {reason}")
+                continue
+
+            class_info = class_entry.get("models", {}).get(class_name)
+            if class_info:
+                referenced_types[class_name] = class_info
+                print(f"  Extracted {len(class_info.get('properties', []))} properties from {class_name}")
 
     return referenced_types
 
@@ -519,7 +537,7 @@ def export_services_to_json(base_dir: str, server_name: str, output_dir: str) ->
     if has_js_services and not has_py_services:
         services = all_services
     else:
-        # For Python projects, filter by server_name as before
+        # For Python projects, filter by server_name as before (served from the scan cache)
         services = scan_codebase_for_mcp_services(base_dir, server_name)
     services_items = sorted(services.items(), key=lambda item: (item[1]["file"], item[1]["line"]))
 
@@ -590,6 +608,9 @@ def export_services_to_json(base_dir: str, server_name: str, output_dir: str) ->
         else:
             print(f"  No referenced types found")
 
+    # Persist entries parsed while resolving referenced types
+    get_scan_cache().save()
+
     return {
         "registry": str(registry_path),
         "types_property": types_property_path,
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Streamable HTTP 멀티 워커 부하 테스트
+
+core/stream_workers.py 의 세션 고정 프록시 뒤에서 워커 수를 바꿔 가며
+tools/call 처리량을 측정합니다. 워커 앱은 생성된 server_stream 과 같은 구성
+(StreamableHTTPSessionManager + lowlevel Server)이고, 도구는 Graph 호출 없이
+서버 쪽 CPU 작업(메일 목록 생성 → 클라이언트 측 필터 → json.dumps(indent=2))만 수행합니다.
+
+각 클라이언트는 자기 세션(Mcp-Session-Id)으로 모든 호출을 보내므로, 세션이 다른 워커로
+잘못 전달되면 404 로 실패해 errors 에 집계됩니다.
+
+사용법:
+    python bench_stream_workers.py                          # 기본 (workers 1,2,4)
+    python bench_stream_workers.py --workers 1,2 --clients 16 --calls 50 --messages 500
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+from typing import Any, Dict, List
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.stream_workers import run_stream_workers, worker_bind  # noqa: E402
+
+TOOL_NAME = "render_mail_page"
+
+
+def build_worker_app():
+    """워커 프로세스가 서비스하는 Starlette 앱 (server_stream.jinja2 와 같은 구성)"""
+    import mcp.types as mcp_types
+    from mcp.server.lowlevel import Server as MCPServer
+    from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+    from starlette.applications import Starlette
+    from starlette.responses import JSONResponse
+    from starlette.routing import Route
+
+    server = MCPServer(name="bench", version="1.0.0")
+
+    @server.list_tools()
+    async def _list_tools() -> List[mcp_types.Tool]:
+        return [mcp_types.Tool(
+            name=TOOL_NAME,
+            description="Synthetic mail page rendering",
+            inputSchema={"type": "object", "properties": {"messages": {"type": "integer"}}},
+        )]
+
+    @server.call_tool(validate_input=False)
+    async def _call_tool(name: str, arguments: Dict[str, Any]):
+        count = int(arguments.get("messages", 300))
+        messages = [{
+            "id": f"AAMk{index:08d}",
+            "subject": f"[Project {index % 17}] weekly report {index}",
+            "from": {"emailAddress": {"name": f"Sender {index % 31}", "address": f"sender{index % 31}@example.com"}},
+            "receivedDateTime": f"2024-01-{index % 28 + 1:02d}T09:00:00Z",
+            "hasAttachments": index % 3 == 0,
+            "bodyPreview": "Lorem ipsum dolor sit amet " * 8,
+        } for index in range(count)]
+        filtered = [m for m in messages if "report" in m["subject"] and not m["from"]["emailAddress"]["address"].startswith("sender0@")]
+        text = json.dumps({"status": "success", "count": len(filtered), "value": filtered}, ensure_ascii=False, indent=2)
+        return [mcp_types.TextContent(type="text", text=text)]
+
+    session_manager = StreamableHTTPSessionManager(app=server, event_store=None, json_response=False, stateless=False)
+
+    class _StreamableHTTPASGI:
+        async def __call__(self, scope, receive, send) -> None:
+            await session_manager.handle_request(scope, receive, send)
+
+    async def health(_request) -> JSONResponse:
+        return JSONResponse({"status": "healthy", "server": "bench", "pid": os.getpid()})
+
+    @contextlib.asynccontextmanager
+    async def lifespan(_app):
+        async with session_manager.run():
+            yield
+
+    return Starlette(
+        routes=[Route("/mcp", endpoint=_StreamableHTTPASGI()), Route("/health", endpoint=health, methods=["GET"])],
+        lifespan=lifespan,
+    )
+
+
+def serve(workers: int, port: int) -> None:
+    """--serve: 프록시(부모) 또는 워커(run_stream_workers 가 다시 실행한 자식)"""
+    bind = worker_bind()
+    if bind:
+        import uvicorn
+        uvicorn.run(build_worker_app(), log_level="warning", **bind)
+    else:
+        run_stream_workers(workers, "127.0.0.1", port)
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _health(port: int) -> Dict[str, Any]:
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/health", timeout=2) as resp:
+            return json.loads(resp.read())
+    except (OSError, ValueError):
+        return {}
+
+
+async def _client(url: str, calls: int, messages: int, latencies: List[float]) -> int:
+    """세션 하나로 calls 번 호출, 실패 수 반환"""
+    from mcp import ClientSession
+    from mcp.client.streamable_http import streamablehttp_client
+
+    errors = 0
+    async with streamablehttp_client(url) as (read_stream, write_stream, _):
+        async with ClientSession(read_stream, write_stream) as session:
+            await session.initialize()
+            for _ in range(calls):
+                start = time.perf_counter()
+                try:
+                    result = await session.call_tool(TOOL_NAME, {"messages": messages})
+                    errors += 1 if result.isError else 0
+                except Exception:
+                    errors += 1
+                latencies.append(time.perf_counter() - start)
+    return errors
+
+
+async def run_load(port: int, clients: int, calls: int, messages: int) -> Dict[str, Any]:
+    url = f"http://127.0.0.1:{port}/mcp"
+    latencies: List[float] = []
+    start = time.perf_counter()
+    results = await asyncio.gather(*(_client(url, calls, messages, latencies) for _ in range(clients)),
+                                   return_exceptions=True)
+    elapsed = time.perf_counter() - start
+    errors = sum(r if isinstance(r, int) else calls for r in results)
+    latencies.sort()
+
+    def percentile(p: float) -> float:
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000 if latencies else 0.0
+
+    return {
+        "calls": clients * calls,
+        "errors": errors,
+        "elapsed": elapsed,
+        "throughput": clients * calls / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(0.50),
+        "p95_ms": percentile(0.95),
+    }
+
+
+def bench(workers: int, args) -> Dict[str, Any]:
+    """프록시 + 워커를 별도 프로세스로 띄우고 부하 측정"""
+    port = _free_port()
+    proc = subprocess.Popen(
+        [sys.executable, str(Path(__file__).resolve()), "--serve", "--workers", str(workers), "--port", str(port)],
+        cwd=str(PROJECT_ROOT),
+    )
+    try:
+        deadline = time.monotonic() + 60
+        while _health(port).get("workers_healthy") != workers:
+            if proc.poll() is not None or time.monotonic() > deadline:
+                raise RuntimeError(f"{workers}-worker server did not start")
+            time.sleep(0.2)
+
+        asyncio.run(run_load(port, min(args.clients, 2), 2, args.messages))  # warm-up
+        result = asyncio.run(run_load(port, args.clients, args.calls, args.messages))
+        health = _health(port)
+        result["per_worker"] = [w["requests"] for w in health.get("workers", [])]
+        return result
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Load test for multi-worker Streamable HTTP mode")
+    parser.add_argument("--workers", default="1,2,4", help="Comma-separated worker counts")
+    parser.add_argument("--clients", type=int, default=8, help="Concurrent MCP client sessions")
+    parser.add_argument("--calls", type=int, default=25, help="tools/call requests per client")
+    parser.add_argument("--messages", type=int, default=300, help="Synthetic messages serialised per call")
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, default=0, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(int(args.workers), args.port)
+        return 0
+
+    counts = [int(value) for value in args.workers.split(",") if value.strip()]
+    print(f"clients={args.clients} calls/client={args.calls} messages/call={args.messages} cpus={os.cpu_count()}")
+    print(f"  {'workers':>7} {'calls/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'errors':>6}  requests per worker")
+
+    baseline = None
+    failed = False
+    for workers in counts:
+        result = bench(workers, args)
+        baseline = baseline or result["throughput"]
+        failed = failed or result["errors"] > 0
+        print(f"  {workers:>7} {result['throughput']:9.1f} {result['p50_ms']:8.1f} {result['p95_ms']:8.1f} "
+              f"{result['errors']:>6}  {result['per_worker']}  ({result['throughput'] / baseline:.2f}x)")
+
+    if failed:
+        print("[FAIL] some calls failed (session routed to the wrong worker?)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
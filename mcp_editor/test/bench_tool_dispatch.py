@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+tools/call 디스패치 오버헤드 마이크로 벤치마크
+
+생성된 MCP 서버의 tools/call 경로 중 서비스 호출 전 단계만 측정합니다.
+  - legacy: MCP_TOOLS 선형 탐색 + inputSchema.properties 순회 + globals() 조회
+  - tables: jinja/python/tool_tables.jinja2 의 사전 계산 테이블 (O(1) 조회)
+
+도구 정의는 mcp_outlook/tool_definition_templates.yaml 을 복제해 도구 수를 늘리고,
+asyncio.gather 로 동시 요청을 흉내 냅니다.
+
+사용법:
+    python bench_tool_dispatch.py                  # 기본 (200 tools, 20000 calls)
+    python bench_tool_dispatch.py --tools 1000 --calls 50000 --concurrency 200
+"""
+
+import argparse
+import asyncio
+import copy
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import yaml
+from jinja2 import Template
+
+EDITOR_DIR = Path(__file__).resolve().parent.parent
+TOOL_TABLES_TEMPLATE = EDITOR_DIR / "jinja" / "python" / "tool_tables.jinja2"
+DEFAULT_YAML = EDITOR_DIR / "mcp_outlook" / "tool_definition_templates.yaml"
+
+
+def load_tools(yaml_path: Path, tool_count: int) -> List[Dict[str, Any]]:
+    """YAML 도구 정의를 tool_count 개가 될 때까지 이름을 바꿔 복제"""
+    with open(yaml_path, "r", encoding="utf-8") as f:
+        base_tools = yaml.safe_load(f).get("tools", [])
+    if not base_tools:
+        raise ValueError(f"No tools in {yaml_path}")
+
+    tools = []
+    for index in range(tool_count):
+        tool = copy.deepcopy(base_tools[index % len(base_tools)])
+        tool["name"] = f"{tool['name']}_{index}"
+        tools.append(tool)
+    return tools
+
+
+async def _dummy_handler(args: Dict[str, Any]) -> Dict[str, Any]:
+    return args
+
+
+def build_legacy_namespace(tools: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """이전 템플릿과 같은 방식의 조회 함수"""
+    namespace: Dict[str, Any] = {f"handle_{tool['name']}": _dummy_handler for tool in tools}
+
+    def get_tool_config(tool_name: str) -> Optional[dict]:
+        for tool in tools:
+            if tool.get("name") == tool_name:
+                return tool
+        return None
+
+    def apply_schema_defaults(tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        tool_config = get_tool_config(tool_name)
+        if not tool_config:
+            return arguments
+        properties = tool_config.get("inputSchema", {}).get("properties", {})
+        merged_args = dict(arguments) if arguments else {}
+        for prop_name, prop_def in properties.items():
+            if prop_name not in merged_args and "default" in prop_def:
+                merged_args[prop_name] = prop_def["default"]
+        return merged_args
+
+    def get_tool_handler(tool_name: str):
+        return namespace.get(f"handle_{tool_name.replace('-', '_')}")
+
+    namespace.update(apply_schema_defaults=apply_schema_defaults, get_tool_handler=get_tool_handler)
+    return namespace
+
+
+def build_tables_namespace(tools: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """tool_tables.jinja2 를 렌더링해 생성 서버와 같은 전역 환경에서 실행"""
+    namespace: Dict[str, Any] = {
+        "Any": Any, "Dict": Dict, "List": List, "Optional": Optional,
+        "MCP_TOOLS": tools,
+        "TOOL_HANDLERS": {tool["name"]: _dummy_handler for tool in tools},
+    }
+    source = Template(TOOL_TABLES_TEMPLATE.read_text(encoding="utf-8")).render()
+    exec(compile(source, str(TOOL_TABLES_TEMPLATE), "exec"), namespace)
+    return namespace
+
+
+async def _call_tool(namespace: Dict[str, Any], tool_name: str, arguments: Dict[str, Any]):
+    """tools/call 경로: 기본값 적용 → 핸들러 조회 → 호출"""
+    arguments = namespace["apply_schema_defaults"](tool_name, arguments)
+    handler = namespace["get_tool_handler"](tool_name)
+    if handler is None:
+        raise ValueError(f"Unknown tool: {tool_name}")
+    return await handler(arguments)
+
+
+async def run_load(namespace: Dict[str, Any], names: List[str], concurrency: int) -> float:
+    """concurrency 개씩 asyncio.gather 로 호출하고 경과 시간(초) 반환"""
+    start = time.perf_counter()
+    for offset in range(0, len(names), concurrency):
+        batch = names[offset:offset + concurrency]
+        await asyncio.gather(*(_call_tool(namespace, name, {}) for name in batch))
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark tools/call dispatch overhead")
+    parser.add_argument("--yaml", type=Path, default=DEFAULT_YAML, help="Tool definition YAML")
+    parser.add_argument("--tools", type=int, default=200, help="Number of tools (YAML is replicated)")
+    parser.add_argument("--calls", type=int, default=20000, help="Number of tools/call requests")
+    parser.add_argument("--concurrency", type=int, default=100, help="Requests per asyncio.gather batch")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    tools = load_tools(args.yaml, args.tools)
+    rng = random.Random(args.seed)
+    names = [rng.choice(tools)["name"] for _ in range(args.calls)]
+
+    legacy = build_legacy_namespace(tools)
+    tables = build_tables_namespace(tools)
+
+    # 두 방식의 결과가 같은지 먼저 확인
+    for tool in tools:
+        name = tool["name"]
+        if legacy["apply_schema_defaults"](name, {}) != tables["apply_schema_defaults"](name, {}):
+            print(f"[FAIL] schema defaults differ for {name}")
+            return 1
+
+    print(f"tools={args.tools} calls={args.calls} concurrency={args.concurrency}")
+    results = {}
+    for label, namespace in (("legacy", legacy), ("tables", tables)):
+        asyncio.run(run_load(namespace, names[:1000], args.concurrency))  # warm-up
+        elapsed = asyncio.run(run_load(namespace, names, args.concurrency))
+        results[label] = elapsed
+        print(f"  {label:7s} {elapsed * 1000:9.1f} ms total  {elapsed / args.calls * 1e6:7.2f} us/call")
+
+    print(f"  speedup {results['legacy'] / results['tables']:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
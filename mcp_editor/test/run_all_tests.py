@@ -30,6 +30,20 @@ def run_test_module(module_name: str) -> tuple[int, int]:
             from test_mcp_service_scanner import run_all_tests
         elif module_name == "service_registry":
             from test_service_registry import run_all_tests
+        elif module_name == "server_startup":
+            from test_server_startup import run_all_tests
+        elif module_name == "server_metrics":
+            from test_server_metrics import run_all_tests
+        elif module_name == "server_tracing":
+            from test_server_tracing import run_all_tests
+        elif module_name == "structured_log":
+            from test_structured_log import run_all_tests
+        elif module_name == "bench_harness":
+            from test_bench_harness import run_all_tests
+        elif module_name == "stream_workers":
+            from test_stream_workers import run_all_tests
+        elif module_name == "hot_reload":
+            from test_hot_reload import run_all_tests
         else:
             print(f"Unknown module: {module_name}")
             return (0, 1)
@@ -64,6 +78,13 @@ def main():
         ("extract_types_js", "JavaScript Type Extractor (Sequelize)"),
         ("mcp_service_scanner", "MCP Service Scanner (@mcp_service decorator)"),
         ("service_registry", "Service Registry (JSON loading & validation)"),
+        ("server_startup", "Server Startup (tool manifest & import time)"),
+        ("server_metrics", "Server Metrics (per-tool & per-Graph-endpoint histograms)"),
+        ("server_tracing", "Server Tracing (request-scoped spans & flame summary)"),
+        ("structured_log", "Structured Logging (queue handler, sampling, rate limits)"),
+        ("bench_harness", "Benchmark Harness (Graph stub, load drivers, baselines)"),
+        ("stream_workers", "Stream Workers (refresh lease & session-sticky proxy routing)"),
+        ("hot_reload", "Hot Reload (tool definition reload & tools/list_changed)"),
     ]
 
     # Filter modules if specific one requested
@@ -71,7 +92,7 @@ def main():
         all_modules = [(m, d) for m, d in all_modules if args.module in m]
         if not all_modules:
             print(f"No matching module for: {args.module}")
-            print("Available modules: extract_types, extract_types_js, mcp_service_scanner, service_registry")
+            print("Available modules: extract_types, extract_types_js, mcp_service_scanner, service_registry, server_startup, server_metrics, server_tracing, structured_log, bench_harness, stream_workers, hot_reload")
             return 1
 
     total_passed = 0
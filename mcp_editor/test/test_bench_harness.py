@@ -0,0 +1,327 @@
+"""
+프로필별 부하 테스트 / 벤치마크 하네스 테스트
+
+테스트 대상:
+- core/bench.py GraphStub: 합성 메일 / 일정 / 드라이브 / OneNote 응답, $top/$skip + nextLink, $batch
+- redirect_graph: https://graph.microsoft.com 요청만 스텁으로 우회
+- 지연 주입, 429 + Retry-After 주입
+- inputSchema 기반 인자 생성, 쓰기 계열 도구 제외
+- 기준선 비교 (처리량 / p95 / RSS 회귀 검출)
+- create_mcp_project.py / scaffold_generator.py 의 benchmarks/bench_<profile>.py 생성
+- 생성된 outlook 하네스로 REST 서버 실제 부하 → 기준선 저장 / 비교
+"""
+
+import ast
+import asyncio
+import contextlib
+import io
+import json
+import py_compile
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "jinja"))
+
+from core import bench  # noqa: E402
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+
+def _report(checks) -> bool:
+    failed = 0
+    for name, ok in checks:
+        print(f"  {'PASS' if ok else 'FAIL'}: {name}")
+        failed += 0 if ok else 1
+    return failed == 0
+
+
+async def _get_json(session, url: str):
+    async with session.get(url) as response:
+        return response.status, dict(response.headers), await response.json(content_type=None)
+
+
+def test_graph_stub_routes():
+    """합성 데이터 응답, 페이지 nextLink, $batch, Graph URL 우회"""
+    print("\n=== test_graph_stub_routes ===")
+    import aiohttp
+
+    stub = bench.GraphStub(latency_ms=0, jitter_ms=0, items=25)
+    stub.start()
+    bench.redirect_graph(stub.url)
+    graph = f"{bench.GRAPH_ORIGIN}/v1.0"
+
+    async def run():
+        async with aiohttp.ClientSession() as session:
+            page = await _get_json(session, f"{graph}/users/a@example.com/messages?$top=10&$skip=20&$count=true")
+            message = await _get_json(session, f"{graph}/users/a@example.com/messages/msg-00003")
+            attachments = await _get_json(session, f"{graph}/users/a@example.com/messages/msg-00003/attachments")
+            events = await _get_json(session, f"{graph}/me/calendarView?startDateTime=x&endDateTime=y&$top=5")
+            children = await _get_json(session, f"{graph}/me/drive/root/children")
+            notebooks = await _get_json(session, f"{graph}/me/onenote/notebooks")
+            async with session.get(f"{graph}/me/onenote/pages/page-00001/content") as response:
+                html = await response.text()
+            batch_body = {"requests": [{"id": "1", "method": "GET", "url": "/users/a@example.com/messages/msg-00001"},
+                                       {"id": "2", "method": "GET", "url": "/me/events?$top=2"}]}
+            async with session.post(f"{graph}/$batch", json=batch_body) as response:
+                batch = await response.json()
+            return page, message, attachments, events, children, notebooks, html, batch
+
+    try:
+        page, message, attachments, events, children, notebooks, html, batch = asyncio.run(run())
+    finally:
+        bench.restore_graph()
+        stub.stop()
+    body = page[2]
+    responses = {r["id"]: r for r in batch["responses"]}
+
+    return _report([
+        ("paged list (skip 20 of 25)", [m["id"] for m in body["value"]] == [f"msg-{i:05d}" for i in range(20, 25)]),
+        ("$count and no nextLink on last page", body.get("@odata.count") == 25 and "@odata.nextLink" not in body),
+        ("message by id", message[0] == 200 and message[2]["id"] == "msg-00003" and "receivedDateTime" in message[2]),
+        ("attachments with contentBytes", len(attachments[2]["value"]) == 2
+         and attachments[2]["value"][0]["contentBytes"]),
+        ("calendarView nextLink points at Graph", events[2]["@odata.nextLink"].startswith(bench.GRAPH_ORIGIN)
+         and "%24skip=5" in events[2]["@odata.nextLink"]),
+        ("drive children", children[2]["value"][1]["file"]["mimeType"] == "text/plain"),
+        ("onenote notebooks / page html", len(notebooks[2]["value"]) == 3 and html.startswith("<html>")),
+        ("$batch sub-responses", responses["1"]["status"] == 200 and responses["1"]["body"]["id"] == "msg-00001"
+         and len(responses["2"]["body"]["value"]) == 2),
+        ("requests counted", stub.stats["requests"] == 8 and stub.stats["batch_subrequests"] == 2),
+        ("redirect removed", not getattr(aiohttp.ClientSession._request, "_bench_redirect", False)),
+    ])
+
+
+def test_latency_and_throttle_injection():
+    """지연 주입, 429 + Retry-After 주입 비율"""
+    print("\n=== test_latency_and_throttle_injection ===")
+    import aiohttp
+
+    stub = bench.GraphStub(latency_ms=30, jitter_ms=0, throttle=0.5, retry_after=3, seed=1)
+    stub.start()
+
+    async def run():
+        async with aiohttp.ClientSession() as session:
+            started = time.perf_counter()
+            results = await asyncio.gather(*(_get_json(session, f"{stub.url}/v1.0/me/messages") for _ in range(40)))
+            return results, time.perf_counter() - started
+
+    try:
+        results, elapsed = asyncio.run(run())
+    finally:
+        stub.stop()
+    throttled = [r for r in results if r[0] == 429]
+
+    return _report([
+        ("latency applied (concurrent, ~30ms)", 0.03 <= elapsed < 1.0),
+        ("about half throttled", 10 <= len(throttled) <= 30 and stub.stats["throttled"] == len(throttled)),
+        ("Retry-After header", all(r[1].get("Retry-After") == "3" for r in throttled)),
+        ("Graph error body", all(r[2]["error"]["code"] == "TooManyRequests" for r in throttled)),
+    ])
+
+
+def test_tool_selection_and_arguments():
+    """inputSchema 로 인자 생성 (필수 + 이메일), 쓰기 계열 도구 제외, SCENARIOS 덮어쓰기"""
+    print("\n=== test_tool_selection_and_arguments ===")
+
+    tools = [
+        {"name": "mail_list_period", "inputSchema": {
+            "type": "object",
+            "properties": {
+                "DatePeriodFilter": {"type": "object", "required": ["received_date_from", "received_date_to"],
+                                     "properties": {"received_date_from": {"type": "string"},
+                                                    "received_date_to": {"type": "string"}}},
+                "user_email": {"type": "string", "default": "someone@contoso.com"},
+                "top": {"type": "integer"},
+            },
+            "required": ["DatePeriodFilter"]}},
+        {"name": "mail_attachment_meta", "inputSchema": {
+            "type": "object", "properties": {"message_ids": {"type": "array", "items": {"type": "string"}}},
+            "required": ["message_ids"]}},
+        {"name": "mail_send", "inputSchema": {"type": "object", "properties": {}}},
+        {"name": "onedrive_upload_file", "inputSchema": {"type": "object", "properties": {}}},
+    ]
+    selected = dict(bench.select_tools(tools, scenarios={"mail_attachment_meta": {"message_ids": ["msg-00001"]}}))
+    period = selected.get("mail_list_period", {})
+    explicit = bench.select_tools(tools, names=["mail_send"])
+    try:
+        bench.select_tools(tools, names=["missing_tool"])
+        unknown_rejected = False
+    except ValueError:
+        unknown_rejected = True
+
+    return _report([
+        ("write tools excluded", sorted(selected) == ["mail_attachment_meta", "mail_list_period"]),
+        ("nested required dates", period.get("DatePeriodFilter", {}).get("received_date_from") == "2024-05-04"
+         and period["DatePeriodFilter"].get("received_date_to") == "2024-06-03"),
+        ("email forced to bench user", period.get("user_email") == bench.BENCH_USER),
+        ("optional non-email omitted", "top" not in period),
+        ("scenario override", selected.get("mail_attachment_meta") == {"message_ids": ["msg-00001"]}),
+        ("explicit tools allowed", [name for name, _ in explicit] == ["mail_send"]),
+        ("unknown tool rejected", unknown_rejected),
+    ])
+
+
+def test_baseline_compare():
+    """처리량 감소 / p95 증가 / RSS 증가 / 오류율 증가 검출, 임계값 이내는 통과"""
+    print("\n=== test_baseline_compare ===")
+
+    baseline = {"results": {"rest": {"throughput_rps": 100.0, "p50_ms": 50.0, "p95_ms": 80.0, "peak_rss_mb": 60.0,
+                                     "graph_calls_per_call": 1.0, "error_rate": 0.0}}}
+    steady = {"rest": {"throughput_rps": 90.0, "p50_ms": 55.0, "p95_ms": 90.0, "peak_rss_mb": 65.0,
+                       "graph_calls_per_call": 1.0, "error_rate": 0.0}}
+    slower = {"rest": {"throughput_rps": 60.0, "p50_ms": 55.0, "p95_ms": 130.0, "peak_rss_mb": 90.0,
+                       "graph_calls_per_call": 3.0, "error_rate": 0.2},
+              "stdio": {"throughput_rps": 1.0}}
+    regressions = bench.compare_to_baseline(slower, baseline, threshold=0.25, rss_threshold=0.2)
+    metrics = sorted(r.split()[1].rstrip(":") for r in regressions)
+
+    return _report([
+        ("within thresholds", bench.compare_to_baseline(steady, baseline, 0.25, 0.2) == []),
+        ("regressions detected", metrics == ["error_rate", "graph_calls_per_call", "p95_ms", "peak_rss_mb",
+                                             "throughput_rps"]),
+        ("protocol without baseline ignored", not any(r.startswith("stdio") for r in regressions)),
+        ("percentile", bench.percentile([1.0, 2.0, 3.0, 4.0], 0.5) == 3.0 and bench.percentile([], 0.9) == 0.0),
+    ])
+
+
+def test_generators_emit_harness():
+    """create_mcp_project.py / scaffold_generator.py 가 benchmarks/bench_<profile>.py 생성 (기존 파일은 --force 때만)"""
+    print("\n=== test_generators_emit_harness ===")
+    from create_mcp_project import MCPProjectCreator
+    from scaffold_generator import MCPServerScaffold
+
+    with tempfile.TemporaryDirectory() as tmp:
+        project_dir = Path(tmp) / "mcp_weather"
+        creator = MCPProjectCreator(tmp)
+        with contextlib.redirect_stdout(io.StringIO()):
+            created, created_written = creator._create_benchmark(project_dir, "weather")
+            scaffold = MCPServerScaffold(str(PROJECT_ROOT / "mcp_editor"))
+            scaffolded, _ = scaffold._create_benchmark(Path(tmp) / "mcp_notes", "notes")
+        content = created.read_text(encoding="utf-8")
+        compiled = True
+        for path in (created, scaffolded):
+            try:
+                py_compile.compile(str(path), doraise=True)
+            except py_compile.PyCompileError as e:
+                print(f"  {e}")
+                compiled = False
+        scaffold_content = scaffolded.read_text(encoding="utf-8")
+
+        # 직접 고친 하네스는 그대로, --force 는 내용이 바뀐 경우에만 기록
+        _, unchanged_written = creator._create_benchmark(project_dir, "weather", force=True)
+        created.write_text(content + "# edited\n", encoding="utf-8")
+        _, skipped_written = creator._create_benchmark(project_dir, "weather")
+        kept_edit = created.read_text(encoding="utf-8").endswith("# edited\n")
+        _, forced_written = creator._create_benchmark(project_dir, "weather", force=True)
+        restored = created.read_text(encoding="utf-8") == content
+
+        outlook_bench, _ = creator._create_benchmark(Path(tmp) / "mcp_outlook", "outlook")
+        tools = next(ast.literal_eval(node.value) for node in ast.parse(outlook_bench.read_text(encoding="utf-8")).body
+                     if isinstance(node, ast.AnnAssign) and getattr(node.target, "id", None) == "TOOLS")
+
+    outlook = PROJECT_ROOT / "mcp_outlook" / "benchmarks" / "bench_outlook.py"
+    return _report([
+        ("create_mcp_project path", created.relative_to(Path(tmp)).as_posix() == "mcp_weather/benchmarks/bench_weather.py"),
+        ("scaffold path", scaffolded.name == "bench_notes.py" and "PROFILE = \"notes\"" in scaffold_content),
+        ("harness compiles", compiled),
+        ("profile + baseline", 'PROFILE = "weather"' in content and "baseline_weather.json" in content),
+        ("all protocols wired", all(f"server_{p}.py" in content for p in bench.PROTOCOLS)),
+        ("delegates to core.bench", "from core.bench import main" in content),
+        ("no tool definitions -> empty TOOLS", created_written and "TOOLS: List[str] = [\n]" in content),
+        ("same content not rewritten", not unchanged_written),
+        ("existing harness kept", not skipped_written and kept_edit),
+        ("--force overwrites", forced_written and restored),
+        ("TOOLS from profile definitions", "mail_list_period" in tools
+         and not any(bench.WRITE_TOOL_PATTERN.search(name) for name in tools)),
+        ("outlook harness present", outlook.exists()),
+    ])
+
+
+def test_outlook_rest_end_to_end():
+    """생성된 outlook 하네스: REST 서버 부하 → 기준선 저장 → 같은 설정 비교 → 악화된 기준선은 회귀"""
+    print("\n=== test_outlook_rest_end_to_end ===")
+    import importlib.util
+
+    harness = PROJECT_ROOT / "mcp_outlook" / "benchmarks" / "bench_outlook.py"
+    spec = importlib.util.spec_from_file_location("bench_outlook", harness)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        baseline = Path(tmp) / "baseline.json"
+        report = Path(tmp) / "report.json"
+        argv = ["--protocols", "rest", "--requests", "24", "--concurrency", "4", "--warmup", "2",
+                "--latency-ms", "5", "--jitter-ms", "0", "--tools", "mail_list_period,mail_fetch_filter",
+                "--baseline", str(baseline), "--json", str(report)]
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            saved = module.main(argv + ["--save-baseline"], profile=module.PROFILE, servers=module.SERVERS)
+            data = json.loads(report.read_text(encoding="utf-8"))
+            stored = json.loads(baseline.read_text(encoding="utf-8"))
+            stored["results"]["rest"]["throughput_rps"] *= 10
+            baseline.write_text(json.dumps(stored), encoding="utf-8")
+            compared = module.main(argv, profile=module.PROFILE, servers=module.SERVERS)
+        print("  " + "\n  ".join(output.getvalue().strip().splitlines()[-4:]))
+
+    rest = data["results"].get("rest", {})
+    return _report([
+        ("baseline saved", saved == 0 and stored["settings"]["tools"] == ["mail_fetch_filter", "mail_list_period"]),
+        ("all calls succeeded", rest.get("calls") == 24 and rest.get("errors") == 0),
+        ("latency percentiles", 0 < rest.get("p50_ms", 0) <= rest.get("p95_ms", 0) <= rest.get("p99_ms", 0)),
+        ("graph calls went to stub", rest.get("graph", {}).get("requests", 0) >= 24
+         and rest.get("graph_calls_per_call", 0) >= 1),
+        ("peak RSS measured", (rest.get("peak_rss_mb") or 0) > 10 or sys.platform != "linux"),
+        ("regression -> exit 1", compared == 1 and "[REGRESSION] rest throughput_rps" in output.getvalue()),
+    ])
+
+
+def run_all_tests():
+    """Run all tests and report results"""
+    print("=" * 60)
+    print("Benchmark Harness Tests (Graph stub, load drivers, baselines)")
+    print("=" * 60)
+
+    tests = [
+        test_graph_stub_routes,
+        test_latency_and_throttle_injection,
+        test_tool_selection_and_arguments,
+        test_baseline_compare,
+        test_generators_emit_harness,
+        test_outlook_rest_end_to_end,
+    ]
+
+    results = []
+    for test_func in tests:
+        try:
+            result = test_func()
+            results.append((test_func.__name__, result))
+        except Exception as e:
+            print(f"  ERROR: {e}")
+            import traceback
+            traceback.print_exc()
+            results.append((test_func.__name__, False))
+
+    print("\n" + "=" * 60)
+    print("Summary")
+    print("=" * 60)
+
+    passed = sum(1 for _, r in results if r)
+    failed = len(results) - passed
+
+    for name, result in results:
+        status = "PASS" if result else "FAIL"
+        print(f"  [{status}] {name}")
+
+    print(f"\nTotal: {passed} passed, {failed} failed")
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,211 @@
+"""
+Generated MCP Server 도구 정의 hot reload 테스트
+
+테스트 대상:
+- universal_server_template.jinja2: reload_tool_definitions() / watch_tool_definitions()
+  (YAML 변경 시 런타임 테이블 교체, 깨진 YAML이면 기존 정의 유지)
+- server_stream.jinja2: _ReloadableMCPServer (tools.listChanged 광고) 와
+  reload 후 연결된 세션으로 보내는 notifications/tools/list_changed
+
+임시 디렉터리에 stream 서버를 생성해 import 하고, MCP SDK in-memory 클라이언트로 연결합니다.
+"""
+
+import asyncio
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "jinja"))
+
+import mcp.types as mcp_types  # noqa: E402
+from mcp.shared.memory import create_connected_server_and_client_session  # noqa: E402
+
+WATCH_INTERVAL = 0.02
+
+
+def _report(checks) -> bool:
+    failed = 0
+    for name, ok in checks:
+        print(f"  {'PASS' if ok else 'FAIL'}: {name}")
+        failed += 0 if ok else 1
+    return failed == 0
+
+
+def _write_tools(yaml_path: Path, tools: dict) -> None:
+    """tools: {name: description} (입력 파라미터 없는 도구)"""
+    lines = ["tools:"]
+    for name, description in tools.items():
+        lines += [f"  - name: {name}", f"    description: {description}",
+                  "    inputSchema:", "      type: object", "      properties: {}"]
+    yaml_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def _load_generated_stream_server(temp: Path, yaml_path: Path):
+    """서비스 없는 레지스트리로 stream 서버를 생성하고 모듈로 import"""
+    from generate_universal_server import ServerGenerationEngine
+
+    registry_path = temp / "registry_outlook.json"
+    registry_path.write_text(json.dumps({"server_name": "outlook", "services": {}}), encoding="utf-8")
+    output_path = temp / "mcp_server" / "server_stream.py"
+    output_path.parent.mkdir()
+
+    result = ServerGenerationEngine(workers=1).render_target({
+        "server_name": "outlook",
+        "registry_path": str(registry_path),
+        "tools_path": str(yaml_path),
+        "output_path": str(output_path),
+        "protocol_type": "stream",
+    })
+    if result["error"]:
+        raise RuntimeError(result["error"])
+
+    spec = importlib.util.spec_from_file_location("hot_reload_stream_server", output_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+async def _wait_for(predicate, timeout: float = 2.0) -> bool:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            return False
+        await asyncio.sleep(WATCH_INTERVAL)
+    return True
+
+
+async def _reload_scenario(server, yaml_path: Path) -> dict:
+    result = {}
+    notifications = []
+
+    async def message_handler(message):
+        if isinstance(message, mcp_types.ServerNotification):
+            notifications.append(message.root.method)
+
+    async def listed_tools(client) -> dict:
+        return {tool.name: tool.description for tool in (await client.list_tools()).tools}
+
+    async with create_connected_server_and_client_session(
+            server.build_mcp_server(), message_handler=message_handler) as client:
+        capabilities = client.get_server_capabilities()
+        result["list_changed_advertised"] = bool(capabilities and capabilities.tools
+                                                 and capabilities.tools.listChanged)
+        result["initial_tools"] = await listed_tools(client)
+        version = server.TOOL_DEFINITIONS_VERSION
+
+        watcher = asyncio.create_task(server.watch_tool_definitions(WATCH_INTERVAL))
+        try:
+            await asyncio.sleep(WATCH_INTERVAL * 3)  # 감시 시작 시점의 파일 서명 기록
+            _write_tools(yaml_path, {"echo": "edited echo"})
+            result["notified"] = await _wait_for(lambda: notifications)
+            result["notifications"] = list(notifications)
+            result["reloaded_tools"] = await listed_tools(client)
+            result["version_bumped"] = server.TOOL_DEFINITIONS_VERSION == version + 1
+
+            # 깨진 YAML: 예외는 감시 루프에서 로그로 처리되고 기존 정의 유지
+            yaml_path.write_text("tools: [echo\n", encoding="utf-8")
+            await asyncio.sleep(WATCH_INTERVAL * 10)
+            result["watcher_alive"] = not watcher.done()
+            result["malformed_tools"] = await listed_tools(client)
+            result["malformed_version"] = server.TOOL_DEFINITIONS_VERSION == version + 1
+            result["malformed_notifications"] = len(notifications)
+        finally:
+            watcher.cancel()
+    return result
+
+
+def test_stream_hot_reload():
+    """YAML 변경 → 새 도구 목록 + tools/list_changed, 깨진 YAML → 기존 정의 유지"""
+    print("\n=== test_stream_hot_reload ===")
+
+    saved_path = list(sys.path)
+    saved_yaml_env = os.environ.get("MCP_YAML_PATH")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp = Path(temp_dir)
+        yaml_path = temp / "tool_definition_templates.yaml"
+        _write_tools(yaml_path, {"echo": "echo text", "shout": "shout text"})
+        os.environ["MCP_YAML_PATH"] = str(yaml_path)
+        try:
+            server = _load_generated_stream_server(temp, yaml_path)
+            result = asyncio.run(_reload_scenario(server, yaml_path))
+
+            # reload_tool_definitions() 직접 호출: 깨진 YAML은 예외, 테이블은 그대로
+            try:
+                server.reload_tool_definitions()
+                malformed_raises = False
+            except Exception:
+                malformed_raises = True
+            tables_kept = (list(server.TOOL_CONFIGS) == ["echo"]
+                           and [tool["name"] for tool in server.MCP_TOOLS] == ["echo"])
+            _write_tools(yaml_path, {"echo": "edited echo"})
+            unchanged_reload = server.reload_tool_definitions() is False
+        finally:
+            sys.path[:] = saved_path
+            if saved_yaml_env is None:
+                os.environ.pop("MCP_YAML_PATH", None)
+            else:
+                os.environ["MCP_YAML_PATH"] = saved_yaml_env
+
+    return _report([
+        ("tools.listChanged advertised", result.get("list_changed_advertised")),
+        ("initial tool list", result.get("initial_tools") == {"echo": "echo text", "shout": "shout text"}),
+        ("tools/list_changed sent after edit",
+         result.get("notified") and result.get("notifications") == ["notifications/tools/list_changed"]),
+        ("tools/list returns edited definitions", result.get("reloaded_tools") == {"echo": "edited echo"}),
+        ("definitions version bumped", result.get("version_bumped")),
+        ("watcher survives malformed YAML", result.get("watcher_alive")),
+        ("malformed YAML keeps previous tools", result.get("malformed_tools") == {"echo": "edited echo"}),
+        ("malformed YAML keeps version", result.get("malformed_version")),
+        ("no notification for malformed YAML", result.get("malformed_notifications") == 1),
+        ("reload_tool_definitions raises on malformed YAML", malformed_raises),
+        ("runtime tables kept after failed reload", tables_kept),
+        ("unchanged definitions are not reloaded", unchanged_reload),
+    ])
+
+
+def run_all_tests():
+    """Run all hot reload tests"""
+    print("=" * 60)
+    print("Hot Reload Tests")
+    print("=" * 60)
+
+    tests = [
+        test_stream_hot_reload,
+    ]
+
+    results = []
+    for test_func in tests:
+        try:
+            result = test_func()
+            results.append((test_func.__name__, result))
+        except Exception as e:
+            print(f"  ERROR: {e}")
+            import traceback
+            traceback.print_exc()
+            results.append((test_func.__name__, False))
+
+    print("\n" + "=" * 60)
+    print("Summary")
+    print("=" * 60)
+
+    passed = sum(1 for _, r in results if r)
+    failed = len(results) - passed
+
+    for name, result in results:
+        status = "PASS" if result else "FAIL"
+        print(f"  [{status}] {name}")
+
+    print(f"\nTotal: {passed} passed, {failed} failed")
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
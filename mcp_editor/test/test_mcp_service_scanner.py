@@ -9,6 +9,7 @@ mcp_service_scanner.py 모듈의 @mcp_service 데코레이터 스캔 기능을 
 - scan_codebase_for_mcp_services(): 전체 코드베이스 스캔
 - export_services_to_json(): registry JSON 생성
 - collect_referenced_types(): 참조된 타입 수집
+- ScanCache: 변경되지 않은 파일 재파싱 방지
 """
 
 import os
@@ -30,6 +31,7 @@ from service_registry.scanner import (
     detect_language,
     Language,
 )
+from service_registry.scan_cache import ScanCache
 
 
 def test_detect_language():
@@ -499,6 +501,62 @@ def test_scan_real_outlook_project():
             return False
 
 
+def test_scan_cache():
+    """스캔 캐시 테스트 - 변경된 파일만 재파싱"""
+    print("\n=== test_scan_cache ===")
+
+    service_code = '''
+def mcp_service(**kwargs):
+    def decorator(func):
+        return func
+    return decorator
+
+@mcp_service(server_name="demo", description="First")
+async def first(query: str):
+    pass
+'''
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        src_dir = Path(temp_dir) / "src"
+        src_dir.mkdir()
+        for i in range(3):
+            (src_dir / f"service_{i}.py").write_text(service_code.replace("first", f"svc_{i}"))
+        (src_dir / "__pycache__").mkdir()
+        (src_dir / "__pycache__" / "skipped.py").write_text(service_code)
+        cache_path = str(Path(temp_dir) / "scan_cache.json")
+
+        cache = ScanCache(cache_path)
+        first = scan_codebase_for_mcp_services(str(src_dir), cache=cache)
+        checks = [
+            ("first scan parses all files", cache.stats["parsed"] == 3),
+            ("skip_parts excluded", sorted(first) == ["svc_0", "svc_1", "svc_2"]),
+        ]
+
+        # Reloaded from disk: unchanged files are stat hits only
+        cache = ScanCache(cache_path)
+        second = scan_codebase_for_mcp_services(str(src_dir), cache=cache)
+        checks.append(("unchanged tree served from cache", cache.stats == {"hits": 3, "rehashed": 0, "parsed": 0}))
+        checks.append(("cached results match", second == first))
+
+        # Touched but identical: hash check only; edited: re-parsed
+        touched = src_dir / "service_0.py"
+        os.utime(touched, ns=(0, 0))
+        (src_dir / "service_1.py").write_text(service_code.replace("first", "renamed"))
+        third = scan_codebase_for_mcp_services(str(src_dir), cache=cache)
+        checks.append(("touched file rehashed", cache.stats["rehashed"] == 1))
+        checks.append(("edited file re-parsed", cache.stats["parsed"] == 1 and "renamed" in third))
+
+        # Parallel parsing gives the same results
+        parallel = scan_codebase_for_mcp_services(str(src_dir), cache=ScanCache(persist=False), workers=2)
+        checks.append(("parallel scan matches", parallel == third))
+
+    failed = 0
+    for name, ok in checks:
+        print(f"  {'PASS' if ok else 'FAIL'}: {name}")
+        failed += 0 if ok else 1
+    return failed == 0
+
+
 def run_all_tests():
     """Run all tests and report results"""
     print("=" * 60)
@@ -513,6 +571,7 @@ def run_all_tests():
         test_scan_codebase_for_mcp_services,
         test_export_services_to_json,
         test_scan_real_outlook_project,
+        test_scan_cache,
     ]
 
     results = []
@@ -0,0 +1,222 @@
+"""
+Generated MCP Server 메트릭 테스트
+
+테스트 대상:
+- core/metrics.py: 히스토그램 / Prometheus text 출력 / 분위수 추정
+- graph_endpoint(): Graph URL → 낮은 카디널리티 endpoint 라벨
+- track_tool() + graph_trace_configs(): 도구별 Graph 호출 수, auth/network/postprocess 분할
+- relabel_metrics(): 멀티 워커 집계용 worker 라벨 추가
+- 계측 오버헤드 (track_tool 1회당)
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core import metrics  # noqa: E402
+
+
+def _report(checks) -> bool:
+    failed = 0
+    for name, ok in checks:
+        print(f"  {'PASS' if ok else 'FAIL'}: {name}")
+        failed += 0 if ok else 1
+    return failed == 0
+
+
+def test_prometheus_render():
+    """히스토그램 누적 버킷 / 카운터 / 라벨 이스케이프"""
+    print("\n=== test_prometheus_render ===")
+
+    registry = metrics.MetricsRegistry()
+    latency = registry.histogram("t_seconds", "test latency", ("tool",), (0.1, 1.0))
+    calls = registry.counter("t_calls_total", "test calls", ("tool",))
+    for value in (0.05, 0.5, 0.7, 3.0):
+        latency.labels("a").observe(value)
+    calls.labels('we"ird').inc(2)
+    text = registry.render()
+
+    histogram = latency.labels("a")
+    return _report([
+        ("cumulative buckets", 't_seconds_bucket{tool="a",le="0.1"} 1' in text
+         and 't_seconds_bucket{tool="a",le="1"} 3' in text
+         and 't_seconds_bucket{tool="a",le="+Inf"} 4' in text),
+        ("count and sum", 't_seconds_count{tool="a"} 4' in text and 't_seconds_sum{tool="a"} 4.25' in text),
+        ("TYPE lines", "# TYPE t_seconds histogram" in text and "# TYPE t_calls_total counter" in text),
+        ("label escaping", 't_calls_total{tool="we\\"ird"} 2' in text),
+        ("median estimate", 0.1 < histogram.quantile(0.5) <= 1.0),
+    ])
+
+
+def test_graph_endpoint_labels():
+    """사용자 / ID / 드라이브 경로는 템플릿으로 치환"""
+    print("\n=== test_graph_endpoint_labels ===")
+
+    cases = [
+        ("/v1.0/users/kim@example.com/messages", "/users/{user}/messages"),
+        ("/v1.0/users/kim@example.com/messages/AAMkADU3NTk2YzQ4LWI1ZjEtNDk0Mi04=/attachments",
+         "/users/{user}/messages/{id}/attachments"),
+        ("/v1.0/$batch", "/$batch"),
+        ("/beta/me/todo/lists/AQMkADAwATM0MDAAMS1hYzQ3/tasks", "/me/todo/lists/{id}/tasks"),
+        ("/v1.0/users/kim@example.com/drive/root:/Mail/2024/report.pdf:/content",
+         "/users/{user}/drive/root:{path}:/content"),
+        ("/v1.0/users/kim@example.com/mailFolders/inbox/messages/delta()", "/users/{user}/mailFolders/inbox/messages/delta(...)"),
+    ]
+    return _report([(f"{path} -> {expected}", metrics.graph_endpoint(path) == expected) for path, expected in cases])
+
+
+async def _tool_with_graph_calls(port: int) -> None:
+    import aiohttp
+
+    with metrics.track_tool("bench_tool") as invocation:
+        with metrics.track_auth():
+            await asyncio.sleep(0.02)
+        async with aiohttp.ClientSession(trace_configs=metrics.graph_trace_configs()) as session:
+            async def fetch(index: int):
+                url = f"http://127.0.0.1:{port}/v1.0/users/a@example.com/messages/AAMkADQ{index:020d}="
+                async with session.get(url) as response:
+                    return await response.json()
+
+            # 3 parallel requests (~50 ms each) count once as network wall time
+            await asyncio.gather(*(fetch(index) for index in range(3)))
+        time.sleep(0.03)  # post-processing
+        invocation.record_response("x" * 5000)
+
+
+async def _run_graph_server_and_tool() -> None:
+    from aiohttp import web
+
+    async def handler(_request):
+        await asyncio.sleep(0.05)
+        return web.json_response({"value": list(range(500))})
+
+    app = web.Application()
+    app.router.add_get("/v1.0/users/{user}/messages/{id}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    try:
+        await _tool_with_graph_calls(port)
+    finally:
+        await runner.cleanup()
+
+
+def test_tool_phase_split():
+    """도구 1회: Graph 요청 3개, auth/network/postprocess 분할, 응답 크기"""
+    print("\n=== test_tool_phase_split ===")
+
+    metrics.REGISTRY.reset()
+    asyncio.run(_run_graph_server_and_tool())
+
+    phase = metrics.TOOL_PHASE
+    auth = phase.labels("bench_tool", "auth").sum
+    network = phase.labels("bench_tool", "network").sum
+    postprocess = phase.labels("bench_tool", "postprocess").sum
+    total = metrics.TOOL_DURATION.labels("bench_tool").sum
+    endpoint = "/users/{user}/messages/{id}"
+    print(f"  total={total * 1000:.1f}ms auth={auth * 1000:.1f}ms network={network * 1000:.1f}ms "
+          f"postprocess={postprocess * 1000:.1f}ms")
+
+    return _report([
+        ("graph calls per invocation", metrics.TOOL_GRAPH_CALLS.labels("bench_tool").sum == 3),
+        ("auth phase", 0.015 < auth < 0.2),
+        ("network is wall time, not sum", 0.04 < network < 0.14),
+        ("postprocess phase", 0.025 < postprocess),
+        ("phases add up", abs(auth + network + postprocess - total) < 1e-6),
+        ("response bytes", metrics.TOOL_RESPONSE_BYTES.labels("bench_tool").sum == 5000),
+        ("per-endpoint requests", metrics.GRAPH_REQUESTS.labels("GET", endpoint, "200").value == 3),
+        ("per-endpoint bytes", metrics.GRAPH_BYTES.labels("GET", endpoint).value > 0),
+        ("tool outcome ok", metrics.TOOL_CALLS.labels("bench_tool", "ok").value == 1),
+    ])
+
+
+def test_tool_errors_and_relabel():
+    """예외 / {"status": "error"} 결과는 error, 워커 라벨 추가"""
+    print("\n=== test_tool_errors_and_relabel ===")
+
+    metrics.REGISTRY.reset()
+    try:
+        with metrics.track_tool("broken"):
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+    with metrics.track_tool("soft_error") as invocation:
+        invocation.record_response([{"type": "text", "text": "한글"}], {"status": "error"})
+
+    text = metrics.render_metrics()
+    lines = metrics.relabel_metrics(text, "worker", "1")
+    return _report([
+        ("exception counted as error", metrics.TOOL_CALLS.labels("broken", "error").value == 1),
+        ("error status counted as error", metrics.TOOL_CALLS.labels("soft_error", "error").value == 1),
+        ("utf-8 byte size", metrics.TOOL_RESPONSE_BYTES.labels("soft_error").sum == 6),
+        ("worker label added", 'mcp_tool_calls_total{tool="broken",outcome="error",worker="1"} 1' in lines),
+        ("HELP kept once", sum(1 for line in lines if line.startswith("# HELP mcp_tool_calls_total")) == 1),
+    ])
+
+
+def test_instrumentation_overhead():
+    """track_tool 1회 오버헤드 (운영 환경에서 켜 둘 수 있는 수준)"""
+    print("\n=== test_instrumentation_overhead ===")
+
+    metrics.REGISTRY.reset()
+    iterations = 20000
+    start = time.perf_counter()
+    for index in range(iterations):
+        with metrics.track_tool(f"tool_{index % 20}") as invocation:
+            invocation.record_response("ok")
+    per_call_us = (time.perf_counter() - start) / iterations * 1e6
+    print(f"  {per_call_us:.2f} us per instrumented tool call")
+    return _report([("overhead < 50 us per call", per_call_us < 50)])
+
+
+def run_all_tests():
+    """Run all tests and report results"""
+    print("=" * 60)
+    print("Server Metrics Tests (per-tool / per-Graph-endpoint instrumentation)")
+    print("=" * 60)
+
+    tests = [
+        test_prometheus_render,
+        test_graph_endpoint_labels,
+        test_tool_phase_split,
+        test_tool_errors_and_relabel,
+        test_instrumentation_overhead,
+    ]
+
+    results = []
+    for test_func in tests:
+        try:
+            result = test_func()
+            results.append((test_func.__name__, result))
+        except Exception as e:
+            print(f"  ERROR: {e}")
+            import traceback
+            traceback.print_exc()
+            results.append((test_func.__name__, False))
+
+    print("\n" + "=" * 60)
+    print("Summary")
+    print("=" * 60)
+
+    passed = sum(1 for _, r in results if r)
+    failed = len(results) - passed
+
+    for name, result in results:
+        status = "PASS" if result else "FAIL"
+        print(f"  [{status}] {name}")
+
+    print(f"\nTotal: {passed} passed, {failed} failed")
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
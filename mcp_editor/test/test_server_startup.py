@@ -0,0 +1,306 @@
+"""
+Generated MCP Server 시작 비용 테스트
+
+테스트 대상:
+- core.tool_manifest: YAML → JSON 매니페스트 사전 컴파일 / YAML 변경 시 재생성
+- core.lazy_service: 생성된 서버의 서비스 모듈 import / 생성 지연
+- generate_universal_server.write_tool_manifest(): 생성기가 만드는 매니페스트
+- generate_universal_server.generate_all_servers() / write_if_changed(): 내용이 같으면 다시 쓰지 않음
+- 무거운 의존성(pdfplumber, pandas, PyMuPDF, openpyxl, Pillow, requests)의 지연 import
+- `python -X importtime` 요약 리포트 (mcp_editor/.cache/importtime_report.txt)
+"""
+
+import os
+import sys
+import shutil
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "jinja"))
+
+EDITOR_DIR = Path(__file__).resolve().parent.parent
+PROJECT_ROOT = EDITOR_DIR.parent
+OUTLOOK_YAML = EDITOR_DIR / "mcp_outlook" / "tool_definition_templates.yaml"
+IMPORTTIME_REPORT = EDITOR_DIR / ".cache" / "importtime_report.txt"
+
+# Modules that must not be imported until a conversion actually needs them
+HEAVY_MODULES = {"pdfplumber", "pandas", "fitz", "openpyxl", "PIL", "pytesseract", "numpy", "requests", "pptx"}
+
+# Modules loaded by generated servers at startup (converter paths included)
+STARTUP_MODULES = [
+    "core.file_sniffer",
+    "mcp_outlook.mail_attachment_converter",
+    "mcp_outlook.outlook_service",
+    "mcp_calendar.calendar_service",
+    "mcp_file_handler.async_file_manager",
+]
+
+
+def parse_importtime(stderr: str) -> list:
+    """Parse `-X importtime` output into (module, self_us, cumulative_us) rows"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        try:
+            parts = line[len("import time:"):].split("|")
+            self_us, cumulative_us, name = int(parts[0]), int(parts[1]), parts[2].strip()
+        except (ValueError, IndexError):
+            continue
+        rows.append((name, self_us, cumulative_us))
+    return rows
+
+
+def importtime_profile(module: str):
+    """Import a module in a fresh interpreter with -X importtime
+
+    Returns:
+        (error or None, rows)
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=str(PROJECT_ROOT), capture_output=True, text=True, timeout=120,
+        env={**os.environ, "PYTHONPATH": str(PROJECT_ROOT)}
+    )
+    rows = parse_importtime(proc.stderr)
+    if proc.returncode != 0:
+        error_lines = [line for line in proc.stderr.splitlines() if not line.startswith("import time:")]
+        return (error_lines[-1] if error_lines else f"exit code {proc.returncode}"), rows
+    return None, rows
+
+
+def test_tool_manifest_roundtrip():
+    """매니페스트 테스트 - YAML과 같은 도구 목록, YAML 변경 시 재생성"""
+    print("\n=== test_tool_manifest_roundtrip ===")
+
+    import yaml
+    from core import tool_manifest as manifest
+    from generate_universal_server import write_tool_manifest
+
+    convert = manifest._convert_boolean_schema_to_enabled_disabled
+
+    def expected_tools(path: Path) -> list:
+        tools = yaml.safe_load(path.read_text(encoding="utf-8")).get("tools", [])
+        for tool in tools:
+            if "inputSchema" in tool:
+                tool["inputSchema"] = convert(tool["inputSchema"])
+        return tools
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yaml_path = Path(temp_dir) / "tool_definition_templates.yaml"
+        shutil.copy(OUTLOOK_YAML, yaml_path)
+        manifest_path = manifest.tool_manifest_path(yaml_path)
+
+        checks = [("generator writes manifest", write_tool_manifest(str(yaml_path)) and manifest_path.exists())]
+        checks.append(("unchanged YAML is not rewritten", write_tool_manifest(str(yaml_path)) is False))
+
+        start = time.perf_counter()
+        tools = manifest.load_tool_manifest(yaml_path)
+        manifest_ms = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        parsed = manifest._parse_tool_yaml(yaml_path.read_bytes())
+        yaml_ms = (time.perf_counter() - start) * 1000
+        print(f"  manifest load: {manifest_ms:.2f} ms, YAML parse: {yaml_ms:.2f} ms")
+
+        checks.append(("manifest matches YAML", tools == expected_tools(yaml_path) == parsed))
+
+        # Edited YAML: the stale manifest is rebuilt on the next load
+        data = yaml.safe_load(yaml_path.read_text(encoding="utf-8"))
+        data["tools"][0]["description"] = "edited description"
+        yaml_path.write_text(yaml.safe_dump(data, allow_unicode=True, sort_keys=False), encoding="utf-8")
+        reloaded = manifest.load_tool_manifest(yaml_path)
+        checks.append(("stale manifest rebuilt", reloaded[0]["description"] == "edited description"))
+        checks.append(("rebuilt manifest current", write_tool_manifest(str(yaml_path)) is False))
+
+        # Values without an exact JSON form keep being read from the YAML
+        date_yaml = Path(temp_dir) / "dated.yaml"
+        date_yaml.write_text("tools:\n  - name: dated\n    since: 2024-01-01\n", encoding="utf-8")
+        dated = manifest.load_tool_manifest(date_yaml)
+        checks.append(("non-JSON YAML still loads", dated[0]["name"] == "dated"))
+        checks.append(("non-JSON YAML has no manifest", not manifest.tool_manifest_path(date_yaml).exists()))
+
+    failed = 0
+    for name, ok in checks:
+        print(f"  {'PASS' if ok else 'FAIL'}: {name}")
+        failed += 0 if ok else 1
+    return failed == 0
+
+
+def test_lazy_service():
+    """서비스 지연 생성 테스트 - 첫 속성 접근 전에는 서비스 모듈을 import하지 않음"""
+    print("\n=== test_lazy_service ===")
+
+    script = (
+        "import sys\n"
+        "from core.lazy_service import LazyService\n"
+        "service = LazyService('mcp_outlook.outlook_service', 'MailService')\n"
+        "print(service.loaded, 'mcp_outlook.outlook_service' in sys.modules)\n"
+        "print(callable(service.initialize), service.loaded, 'mcp_outlook.outlook_service' in sys.modules)\n"
+        "print(service.get() is service.get(), type(service.get()).__name__)\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=str(PROJECT_ROOT), capture_output=True, text=True, timeout=120,
+        env={**os.environ, "PYTHONPATH": str(PROJECT_ROOT)}
+    )
+    if proc.returncode != 0:
+        error_lines = proc.stderr.strip().splitlines()
+        print(f"  SKIP: mcp_outlook.outlook_service ({error_lines[-1] if error_lines else proc.returncode})")
+        return True
+
+    lines = proc.stdout.strip().splitlines()[-3:]
+    checks = [
+        ("service module not imported before first use", lines[0] == "False False"),
+        ("first attribute access imports and constructs", lines[1] == "True True True"),
+        ("single shared instance", lines[2] == "True MailService"),
+    ]
+
+    failed = 0
+    for name, ok in checks:
+        print(f"  {'PASS' if ok else 'FAIL'}: {name}")
+        failed += 0 if ok else 1
+    return failed == 0
+
+
+def test_generate_all_servers_idempotent():
+    """재생성 테스트 - 두 번째 생성은 파일을 다시 쓰지 않고 결과는 바이트 단위로 같음"""
+    print("\n=== test_generate_all_servers_idempotent ===")
+
+    import json
+    import generate_universal_server as generator
+
+    patched = ("find_registry_file", "find_tools_file", "server_output_path", "server_yaml_path")
+    originals = {name: getattr(generator, name) for name in patched}
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp = Path(temp_dir)
+        yaml_path = temp / "tool_definition_templates.yaml"
+        registry_path = temp / "registry_outlook.json"
+        shutil.copy(OUTLOOK_YAML, yaml_path)
+        registry_path.write_text(json.dumps({"server_name": "outlook", "services": {}}), encoding="utf-8")
+
+        # 저장소의 서버/매니페스트 대신 임시 디렉터리에 생성
+        generator.find_registry_file = lambda server_name: str(registry_path)
+        generator.find_tools_file = lambda server_name: str(yaml_path)
+        generator.server_output_path = lambda server_name, protocol, *args, **kwargs: str(temp / f"server_{protocol}.py")
+        generator.server_yaml_path = lambda server_name, profile_name=None: yaml_path
+        try:
+            first = generator.generate_all_servers(profiles=["outlook"], workers=1)
+            outputs = [Path(result["output_path"]) for result in first]
+            snapshot = {path: (path.read_bytes(), path.stat().st_mtime_ns) for path in outputs}
+
+            second = generator.generate_all_servers(profiles=["outlook"], workers=1)
+            untouched = all((path.read_bytes(), path.stat().st_mtime_ns) == snapshot[path] for path in outputs)
+
+            # 손으로 고친 출력은 다음 생성에서 원래 내용으로 복원
+            edited = outputs[0]
+            edited.write_bytes(snapshot[edited][0] + b"# edited\n")
+            third = generator.generate_all_servers(profiles=["outlook"], workers=1)
+        finally:
+            for name, original in originals.items():
+                setattr(generator, name, original)
+
+        checks = [
+            ("all protocols generated", [r["protocol"] for r in first] == list(generator.PROTOCOLS)),
+            ("first run writes", all(r["changed"] and not r["error"] for r in first)),
+            ("second run skips every write", all(not r["changed"] and not r["error"] for r in second)),
+            ("outputs byte-identical and untouched", untouched),
+            ("edited output rewritten", [r["changed"] for r in third] == [True] + [False] * (len(outputs) - 1)),
+            ("rewritten output matches first render", edited.read_bytes() == snapshot[edited][0]),
+            ("write_if_changed skips same content",
+             generator.write_if_changed(str(edited), snapshot[edited][0].decode("utf-8")) is False),
+        ]
+
+    failed = 0
+    for name, ok in checks:
+        print(f"  {'PASS' if ok else 'FAIL'}: {name}")
+        failed += 0 if ok else 1
+    return failed == 0
+
+
+def test_importtime_report():
+    """-X importtime 요약 리포트 - 무거운 의존성은 시작 시 import되지 않아야 함"""
+    print("\n=== test_importtime_report ===")
+
+    report = [f"# python -X importtime summary ({sys.version.split()[0]})", ""]
+    failed = 0
+
+    for module in STARTUP_MODULES:
+        error, rows = importtime_profile(module)
+        if error:
+            # Missing optional dependencies in this environment
+            print(f"  SKIP: {module} ({error})")
+            report.append(f"## {module}: skipped ({error})\n")
+            continue
+
+        total_ms = max((cumulative for _, _, cumulative in rows), default=0) / 1000
+        heavy = sorted({name.split(".")[0] for name, _, _ in rows} & HEAVY_MODULES)
+        ok = not heavy
+        failed += 0 if ok else 1
+        print(f"  {'PASS' if ok else 'FAIL'}: {module} imports in {total_ms:.1f} ms"
+              + (f" (eager heavy imports: {', '.join(heavy)})" if heavy else ""))
+
+        report.append(f"## {module}: {total_ms:.1f} ms, {len(rows)} modules")
+        report.append(f"{'cumulative ms':>14} {'self ms':>9}  module")
+        for name, self_us, cumulative_us in sorted(rows, key=lambda row: row[2], reverse=True)[:15]:
+            report.append(f"{cumulative_us / 1000:14.1f} {self_us / 1000:9.1f}  {name}")
+        report.append("")
+
+    try:
+        IMPORTTIME_REPORT.parent.mkdir(parents=True, exist_ok=True)
+        IMPORTTIME_REPORT.write_text("\n".join(report), encoding="utf-8")
+        print(f"  Report: {IMPORTTIME_REPORT}")
+    except OSError as e:
+        print(f"  Report not written: {e}")
+
+    return failed == 0
+
+
+def run_all_tests():
+    """Run all tests and report results"""
+    print("=" * 60)
+    print("Server Startup Tests (tool manifest, lazy imports)")
+    print("=" * 60)
+
+    tests = [
+        test_tool_manifest_roundtrip,
+        test_lazy_service,
+        test_generate_all_servers_idempotent,
+        test_importtime_report,
+    ]
+
+    results = []
+    for test_func in tests:
+        try:
+            result = test_func()
+            results.append((test_func.__name__, result))
+        except Exception as e:
+            print(f"  ERROR: {e}")
+            import traceback
+            traceback.print_exc()
+            results.append((test_func.__name__, False))
+
+    print("\n" + "=" * 60)
+    print("Summary")
+    print("=" * 60)
+
+    passed = sum(1 for _, r in results if r)
+    failed = len(results) - passed
+
+    for name, result in results:
+        status = "PASS" if result else "FAIL"
+        print(f"  [{status}] {name}")
+
+    print(f"\nTotal: {passed} passed, {failed} failed")
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
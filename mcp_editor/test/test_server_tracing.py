@@ -0,0 +1,311 @@
+"""
+Generated MCP Server 요청 tracing 테스트
+
+테스트 대상:
+- core/tracing.py: trace_request() 요청 ID / span 트리 / JSONL exporter
+- traced() 데코레이터: async 메서드, gather() 병렬 자식, {"success": False} → error
+- graph_trace_configs(): Graph HTTP 요청 client span (endpoint 템플릿 이름, 상태 코드)
+- OTLP/HTTP JSON exporter → collector 대용 CLI → JSONL 왕복
+- summary CLI: 느린 요청 flame 트리 + 자기 시간 순위
+- exporter 가 없을 때 오버헤드
+"""
+
+import asyncio
+import json
+import socket
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core import metrics, tracing  # noqa: E402
+
+
+def _report(checks) -> bool:
+    failed = 0
+    for name, ok in checks:
+        print(f"  {'PASS' if ok else 'FAIL'}: {name}")
+        failed += 0 if ok else 1
+    return failed == 0
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _read_jsonl(path: Path):
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
+
+
+class _FakeBatch:
+    """GraphMailIdBatch / 저장소 흉내 (traced 데코레이터 대상)"""
+
+    @tracing.traced()
+    async def batch_fetch_by_ids(self, count: int):
+        tracing.set_span_attribute("messages", count)
+        await asyncio.gather(*(self.save_file(index) for index in range(3)))
+        return {"success": True}
+
+    @tracing.traced()
+    async def save_file(self, index: int):
+        await asyncio.sleep(0.01 * (index + 1))
+        return f"file_{index}"
+
+    @tracing.traced()
+    async def upload(self):
+        return {"success": False, "error": "quota exceeded"}
+
+
+async def _traced_request(tool: str):
+    batch = _FakeBatch()
+    with tracing.trace_request(f"tools/call {tool}", tool=tool) as request_id:
+        assert tracing.current_request_id() == request_id
+        with tracing.span("base64.decode", bytes=3):
+            time.sleep(0.005)
+        await batch.batch_fetch_by_ids(3)
+        await batch.upload()
+    return request_id
+
+
+def test_span_tree_and_request_id():
+    """루트 1개 + 자식 span, 병렬 자식의 부모, 요청 ID 범위"""
+    print("\n=== test_span_tree_and_request_id ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        trace_file = Path(tmp) / "spans" / "traces.jsonl"
+        tracing.configure(trace_file=str(trace_file), otlp_endpoint="")
+        try:
+            request_id = asyncio.run(_traced_request("mail_attachment_download"))
+            tracing.flush()
+        finally:
+            tracing.configure(trace_file="", otlp_endpoint="")
+        records = _read_jsonl(trace_file)
+
+    by_name = {}
+    for record in records:
+        by_name.setdefault(record["name"], []).append(record)
+    root = by_name.get("tools/call mail_attachment_download", [{}])[0]
+    fetch = by_name.get("_FakeBatch.batch_fetch_by_ids", [{}])[0]
+    saves = by_name.get("_FakeBatch.save_file", [])
+    upload = by_name.get("_FakeBatch.upload", [{}])[0]
+
+    return _report([
+        ("7 spans exported", len(records) == 7),
+        ("single trace = request id", {r["trace_id"] for r in records} == {request_id}),
+        ("root has no parent", root.get("parent_id") is None and root.get("attrs", {}).get("tool") == "mail_attachment_download"),
+        ("explicit span under root", by_name.get("base64.decode", [{}])[0].get("parent_id") == root.get("span_id")),
+        ("gather children keep parent", len(saves) == 3 and all(s["parent_id"] == fetch.get("span_id") for s in saves)),
+        ("span attribute", fetch.get("attrs", {}).get("messages") == 3),
+        ("success=False marks error", upload.get("status") == "error" and upload.get("error") == "quota exceeded"),
+        ("request id reset after request", tracing.current_request_id() is None),
+    ])
+
+
+async def _graph_calls(port: int, tool: str):
+    import aiohttp
+    from aiohttp import web
+
+    async def handler(request):
+        await asyncio.sleep(0.02)
+        if request.match_info["id"].startswith("missing"):
+            return web.json_response({"error": {"code": "ErrorItemNotFound"}}, status=404)
+        return web.json_response({"value": list(range(200))})
+
+    app = web.Application()
+    app.router.add_get("/v1.0/users/{user}/messages/{id}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", port).start()
+    try:
+        with tracing.trace_request(f"tools/call {tool}", tool=tool):
+            async with aiohttp.ClientSession(trace_configs=metrics.graph_trace_configs()) as session:
+                for message_id in ("AAMkADQ0000000000000000001=", "missing-AAMkADQ000000000002="):
+                    url = f"http://127.0.0.1:{port}/v1.0/users/a@example.com/messages/{message_id}"
+                    async with session.get(url) as response:
+                        await response.json()
+    finally:
+        await runner.cleanup()
+
+
+def test_graph_http_spans():
+    """Graph HTTP 요청은 endpoint 템플릿 이름의 client span (본문 수신까지 포함)"""
+    print("\n=== test_graph_http_spans ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        trace_file = Path(tmp) / "traces.jsonl"
+        tracing.configure(trace_file=str(trace_file), otlp_endpoint="")
+        try:
+            asyncio.run(_graph_calls(_free_port(), "mail_fetch"))
+            tracing.flush()
+        finally:
+            tracing.configure(trace_file="", otlp_endpoint="")
+        records = _read_jsonl(trace_file)
+
+    root = next((r for r in records if r["parent_id"] is None), {})
+    http = [r for r in records if r.get("kind") == "client"]
+    expected_name = "GET /users/{user}/messages/{id}"
+    return _report([
+        ("two client spans", len(http) == 2),
+        ("endpoint template name", all(r["name"] == expected_name for r in http)),
+        ("children of tool span", all(r["parent_id"] == root.get("span_id") for r in http)),
+        ("status codes", sorted(r["attrs"].get("http.status_code") for r in http) == [200, 404]),
+        ("404 is error", [r["status"] for r in http if r["attrs"].get("http.status_code") == 404] == ["error"]),
+        ("response bytes", all(r["attrs"].get("http.response_bytes", 0) > 0 for r in http)),
+        ("duration includes server latency", all(r["duration_ms"] >= 15 for r in http)),
+    ])
+
+
+def test_otlp_collector_roundtrip():
+    """OTLP/HTTP JSON exporter → collector CLI → JSONL"""
+    print("\n=== test_otlp_collector_roundtrip ===")
+
+    port = _free_port()
+    with tempfile.TemporaryDirectory() as tmp:
+        output = Path(tmp) / "collected.jsonl"
+        threading.Thread(target=tracing.run_collector, args=("127.0.0.1", port, str(output)), daemon=True).start()
+        time.sleep(0.2)
+
+        tracing.configure(service_name="outlook", trace_file="", otlp_endpoint=f"http://127.0.0.1:{port}")
+        try:
+            request_id = asyncio.run(_traced_request("mail_list"))
+            tracing.flush()
+        finally:
+            tracing.configure(trace_file="", otlp_endpoint="")
+        records = _read_jsonl(output)
+
+    payload = tracing.to_otlp(records)
+    spans = payload["resourceSpans"][0]["scopeSpans"][0]["spans"] if records else []
+    return _report([
+        ("collector received all spans", len(records) == 7),
+        ("trace id preserved", {r["trace_id"] for r in records} == {request_id}),
+        ("service.name resource", {r["service"] for r in records} == {"outlook"}),
+        ("int attribute preserved", any(r["attrs"].get("messages") == 3 for r in records)),
+        ("error status preserved", any(r["status"] == "error" for r in records)),
+        ("OTLP ids are hex of spec length", all(len(s["traceId"]) == 32 and len(s["spanId"]) == 16 for s in spans)),
+    ])
+
+
+def _write_synthetic_traces(path: Path) -> None:
+    """느린 요청 1개 (OneDrive 업로드 지연) + 빠른 요청 2개"""
+    now = time.time()
+    records = []
+
+    def add(trace_id, span_id, parent, name, start, duration_ms, **attrs):
+        records.append({"trace_id": trace_id, "span_id": span_id, "parent_id": parent, "name": name,
+                        "start": now + start, "duration_ms": duration_ms, "status": "ok", "attrs": attrs})
+
+    add("slow", "r", None, "tools/call mail_attachment_download", 0.0, 2000.0)
+    add("slow", "a", "r", "AuthManager.validate_and_refresh_token", 0.0, 100.0)
+    add("slow", "b", "r", "BatchAttachmentHandler.fetch_and_save", 0.1, 1900.0)
+    add("slow", "c", "b", "POST /$batch", 0.1, 300.0, **{"http.status_code": 200})
+    add("slow", "d", "b", "OneDriveStorageBackend._upload_large", 0.4, 1500.0)
+    add("slow", "e", "d", "PUT /uploadSession", 0.4, 200.0)
+    for index in range(2):
+        add(f"fast{index}", "r", None, "tools/call mail_list", index, 50.0)
+    path.write_text("\n".join(json.dumps(record) for record in records) + "\n", encoding="utf-8")
+
+
+def test_flame_summary():
+    """slowest-first 정렬, 트리 들여쓰기, 자기 시간 순위, CLI 종료 코드"""
+    print("\n=== test_flame_summary ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "traces.jsonl"
+        _write_synthetic_traces(path)
+        text = tracing.summarize(str(path), top=2)
+        filtered = tracing.summarize(str(path), top=5, name_filter="mail_list")
+        exit_code = tracing.main(["summary", str(path), "--top", "1"])
+    print(text)
+
+    lines = text.splitlines()
+    first = next((line for line in lines if line.startswith("[1]")), "")
+    self_rows = lines[lines.index(next(line for line in lines if line.startswith("Self time"))) + 2:]
+    return _report([
+        ("slowest first", "mail_attachment_download" in first and "2000.0 ms" in first),
+        ("nested indentation", any("|     OneDriveStorageBackend._upload_large" in line for line in lines)),
+        ("status code shown", any("POST /$batch [200]" in line for line in lines)),
+        ("upload dominates self time", bool(self_rows) and self_rows[0].endswith("OneDriveStorageBackend._upload_large")),
+        ("name filter", "mail_attachment_download" not in filtered and "2 traces" in filtered),
+        ("CLI exit code", exit_code == 0),
+    ])
+
+
+def test_disabled_overhead():
+    """exporter 가 없으면 span 없이 요청 ID 만 발급"""
+    print("\n=== test_disabled_overhead ===")
+
+    tracing.configure(trace_file="", otlp_endpoint="")
+    batch = _FakeBatch()
+
+    async def run(iterations: int) -> float:
+        start = time.perf_counter()
+        for _ in range(iterations):
+            with tracing.trace_request("tools/call noop"):
+                await batch.upload()
+        return (time.perf_counter() - start) / iterations * 1e6
+
+    with tracing.trace_request("tools/call noop") as request_id:
+        with tracing.span("inner") as inner:
+            pass
+    per_call_us = asyncio.run(run(20000))
+    print(f"  {per_call_us:.2f} us per request with tracing disabled")
+    return _report([
+        ("request id still issued", isinstance(request_id, str) and len(request_id) == 32),
+        ("no span objects", inner is None and not tracing.tracing_enabled()),
+        ("overhead < 20 us per request", per_call_us < 20),
+    ])
+
+
+def run_all_tests():
+    """Run all tests and report results"""
+    print("=" * 60)
+    print("Server Tracing Tests (request-scoped spans)")
+    print("=" * 60)
+
+    tests = [
+        test_span_tree_and_request_id,
+        test_graph_http_spans,
+        test_otlp_collector_roundtrip,
+        test_flame_summary,
+        test_disabled_overhead,
+    ]
+
+    results = []
+    for test_func in tests:
+        try:
+            result = test_func()
+            results.append((test_func.__name__, result))
+        except Exception as e:
+            print(f"  ERROR: {e}")
+            import traceback
+            traceback.print_exc()
+            results.append((test_func.__name__, False))
+
+    print("\n" + "=" * 60)
+    print("Summary")
+    print("=" * 60)
+
+    passed = sum(1 for _, r in results if r)
+    failed = len(results) - passed
+
+    for name, result in results:
+        status = "PASS" if result else "FAIL"
+        print(f"  [{status}] {name}")
+
+    print(f"\nTotal: {passed} passed, {failed} failed")
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
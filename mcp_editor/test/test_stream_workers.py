@@ -0,0 +1,300 @@
+"""
+멀티 워커 stream 서버 테스트
+
+테스트 대상:
+- session/auth_database.py: 프로세스 간 토큰 갱신 lease (획득, 만료 후 인계, owner 확인 해제)
+- session/auth_manager.py: lease를 얻지 못한 프로세스는 갱신하지 않고 DB의 새 토큰을 읽거나 실패
+- core/stream_workers.py: StreamWorkerProxy 세션 고정 라우팅
+  (새 세션은 부하가 적은 워커, 같은 세션은 같은 워커, 알 수 없는 세션/DELETE/워커 404 처리)
+
+워커 프로세스 대신 워커 소켓에 바인딩한 in-process aiohttp 앱을 사용합니다.
+"""
+
+import asyncio
+import socket
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import aiohttp  # noqa: E402
+from aiohttp import web  # noqa: E402
+
+from core.stream_workers import SESSION_HEADER, StreamWorkerProxy  # noqa: E402
+from session.auth_database import AuthDatabase  # noqa: E402
+
+
+def _report(checks) -> bool:
+    failed = 0
+    for name, ok in checks:
+        print(f"  {'PASS' if ok else 'FAIL'}: {name}")
+        failed += 0 if ok else 1
+    return failed == 0
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_refresh_lease():
+    """lease 획득/중복 획득 거부, owner 확인 해제, 만료된 lease 인계"""
+    print("\n=== test_refresh_lease ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "auth.db")
+        # 같은 auth.db 를 여는 두 워커 프로세스
+        db_a = AuthDatabase(db_path)
+        db_b = AuthDatabase(db_path)
+        email = "user@example.com"
+
+        first = db_a.acquire_refresh_lease(email, "pid:1")
+        contended = db_b.acquire_refresh_lease(email, "pid:2")
+        reentrant = db_a.acquire_refresh_lease(email, "pid:1")
+        other_user = db_b.acquire_refresh_lease("other@example.com", "pid:2")
+
+        db_b.release_refresh_lease(email, "pid:2")  # 보유자가 아니면 해제되지 않음
+        after_foreign_release = db_b.acquire_refresh_lease(email, "pid:2")
+
+        db_a.release_refresh_lease(email, "pid:1")
+        after_owner_release = db_b.acquire_refresh_lease(email, "pid:2")
+        db_b.release_refresh_lease(email, "pid:2")
+
+        # 갱신 중 프로세스가 죽으면 ttl 이 지난 뒤 다른 프로세스가 가져감
+        short = db_a.acquire_refresh_lease(email, "pid:1", ttl=0.05)
+        before_expiry = db_b.acquire_refresh_lease(email, "pid:2")
+        time.sleep(0.1)
+        after_expiry = db_b.acquire_refresh_lease(email, "pid:2")
+        db_a.release_refresh_lease(email, "pid:1")  # 만료 후 원래 owner 의 해제는 새 lease 에 영향 없음
+        still_held = not db_a.acquire_refresh_lease(email, "pid:1")
+
+    return _report([
+        ("first acquire", first),
+        ("second owner rejected while held", not contended),
+        ("owner re-acquires its own lease", reentrant),
+        ("leases are per user", other_user),
+        ("non-owner release is ignored", not after_foreign_release),
+        ("owner release frees the lease", after_owner_release),
+        ("short lease acquired", short),
+        ("not taken before expiry", not before_expiry),
+        ("expired lease taken over", after_expiry),
+        ("stale owner release keeps new lease", still_held),
+    ])
+
+
+async def _lease_wait_scenario(db_path: str) -> dict:
+    from datetime import datetime, timedelta, timezone
+    from unittest.mock import AsyncMock, patch
+
+    import session.auth_manager as auth_manager_module
+
+    email = "lease@example.com"
+    expired = (datetime.now(timezone.utc) - timedelta(hours=1)).isoformat()
+    fresh = (datetime.now(timezone.utc) + timedelta(hours=1)).isoformat()
+    result = {}
+
+    manager = auth_manager_module.AuthManager(db_path=db_path)
+    manager.refresh_token = AsyncMock(return_value={"status": "success", "access_token": "refreshed"})
+    manager.auth_db.save_token(email, {"access_token": "old", "refresh_token": "r", "expires_at": expired})
+    # 다른 워커가 갱신 lease를 보유 중 (TTL이 대기 시간보다 길어 끝까지 풀리지 않음)
+    manager.auth_db.acquire_refresh_lease(email, "pid:other", ttl=60)
+
+    with patch.object(auth_manager_module, "REFRESH_LEASE_SECONDS", 0.3), \
+            patch.object(auth_manager_module, "REFRESH_LEASE_POLL_SECONDS", 0.05):
+        start = time.monotonic()
+        result["timeout_token"] = await manager.validate_and_refresh_token(email)
+        result["timeout_elapsed"] = time.monotonic() - start
+        result["timeout_refreshed"] = manager.refresh_token.await_count
+
+        # 보유자가 대기 중에 새 토큰을 저장하면 그 토큰을 사용
+        async def store_new_token():
+            await asyncio.sleep(0.1)
+            manager.auth_db.save_token(email, {"access_token": "stored", "expires_at": fresh})
+
+        _, result["stored_token"] = await asyncio.gather(
+            store_new_token(), manager.validate_and_refresh_token(email))
+        result["stored_refreshed"] = manager.refresh_token.await_count
+    return result
+
+
+def test_refresh_requires_lease():
+    """lease 대기 시간 초과 시 lease 없이 갱신하지 않음, 다른 프로세스가 저장한 토큰은 사용"""
+    print("\n=== test_refresh_requires_lease ===")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        result = asyncio.run(_lease_wait_scenario(str(Path(temp_dir) / "auth.db")))
+
+    return _report([
+        ("no refresh without the lease", result["timeout_refreshed"] == 0),
+        ("lease timeout fails", result["timeout_token"] is None),
+        ("gives up after the lease wait", 0.3 <= result["timeout_elapsed"] < 2),
+        ("token stored by lease holder is used", result["stored_token"] == "stored"),
+        ("still no refresh", result["stored_refreshed"] == 0),
+    ])
+
+
+def _fake_worker_app(index: int) -> web.Application:
+    """세션을 프로세스 메모리에 보관하는 워커 (StreamableHTTPSessionManager 와 같은 동작)"""
+    sessions = set()
+
+    async def handle(request: web.Request) -> web.Response:
+        session_id = request.headers.get(SESSION_HEADER)
+        if session_id is None:
+            session_id = f"w{index}-s{len(sessions)}"
+            sessions.add(session_id)
+            return web.json_response({"worker": index}, headers={SESSION_HEADER: session_id})
+        if session_id not in sessions:
+            return web.json_response({"error": "Session not found"}, status=404)
+        if request.method == "DELETE":
+            sessions.discard(session_id)
+        return web.json_response({"worker": index})
+
+    app = web.Application()
+    app["sessions"] = sessions
+    app.router.add_route("*", "/{tail:.*}", handle)
+    return app
+
+
+async def _attach_fake_workers(proxy: StreamWorkerProxy):
+    runners, apps = [], []
+    for worker in proxy.workers:
+        app = _fake_worker_app(worker.index)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        if worker.socket_path:
+            await web.UnixSite(runner, worker.socket_path).start()
+            connector = aiohttp.UnixConnector(path=worker.socket_path)
+        else:
+            await web.TCPSite(runner, "127.0.0.1", worker.port).start()
+            connector = aiohttp.TCPConnector()
+        worker.client = aiohttp.ClientSession(connector=connector)
+        worker.process = SimpleNamespace(pid=None, returncode=None, poll=lambda: None)
+        runners.append(runner)
+        apps.append(app)
+    return runners, apps
+
+
+async def _routing_scenario():
+    proxy = StreamWorkerProxy(2)
+    runners, apps = await _attach_fake_workers(proxy)
+    proxy_runner = web.AppRunner(proxy.build_app(), access_log=None)
+    await proxy_runner.setup()
+    port = _free_port()
+    await web.TCPSite(proxy_runner, "127.0.0.1", port).start()
+    url = f"http://127.0.0.1:{port}/mcp"
+    result = {}
+
+    async def call(http, session_id=None, method="POST"):
+        headers = {SESSION_HEADER: session_id} if session_id else {}
+        async with http.request(method, url, json={}, headers=headers) as resp:
+            body = await resp.json()
+            return resp.status, resp.headers.get(SESSION_HEADER), body
+
+    try:
+        async with aiohttp.ClientSession() as http:
+            _, session_a, first_a = await call(http)
+            _, session_b, first_b = await call(http)
+            result["spread"] = {first_a["worker"], first_b["worker"]} == {0, 1}
+
+            pinned = await asyncio.gather(*(call(http, sid) for sid in [session_a, session_b] * 5))
+            result["pinned"] = all(
+                status == 200 and body["worker"] == (first_a if sid == session_a else first_b)["worker"]
+                for (status, _, body), sid in zip(pinned, [session_a, session_b] * 5)
+            )
+
+            requests_before = sum(w.requests for w in proxy.workers)
+            status, _, _ = await call(http, "unknown-session")
+            result["unknown_404"] = status == 404
+            result["unknown_not_forwarded"] = sum(w.requests for w in proxy.workers) == requests_before
+
+            status, _, _ = await call(http, session_a, method="DELETE")
+            status_after, _, _ = await call(http, session_a)
+            worker_a = proxy.workers[first_a["worker"]]
+            result["delete_drops_mapping"] = (status == 200 and status_after == 404
+                                              and session_a not in proxy._sessions and worker_a.sessions == 0)
+
+            # 새 세션은 세션이 비어 있는 워커로
+            _, _, first_c = await call(http)
+            result["least_loaded"] = first_c["worker"] == first_a["worker"]
+
+            # 워커가 세션을 잃으면(idle timeout 등) 404 를 받은 뒤 매핑 제거
+            apps[first_b["worker"]]["sessions"].discard(session_b)
+            status, _, _ = await call(http, session_b)
+            result["worker_404_drops_mapping"] = status == 404 and session_b not in proxy._sessions
+    finally:
+        await proxy_runner.cleanup()
+        for runner in runners:
+            await runner.cleanup()
+        for worker in proxy.workers:
+            worker.process = None
+            await worker.close()
+        if proxy._socket_dir:
+            Path(proxy._socket_dir).rmdir()
+    return result
+
+
+def test_session_sticky_routing():
+    """세션 고정 라우팅: 분산, 고정, 알 수 없는 세션, DELETE, 워커 404"""
+    print("\n=== test_session_sticky_routing ===")
+
+    result = asyncio.run(_routing_scenario())
+
+    return _report([
+        ("new sessions spread across workers", result.get("spread")),
+        ("same session always hits same worker", result.get("pinned")),
+        ("unknown session -> 404", result.get("unknown_404")),
+        ("unknown session not forwarded", result.get("unknown_not_forwarded")),
+        ("DELETE drops session mapping", result.get("delete_drops_mapping")),
+        ("new session goes to least-loaded worker", result.get("least_loaded")),
+        ("worker 404 drops session mapping", result.get("worker_404_drops_mapping")),
+    ])
+
+
+def run_all_tests():
+    """Run all stream worker tests"""
+    print("=" * 60)
+    print("Stream Worker Tests")
+    print("=" * 60)
+
+    tests = [
+        test_refresh_lease,
+        test_refresh_requires_lease,
+        test_session_sticky_routing,
+    ]
+
+    results = []
+    for test_func in tests:
+        try:
+            result = test_func()
+            results.append((test_func.__name__, result))
+        except Exception as e:
+            print(f"  ERROR: {e}")
+            import traceback
+            traceback.print_exc()
+            results.append((test_func.__name__, False))
+
+    print("\n" + "=" * 60)
+    print("Summary")
+    print("=" * 60)
+
+    passed = sum(1 for _, r in results if r)
+    failed = len(results) - passed
+
+    for name, result in results:
+        status = "PASS" if result else "FAIL"
+        print(f"  [{status}] {name}")
+
+    print(f"\nTotal: {passed} passed, {failed} failed")
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
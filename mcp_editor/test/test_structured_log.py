@@ -0,0 +1,262 @@
+"""
+구조화 로깅 테스트 (핫 패스 print() 대체)
+
+테스트 대상:
+- core/structured_log.py: 큐 기반 비동기 출력 (stdout 미사용), text / JSON 형식
+- 항목 이벤트 rate limit / DEBUG 샘플링, 억제 수의 작업 요약 집계
+- 작업 요약 이벤트: duration_ms, 카운터, outcome, request_id
+- GraphMailQuery._fetch_parallel_with_url: 페이지마다 print 대신 요약 1회
+- 억제된 항목 이벤트 1회 비용
+"""
+
+import asyncio
+import contextlib
+import io
+import json
+import logging
+import socket
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core import structured_log, tracing  # noqa: E402
+
+
+def _report(checks) -> bool:
+    failed = 0
+    for name, ok in checks:
+        print(f"  {'PASS' if ok else 'FAIL'}: {name}")
+        failed += 0 if ok else 1
+    return failed == 0
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _configure(**kwargs) -> io.StringIO:
+    stream = io.StringIO()
+    structured_log.configure_logging(stream=stream, log_file="", **kwargs)
+    return stream
+
+
+def _json_lines(stream: io.StringIO):
+    structured_log.flush_logging()
+    return [json.loads(line) for line in stream.getvalue().splitlines() if line.startswith("{")]
+
+
+def test_queue_output_text_format():
+    """큐 핸들러 경유 출력, stdout 미사용, key=value 형식"""
+    print("\n=== test_queue_output_text_format ===")
+
+    stream = _configure(level="INFO", fmt="text")
+    log = structured_log.get_logger("test.queue")
+    stdout = io.StringIO()
+    with contextlib.redirect_stdout(stdout):
+        log.event("mail.fetch_pages", pages=3, emails=450, duration_ms=812.25, label="two words")
+    structured_log.flush_logging()
+    line = stream.getvalue().strip()
+    handlers = logging.getLogger("mcp").handlers
+
+    return _report([
+        ("queue handler installed", any(isinstance(h, logging.handlers.QueueHandler) for h in handlers)),
+        ("not propagated to root", logging.getLogger("mcp").propagate is False),
+        ("nothing written to stdout", stdout.getvalue() == ""),
+        ("logger name prefixed", " mcp.test.queue mail.fetch_pages " in line),
+        ("key=value fields", "pages=3 emails=450 duration_ms=812.2" in line or "duration_ms=812.3" in line),
+        ("quoted value with spaces", 'label="two words"' in line),
+    ])
+
+
+def test_rate_limit_and_sampling():
+    """항목 이벤트 rate limit, DEBUG 샘플링 (WARNING 은 샘플링 제외), 억제 수 집계"""
+    print("\n=== test_rate_limit_and_sampling ===")
+
+    stream = _configure(level="DEBUG", fmt="json", item_rate=5, sample_rate=1.0)
+    log = structured_log.get_logger("test.rate")
+    with log.operation("batch_fetch", batches=100) as op:
+        for index in range(100):
+            op.item("batch", batch=index)
+    records = _json_lines(stream)
+    items = [r for r in records if r["event"] == "batch_fetch.batch"]
+    summary = next((r for r in records if r["event"] == "batch_fetch"), {})
+
+    stream = _configure(level="DEBUG", fmt="json", item_rate=1000, sample_rate=0.0)
+    log = structured_log.get_logger("test.sample")
+    with log.operation("upload") as op:
+        for index in range(10):
+            op.item("chunk", chunk=index)
+        op.item("chunk_failed", level=logging.WARNING, chunk=3)
+    sampled = _json_lines(stream)
+
+    return _report([
+        ("burst limited to rate", len(items) == 5),
+        ("summary counts suppressed items", summary.get("items_suppressed") == 95),
+        ("debug items sampled out", not any(r["event"] == "upload.chunk" for r in sampled)),
+        ("warnings bypass sampling", any(r["event"] == "upload.chunk_failed" for r in sampled)),
+        ("summary still emitted", any(r["event"] == "upload" and r.get("items_suppressed") == 10 for r in sampled)),
+    ])
+
+
+def test_operation_summary_fields():
+    """요약 1개: duration_ms, 카운터, 실패 시 WARNING, request_id, 하위 로거 억제 수 집계"""
+    print("\n=== test_operation_summary_fields ===")
+
+    stream = _configure(level="INFO", fmt="json", item_rate=1)
+    log = structured_log.get_logger("test.summary")
+    helper_log = structured_log.get_logger("test.helper")
+
+    async def run():
+        with tracing.trace_request("tools/call mail_attachment_download") as request_id:
+            op = log.operation("attachment.fetch_and_save", requested=3)
+            for _ in range(3):
+                await asyncio.sleep(0.01)
+                op.count("attachments", 2)
+                helper_log.item("storage.saved", level=logging.INFO, name="a.pdf")
+            op.fail("1 mail failed")
+            op.finish()
+            op.finish()  # 두 번째 호출은 무시
+        return request_id
+
+    request_id = asyncio.run(run())
+    records = _json_lines(stream)
+    summaries = [r for r in records if r["event"] == "attachment.fetch_and_save"]
+    summary = summaries[0] if summaries else {}
+
+    return _report([
+        ("one summary event", len(summaries) == 1),
+        ("counter aggregated", summary.get("attachments") == 6 and summary.get("requested") == 3),
+        ("duration_ms", summary.get("duration_ms", 0) >= 25),
+        ("failure -> WARNING + error", summary.get("level") == "WARNING" and summary.get("outcome") == "error"
+         and summary.get("error") == "1 mail failed"),
+        ("request_id from trace_request", summary.get("request_id") == request_id),
+        ("helper items suppressed into operation", summary.get("items_suppressed") == 2),
+        ("operation context cleared", structured_log.current_operation() is None),
+    ])
+
+
+async def _fetch_pages(port: int):
+    from aiohttp import web
+
+    from mcp_outlook.graph_mail_query import GraphMailQuery
+
+    async def messages(request):
+        top = int(request.query.get("$top", 10))
+        skip = int(request.query.get("$skip", 0))
+        if skip == 150:
+            return web.json_response({"error": {"code": "TooManyRequests"}}, status=429)
+        return web.json_response({"value": [{"id": f"m{skip + i}"} for i in range(top)]})
+
+    app = web.Application()
+    app.router.add_get("/v1.0/users/{user}/messages", messages)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", port).start()
+    try:
+        query = GraphMailQuery(token_provider=object())
+        return await query._fetch_parallel_with_url(
+            "a@example.com", "token", f"http://127.0.0.1:{port}/v1.0/users/a@example.com/messages", 400
+        )
+    finally:
+        await runner.cleanup()
+
+
+def test_fetch_pages_summary():
+    """_fetch_parallel_with_url: stdout 출력 없이 요약 1회 (실패 페이지는 WARNING 항목)"""
+    print("\n=== test_fetch_pages_summary ===")
+
+    stream = _configure(level="INFO", fmt="json")
+    stdout = io.StringIO()
+    with contextlib.redirect_stdout(stdout):
+        result = asyncio.run(_fetch_pages(_free_port()))
+    records = _json_lines(stream)
+    summary = next((r for r in records if r["event"] == "mail.fetch_pages"), {})
+
+    return _report([
+        ("result unchanged", result["total"] == 250 and result["pages_requested"] == 3),
+        ("no stdout output", stdout.getvalue() == ""),
+        ("summary fields", summary.get("pages") == 3 and summary.get("emails") == 250
+         and summary.get("retrieved") == 250 and "duration_ms" in summary),
+        ("failed page recorded", summary.get("failed_pages") == 1 and summary.get("outcome") == "error"),
+        ("failed page item", any(r["event"] == "mail.fetch_pages.page_failed" and r.get("status") == 429
+                                 for r in records)),
+        ("per-page items hidden at INFO", not any(r["event"] == "mail.fetch_pages.page" for r in records)),
+    ])
+
+
+def test_suppressed_item_overhead():
+    """억제된 항목 이벤트(레벨 미달 / rate limit) 1회 비용"""
+    print("\n=== test_suppressed_item_overhead ===")
+
+    _configure(level="INFO", fmt="text", item_rate=1)
+    log = structured_log.get_logger("test.overhead")
+    iterations = 50000
+
+    start = time.perf_counter()
+    for index in range(iterations):
+        log.item("page", page=index)  # DEBUG < INFO
+    disabled_us = (time.perf_counter() - start) / iterations * 1e6
+
+    start = time.perf_counter()
+    for index in range(iterations):
+        log.item("page_failed", level=logging.WARNING, page=index)  # rate limited after first
+    limited_us = (time.perf_counter() - start) / iterations * 1e6
+    structured_log.configure_logging(stream=sys.stderr, log_file="")
+
+    print(f"  level-disabled item: {disabled_us:.2f} us, rate-limited item: {limited_us:.2f} us")
+    return _report([
+        ("level-disabled item < 2 us", disabled_us < 2),
+        ("rate-limited item < 10 us", limited_us < 10),
+    ])
+
+
+def run_all_tests():
+    """Run all tests and report results"""
+    print("=" * 60)
+    print("Structured Logging Tests (queue handler, sampling, rate limits)")
+    print("=" * 60)
+
+    tests = [
+        test_queue_output_text_format,
+        test_rate_limit_and_sampling,
+        test_operation_summary_fields,
+        test_fetch_pages_summary,
+        test_suppressed_item_overhead,
+    ]
+
+    results = []
+    for test_func in tests:
+        try:
+            result = test_func()
+            results.append((test_func.__name__, result))
+        except Exception as e:
+            print(f"  ERROR: {e}")
+            import traceback
+            traceback.print_exc()
+            results.append((test_func.__name__, False))
+
+    print("\n" + "=" * 60)
+    print("Summary")
+    print("=" * 60)
+
+    passed = sum(1 for _, r in results if r)
+    failed = len(results) - passed
+
+    for name, result in results:
+        status = "PASS" if result else "FAIL"
+        print(f"  [{status}] {name}")
+
+    print(f"\nTotal: {passed} passed, {failed} failed")
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -328,13 +328,25 @@ def discover_mcp_modules(profile_conf: dict | None = None, profile_name: str | N
 
 
 def load_generator_module():
-    """Load the Jinja2 generator module dynamically"""
+    """Load the Jinja2 generator module dynamically
+
+    스크립트가 수정되지 않았다면 이전에 로드한 모듈을 재사용한다
+    (모듈 단위로 캐시된 Jinja2 Environment가 요청 간에 유지됨).
+    """
     if not os.path.exists(GENERATOR_SCRIPT_PATH):
         raise FileNotFoundError(f"Generator script not found at {GENERATOR_SCRIPT_PATH}")
 
+    mtime_ns = os.stat(GENERATOR_SCRIPT_PATH).st_mtime_ns
+    module = sys.modules.get("mcp_jinja_generator")
+    if module is not None and getattr(module, "_loaded_mtime_ns", None) == mtime_ns:
+        return module
+
     spec = importlib.util.spec_from_file_location("mcp_jinja_generator", GENERATOR_SCRIPT_PATH)
     module = importlib.util.module_from_spec(spec)
+    # Registered so worker processes can unpickle the generator's functions
+    sys.modules["mcp_jinja_generator"] = module
     spec.loader.exec_module(module)
+    module._loaded_mtime_ns = mtime_ns
     return module
 
 
@@ -188,8 +188,12 @@ def generate_server_from_web():
             return jsonify({"error": f"Registry file not found for server: {server_name}"}), 400
 
         # Generate ALL server types by default
-        protocols_to_generate = ["rest", "stdio", "stream"]
+        protocols_to_generate = list(generator_module.PROTOCOLS)
         generated_files = []
+        unchanged_files = []
+
+        # Registry, tool definitions and context are loaded once for all protocols
+        engine = generator_module.ServerGenerationEngine()
 
         for protocol in protocols_to_generate:
             # Always use universal template for all protocols
@@ -217,7 +221,7 @@ def generate_server_from_web():
             # Generate this protocol's server
             # Get port from profile config
             server_port = profile_conf.get("port", 8080)
-            generator_module.generate_server(
+            changed = generator_module.generate_server(
                 template_path=protocol_template_path,
                 output_path=protocol_output_path,
                 registry_path=registry_path,
@@ -225,11 +229,14 @@ def generate_server_from_web():
                 server_name=server_name,
                 protocol_type=protocol,
                 port=server_port,
+                engine=engine,
             )
             generated_files.append(protocol_output_path)
+            if not changed:
+                unchanged_files.append(protocol_output_path)
 
         # Count tools for response
-        loaded_tools = generator_module.load_tool_definitions(tools_path)
+        loaded_tools = engine.load_tools(tools_path)
 
         return jsonify(
             {
@@ -241,6 +248,7 @@ def generate_server_from_web():
                 "registry_path": registry_path,
                 "tool_count": len(loaded_tools),
                 "generated_files": generated_files,
+                "unchanged_files": unchanged_files,
                 "protocols": protocols_to_generate,
             }
         )
@@ -11,6 +11,7 @@ A comprehensive file conversion and management system that supports:
 __version__ = "1.0.0"
 
 from .file_manager import FileManager
+from .async_file_manager import AsyncFileManager
 from .base_converter import BaseConverter
 from .converters import (
     PDFConverter,
@@ -29,6 +30,7 @@ from .config import Settings
 __all__ = [
     # Main entry point
     'FileManager',
+    'AsyncFileManager',
 
     # Converters
     'BaseConverter',
@@ -0,0 +1,421 @@
+"""Async facade over FileManager for the MCP servers."""
+
+import asyncio
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from .file_manager import FileManager, _convert_file_worker, _init_worker, plan_directory_files
+from .onedrive.async_downloader import AsyncOneDriveDownloader
+from .utils import setup_logger
+
+from mcp_editor.mcp_service_registry.mcp_service_decorator import mcp_service
+
+logger = setup_logger('async_file_manager')
+
+
+def _error_result(message: str, **extra) -> Dict[str, Any]:
+    """Build a failed processing result."""
+    result = {
+        'success': False,
+        'text': '',
+        'metadata': {},
+        'errors': [message]
+    }
+    result.update(extra)
+    return result
+
+
+class AsyncFileManager:
+    """Event-loop friendly FileManager.
+
+    CPU-bound conversions run in a shared process pool, OneDrive downloads
+    and metadata storage run in threads. Conversion tool calls are bounded
+    by max_concurrent_requests and cut off after request_timeout seconds,
+    so a long OCR job cannot starve other requests or health checks.
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None,
+                 file_manager: Optional[FileManager] = None):
+        """Initialize AsyncFileManager.
+
+        Args:
+            config: Optional configuration dictionary
+            file_manager: Optional existing FileManager to wrap
+        """
+        self.manager = file_manager or FileManager(config)
+        self.settings = self.manager.settings
+        self.request_timeout = float(self.settings.get('request_timeout', 300) or 0)
+        self.max_workers = max(1, int(self.settings.get('max_workers', 4)))
+        self._semaphore = asyncio.Semaphore(
+            max(1, int(self.settings.get('max_concurrent_requests', 4)))
+        )
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self.downloader = AsyncOneDriveDownloader(
+            self.manager.auth_manager,
+            concurrency=int(self.settings.get('onedrive_concurrency', 8))
+        )
+
+    @property
+    def metadata_manager(self):
+        """Metadata manager of the wrapped FileManager."""
+        return self.manager.metadata_manager
+
+    async def initialize(self):
+        """Start the conversion worker pool."""
+        self._get_executor()
+        logger.info(f"Conversion pool started with {self.max_workers} workers")
+
+    async def shutdown(self):
+        """Stop the conversion worker pool."""
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Get (or lazily create) the conversion process pool."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker
+            )
+        return self._executor
+
+    async def _run(self, operation: str,
+                   factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Run a conversion under the concurrency limit and request timeout.
+
+        The timeout covers time spent waiting for a slot as well. Work already
+        handed to the process pool cannot be cancelled, so on timeout the
+        caller gets an error result but the slot stays taken until the
+        operation actually finishes; max_concurrent_requests stays a real bound.
+
+        Args:
+            operation: Operation name for logging
+            factory: Callable returning the coroutine to run
+
+        Returns:
+            Operation result, or an error result on timeout
+        """
+        timeout = self.request_timeout or None
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout if timeout else None
+
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return self._timeout_result(operation)
+
+        task = asyncio.ensure_future(factory())
+        task.add_done_callback(self._release_slot)
+        try:
+            remaining = max(0.0, deadline - loop.time()) if deadline else None
+            return await asyncio.wait_for(asyncio.shield(task), timeout=remaining)
+        except asyncio.TimeoutError:
+            return self._timeout_result(operation)
+
+    def _release_slot(self, task: asyncio.Future):
+        """Free the concurrency slot once the operation has really finished."""
+        self._semaphore.release()
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Operation finished after timeout with error: {task.exception()}")
+
+    def _timeout_result(self, operation: str) -> Dict[str, Any]:
+        logger.error(f"{operation} timed out after {self.request_timeout}s")
+        return _error_result(f"{operation} timed out after {self.request_timeout}s")
+
+    async def _convert(self, file_path: str) -> Dict[str, Any]:
+        """Convert a local file in the process pool.
+
+        Args:
+            file_path: Path to local file
+
+        Returns:
+            Processing result (includes 'file')
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._get_executor(), _convert_file_worker, file_path)
+        except BrokenProcessPool as e:
+            # A crashed worker (e.g. OOM in OCR) breaks the pool; start a new one
+            logger.error(f"Conversion pool broken while converting {file_path}: {e}")
+            self._executor = None
+            return _error_result(f"Conversion worker crashed: {e}", file=file_path)
+
+    async def _save_if_requested(self, file_path: str, result: Dict[str, Any], **kwargs):
+        """Store metadata for a successful conversion when save_metadata is set."""
+        if result['success'] and kwargs.get('save_metadata', False):
+            await asyncio.to_thread(
+                self.manager.metadata_manager.save,
+                file_path, kwargs.get('keywords', []), result['metadata']
+            )
+
+    @mcp_service(
+        tool_name="convert_file_to_text",
+        server_name="file_handler",
+        service_name="process",
+        category="file_conversion",
+        tags=["file", "conversion", "text-extraction"],
+        priority=10,
+        description="Process file or URL for text extraction with support for PDF, DOCX, HWP, Excel, Images, and OneDrive URLs",
+        related_objects=["mcp_file_handler.async_file_manager.AsyncFileManager"]
+    )
+    async def process(self, input_path: str, **kwargs) -> Dict[str, Any]:
+        """Process file or URL for text extraction.
+
+        Args:
+            input_path: File path or URL to process
+            **kwargs: Additional options
+
+        Returns:
+            Dictionary with extracted text and metadata
+        """
+        detector = self.manager.file_detector
+        if detector.is_url(input_path):
+            if detector.is_onedrive_url(input_path):
+                return await self.process_onedrive(input_path, **kwargs)
+            return _error_result(f"Unsupported URL type: {input_path}")
+
+        return await self._run('process', lambda: self._process_local_file(input_path, **kwargs))
+
+    async def _process_local_file(self, file_path: str, **kwargs) -> Dict[str, Any]:
+        """Process local file.
+
+        Args:
+            file_path: Path to local file
+            **kwargs: Additional options
+
+        Returns:
+            Processing result
+        """
+        if not Path(file_path).exists():
+            return _error_result(f"File not found: {file_path}")
+
+        result = await self._convert(file_path)
+        result.pop('file', None)
+        await self._save_if_requested(file_path, result, **kwargs)
+        return result
+
+    @mcp_service(
+        tool_name="process_directory",
+        server_name="file_handler",
+        service_name="process_directory",
+        category="file_conversion",
+        tags=["directory", "batch", "conversion"],
+        priority=8,
+        description="Process all files in a directory with optional recursive scanning",
+        related_objects=["mcp_file_handler.async_file_manager.AsyncFileManager"]
+    )
+    async def process_directory(self, directory_path: str, **kwargs) -> List[Dict[str, Any]]:
+        """Process all files in a directory.
+
+        Args:
+            directory_path: Path to directory
+            **kwargs: Additional options (pattern, recursive)
+
+        Returns:
+            List of processing results
+        """
+        dir_path = Path(directory_path)
+        if not dir_path.exists() or not dir_path.is_dir():
+            logger.error(f"Invalid directory: {directory_path}")
+            return []
+
+        async def run():
+            files = await asyncio.to_thread(
+                lambda: [(str(p), p.stat().st_size) for p in self.manager._find_files(dir_path, **kwargs)]
+            )
+            scheduled, skipped = plan_directory_files(
+                files,
+                max_file_size=self.settings.get('max_file_size'),
+                max_total_size=self.settings.get('max_total_size')
+            )
+            results = await asyncio.gather(*(self._convert(path) for path, _ in scheduled))
+            for result in results:
+                await self._save_if_requested(result['file'], result, **kwargs)
+            return skipped + list(results)
+
+        result = await self._run('process_directory', run)
+        return [result] if isinstance(result, dict) else result
+
+    @mcp_service(
+        tool_name="convert_onedrive_to_text",
+        server_name="file_handler",
+        service_name="process_onedrive",
+        category="file_conversion",
+        tags=["onedrive", "cloud", "conversion"],
+        priority=9,
+        description="Convert OneDrive file or folder to text",
+        related_objects=["mcp_file_handler.async_file_manager.AsyncFileManager"]
+    )
+    async def process_onedrive(self, url: str, **kwargs) -> Dict[str, Any]:
+        """Process OneDrive URL for text extraction.
+
+        Args:
+            url: OneDrive URL
+            **kwargs: Additional options
+
+        Returns:
+            Processing result dictionary
+        """
+        return await self._run('process_onedrive', lambda: self._process_onedrive_url(url, **kwargs))
+
+    async def _process_onedrive_url(self, url: str, **kwargs) -> Dict[str, Any]:
+        """Download OneDrive items, then convert them in parallel.
+
+        Each call without output_dir downloads into its own temp directory.
+        With output_dir, unchanged files are skipped via the folder manifest.
+
+        Args:
+            url: OneDrive URL
+            **kwargs: Additional options
+
+        Returns:
+            Processing result
+        """
+        output_dir = kwargs.get('output_dir') or tempfile.mkdtemp(
+            prefix='onedrive_', dir=self.settings.get('onedrive_temp_dir')
+        )
+        result = {
+            'success': False,
+            'text': '',
+            'metadata': {},
+            'errors': []
+        }
+
+        try:
+            items = await self.downloader.download_by_url(
+                url, output_dir, recursive=kwargs.get('recursive', True)
+            )
+            if not items:
+                result['errors'].append("No files downloaded from OneDrive")
+                return result
+
+            result['errors'].extend(
+                f"{item['name']}: {item['error']}" for item in items if item.get('error')
+            )
+            files = [item for item in items if item['type'] == 'file' and not item.get('error')]
+            converted = await asyncio.gather(*(self._convert(item['local_path']) for item in files))
+
+            all_text = []
+            all_metadata = []
+            for item, file_result in zip(files, converted):
+                if file_result['success']:
+                    await self._save_if_requested(item['local_path'], file_result, **kwargs)
+                    all_text.append(f"--- {item['name']} ---")
+                    all_text.append(file_result['text'])
+                    all_metadata.append(file_result['metadata'])
+                else:
+                    result['errors'].extend(file_result['errors'])
+
+            result.update({
+                'success': len(all_text) > 0,
+                'text': '\n\n'.join(all_text),
+                'metadata': {
+                    'source': 'onedrive',
+                    'url': url,
+                    'files_processed': len(all_metadata),
+                    'file_metadata': all_metadata
+                }
+            })
+
+        except Exception as e:
+            logger.error(f"OneDrive processing failed for {url}: {e}")
+            result['errors'].append(str(e))
+        finally:
+            if not kwargs.get('output_dir'):
+                shutil.rmtree(output_dir, ignore_errors=True)
+
+        return result
+
+    @mcp_service(
+        tool_name="save_file_metadata",
+        server_name="file_handler",
+        service_name="save_metadata",
+        category="metadata",
+        tags=["metadata", "storage", "keywords"],
+        priority=5,
+        description="Save metadata for a processed file with keywords and additional information",
+        related_objects=["mcp_file_handler.async_file_manager.AsyncFileManager"]
+    )
+    async def save_metadata(self, file_url: str, keywords: List[str],
+                            additional_metadata: Optional[Dict[str, Any]] = None) -> bool:
+        """Save metadata for a file.
+
+        Args:
+            file_url: File URL or path
+            keywords: List of keywords
+            additional_metadata: Optional additional metadata
+
+        Returns:
+            True if successful
+        """
+        return await asyncio.to_thread(self.manager.save_metadata, file_url, keywords, additional_metadata)
+
+    @mcp_service(
+        tool_name="search_metadata",
+        server_name="file_handler",
+        service_name="search_metadata",
+        category="metadata",
+        tags=["metadata", "search", "query"],
+        priority=5,
+        description="Search file metadata by various criteria (keywords, date, file type, etc.)",
+        related_objects=["mcp_file_handler.async_file_manager.AsyncFileManager"]
+    )
+    async def search_metadata(self, **search_criteria) -> List[Dict[str, Any]]:
+        """Search metadata.
+
+        Args:
+            **search_criteria: Search criteria: keyword/keywords (exact,
+                case-insensitive), query (ranked full-text over keywords and
+                metadata values), file_url (substring), limit, offset
+
+        Returns:
+            List of matching metadata entries
+        """
+        return await asyncio.to_thread(lambda: self.manager.search_metadata(**search_criteria))
+
+    @mcp_service(
+        tool_name="get_file_metadata",
+        server_name="file_handler",
+        service_name="get_metadata",
+        category="metadata",
+        tags=["metadata", "retrieval"],
+        priority=5,
+        description="Get metadata for a specific file by URL",
+        related_objects=["mcp_file_handler.async_file_manager.AsyncFileManager"]
+    )
+    async def get_metadata(self, file_url: str) -> Optional[Dict[str, Any]]:
+        """Get metadata for a file.
+
+        Args:
+            file_url: File URL or path
+
+        Returns:
+            Metadata dictionary or None if not found
+        """
+        return await asyncio.to_thread(self.manager.get_metadata, file_url)
+
+    @mcp_service(
+        tool_name="delete_file_metadata",
+        server_name="file_handler",
+        service_name="delete_metadata",
+        category="metadata",
+        tags=["metadata", "deletion"],
+        priority=3,
+        description="Delete metadata for a specific file",
+        related_objects=["mcp_file_handler.async_file_manager.AsyncFileManager"]
+    )
+    async def delete_metadata(self, file_url: str) -> bool:
+        """Delete metadata for a file.
+
+        Args:
+            file_url: File URL or path
+
+        Returns:
+            True if successful
+        """
+        return await asyncio.to_thread(self.manager.delete_metadata, file_url)
@@ -1,13 +1,19 @@
 """Base converter interface for all file converters."""
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
 
+from core.file_sniffer import sniff_file
+
 
 class BaseConverter(ABC):
     """Abstract base class for all file converters."""
 
+    # Sniffed content kinds (core.file_sniffer) accepted regardless of the
+    # file extension, so misnamed files still reach the right converter
+    content_kinds: Tuple[str, ...] = ()
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """Initialize converter with optional configuration.
 
@@ -44,6 +50,17 @@ class BaseConverter(ABC):
         """
         pass
 
+    def supports_content(self, file_path: str) -> bool:
+        """Check if the file's magic bytes match this converter.
+
+        Args:
+            file_path: Path to the file to check
+
+        Returns:
+            True if the sniffed content kind is in content_kinds
+        """
+        return bool(self.content_kinds) and sniff_file(file_path) in self.content_kinds
+
     def get_metadata(self, file_path: str) -> Dict[str, Any]:
         """Extract metadata from file.
 
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+File Handler MCP Server 부하 테스트 / 벤치마크 (생성 파일)
+
+로컬 Graph 스텁(core.bench.GraphStub)을 띄우고 generate_universal_server.py 가 만든
+mcp_server/server_{stdio,rest,stream}.py 에 동시 tools/call 부하를 보내
+처리량, 지연 p50/p95/p99, peak RSS, 호출당 Graph 요청 수를 보고합니다.
+같은 설정으로 저장한 기준선(baseline_file_handler.json)과 비교해 회귀가 있으면 종료 코드 1 을 반환합니다.
+
+사용법:
+    python bench_file_handler.py                                  # 전체 프로토콜, 기준선 비교
+    python bench_file_handler.py --protocols rest,stream --concurrency 16 --requests 400
+    python bench_file_handler.py --latency-ms 50 --throttle 0.05 --items 500
+    python bench_file_handler.py --save-baseline                  # 현재 결과를 기준선으로 저장
+
+Generated by mcp_editor/jinja (create_mcp_project.py); SCENARIOS / TOOLS 는 직접 수정해도 됩니다.
+"""
+
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+BENCH_DIR = Path(__file__).resolve().parent
+SERVER_DIR = BENCH_DIR.parent / "mcp_server"
+
+for _candidate in [BENCH_DIR, *BENCH_DIR.parents]:
+    if (_candidate / "core" / "bench.py").exists():
+        sys.path.insert(0, str(_candidate))
+        break
+
+from core.bench import main  # noqa: E402
+
+PROFILE = "file_handler"
+
+SERVERS = {
+    "stdio": SERVER_DIR / "server_stdio.py",
+    "rest": SERVER_DIR / "server_rest.py",
+    "stream": SERVER_DIR / "server_stream.py",
+}
+
+BASELINE_FILE = BENCH_DIR / "baseline_file_handler.json"
+
+# 부하 대상 도구 (비우면 쓰기 계열 이름을 제외한 전체, --tools 로 덮어쓰기)
+TOOLS: List[str] = [
+    "convert_file_to_text",
+    "process_directory",
+    "search_metadata",
+    "convert_onedrive_to_text",
+    "get_file_metadata",
+]
+
+# 도구별 호출 인자 (inputSchema 로 만든 기본 인자에 덮어씀)
+SCENARIOS: Dict[str, Dict[str, Any]] = {
+}
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:], profile=PROFILE, servers=SERVERS, baseline_path=BASELINE_FILE,
+                  scenarios=SCENARIOS, tools=TOOLS))
\ No newline at end of file
@@ -26,6 +26,7 @@ class Settings:
         # OneDrive settings
         'onedrive_temp_dir': '/tmp/onedrive_downloads',
         'onedrive_recursive': True,
+        'onedrive_concurrency': 8,  # Concurrent Graph requests per folder download
 
         # Logging
         'log_level': 'INFO',
@@ -41,7 +42,11 @@ class Settings:
 
         # Processing
         'parallel_processing': False,
-        'max_workers': 4
+        'max_workers': 4,
+
+        # Async server facade
+        'max_concurrent_requests': 4,  # Concurrent conversion tool calls
+        'request_timeout': 300  # Seconds per conversion tool call
     }
 
     def __init__(self, config: Optional[Dict[str, Any]] = None):
@@ -76,14 +81,17 @@ class Settings:
             'MCP_ATTACHMENT_LOG_LEVEL': 'log_level',
             'MCP_ATTACHMENT_LOG_FILE': 'log_file',
             'MCP_ATTACHMENT_MAX_FILE_SIZE': 'max_file_size',
-            'MCP_ATTACHMENT_MAX_WORKERS': 'max_workers'
+            'MCP_ATTACHMENT_MAX_WORKERS': 'max_workers',
+            'MCP_ATTACHMENT_MAX_CONCURRENT_REQUESTS': 'max_concurrent_requests',
+            'MCP_ATTACHMENT_REQUEST_TIMEOUT': 'request_timeout'
         }
 
         for env_var, config_key in env_mappings.items():
             value = os.environ.get(env_var)
             if value:
                 # Convert numeric values
-                if config_key in ['max_file_size', 'max_total_size', 'max_workers']:
+                if config_key in ['max_file_size', 'max_total_size', 'max_workers',
+                                  'max_concurrent_requests', 'request_timeout']:
                     try:
                         value = int(value)
                     except ValueError:
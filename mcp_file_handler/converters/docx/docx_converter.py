@@ -11,6 +11,8 @@ logger = logging.getLogger(__name__)
 class DOCXConverter(BaseConverter):
     """Convert Microsoft Word DOCX files to text."""
 
+    content_kinds = ('docx',)
+
     def convert(self, file_path: str) -> str:
         """Convert DOCX file to text.
 
@@ -63,4 +65,4 @@ class DOCXConverter(BaseConverter):
             True if file has DOCX extension
         """
         path = Path(file_path)
-        return path.suffix.lower() in ['.docx', '.doc']
\ No newline at end of file
+        return path.suffix.lower() in ['.docx', '.doc'] or self.supports_content(file_path)
\ No newline at end of file
@@ -1,16 +1,174 @@
 """Excel to text converter."""
 
+from collections import deque
 from pathlib import Path
 import logging
-from typing import List
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 from ...base_converter import BaseConverter
+from core.file_sniffer import sniff_file
 
 logger = logging.getLogger(__name__)
 
+# Extensions openpyxl can read in read_only mode
+STREAMING_EXTENSIONS = ['.xlsx', '.xlsm']
+
+# Distinct values tracked per column in sampling mode
+MAX_DISTINCT_TRACKED = 1000
+
+
+def _format_row(row: Sequence[Any]) -> str:
+    """Render a row of cell values as tab-separated text ('' if empty)."""
+    values = ['' if cell is None else str(cell) for cell in row]
+    if not any(values):
+        return ''
+    return '\t'.join(values).rstrip('\t')
+
+
+class _ColumnStats:
+    """Running statistics for one column (sampling mode)."""
+
+    def __init__(self):
+        self.non_empty = 0
+        self.numeric = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        self.distinct = set()
+
+    def add(self, value: Any):
+        if value is None or value == '':
+            return
+        self.non_empty += 1
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            self.numeric += 1
+            self.total += value
+            self.min = value if self.min is None else min(self.min, value)
+            self.max = value if self.max is None else max(self.max, value)
+        if len(self.distinct) < MAX_DISTINCT_TRACKED:
+            self.distinct.add(value)
+
+    def describe(self) -> str:
+        distinct = len(self.distinct)
+        parts = [f"non-empty={self.non_empty}",
+                 f"distinct={distinct}{'+' if distinct >= MAX_DISTINCT_TRACKED else ''}"]
+        if self.numeric:
+            parts.append(f"min={self.min} max={self.max} mean={self.total / self.numeric:.4g}")
+        return ', '.join(parts)
+
+
+def stream_sheet_rows(sheets: Iterable[Tuple[str, Iterable[Sequence[Any]]]],
+                      max_rows_per_sheet: Optional[int] = None,
+                      max_rows: Optional[int] = None,
+                      max_chars: Optional[int] = None) -> Iterator[str]:
+    """Render sheets row by row under per-sheet and global budgets.
+
+    Args:
+        sheets: (sheet name, row iterator) pairs
+        max_rows_per_sheet: Non-empty rows emitted per sheet
+        max_rows: Non-empty rows emitted in total
+        max_chars: Characters emitted in total
+
+    Yields:
+        Text lines (sheet headers, rows, truncation notes)
+    """
+    total_rows = 0
+    total_chars = 0
+
+    for sheet_name, rows in sheets:
+        header = f"=== Sheet: {sheet_name} ==="
+        total_chars += len(header) + 1
+        yield header
+
+        sheet_rows = 0
+        for row in rows:
+            line = _format_row(row)
+            if not line:
+                continue
+            if max_rows_per_sheet and sheet_rows >= max_rows_per_sheet:
+                yield f"... (sheet truncated after {sheet_rows} rows)"
+                break
+            if (max_rows and total_rows >= max_rows) or (max_chars and total_chars >= max_chars):
+                yield f"... (workbook truncated after {total_rows} rows)"
+                return
+            sheet_rows += 1
+            total_rows += 1
+            total_chars += len(line) + 1
+            yield line
+
+        yield ""  # Add blank line between sheets
+
+
+def sample_sheet_rows(sheet_name: str, rows: Iterable[Sequence[Any]],
+                      head_rows: int = 5, tail_rows: int = 5) -> List[str]:
+    """Summarize a sheet as header, first/last rows and column statistics.
+
+    Rows are consumed in one pass; only head_rows + tail_rows rows are kept.
+
+    Args:
+        sheet_name: Sheet name
+        rows: Row iterator (first non-empty row is the header)
+        head_rows: Rows kept from the start
+        tail_rows: Rows kept from the end
+
+    Returns:
+        Text lines
+    """
+    header = None
+    head: List[str] = []
+    tail: deque = deque(maxlen=tail_rows)
+    stats: List[_ColumnStats] = []
+    count = 0
+
+    for row in rows:
+        line = _format_row(row)
+        if not line:
+            continue
+        if header is None:
+            header = row
+            continue
+        count += 1
+        if len(stats) < len(row):
+            stats.extend(_ColumnStats() for _ in range(len(row) - len(stats)))
+        for column, value in enumerate(row):
+            stats[column].add(value)
+        if len(head) < head_rows:
+            head.append(line)
+        elif tail_rows:
+            tail.append(line)
+
+    lines = [f"=== Sheet: {sheet_name} ({count} data rows) ==="]
+    if header is None:
+        lines.append("")
+        return lines
+
+    lines.append(_format_row(header))
+    lines.extend(head)
+    skipped = count - len(head) - len(tail)
+    if skipped > 0:
+        lines.append(f"... ({skipped} rows omitted)")
+    lines.extend(tail)
+
+    lines.append("--- Column stats ---")
+    for column, column_stats in enumerate(stats):
+        name = header[column] if column < len(header) and header[column] is not None else f"col{column + 1}"
+        if column_stats.non_empty:
+            lines.append(f"{name}: {column_stats.describe()}")
+    lines.append("")
+    return lines
+
 
 class ExcelConverter(BaseConverter):
-    """Convert Excel files to text."""
+    """Convert Excel files to text.
+
+    Config keys:
+        mode: 'stream' (default, openpyxl read_only), 'sample'
+            (header + first/last rows + column stats) or 'pandas'
+        max_rows_per_sheet, max_rows, max_chars: streaming budgets
+        sample_head_rows, sample_tail_rows: sampling window (default 5)
+    """
+
+    content_kinds = ('xlsx', 'xls')
 
     def convert(self, file_path: str) -> str:
         """Convert Excel file to text.
@@ -24,29 +182,19 @@ class ExcelConverter(BaseConverter):
         if not self.supports(file_path):
             raise ValueError(f"File {file_path} is not an Excel file")
 
-        try:
-            import openpyxl
-            import pandas as pd
-
-            # Use pandas for better data extraction
-            excel_file = pd.ExcelFile(file_path)
-            text_content = []
+        mode = self.config.get('mode', 'stream')
+        suffix = Path(file_path).suffix.lower()
+        # Misnamed OOXML workbooks are streamed too (.xlsb is also a ZIP)
+        streamable = suffix in STREAMING_EXTENSIONS or (
+            suffix not in ('.xls', '.xlsb') and sniff_file(file_path) == 'xlsx'
+        )
 
-            for sheet_name in excel_file.sheet_names:
-                df = excel_file.parse(sheet_name)
-
-                if df.empty:
-                    continue
-
-                # Add sheet header
-                text_content.append(f"=== Sheet: {sheet_name} ===")
-
-                # Convert dataframe to readable text
-                # Include column headers and data
-                text_content.append(df.to_string(index=False, na_rep=''))
-                text_content.append("")  # Add blank line between sheets
-
-            return '\n'.join(text_content)
+        try:
+            if mode == 'sample' and streamable:
+                return self.sample(file_path)
+            if mode != 'pandas' and streamable:
+                return '\n'.join(self.iter_lines(file_path))
+            return self._convert_with_pandas(file_path)
 
         except ImportError:
             # Fallback to openpyxl only
@@ -60,35 +208,107 @@ class ExcelConverter(BaseConverter):
             logger.error(f"Error converting Excel {file_path}: {e}")
             raise
 
-    def _convert_with_openpyxl(self, file_path: str) -> str:
-        """Convert using openpyxl only.
+    def _iter_sheets(self, workbook) -> Iterator[Tuple[str, Iterable[Sequence[Any]]]]:
+        """Yield (sheet name, row iterator) pairs of a workbook."""
+        for sheet_name in workbook.sheetnames:
+            yield sheet_name, workbook[sheet_name].iter_rows(values_only=True)
+
+    def iter_lines(self, file_path: str) -> Iterator[str]:
+        """Stream workbook text line by line (openpyxl read_only mode).
+
+        Memory use is bounded by a single row regardless of workbook size.
+
+        Args:
+            file_path: Path to the Excel file
+
+        Yields:
+            Text lines
+        """
+        import openpyxl
+
+        workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            yield from stream_sheet_rows(
+                self._iter_sheets(workbook),
+                max_rows_per_sheet=self.config.get('max_rows_per_sheet'),
+                max_rows=self.config.get('max_rows'),
+                max_chars=self.config.get('max_chars')
+            )
+        finally:
+            workbook.close()
+
+    def sample(self, file_path: str) -> str:
+        """Summarize each sheet for LLM consumption.
 
         Args:
             file_path: Path to the Excel file
 
         Returns:
-            Extracted text content
+            Header, first/last rows and column statistics per sheet
         """
         import openpyxl
 
-        workbook = openpyxl.load_workbook(file_path, data_only=True)
+        workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            lines = []
+            for sheet_name, rows in self._iter_sheets(workbook):
+                lines.extend(sample_sheet_rows(
+                    sheet_name, rows,
+                    head_rows=self.config.get('sample_head_rows', 5),
+                    tail_rows=self.config.get('sample_tail_rows', 5)
+                ))
+            return '\n'.join(lines)
+        finally:
+            workbook.close()
+
+    def _convert_with_pandas(self, file_path: str) -> str:
+        """Convert using pandas (loads each sheet fully; used for .xls/.xlsb).
+
+        Args:
+            file_path: Path to the Excel file
+
+        Returns:
+            Extracted text content
+        """
+        import pandas as pd
+
+        # Use pandas for better data extraction
+        excel_file = pd.ExcelFile(file_path)
         text_content = []
 
-        for sheet_name in workbook.sheetnames:
-            sheet = workbook[sheet_name]
-            text_content.append(f"=== Sheet: {sheet_name} ===")
+        for sheet_name in excel_file.sheet_names:
+            df = excel_file.parse(sheet_name)
+
+            if df.empty:
+                continue
 
-            for row in sheet.iter_rows(values_only=True):
-                # Filter out empty rows
-                row_values = [str(cell) if cell is not None else '' for cell in row]
-                if any(row_values):
-                    text_content.append('\t'.join(row_values))
+            # Add sheet header
+            text_content.append(f"=== Sheet: {sheet_name} ===")
 
+            # Convert dataframe to readable text
+            # Include column headers and data
+            text_content.append(df.to_string(index=False, na_rep=''))
             text_content.append("")  # Add blank line between sheets
 
-        workbook.close()
         return '\n'.join(text_content)
 
+    def _convert_with_openpyxl(self, file_path: str) -> str:
+        """Convert using openpyxl only.
+
+        Args:
+            file_path: Path to the Excel file
+
+        Returns:
+            Extracted text content
+        """
+        import openpyxl
+
+        workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            return '\n'.join(stream_sheet_rows(self._iter_sheets(workbook)))
+        finally:
+            workbook.close()
+
     def supports(self, file_path: str) -> bool:
         """Check if file is an Excel file.
 
@@ -99,4 +319,4 @@ class ExcelConverter(BaseConverter):
             True if file has Excel extension
         """
         path = Path(file_path)
-        return path.suffix.lower() in ['.xlsx', '.xls', '.xlsm', '.xlsb']
\ No newline at end of file
+        return path.suffix.lower() in ['.xlsx', '.xls', '.xlsm', '.xlsb'] or self.supports_content(file_path)
@@ -13,6 +13,8 @@ logger = logging.getLogger(__name__)
 class HWPConverter(BaseConverter):
     """Convert HWP files to text."""
 
+    content_kinds = ('hwp',)
+
     def convert(self, file_path: str) -> str:
         """Convert HWP file to text.
 
@@ -106,4 +108,4 @@ class HWPConverter(BaseConverter):
             True if file has HWP extension
         """
         path = Path(file_path)
-        return path.suffix.lower() == '.hwp'
\ No newline at end of file
+        return path.suffix.lower() == '.hwp' or self.supports_content(file_path)
\ No newline at end of file
@@ -1,5 +1,6 @@
 """Image OCR converter module."""
 
 from .ocr_converter import OCRConverter
+from .ocr_service import OCRService, get_ocr_service
 
-__all__ = ['OCRConverter']
\ No newline at end of file
+__all__ = ['OCRConverter', 'OCRService', 'get_ocr_service']
\ No newline at end of file
@@ -2,9 +2,9 @@
 
 from pathlib import Path
 import logging
-from typing import Optional
 
 from ...base_converter import BaseConverter
+from .ocr_service import OCRService, ocr_service_from_config, preprocess_image
 
 logger = logging.getLogger(__name__)
 
@@ -12,6 +12,8 @@ logger = logging.getLogger(__name__)
 class OCRConverter(BaseConverter):
     """Convert images to text using OCR."""
 
+    content_kinds = ('png', 'jpeg', 'gif', 'bmp', 'tiff')
+
     def convert(self, file_path: str) -> str:
         """Convert image file to text using OCR.
 
@@ -25,20 +27,7 @@ class OCRConverter(BaseConverter):
             raise ValueError(f"File {file_path} is not a supported image format")
 
         try:
-            import pytesseract
-            from PIL import Image
-
-            # Open and process image
-            image = Image.open(file_path)
-
-            # Get OCR language from config, default to English
-            lang = self.config.get('ocr_lang', 'eng')
-
-            # Perform OCR
-            text = pytesseract.image_to_string(image, lang=lang)
-
-            # Clean up text
-            text = text.strip()
+            text = self.get_service().recognize(Path(file_path).read_bytes())
             if not text:
                 return "No text found in image"
 
@@ -67,39 +56,31 @@ class OCRConverter(BaseConverter):
             '.png', '.jpg', '.jpeg', '.gif', '.bmp',
             '.tiff', '.tif', '.webp', '.ico'
         ]
-        return path.suffix.lower() in supported_formats
+        return path.suffix.lower() in supported_formats or self.supports_content(file_path)
 
-    def preprocess_image(self, file_path: str) -> Optional[str]:
-        """Preprocess image for better OCR results.
+    def get_service(self) -> OCRService:
+        """Get the shared OCR service for this converter's config.
+
+        Returns:
+            OCRService instance
+        """
+        return ocr_service_from_config(self.config)
+
+    def preprocess_image(self, file_path: str):
+        """Preprocess image for better OCR results (in memory).
 
         Args:
             file_path: Path to the image file
 
         Returns:
-            Path to preprocessed image or None
+            Preprocessed PIL image or None
         """
         try:
-            from PIL import Image, ImageEnhance, ImageFilter
-            import tempfile
-
-            image = Image.open(file_path)
-
-            # Convert to grayscale
-            if image.mode != 'L':
-                image = image.convert('L')
-
-            # Enhance contrast
-            enhancer = ImageEnhance.Contrast(image)
-            image = enhancer.enhance(2.0)
-
-            # Apply sharpening filter
-            image = image.filter(ImageFilter.SHARPEN)
+            from PIL import Image
 
-            # Save preprocessed image
-            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                image.save(tmp.name)
-                return tmp.name
+            with Image.open(file_path) as image:
+                return preprocess_image(image)
 
         except Exception as e:
             logger.warning(f"Image preprocessing failed: {e}")
-            return None
\ No newline at end of file
+            return None
@@ -0,0 +1,322 @@
+"""OCR service with long-lived engines, in-memory preprocessing and a result cache.
+
+Recognition uses tesserocr when it is installed, so the Tesseract engine is
+loaded once per process instead of spawning a tesseract binary per image
+(pytesseract is the fallback). With workers > 1 a process pool keeps one
+engine per worker. Results are cached in SQLite by image hash, language
+and preprocessing flag, in a per-user cache directory only the owner can read.
+"""
+
+import hashlib
+import io
+import logging
+import os
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Longest image side fed to Tesseract; larger scans are downscaled
+DEFAULT_MAX_SIDE = 3000
+
+
+def default_ocr_cache_path() -> str:
+    """Per-user OCR cache path ($XDG_CACHE_HOME or ~/.cache)/mcp_file_handler/ocr_cache.db.
+
+    The cache holds recognized document text, so its directory is kept private (0700).
+    """
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    cache_dir = os.path.join(cache_home, 'mcp_file_handler')
+    os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+    os.chmod(cache_dir, 0o700)
+    return os.path.join(cache_dir, 'ocr_cache.db')
+
+# Per-process recognizer (created once in _init_ocr_worker)
+_worker_engine = None
+
+
+def preprocess_image(image, max_side: int = DEFAULT_MAX_SIDE):
+    """Grayscale, downscale and binarise a PIL image in memory.
+
+    Binarisation uses an Otsu threshold computed with NumPy when it is
+    available, otherwise a fixed mid-grey threshold.
+
+    Args:
+        image: PIL image
+        max_side: Longest side after downscaling
+
+    Returns:
+        Preprocessed PIL image (mode 'L')
+    """
+    from PIL import Image, ImageOps
+
+    if image.mode != 'L':
+        image = image.convert('L')
+
+    longest = max(image.size)
+    if max_side and longest > max_side:
+        scale = max_side / longest
+        image = image.resize(
+            (max(1, int(image.width * scale)), max(1, int(image.height * scale))),
+            Image.LANCZOS
+        )
+
+    image = ImageOps.autocontrast(image)
+
+    try:
+        import numpy as np
+
+        pixels = np.asarray(image)
+        threshold = otsu_threshold(np.bincount(pixels.ravel(), minlength=256))
+        return Image.fromarray(np.where(pixels > threshold, 255, 0).astype('uint8'), mode='L')
+    except ImportError:
+        return image.point(lambda value: 255 if value > 127 else 0)
+
+
+def otsu_threshold(histogram: Sequence[int]) -> int:
+    """Compute the Otsu threshold of a 256-bin grey-level histogram.
+
+    Args:
+        histogram: Pixel counts per grey level
+
+    Returns:
+        Threshold grey level
+    """
+    total = sum(histogram)
+    weighted_total = sum(level * count for level, count in enumerate(histogram))
+    background = 0
+    background_sum = 0.0
+    best_threshold = 127
+    best_variance = -1.0
+
+    for level, count in enumerate(histogram):
+        background += count
+        if background == 0:
+            continue
+        foreground = total - background
+        if foreground == 0:
+            break
+        background_sum += level * count
+        mean_background = background_sum / background
+        mean_foreground = (weighted_total - background_sum) / foreground
+        variance = background * foreground * (mean_background - mean_foreground) ** 2
+        if variance > best_variance:
+            best_variance = variance
+            best_threshold = level
+
+    return best_threshold
+
+
+class _Recognizer:
+    """Tesseract engine that stays loaded for the life of the process."""
+
+    def __init__(self, lang: str, preprocess: bool, max_side: int):
+        self.lang = lang
+        self.preprocess = preprocess
+        self.max_side = max_side
+        self._api = None
+        try:
+            import tesserocr
+            self._api = tesserocr.PyTessBaseAPI(lang=lang)
+        except Exception:
+            # tesserocr missing or language data unavailable; use pytesseract
+            self._api = None
+
+    def recognize(self, image_bytes: bytes) -> str:
+        from PIL import Image
+
+        image = Image.open(io.BytesIO(image_bytes))
+        if self.preprocess:
+            image = preprocess_image(image, self.max_side)
+
+        if self._api is not None:
+            self._api.SetImage(image)
+            return self._api.GetUTF8Text().strip()
+
+        import pytesseract
+        return pytesseract.image_to_string(image, lang=self.lang).strip()
+
+
+def _init_ocr_worker(lang: str, preprocess: bool, max_side: int):
+    """Initialize an OCR worker process."""
+    global _worker_engine
+    _worker_engine = _Recognizer(lang, preprocess, max_side)
+
+
+def _recognize_worker(image_bytes: bytes) -> str:
+    """Recognize one image inside a pool worker."""
+    return _worker_engine.recognize(image_bytes)
+
+
+class OCRCache:
+    """SQLite cache of OCR output keyed by image hash."""
+
+    def __init__(self, db_path: str):
+        """Initialize cache.
+
+        Args:
+            db_path: SQLite database path
+        """
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), mode=0o700, exist_ok=True)
+        # Owner-only database file (SQLite journals inherit its permissions)
+        os.close(os.open(db_path, os.O_RDWR | os.O_CREAT, 0o600))
+        os.chmod(db_path, 0o600)
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS ocr_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    text TEXT NOT NULL
+                )
+            """)
+            conn.commit()
+        finally:
+            conn.close()
+
+    def get_many(self, keys: List[str]) -> Dict[str, str]:
+        """Look up cached text for keys (chunked IN queries)."""
+        found = {}
+        conn = sqlite3.connect(self.db_path)
+        try:
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                placeholders = ','.join('?' * len(chunk))
+                rows = conn.execute(
+                    f"SELECT cache_key, text FROM ocr_cache WHERE cache_key IN ({placeholders})",
+                    chunk
+                ).fetchall()
+                found.update(rows)
+        finally:
+            conn.close()
+        return found
+
+    def put_many(self, entries: Dict[str, str]):
+        """Store OCR text for keys."""
+        if not entries:
+            return
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.executemany(
+                "INSERT OR REPLACE INTO ocr_cache (cache_key, text) VALUES (?, ?)",
+                list(entries.items())
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+
+class OCRService:
+    """Batched OCR over long-lived Tesseract engines."""
+
+    def __init__(self, lang: str = 'eng', workers: int = 1, preprocess: bool = True,
+                 max_side: int = DEFAULT_MAX_SIDE, cache_path: Optional[str] = None):
+        """Initialize OCR service.
+
+        Args:
+            lang: Tesseract language
+            workers: Worker processes (1 recognizes in-process)
+            preprocess: Downscale/binarise images before recognition
+            max_side: Longest image side after downscaling
+            cache_path: SQLite cache path (None disables caching)
+        """
+        self.lang = lang
+        self.workers = max(1, workers)
+        self.preprocess = preprocess
+        self.max_side = max_side
+        self.cache = OCRCache(cache_path) if cache_path else None
+        self._engine: Optional[_Recognizer] = None
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def cache_key(self, image_bytes: bytes) -> str:
+        """Cache key for an image under the current OCR settings."""
+        digest = hashlib.sha256(image_bytes).hexdigest()
+        return f"{digest}:{self.lang}:{int(self.preprocess)}:{self.max_side}"
+
+    def recognize_many(self, images: List[bytes]) -> List[str]:
+        """Recognize a batch of encoded images (PNG/JPEG/... bytes).
+
+        Args:
+            images: Encoded image bytes
+
+        Returns:
+            Recognized text per image, in input order
+        """
+        keys = [self.cache_key(image) for image in images]
+        cached = self.cache.get_many(list(set(keys))) if self.cache else {}
+
+        # Recognize each distinct uncached image once
+        missing = {}
+        for key, image in zip(keys, images):
+            if key not in cached and key not in missing:
+                missing[key] = image
+
+        if missing:
+            logger.info(f"OCR: {len(missing)} images to recognize, {len(images) - len(missing)} cached")
+            texts = self._recognize(list(missing.values()))
+            recognized = dict(zip(missing.keys(), texts))
+            if self.cache:
+                self.cache.put_many(recognized)
+            cached.update(recognized)
+
+        return [cached[key] for key in keys]
+
+    def recognize(self, image_bytes: bytes) -> str:
+        """Recognize a single encoded image."""
+        return self.recognize_many([image_bytes])[0]
+
+    def _recognize(self, images: List[bytes]) -> List[str]:
+        """Run recognition in-process or in the worker pool."""
+        if self.workers <= 1 or len(images) <= 1:
+            if self._engine is None:
+                self._engine = _Recognizer(self.lang, self.preprocess, self.max_side)
+            return [self._engine.recognize(image) for image in images]
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_ocr_worker,
+                initargs=(self.lang, self.preprocess, self.max_side)
+            )
+        return list(self._executor.map(_recognize_worker, images))
+
+    def close(self):
+        """Shut down the worker pool."""
+        if self._executor:
+            self._executor.shutdown()
+            self._executor = None
+
+
+_services: Dict[tuple, OCRService] = {}
+
+
+def get_ocr_service(lang: str = 'eng', workers: int = 1, preprocess: bool = True,
+                    cache_path: Optional[str] = None) -> OCRService:
+    """Get a shared OCRService for the given settings (one per process)."""
+    key = (lang, workers, preprocess, cache_path)
+    if key not in _services:
+        _services[key] = OCRService(lang=lang, workers=workers, preprocess=preprocess,
+                                    cache_path=cache_path)
+    return _services[key]
+
+
+def ocr_service_from_config(config: Dict) -> OCRService:
+    """Get the shared OCRService for a converter config.
+
+    Config keys: 'ocr_lang' (default 'eng'), 'ocr_workers' (default 1),
+    'ocr_preprocess' (default True) and 'ocr_cache_path' (default
+    default_ocr_cache_path(); None disables the cache).
+
+    Args:
+        config: Converter configuration
+
+    Returns:
+        OCRService instance
+    """
+    return get_ocr_service(
+        lang=config.get('ocr_lang', 'eng'),
+        workers=config.get('ocr_workers', 1),
+        preprocess=config.get('ocr_preprocess', True),
+        cache_path=config['ocr_cache_path'] if 'ocr_cache_path' in config else default_ocr_cache_path()
+    )
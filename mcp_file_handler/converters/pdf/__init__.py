@@ -1,5 +1,6 @@
 """PDF converter module."""
 
 from .pdf_converter import PDFConverter
+from .pdf_engine import iter_pdf_pages
 
-__all__ = ['PDFConverter']
\ No newline at end of file
+__all__ = ['PDFConverter', 'iter_pdf_pages']
\ No newline at end of file
@@ -1,17 +1,35 @@
 """PDF to text converter."""
 
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator, List, Tuple
 import logging
 
 from ...base_converter import BaseConverter
+from ..image.ocr_service import ocr_service_from_config
+from .pdf_engine import count_pages, iter_pdf_pages
+
+# Scanned pages rendered and recognized per batch
+OCR_BATCH_PAGES = 8
 
 logger = logging.getLogger(__name__)
 
 
+def _page_runs(pages: List[int]) -> List[Tuple[int, int]]:
+    """Group sorted page numbers into (first, last) runs of consecutive pages."""
+    runs: List[Tuple[int, int]] = []
+    for page_number in pages:
+        if runs and runs[-1][1] == page_number - 1:
+            runs[-1] = (runs[-1][0], page_number)
+        else:
+            runs.append((page_number, page_number))
+    return runs
+
+
 class PDFConverter(BaseConverter):
     """Convert PDF files to text."""
 
+    content_kinds = ('pdf',)
+
     def convert(self, file_path: str) -> str:
         """Convert PDF file to text.
 
@@ -25,17 +43,7 @@ class PDFConverter(BaseConverter):
             raise ValueError(f"File {file_path} is not a PDF file")
 
         try:
-            import pdfplumber
-
-            text_content = []
-            with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_content.append(page_text)
-
-            return '\n\n'.join(text_content)
-
+            return '\n\n'.join(text for _, text in self.iter_pages(file_path))
         except ImportError:
             logger.error("pdfplumber not installed. Install with: pip install pdfplumber")
             raise
@@ -43,6 +51,30 @@ class PDFConverter(BaseConverter):
             logger.error(f"Error converting PDF {file_path}: {e}")
             raise
 
+    def iter_pages(self, file_path: str,
+                   pages: Optional[Tuple[int, int]] = None,
+                   max_chars: Optional[int] = None) -> Iterator[Tuple[int, str]]:
+        """Stream page text from a PDF file.
+
+        Config keys: 'max_chars' (default budget), 'workers' (processes,
+        default 1) and 'fast_path' (try PyMuPDF first, default True).
+
+        Args:
+            file_path: Path to the PDF file
+            pages: Optional (first, last) 1-based inclusive page range
+            max_chars: Stop after this many characters (overrides config)
+
+        Yields:
+            (page number, text) for pages with text
+        """
+        return iter_pdf_pages(
+            file_path,
+            pages=pages,
+            max_chars=max_chars if max_chars is not None else self.config.get('max_chars'),
+            workers=self.config.get('workers', 1),
+            fast_path=self.config.get('fast_path', True)
+        )
+
     def supports(self, file_path: str) -> bool:
         """Check if file is a PDF.
 
@@ -53,33 +85,52 @@ class PDFConverter(BaseConverter):
             True if file has PDF extension
         """
         path = Path(file_path)
-        return path.suffix.lower() == '.pdf'
+        return path.suffix.lower() == '.pdf' or self.supports_content(file_path)
 
     def convert_with_ocr(self, file_path: str) -> str:
         """Convert PDF with OCR for scanned documents.
 
+        Pages that already have a text layer are extracted directly; only
+        the remaining pages are rendered and recognized, in batches.
+
         Args:
             file_path: Path to the PDF file
 
         Returns:
-            OCR extracted text content
+            Text content per page
         """
         try:
             import pdf2image
-            import pytesseract
-            from PIL import Image
-
-            # Convert PDF to images
-            images = pdf2image.convert_from_path(file_path)
-
-            # Extract text from each image using OCR
-            text_content = []
-            for i, image in enumerate(images):
-                text = pytesseract.image_to_string(image)
-                if text.strip():
-                    text_content.append(f"--- Page {i+1} ---\n{text}")
-
-            return '\n\n'.join(text_content)
+            from io import BytesIO
+
+            page_texts = dict(iter_pdf_pages(file_path, fast_path=self.config.get('fast_path', True)))
+            total_pages = count_pages(file_path)
+            scanned = [n for n in range(1, total_pages + 1) if n not in page_texts]
+            service = ocr_service_from_config(self.config)
+
+            for i in range(0, len(scanned), OCR_BATCH_PAGES):
+                batch = scanned[i:i + OCR_BATCH_PAGES]
+                images = []
+                # One render per run of consecutive pages (poppler parses the file once per call)
+                for first, last in _page_runs(batch):
+                    rendered = pdf2image.convert_from_path(
+                        file_path, dpi=self.config.get('ocr_dpi', 300),
+                        first_page=first, last_page=last
+                    )
+                    for image in rendered:
+                        buffer = BytesIO()
+                        image.save(buffer, format='PNG')
+                        images.append(buffer.getvalue())
+
+                for page_number, text in zip(batch, service.recognize_many(images)):
+                    if text.strip():
+                        page_texts[page_number] = text
+
+            logger.info(f"OCR: {len(scanned)} of {total_pages} pages needed recognition")
+
+            return '\n\n'.join(
+                f"--- Page {n} ---\n{page_texts[n]}" for n in sorted(page_texts)
+            )
 
         except ImportError as e:
             logger.error(f"Missing OCR dependencies: {e}")
@@ -87,4 +138,4 @@ class PDFConverter(BaseConverter):
             raise
         except Exception as e:
             logger.error(f"Error in OCR conversion of {file_path}: {e}")
-            raise
\ No newline at end of file
+            raise
@@ -0,0 +1,187 @@
+"""Page-streaming PDF text extraction engine.
+
+Pages are extracted in contiguous chunks, optionally spread across worker
+processes, and yielded in page order as soon as they are ready. Extraction
+stops once a character budget is met. A fast text-layer extractor
+(PyMuPDF) is tried first; pdfplumber is used for pages without a text
+layer or with table/form-like layouts, or when PyMuPDF is not installed.
+"""
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from typing import Iterator, List, Optional, Tuple, Union
+import logging
+
+logger = logging.getLogger(__name__)
+
+PdfSource = Union[str, bytes]
+
+# Pages per extraction task
+DEFAULT_CHUNK_PAGES = 16
+
+# Pages with at least this many text blocks, mostly short ones, are treated
+# as tables/forms and re-extracted with pdfplumber
+LAYOUT_BLOCK_THRESHOLD = 40
+SHORT_BLOCK_CHARS = 20
+
+
+def _open_fitz(source: PdfSource):
+    """Open source with PyMuPDF, or return None if it is not installed."""
+    try:
+        import fitz
+    except ImportError:
+        return None
+    if isinstance(source, bytes):
+        return fitz.open(stream=source, filetype='pdf')
+    return fitz.open(source)
+
+
+def _open_pdfplumber(source: PdfSource):
+    """Open source with pdfplumber."""
+    import pdfplumber
+    return pdfplumber.open(BytesIO(source) if isinstance(source, bytes) else source)
+
+
+def count_pages(source: PdfSource) -> int:
+    """Count pages in a PDF.
+
+    Args:
+        source: PDF file path or bytes
+
+    Returns:
+        Number of pages
+    """
+    doc = _open_fitz(source)
+    if doc is not None:
+        with doc:
+            return doc.page_count
+    with _open_pdfplumber(source) as pdf:
+        return len(pdf.pages)
+
+
+def is_layout_heavy(blocks: List[tuple]) -> bool:
+    """Check whether PyMuPDF text blocks look like a table or form.
+
+    Args:
+        blocks: Result of page.get_text('blocks')
+
+    Returns:
+        True if the page should be re-extracted with pdfplumber
+    """
+    texts = [b[4].strip() for b in blocks if len(b) > 6 and b[6] == 0 and b[4].strip()]
+    if len(texts) < LAYOUT_BLOCK_THRESHOLD:
+        return False
+    short = sum(1 for text in texts if len(text) < SHORT_BLOCK_CHARS)
+    return short * 2 > len(texts)
+
+
+def extract_page_range(source: PdfSource, start: int, end: int,
+                       fast_path: bool = True) -> List[Tuple[int, str]]:
+    """Extract text from pages [start, end) (0-based).
+
+    Args:
+        source: PDF file path or bytes
+        start: First page index
+        end: Page index after the last page
+        fast_path: Try PyMuPDF before pdfplumber
+
+    Returns:
+        List of (1-based page number, text) in page order
+    """
+    texts = {}
+    fallback = list(range(start, end))
+
+    doc = _open_fitz(source) if fast_path else None
+    if doc is not None:
+        fallback = []
+        with doc:
+            for index in range(start, min(end, doc.page_count)):
+                page = doc[index]
+                text = page.get_text('text').strip()
+                if not text or is_layout_heavy(page.get_text('blocks')):
+                    fallback.append(index)
+                else:
+                    texts[index] = text
+
+    if fallback:
+        with _open_pdfplumber(source) as pdf:
+            for index in fallback:
+                if index >= len(pdf.pages):
+                    break
+                page = pdf.pages[index]
+                texts[index] = (page.extract_text() or '').strip()
+                # Release parsed layout objects; long documents otherwise
+                # keep every page in memory
+                if hasattr(page, 'close'):
+                    page.close()
+
+    return [(index + 1, texts[index]) for index in sorted(texts)]
+
+
+def iter_pdf_pages(source: PdfSource,
+                   pages: Optional[Tuple[int, int]] = None,
+                   max_chars: Optional[int] = None,
+                   workers: int = 1,
+                   chunk_pages: int = DEFAULT_CHUNK_PAGES,
+                   fast_path: bool = True) -> Iterator[Tuple[int, str]]:
+    """Yield page text in page order, stopping once max_chars is reached.
+
+    With workers > 1, page chunks are extracted in a process pool with at
+    most 2 * workers chunks in flight, so an early exit does not pay for
+    the rest of the document.
+
+    Args:
+        source: PDF file path or bytes
+        pages: Optional (first, last) 1-based inclusive page range
+        max_chars: Stop after this many characters (None for no limit)
+        workers: Number of worker processes
+        chunk_pages: Pages per extraction task
+        fast_path: Try PyMuPDF before pdfplumber
+
+    Yields:
+        (1-based page number, text) for pages with text
+    """
+    total = count_pages(source)
+    first, last = pages or (1, total)
+    start, end = max(first, 1) - 1, min(last, total)
+    chunks = [(s, min(s + chunk_pages, end)) for s in range(start, end, chunk_pages)]
+    emitted = 0
+
+    def emit(results):
+        nonlocal emitted
+        for page_number, text in results:
+            if text:
+                emitted += len(text)
+                yield page_number, text
+            if max_chars and emitted >= max_chars:
+                return
+
+    if workers <= 1 or len(chunks) <= 1:
+        for chunk_start, chunk_end in chunks:
+            yield from emit(extract_page_range(source, chunk_start, chunk_end, fast_path))
+            if max_chars and emitted >= max_chars:
+                return
+        return
+
+    executor = ProcessPoolExecutor(max_workers=workers)
+    pending = deque()
+    remaining = iter(chunks)
+
+    def submit_next():
+        chunk = next(remaining, None)
+        if chunk:
+            pending.append(executor.submit(extract_page_range, source, chunk[0], chunk[1], fast_path))
+
+    try:
+        for _ in range(workers * 2):
+            submit_next()
+        while pending:
+            results = pending.popleft().result()
+            yield from emit(results)
+            if max_chars and emitted >= max_chars:
+                logger.debug(f"PDF character budget reached after {emitted} chars")
+                return
+            submit_next()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
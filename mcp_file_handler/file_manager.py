@@ -2,8 +2,9 @@
 
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 import tempfile
 import shutil
 import logging
@@ -17,11 +18,102 @@ from .metadata.manager import MetadataManager
 from .onedrive.processor import OneDriveProcessor
 from .config.settings import Settings
 
-# Import mcp_service decorator
-from mcp_editor.mcp_service_registry.mcp_service_decorator import mcp_service
-
 logger = setup_logger('file_manager')
 
+_MB = 1024 * 1024
+
+# Per-process FileDetector for pool workers (created once in _init_worker)
+_worker_detector: Optional[FileDetector] = None
+
+
+def _init_worker():
+    """Initialize a conversion worker process."""
+    global _worker_detector
+    _worker_detector = FileDetector()
+
+
+def _convert_file_worker(file_path: str) -> Dict[str, Any]:
+    """Convert a single local file inside a pool worker.
+
+    Args:
+        file_path: Path to local file
+
+    Returns:
+        Processing result (same shape as FileManager._process_local_file)
+    """
+    detector = _worker_detector or FileDetector()
+    result = {
+        'success': False,
+        'text': '',
+        'metadata': {},
+        'errors': [],
+        'file': file_path
+    }
+
+    converter = detector.get_converter(file_path)
+    if not converter:
+        result['errors'].append(f"No converter available for: {file_path}")
+        return result
+
+    try:
+        result.update({
+            'success': True,
+            'text': converter.convert(file_path),
+            'metadata': converter.get_metadata(file_path)
+        })
+    except Exception as e:
+        result['errors'].append(str(e))
+
+    return result
+
+
+def plan_directory_files(
+    files: List[Tuple[str, int]],
+    max_file_size: Optional[float] = None,
+    max_total_size: Optional[float] = None
+) -> Tuple[List[Tuple[str, int]], List[Dict[str, Any]]]:
+    """Apply size limits and order files for batch conversion.
+
+    Limits are checked in the given order; accepted files are then sorted
+    largest-first so the longest conversions start early.
+
+    Args:
+        files: List of (path, size in bytes)
+        max_file_size: Per-file limit in MB (None or <= 0 disables)
+        max_total_size: Total limit in MB (None or <= 0 disables)
+
+    Returns:
+        Tuple of (scheduled files, skipped results)
+    """
+    scheduled = []
+    skipped = []
+    total = 0
+
+    for file_path, size in files:
+        if max_file_size and max_file_size > 0 and size > max_file_size * _MB:
+            skipped.append({
+                'success': False,
+                'text': '',
+                'metadata': {},
+                'errors': [f"File exceeds max_file_size ({max_file_size} MB): {file_path}"],
+                'file': file_path
+            })
+            continue
+        if max_total_size and max_total_size > 0 and total + size > max_total_size * _MB:
+            skipped.append({
+                'success': False,
+                'text': '',
+                'metadata': {},
+                'errors': [f"Skipped, max_total_size ({max_total_size} MB) reached: {file_path}"],
+                'file': file_path
+            })
+            continue
+        total += size
+        scheduled.append((file_path, size))
+
+    scheduled.sort(key=lambda item: item[1], reverse=True)
+    return scheduled, skipped
+
 
 class FileManager:
     """Central manager for file conversion operations."""
@@ -44,16 +136,6 @@ class FileManager:
             log_file=self.settings.get('log_file')
         )
 
-    @mcp_service(
-        tool_name="convert_file_to_text",
-        server_name="file_handler",
-        service_name="process",
-        category="file_conversion",
-        tags=["file", "conversion", "text-extraction"],
-        priority=10,
-        description="Process file or URL for text extraction with support for PDF, DOCX, HWP, Excel, Images, and OneDrive URLs",
-        related_objects=["mcp_file_handler.file_manager.FileManager"]
-    )
     def process(self, input_path: str, **kwargs) -> Dict[str, Any]:
         """Process file or URL for text extraction.
 
@@ -197,62 +279,110 @@ class FileManager:
 
         return result
 
-    @mcp_service(
-        tool_name="process_directory",
-        server_name="file_handler",
-        service_name="process_directory",
-        category="file_conversion",
-        tags=["directory", "batch", "conversion"],
-        priority=8,
-        description="Process all files in a directory with optional recursive scanning",
-        related_objects=["mcp_file_handler.file_manager.FileManager"]
-    )
     def process_directory(self, directory_path: str, **kwargs) -> List[Dict[str, Any]]:
         """Process all files in a directory.
 
         Args:
             directory_path: Path to directory
-            **kwargs: Additional options
+            **kwargs: Additional options (pattern, recursive, parallel, max_workers)
 
         Returns:
             List of processing results
         """
-        results = []
         dir_path = Path(directory_path)
 
         if not dir_path.exists() or not dir_path.is_dir():
             logger.error(f"Invalid directory: {directory_path}")
-            return results
+            return []
 
-        # Get file pattern from kwargs
-        pattern = kwargs.get('pattern', '*')
-        recursive = kwargs.get('recursive', False)
+        if kwargs.get('parallel', self.settings.get('parallel_processing', False)):
+            return list(self.iter_process_directory(directory_path, **kwargs))
+
+        results = []
+        for file_path in self._find_files(dir_path, **kwargs):
+            logger.info(f"Processing: {file_path}")
+            result = self.process(str(file_path), **kwargs)
+            result['file'] = str(file_path)
+            results.append(result)
+
+        return results
 
-        # Find files
-        if recursive:
+    def iter_process_directory(self, directory_path: str, **kwargs) -> Iterator[Dict[str, Any]]:
+        """Convert files in a directory with a process pool, yielding results as they complete.
+
+        Size limits (max_file_size / max_total_size) are enforced before
+        scheduling, and files are submitted largest-first.
+
+        Args:
+            directory_path: Path to directory
+            **kwargs: Additional options (pattern, recursive, max_workers,
+                save_metadata, keywords)
+
+        Yields:
+            Processing results in completion order
+        """
+        dir_path = Path(directory_path)
+        if not dir_path.exists() or not dir_path.is_dir():
+            logger.error(f"Invalid directory: {directory_path}")
+            return
+
+        files = [(str(p), p.stat().st_size) for p in self._find_files(dir_path, **kwargs)]
+        scheduled, skipped = plan_directory_files(
+            files,
+            max_file_size=self.settings.get('max_file_size'),
+            max_total_size=self.settings.get('max_total_size')
+        )
+        yield from skipped
+
+        if not scheduled:
+            return
+
+        max_workers = kwargs.get('max_workers') or self.settings.get('max_workers', 4)
+        max_workers = max(1, min(int(max_workers), len(scheduled)))
+        logger.info(f"Converting {len(scheduled)} files with {max_workers} workers")
+
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker) as executor:
+            futures = {
+                executor.submit(_convert_file_worker, file_path): file_path
+                for file_path, _ in scheduled
+            }
+            for future in as_completed(futures):
+                file_path = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(f"Conversion worker failed for {file_path}: {e}")
+                    result = {
+                        'success': False,
+                        'text': '',
+                        'metadata': {},
+                        'errors': [str(e)],
+                        'file': file_path
+                    }
+
+                # Metadata storage stays in the parent process
+                if result['success'] and kwargs.get('save_metadata', False):
+                    self.metadata_manager.save(file_path, kwargs.get('keywords', []), result['metadata'])
+
+                yield result
+
+    def _find_files(self, dir_path: Path, **kwargs) -> List[Path]:
+        """Find files in a directory using pattern/recursive options.
+
+        Args:
+            dir_path: Directory path
+            **kwargs: pattern (default '*'), recursive (default False)
+
+        Returns:
+            Sorted list of file paths
+        """
+        pattern = kwargs.get('pattern', '*')
+        if kwargs.get('recursive', False):
             files = dir_path.rglob(pattern)
         else:
             files = dir_path.glob(pattern)
+        return sorted(p for p in files if p.is_file())
 
-        for file_path in files:
-            if file_path.is_file():
-                logger.info(f"Processing: {file_path}")
-                result = self.process(str(file_path), **kwargs)
-                result['file'] = str(file_path)
-                results.append(result)
-
-        return results
-
-    @mcp_service(
-        tool_name="save_file_metadata",
-        server_name="file_handler",
-        service_name="save_metadata",
-        category="metadata",
-        tags=["metadata", "storage", "keywords"],
-        priority=5,
-        description="Save metadata for a processed file with keywords and additional information",
-        related_objects=["mcp_file_handler.file_manager.FileManager"]
-    )
     def save_metadata(self, file_url: str, keywords: List[str],
                       additional_metadata: Optional[Dict[str, Any]] = None) -> bool:
         """Save metadata for a file.
@@ -271,21 +401,13 @@ class FileManager:
             logger.error(f"Failed to save metadata: {e}")
             return False
 
-    @mcp_service(
-        tool_name="search_metadata",
-        server_name="file_handler",
-        service_name="search_metadata",
-        category="metadata",
-        tags=["metadata", "search", "query"],
-        priority=5,
-        description="Search file metadata by various criteria (keywords, date, file type, etc.)",
-        related_objects=["mcp_file_handler.file_manager.FileManager"]
-    )
     def search_metadata(self, **search_criteria) -> List[Dict[str, Any]]:
         """Search metadata.
 
         Args:
-            **search_criteria: Search criteria
+            **search_criteria: Search criteria: keyword/keywords (exact,
+                case-insensitive), query (ranked full-text over keywords and
+                metadata values), file_url (substring), limit, offset
 
         Returns:
             List of matching metadata entries
@@ -296,16 +418,6 @@ class FileManager:
             logger.error(f"Metadata search failed: {e}")
             return []
 
-    @mcp_service(
-        tool_name="convert_onedrive_to_text",
-        server_name="file_handler",
-        service_name="process_onedrive",
-        category="file_conversion",
-        tags=["onedrive", "cloud", "conversion"],
-        priority=9,
-        description="Convert OneDrive file or folder to text",
-        related_objects=["mcp_file_handler.file_manager.FileManager"]
-    )
     def process_onedrive(self, url: str, **kwargs) -> Dict[str, Any]:
         """Process OneDrive URL for text extraction.
 
@@ -318,16 +430,6 @@ class FileManager:
         """
         return self._process_onedrive_url(url, **kwargs)
 
-    @mcp_service(
-        tool_name="get_file_metadata",
-        server_name="file_handler",
-        service_name="get_metadata",
-        category="metadata",
-        tags=["metadata", "retrieval"],
-        priority=5,
-        description="Get metadata for a specific file by URL",
-        related_objects=["mcp_file_handler.file_manager.FileManager"]
-    )
     def get_metadata(self, file_url: str) -> Optional[Dict[str, Any]]:
         """Get metadata for a file.
 
@@ -343,16 +445,6 @@ class FileManager:
             logger.error(f"Failed to get metadata: {e}")
             return None
 
-    @mcp_service(
-        tool_name="delete_file_metadata",
-        server_name="file_handler",
-        service_name="delete_metadata",
-        category="metadata",
-        tags=["metadata", "deletion"],
-        priority=3,
-        description="Delete metadata for a specific file",
-        related_objects=["mcp_file_handler.file_manager.FileManager"]
-    )
     def delete_metadata(self, file_url: str) -> bool:
         """Delete metadata for a file.
 
@@ -383,6 +475,10 @@ def main():
                         help='Process directory recursively')
     parser.add_argument('--pattern', '-p', default='*',
                         help='File pattern for directory processing')
+    parser.add_argument('--parallel', action='store_true',
+                        help='Convert directory files in a process pool')
+    parser.add_argument('--workers', '-w', type=int,
+                        help='Number of worker processes (default: max_workers setting)')
 
     args = parser.parse_args()
 
@@ -391,13 +487,17 @@ def main():
 
     # Process input
     if Path(args.input).is_dir():
-        results = manager.process_directory(
-            args.input,
+        options = dict(
             recursive=args.recursive,
             pattern=args.pattern,
             keywords=args.keywords or [],
-            save_metadata=args.save_metadata
+            save_metadata=args.save_metadata,
+            max_workers=args.workers
         )
+        if args.parallel:
+            results = manager.iter_process_directory(args.input, **options)
+        else:
+            results = manager.process_directory(args.input, **options)
 
         for result in results:
             if result['success']:
@@ -37,10 +37,10 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Import service classes (unique)
-from mcp_file_handler.file_manager import FileManager
+from mcp_file_handler.async_file_manager import AsyncFileManager
 
 # Create service instances
-file_manager = FileManager()
+file_manager = AsyncFileManager()
 
 # ============================================================
 # Common MCP protocol utilities (shared across protocols)
@@ -51,38 +51,38 @@ SUPPORTED_PROTOCOLS = {"rest", "stdio", "stream"}
 # Pre-computed tool -> implementation mapping
 TOOL_IMPLEMENTATIONS = {
     "convert_file_to_text": {
-        "service_class": "FileManager",
+        "service_class": "AsyncFileManager",
         "method": "process"
     },
     "process_directory": {
-        "service_class": "FileManager",
+        "service_class": "AsyncFileManager",
         "method": "process_directory"
     },
     "save_file_metadata": {
-        "service_class": "FileManager",
+        "service_class": "AsyncFileManager",
         "method": "save_metadata"
     },
     "search_metadata": {
-        "service_class": "FileManager",
+        "service_class": "AsyncFileManager",
         "method": "search_metadata"
     },
     "convert_onedrive_to_text": {
-        "service_class": "FileManager",
+        "service_class": "AsyncFileManager",
         "method": "process_onedrive"
     },
     "get_file_metadata": {
-        "service_class": "FileManager",
+        "service_class": "AsyncFileManager",
         "method": "get_metadata"
     },
     "delete_file_metadata": {
-        "service_class": "FileManager",
+        "service_class": "AsyncFileManager",
         "method": "delete_metadata"
     },
 }
 
 # Pre-computed service class -> instance mapping
 SERVICE_INSTANCES = {
-    "FileManager": file_manager,
+    "AsyncFileManager": file_manager,
 }
 
 
@@ -313,7 +313,7 @@ async def startup_event():
     """Initialize services on server startup"""
     if hasattr(file_manager, 'initialize'):
         await file_manager.initialize()
-        logger.info("FileManager initialized")
+        logger.info("AsyncFileManager initialized")
     logger.info("File Handler MCP Server started")
 
 
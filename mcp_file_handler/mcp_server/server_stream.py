@@ -39,10 +39,10 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Import service classes (unique)
-from mcp_file_handler.file_manager import FileManager
+from mcp_file_handler.async_file_manager import AsyncFileManager
 
 # Create service instances
-file_manager = FileManager()
+file_manager = AsyncFileManager()
 
 # ============================================================
 # Common MCP protocol utilities (shared across protocols)
@@ -53,38 +53,38 @@ SUPPORTED_PROTOCOLS = {"rest", "stdio", "stream"}
 # Pre-computed tool -> implementation mapping
 TOOL_IMPLEMENTATIONS = {
     "convert_file_to_text": {
-        "service_class": "FileManager",
+        "service_class": "AsyncFileManager",
         "method": "process"
     },
     "process_directory": {
-        "service_class": "FileManager",
+        "service_class": "AsyncFileManager",
         "method": "process_directory"
     },
     "save_file_metadata": {
-        "service_class": "FileManager",
+        "service_class": "AsyncFileManager",
         "method": "save_metadata"
     },
     "search_metadata": {
-        "service_class": "FileManager",
+        "service_class": "AsyncFileManager",
         "method": "search_metadata"
     },
     "convert_onedrive_to_text": {
-        "service_class": "FileManager",
+        "service_class": "AsyncFileManager",
         "method": "process_onedrive"
     },
     "get_file_metadata": {
-        "service_class": "FileManager",
+        "service_class": "AsyncFileManager",
         "method": "get_metadata"
     },
     "delete_file_metadata": {
-        "service_class": "FileManager",
+        "service_class": "AsyncFileManager",
         "method": "delete_metadata"
     },
 }
 
 # Pre-computed service class -> instance mapping
 SERVICE_INSTANCES = {
-    "FileManager": file_manager,
+    "AsyncFileManager": file_manager,
 }
 
 
@@ -566,12 +566,16 @@ class StreamableHTTPMCPServer:
         # Initialize services
         if hasattr(file_manager, 'initialize'):
             await file_manager.initialize()
-            logger.info("FileManager initialized")
+            logger.info("AsyncFileManager initialized")
 
     async def on_cleanup(self, app):
         """서버 종료 시 정리"""
         logger.info(f"File Handler MCP Server StreamableHTTP Server shutting down")
 
+        # Shutdown services
+        if hasattr(file_manager, 'shutdown'):
+            await file_manager.shutdown()
+
     def run(self, host: str = '0.0.0.0', port: int = 8001):
         """서버 실행"""
         self.app['port'] = port
@@ -68,7 +68,8 @@ class MetadataManager:
         """Search metadata.
 
         Args:
-            **search_criteria: Search criteria (keyword, file_url, etc.)
+            **search_criteria: Search criteria (keyword, keywords, query,
+                file_url, limit, offset)
 
         Returns:
             List of matching metadata entries
@@ -128,7 +129,7 @@ class MetadataManager:
         return False
 
     def bulk_save(self, entries: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Save multiple metadata entries.
+        """Save multiple metadata entries in one storage batch.
 
         Args:
             entries: List of entries with file_url, keywords, metadata
@@ -142,19 +143,23 @@ class MetadataManager:
             'errors': []
         }
 
+        batch = []
         for entry in entries:
-            try:
-                if self.save(
-                    entry['file_url'],
-                    entry.get('keywords', []),
-                    entry.get('metadata', {})
-                ):
-                    results['successful'] += 1
-                else:
-                    results['failed'] += 1
-                    results['errors'].append(f"Failed to save: {entry['file_url']}")
-            except Exception as e:
+            file_url = entry.get('file_url')
+            if not file_url:
                 results['failed'] += 1
-                results['errors'].append(f"Error with {entry['file_url']}: {e}")
-
-        return results
\ No newline at end of file
+                results['errors'].append(f"Entry without file_url: {entry}")
+                continue
+            metadata = dict(entry.get('metadata') or {})
+            metadata['source'] = 'file' if not file_url.startswith('http') else 'url'
+            batch.append((file_url, entry.get('keywords', []), metadata))
+
+        if batch:
+            saved = self.storage.save_many(batch)
+            if saved:
+                results['successful'] += len(batch)
+            else:
+                results['failed'] += len(batch)
+                results['errors'].append(f"Failed to save batch of {len(batch)} entries")
+
+        return results
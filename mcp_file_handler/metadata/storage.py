@@ -5,11 +5,87 @@ import sqlite3
 from abc import ABC, abstractmethod
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# SQLite bound-parameter chunk size for IN (...) queries
+IN_QUERY_CHUNK = 500
+
+# Schema version of the keyword/full-text search tables (PRAGMA user_version)
+# 2: metadata.id INTEGER PRIMARY KEY is the metadata_fts rowid
+# 3: metadata_fts uses the trigram tokenizer (substring matching)
+SEARCH_SCHEMA_VERSION = 3
+
+# Shortest term the trigram tokenizer can match; shorter terms use LIKE
+FTS_MIN_TERM = 3
+
+_METADATA_COLUMNS = 'file_url, keywords, metadata, created_at, updated_at'
+
+
+def normalize_keywords(keywords: Iterable[str]) -> List[str]:
+    """Lower-case, strip and de-duplicate keywords, keeping their order.
+
+    Args:
+        keywords: Raw keywords
+
+    Returns:
+        Normalized keywords
+    """
+    seen = {}
+    for keyword in keywords:
+        normalized = str(keyword).strip().lower()
+        if normalized:
+            seen.setdefault(normalized, None)
+    return list(seen)
+
+
+def metadata_text(metadata: Dict[str, Any]) -> str:
+    """Flatten the values (not the keys) of JSON metadata into search text.
+
+    Args:
+        metadata: Metadata dictionary
+
+    Returns:
+        Space-separated scalar values
+    """
+    values = []
+
+    def walk(value):
+        if isinstance(value, dict):
+            for item in value.values():
+                walk(item)
+        elif isinstance(value, (list, tuple)):
+            for item in value:
+                walk(item)
+        elif value is not None:
+            values.append(str(value))
+
+    walk(metadata)
+    return ' '.join(values)
+
+
+def _fts_query(terms: List[str]) -> str:
+    """Turn terms into an FTS5 trigram query (each must occur as a substring)."""
+    return ' '.join('"' + term.replace('"', '""') + '"' for term in terms)
+
+
+def _like_pattern(term: str) -> str:
+    """LIKE pattern matching term as a substring (use with ESCAPE '\\')."""
+    escaped = term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return f'%{escaped}%'
+
+
+def _search_keywords(criteria: Dict[str, Any]) -> List[str]:
+    """Normalized keywords from the 'keyword' and 'keywords' criteria."""
+    keywords = criteria.get('keywords') or []
+    if isinstance(keywords, str):
+        keywords = keywords.split(',')
+    if criteria.get('keyword'):
+        keywords = [criteria['keyword'], *keywords]
+    return normalize_keywords(keywords)
+
 
 class MetadataStorage(ABC):
     """Abstract base class for metadata storage."""
@@ -41,10 +117,28 @@ class MetadataStorage(ABC):
         """
         pass
 
+    def save_many(self, entries: List[Tuple[str, List[str], Dict[str, Any]]]) -> int:
+        """Save several entries.
+
+        Args:
+            entries: (file_url, keywords, metadata) tuples
+
+        Returns:
+            Number of entries saved
+        """
+        return sum(1 for file_url, keywords, metadata in entries
+                   if self.save(file_url, keywords, metadata))
+
     @abstractmethod
     def search(self, **criteria) -> List[Dict[str, Any]]:
         """Search metadata.
 
+        Criteria:
+            keyword / keywords: exact keyword match (case-insensitive, all must match)
+            query: full-text search over keywords and metadata values, ranked
+            file_url: substring of the file URL
+            limit, offset: pagination
+
         Args:
             **criteria: Search criteria
 
@@ -67,7 +161,14 @@ class MetadataStorage(ABC):
 
 
 class SQLiteStorage(MetadataStorage):
-    """SQLite-based metadata storage."""
+    """SQLite-based metadata storage.
+
+    Keywords are stored normalized in metadata_keywords (one row per
+    keyword/file), and keywords plus flattened metadata values are indexed
+    in the metadata_fts FTS5 trigram table (rowid = metadata.id), so query
+    terms match as case-insensitive substrings like JSONStorage.search
+    (e.g. '보고서' finds '보고서를').
+    """
 
     def __init__(self, db_path: str = 'metadata.db'):
         """Initialize SQLite storage.
@@ -76,6 +177,7 @@ class SQLiteStorage(MetadataStorage):
             db_path: Path to SQLite database
         """
         self.db_path = db_path
+        self._fts_enabled = False
         self._init_db()
 
     def _init_db(self):
@@ -83,9 +185,17 @@ class SQLiteStorage(MetadataStorage):
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
+        # The FTS rowid must be a stable key: the implicit rowid of a table
+        # keyed by file_url TEXT may be renumbered by VACUUM
+        columns = [row[1] for row in cursor.execute('PRAGMA table_info(metadata)')]
+        legacy = bool(columns) and 'id' not in columns
+        if legacy:
+            cursor.execute('ALTER TABLE metadata RENAME TO metadata_legacy')
+
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS metadata (
-                file_url TEXT PRIMARY KEY,
+                id INTEGER PRIMARY KEY,
+                file_url TEXT NOT NULL UNIQUE,
                 keywords TEXT,
                 metadata TEXT,
                 created_at TEXT,
@@ -93,38 +203,168 @@ class SQLiteStorage(MetadataStorage):
             )
         ''')
 
+        if legacy:
+            cursor.execute(f'INSERT INTO metadata ({_METADATA_COLUMNS}) '
+                           f'SELECT {_METADATA_COLUMNS} FROM metadata_legacy')
+            cursor.execute('DROP TABLE metadata_legacy')
+
+        # keywords LIKE '%kw%' could never use this index
+        cursor.execute('DROP INDEX IF EXISTS idx_keywords')
+
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS metadata_keywords (
+                keyword TEXT NOT NULL,
+                file_url TEXT NOT NULL,
+                PRIMARY KEY (keyword, file_url)
+            ) WITHOUT ROWID
+        ''')
+
         cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_keywords
-            ON metadata (keywords)
+            CREATE INDEX IF NOT EXISTS idx_metadata_keywords_file
+            ON metadata_keywords (file_url)
         ''')
 
+        version = cursor.execute('PRAGMA user_version').fetchone()[0]
+        if version < SEARCH_SCHEMA_VERSION:
+            # Tokenizer changes need a new table; it is refilled below
+            cursor.execute('DROP TABLE IF EXISTS metadata_fts')
+
+        try:
+            cursor.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS metadata_fts
+                USING fts5(keywords, content, tokenize='trigram')
+            ''')
+            self._fts_enabled = True
+        except sqlite3.OperationalError as e:
+            logger.warning(f"FTS5 trigram unavailable, full-text search falls back to LIKE: {e}")
+
         conn.commit()
+
+        # Backfill search tables of databases created before they existed
+        if version < SEARCH_SCHEMA_VERSION:
+            self._rebuild_search_index(conn)
+            cursor.execute(f'PRAGMA user_version = {SEARCH_SCHEMA_VERSION}')
+            conn.commit()
+
         conn.close()
 
+    def _rebuild_search_index(self, conn: sqlite3.Connection):
+        """Rebuild keyword and full-text tables from the metadata table."""
+        conn.execute('DELETE FROM metadata_keywords')
+        if self._fts_enabled:
+            conn.execute('DELETE FROM metadata_fts')
+
+        cursor = conn.execute('SELECT id, file_url, keywords, metadata FROM metadata')
+        while True:
+            rows = cursor.fetchmany(IN_QUERY_CHUNK)
+            if not rows:
+                break
+            self._index_rows(conn, [
+                (row_id, file_url, row_keywords.split(',') if row_keywords else [],
+                 json.loads(row_metadata) if row_metadata else {})
+                for row_id, file_url, row_keywords, row_metadata in rows
+            ])
+        logger.info("Rebuilt metadata search index")
+
+    def _index_rows(self, conn: sqlite3.Connection,
+                    rows: List[Tuple[int, str, List[str], Dict[str, Any]]]):
+        """Write keyword and full-text rows for (id, file_url, keywords, metadata)."""
+        conn.executemany(
+            'INSERT OR IGNORE INTO metadata_keywords (keyword, file_url) VALUES (?, ?)',
+            [(keyword, file_url) for _, file_url, keywords, _ in rows
+             for keyword in normalize_keywords(keywords)]
+        )
+        if self._fts_enabled:
+            conn.executemany(
+                'INSERT INTO metadata_fts (rowid, keywords, content) VALUES (?, ?, ?)',
+                [(row_id, ' '.join(keywords), metadata_text(metadata))
+                 for row_id, _, keywords, metadata in rows]
+            )
+
+    def _ids(self, conn: sqlite3.Connection, file_urls: List[str]) -> Dict[str, int]:
+        """Look up metadata ids by file URL (chunked IN queries)."""
+        ids = {}
+        for i in range(0, len(file_urls), IN_QUERY_CHUNK):
+            chunk = file_urls[i:i + IN_QUERY_CHUNK]
+            placeholders = ','.join('?' * len(chunk))
+            ids.update(
+                (file_url, row_id) for row_id, file_url in conn.execute(
+                    f'SELECT id, file_url FROM metadata WHERE file_url IN ({placeholders})',
+                    chunk
+                )
+            )
+        return ids
+
+    def _unindex(self, conn: sqlite3.Connection, ids: Dict[str, int]):
+        """Remove keyword and full-text rows of files."""
+        conn.executemany('DELETE FROM metadata_keywords WHERE file_url = ?',
+                         [(file_url,) for file_url in ids])
+        if self._fts_enabled:
+            conn.executemany('DELETE FROM metadata_fts WHERE rowid = ?',
+                             [(row_id,) for row_id in ids.values()])
+
     def save(self, file_url: str, keywords: List[str],
              metadata: Dict[str, Any]) -> bool:
         """Save metadata to SQLite."""
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+        return self.save_many([(file_url, keywords, metadata)]) == 1
 
-            now = datetime.now().isoformat()
-            keywords_str = ','.join(keywords)
-            metadata_str = json.dumps(metadata)
+    def save_many(self, entries: List[Tuple[str, List[str], Dict[str, Any]]]) -> int:
+        """Save entries in a single transaction (last entry wins per file URL).
 
-            cursor.execute('''
-                INSERT OR REPLACE INTO metadata
-                (file_url, keywords, metadata, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (file_url, keywords_str, metadata_str, now, now))
+        Args:
+            entries: (file_url, keywords, metadata) tuples
 
-            conn.commit()
-            conn.close()
-            return True
+        Returns:
+            Number of entries saved (0 on failure)
+        """
+        latest = {file_url: (keywords, metadata) for file_url, keywords, metadata in entries}
+        if not latest:
+            return 0
+
+        try:
+            conn = sqlite3.connect(self.db_path)
+            try:
+                now = datetime.now().isoformat()
+                self._unindex(conn, self._ids(conn, list(latest)))
+
+                conn.executemany('''
+                    INSERT INTO metadata
+                    (file_url, keywords, metadata, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT (file_url) DO UPDATE SET
+                        keywords = excluded.keywords,
+                        metadata = excluded.metadata,
+                        updated_at = excluded.updated_at
+                ''', [
+                    (file_url, ','.join(keywords), json.dumps(metadata, ensure_ascii=False), now, now)
+                    for file_url, (keywords, metadata) in latest.items()
+                ])
+
+                ids = self._ids(conn, list(latest))
+                self._index_rows(conn, [
+                    (ids[file_url], file_url, keywords, metadata)
+                    for file_url, (keywords, metadata) in latest.items()
+                ])
+
+                conn.commit()
+                return len(latest)
+            finally:
+                conn.close()
 
         except Exception as e:
             logger.error(f"Failed to save metadata: {e}")
-            return False
+            return 0
+
+    @staticmethod
+    def _row_to_entry(row: tuple) -> Dict[str, Any]:
+        """Build a result entry from a metadata row."""
+        return {
+            'file_url': row[0],
+            'keywords': row[1].split(',') if row[1] else [],
+            'metadata': json.loads(row[2]),
+            'created_at': row[3],
+            'updated_at': row[4]
+        }
 
     def get(self, file_url: str) -> Optional[Dict[str, Any]]:
         """Get metadata from SQLite."""
@@ -133,7 +373,7 @@ class SQLiteStorage(MetadataStorage):
             cursor = conn.cursor()
 
             cursor.execute('''
-                SELECT keywords, metadata, created_at, updated_at
+                SELECT file_url, keywords, metadata, created_at, updated_at
                 FROM metadata
                 WHERE file_url = ?
             ''', (file_url,))
@@ -141,51 +381,78 @@ class SQLiteStorage(MetadataStorage):
             row = cursor.fetchone()
             conn.close()
 
-            if row:
-                return {
-                    'file_url': file_url,
-                    'keywords': row[0].split(',') if row[0] else [],
-                    'metadata': json.loads(row[1]),
-                    'created_at': row[2],
-                    'updated_at': row[3]
-                }
-
-            return None
+            return self._row_to_entry(row) if row else None
 
         except Exception as e:
             logger.error(f"Failed to get metadata: {e}")
             return None
 
     def search(self, **criteria) -> List[Dict[str, Any]]:
-        """Search metadata in SQLite."""
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            query = 'SELECT * FROM metadata WHERE 1=1'
-            params = []
+        """Search metadata in SQLite.
 
-            if 'keyword' in criteria:
-                query += ' AND keywords LIKE ?'
-                params.append(f'%{criteria["keyword"]}%')
+        Every query term must occur as a substring of the keywords or
+        metadata values. Full-text results (query) are ranked by bm25 with
+        keyword matches weighted above metadata values and carry a 'score';
+        other results are ordered by file URL. Terms shorter than
+        FTS_MIN_TERM are matched with LIKE and do not affect the rank.
+        """
+        try:
+            columns = 'm.file_url, m.keywords, m.metadata, m.created_at, m.updated_at'
+            tables = 'metadata m'
+            conditions = []
+            params: List[Any] = []
+            order = 'm.file_url'
+
+            terms = (criteria.get('query') or '').lower().split()
+            if terms and self._fts_enabled:
+                tables += ' JOIN metadata_fts ON metadata_fts.rowid = m.id'
+                long_terms = [term for term in terms if len(term) >= FTS_MIN_TERM]
+                if long_terms:
+                    columns += ', bm25(metadata_fts, 2.0, 1.0) AS rank'
+                    conditions.append('metadata_fts MATCH ?')
+                    params.append(_fts_query(long_terms))
+                    order = 'rank'
+                else:
+                    columns += ', 0.0 AS rank'
+                for term in terms:
+                    if len(term) < FTS_MIN_TERM:
+                        conditions.append("(metadata_fts.keywords LIKE ? ESCAPE '\\' "
+                                          "OR metadata_fts.content LIKE ? ESCAPE '\\')")
+                        params.extend([_like_pattern(term)] * 2)
+            elif terms:
+                for term in terms:
+                    conditions.append("(m.keywords LIKE ? ESCAPE '\\' OR m.metadata LIKE ? ESCAPE '\\')")
+                    params.extend([_like_pattern(term)] * 2)
+
+            for keyword in _search_keywords(criteria):
+                conditions.append(
+                    'm.file_url IN (SELECT file_url FROM metadata_keywords WHERE keyword = ?)'
+                )
+                params.append(keyword)
 
             if 'file_url' in criteria:
-                query += ' AND file_url LIKE ?'
+                conditions.append('m.file_url LIKE ?')
                 params.append(f'%{criteria["file_url"]}%')
 
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
-            conn.close()
+            sql = f'SELECT {columns} FROM {tables}'
+            if conditions:
+                sql += ' WHERE ' + ' AND '.join(conditions)
+            sql += f' ORDER BY {order} LIMIT ? OFFSET ?'
+            limit = criteria.get('limit')
+            params.extend([int(limit) if limit else -1, int(criteria.get('offset') or 0)])
+
+            conn = sqlite3.connect(self.db_path)
+            try:
+                rows = conn.execute(sql, params).fetchall()
+            finally:
+                conn.close()
 
             results = []
             for row in rows:
-                results.append({
-                    'file_url': row[0],
-                    'keywords': row[1].split(',') if row[1] else [],
-                    'metadata': json.loads(row[2]),
-                    'created_at': row[3],
-                    'updated_at': row[4]
-                })
+                entry = self._row_to_entry(row)
+                if len(row) > 5:
+                    entry['score'] = -row[5]
+                results.append(entry)
 
             return results
 
@@ -199,6 +466,7 @@ class SQLiteStorage(MetadataStorage):
             conn = sqlite3.connect(self.db_path)
             cursor = conn.cursor()
 
+            self._unindex(conn, self._ids(conn, [file_url]))
             cursor.execute('DELETE FROM metadata WHERE file_url = ?', (file_url,))
             affected = cursor.rowcount
 
@@ -213,7 +481,11 @@ class SQLiteStorage(MetadataStorage):
 
 
 class JSONStorage(MetadataStorage):
-    """JSON file-based metadata storage."""
+    """JSON file-based metadata storage.
+
+    An in-memory keyword -> file URL index is kept alongside the data so
+    keyword searches do not scan every entry.
+    """
 
     def __init__(self, json_path: str = 'metadata.json'):
         """Initialize JSON storage.
@@ -236,6 +508,24 @@ class JSONStorage(MetadataStorage):
         else:
             self.data = {}
 
+        self._keyword_index: Dict[str, set] = {}
+        for file_url, data in self.data.items():
+            self._index(file_url, data.get('keywords', []))
+
+    def _index(self, file_url: str, keywords: List[str]):
+        """Add a file's keywords to the keyword index."""
+        for keyword in normalize_keywords(keywords):
+            self._keyword_index.setdefault(keyword, set()).add(file_url)
+
+    def _unindex(self, file_url: str):
+        """Remove a file's keywords from the keyword index."""
+        for keyword in normalize_keywords(self.data.get(file_url, {}).get('keywords', [])):
+            urls = self._keyword_index.get(keyword)
+            if urls:
+                urls.discard(file_url)
+                if not urls:
+                    del self._keyword_index[keyword]
+
     def _save_data(self):
         """Save data to JSON file."""
         try:
@@ -246,17 +536,30 @@ class JSONStorage(MetadataStorage):
             logger.error(f"Failed to save JSON data: {e}")
             return False
 
-    def save(self, file_url: str, keywords: List[str],
-             metadata: Dict[str, Any]) -> bool:
-        """Save metadata to JSON."""
+    def _put(self, file_url: str, keywords: List[str], metadata: Dict[str, Any]):
+        """Store an entry in memory and index its keywords."""
+        now = datetime.now().isoformat()
+        self._unindex(file_url)
         self.data[file_url] = {
             'keywords': keywords,
             'metadata': metadata,
-            'created_at': datetime.now().isoformat(),
-            'updated_at': datetime.now().isoformat()
+            'created_at': self.data.get(file_url, {}).get('created_at', now),
+            'updated_at': now
         }
+        self._index(file_url, keywords)
+
+    def save(self, file_url: str, keywords: List[str],
+             metadata: Dict[str, Any]) -> bool:
+        """Save metadata to JSON."""
+        self._put(file_url, keywords, metadata)
         return self._save_data()
 
+    def save_many(self, entries: List[Tuple[str, List[str], Dict[str, Any]]]) -> int:
+        """Save entries, writing the JSON file once."""
+        for file_url, keywords, metadata in entries:
+            self._put(file_url, keywords, metadata)
+        return len(entries) if entries and self._save_data() else 0
+
     def get(self, file_url: str) -> Optional[Dict[str, Any]]:
         """Get metadata from JSON."""
         if file_url in self.data:
@@ -266,30 +569,51 @@ class JSONStorage(MetadataStorage):
         return None
 
     def search(self, **criteria) -> List[Dict[str, Any]]:
-        """Search metadata in JSON."""
+        """Search metadata in JSON.
+
+        Query results are ranked by the number of term occurrences in the
+        keywords and metadata values.
+        """
+        keywords = _search_keywords(criteria)
+        if keywords:
+            candidates = set.intersection(
+                *(self._keyword_index.get(keyword, set()) for keyword in keywords)
+            )
+        else:
+            candidates = self.data.keys()
+
+        terms = (criteria.get('query') or '').lower().split()
         results = []
 
-        for file_url, data in self.data.items():
-            match = True
+        for file_url in sorted(candidates):
+            data = self.data[file_url]
 
-            if 'keyword' in criteria:
-                if criteria['keyword'] not in ','.join(data.get('keywords', [])):
-                    match = False
+            if 'file_url' in criteria and criteria['file_url'] not in file_url:
+                continue
 
-            if 'file_url' in criteria:
-                if criteria['file_url'] not in file_url:
-                    match = False
+            result = data.copy()
+            result['file_url'] = file_url
+
+            if terms:
+                text = ' '.join(data.get('keywords', [])).lower() + ' ' + \
+                    metadata_text(data.get('metadata', {})).lower()
+                if not all(term in text for term in terms):
+                    continue
+                result['score'] = sum(text.count(term) for term in terms)
+
+            results.append(result)
 
-            if match:
-                result = data.copy()
-                result['file_url'] = file_url
-                results.append(result)
+        if terms:
+            results.sort(key=lambda entry: -entry['score'])
 
-        return results
+        offset = int(criteria.get('offset') or 0)
+        limit = criteria.get('limit')
+        return results[offset:offset + int(limit) if limit else None]
 
     def delete(self, file_url: str) -> bool:
         """Delete metadata from JSON."""
         if file_url in self.data:
+            self._unindex(file_url)
             del self.data[file_url]
             return self._save_data()
-        return False
\ No newline at end of file
+        return False
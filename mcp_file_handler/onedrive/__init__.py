@@ -3,5 +3,6 @@
 from .client import OneDriveClient
 from .downloader import OneDriveDownloader
 from .processor import OneDriveProcessor
+from .async_downloader import AsyncOneDriveDownloader
 
-__all__ = ['OneDriveClient', 'OneDriveDownloader', 'OneDriveProcessor']
\ No newline at end of file
+__all__ = ['OneDriveClient', 'OneDriveDownloader', 'OneDriveProcessor', 'AsyncOneDriveDownloader']
\ No newline at end of file
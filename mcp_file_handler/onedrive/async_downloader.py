@@ -0,0 +1,282 @@
+"""Async, concurrent OneDrive folder downloader."""
+
+import asyncio
+import base64
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+# Per-folder manifest of downloaded items (item id -> cTag/eTag/size/path)
+MANIFEST_NAME = '.onedrive_manifest.json'
+
+CHILD_FIELDS = 'id,name,size,eTag,cTag,folder,file,parentReference'
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def load_manifest(output_dir: str) -> Dict[str, Dict[str, Any]]:
+    """Load the download manifest of an output directory.
+
+    Args:
+        output_dir: Local output directory
+
+    Returns:
+        Manifest entries keyed by item ID (empty if missing/corrupt)
+    """
+    path = Path(output_dir) / MANIFEST_NAME
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text(encoding='utf-8'))
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable manifest {path}: {e}")
+        return {}
+
+
+def save_manifest(output_dir: str, manifest: Dict[str, Dict[str, Any]]):
+    """Atomically write the download manifest of an output directory."""
+    path = Path(output_dir) / MANIFEST_NAME
+    tmp_path = path.with_suffix('.tmp')
+    tmp_path.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding='utf-8')
+    os.replace(tmp_path, path)
+
+
+def is_unchanged(item: Dict[str, Any], entry: Optional[Dict[str, Any]]) -> bool:
+    """Check whether a remote item matches its manifest entry and local file.
+
+    cTag (content tag) is compared when present, otherwise eTag.
+
+    Args:
+        item: DriveItem from Graph
+        entry: Manifest entry or None
+
+    Returns:
+        True if the local copy is current
+    """
+    if not entry:
+        return False
+    tag_key = 'cTag' if item.get('cTag') else 'eTag'
+    if not item.get(tag_key) or entry.get(tag_key) != item.get(tag_key):
+        return False
+    local = Path(entry.get('local_path', ''))
+    return local.is_file() and local.stat().st_size == item.get('size', local.stat().st_size)
+
+
+class AsyncOneDriveDownloader:
+    """Download OneDrive files and folders with aiohttp.
+
+    Folders are walked breadth-first, one level of listings at a time, with
+    children fully paged via @odata.nextLink. Files are streamed to disk in
+    parallel under a concurrency limit, and files whose cTag/eTag match the
+    local manifest are skipped.
+    """
+
+    def __init__(self, auth_manager, concurrency: int = 8,
+                 user_email: Optional[str] = None):
+        """Initialize downloader.
+
+        Args:
+            auth_manager: AuthManager instance
+            concurrency: Maximum concurrent Graph requests
+            user_email: User whose token is used (None for the default user)
+        """
+        self.auth_manager = auth_manager
+        self.user_email = user_email
+        self.base_url = 'https://graph.microsoft.com/v1.0'
+        self._semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _get_headers(self) -> Dict[str, str]:
+        """Get authorization headers.
+
+        Returns:
+            Headers with authorization token
+        """
+        if hasattr(self.auth_manager, 'validate_and_refresh_token'):
+            token = await self.auth_manager.validate_and_refresh_token(self.user_email)
+        else:
+            token = self.auth_manager.get_access_token()
+        if not token:
+            raise RuntimeError("No valid access token for OneDrive")
+        return {'Authorization': f'Bearer {token}'}
+
+    async def _get_json(self, session: aiohttp.ClientSession, url: str,
+                        params: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """GET a Graph URL under the concurrency limit."""
+        async with self._semaphore:
+            async with session.get(url, headers=await self._get_headers(), params=params) as response:
+                response.raise_for_status()
+                return await response.json()
+
+    def _items_url(self, item: Dict[str, Any]) -> str:
+        """Items endpoint for a DriveItem (its own drive if shared)."""
+        drive_id = item.get('parentReference', {}).get('driveId')
+        if drive_id:
+            return f"{self.base_url}/drives/{drive_id}/items/{item['id']}"
+        return f"{self.base_url}/me/drive/items/{item['id']}"
+
+    async def list_children(self, session: aiohttp.ClientSession,
+                            folder: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """List all children of a folder, following @odata.nextLink.
+
+        Args:
+            session: aiohttp session
+            folder: Folder DriveItem
+
+        Returns:
+            List of child items
+        """
+        children = []
+        data = await self._get_json(
+            session, f"{self._items_url(folder)}/children",
+            params={'$top': '200', '$select': CHILD_FIELDS}
+        )
+        while True:
+            for child in data.get('value', []):
+                child.setdefault('parentReference', {}).setdefault(
+                    'driveId', folder.get('parentReference', {}).get('driveId')
+                )
+                children.append(child)
+            next_link = data.get('@odata.nextLink')
+            if not next_link:
+                return children
+            data = await self._get_json(session, next_link)
+
+    async def download_file(self, session: aiohttp.ClientSession,
+                            item: Dict[str, Any], output_path: Path) -> str:
+        """Stream a file to disk (written to .part, then renamed).
+
+        Args:
+            session: aiohttp session
+            item: File DriveItem
+            output_path: Local path to save file
+
+        Returns:
+            Path to downloaded file
+        """
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        part_path = output_path.with_name(output_path.name + '.part')
+
+        async with self._semaphore:
+            async with session.get(f"{self._items_url(item)}/content",
+                                   headers=await self._get_headers()) as response:
+                response.raise_for_status()
+                with open(part_path, 'wb') as f:
+                    async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+
+        os.replace(part_path, output_path)
+        logger.info(f"Downloaded: {output_path}")
+        return str(output_path)
+
+    async def _download_item(self, session: aiohttp.ClientSession, item: Dict[str, Any],
+                             local_dir: Path, manifest: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """Download one file unless the manifest shows it is unchanged."""
+        result = {
+            'type': 'file',
+            'name': item['name'],
+            'id': item['id'],
+            'local_path': str(local_dir / item['name']),
+            'size': item.get('size', 0)
+        }
+
+        entry = manifest.get(item['id'])
+        if is_unchanged(item, entry):
+            result['local_path'] = entry['local_path']
+            result['unchanged'] = True
+            return result
+
+        try:
+            result['local_path'] = await self.download_file(session, item, local_dir / item['name'])
+            manifest[item['id']] = {
+                'name': item['name'],
+                'local_path': result['local_path'],
+                'size': item.get('size', 0),
+                'eTag': item.get('eTag'),
+                'cTag': item.get('cTag')
+            }
+        except Exception as e:
+            logger.error(f"Failed to download {item['name']}: {e}")
+            result['error'] = str(e)
+
+        return result
+
+    async def download_folder(self, folder: Dict[str, Any], output_dir: str,
+                              recursive: bool = True) -> List[Dict[str, Any]]:
+        """Download all files in a folder tree.
+
+        Args:
+            folder: Folder DriveItem
+            output_dir: Local output directory
+            recursive: Download subfolders recursively
+
+        Returns:
+            List of download results (same shape as OneDriveDownloader)
+        """
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        manifest = load_manifest(output_dir)
+        results = []
+        files: List[Tuple[Dict[str, Any], Path]] = []
+
+        async with aiohttp.ClientSession() as session:
+            level = [(folder, Path(output_dir))]
+            while level:
+                listings = await asyncio.gather(
+                    *(self.list_children(session, item) for item, _ in level)
+                )
+                next_level = []
+                for (_, local_dir), children in zip(level, listings):
+                    for child in children:
+                        if 'folder' not in child:
+                            files.append((child, local_dir))
+                        elif recursive:
+                            next_level.append((child, local_dir / child['name']))
+                        else:
+                            results.append({
+                                'type': 'folder',
+                                'name': child['name'],
+                                'id': child['id'],
+                                'skipped': True
+                            })
+                level = next_level
+
+            results.extend(await asyncio.gather(
+                *(self._download_item(session, item, local_dir, manifest) for item, local_dir in files)
+            ))
+
+        save_manifest(output_dir, manifest)
+        unchanged = sum(1 for r in results if r.get('unchanged'))
+        logger.info(f"Folder sync: {len(files)} files, {unchanged} unchanged")
+        return results
+
+    async def download_by_url(self, url: str, output_dir: str,
+                              recursive: bool = True) -> List[Dict[str, Any]]:
+        """Download from OneDrive share URL.
+
+        Args:
+            url: OneDrive share URL
+            output_dir: Local output directory
+            recursive: Download folders recursively
+
+        Returns:
+            List of download results
+        """
+        encoded_url = base64.urlsafe_b64encode(url.encode('utf-8')).rstrip(b'=').decode('utf-8')
+
+        async with aiohttp.ClientSession() as session:
+            item = await self._get_json(session, f"{self.base_url}/shares/u!{encoded_url}/driveItem")
+
+            if 'folder' not in item:
+                logger.info(f"Downloading file: {item['name']}")
+                Path(output_dir).mkdir(parents=True, exist_ok=True)
+                manifest = load_manifest(output_dir)
+                result = await self._download_item(session, item, Path(output_dir), manifest)
+                save_manifest(output_dir, manifest)
+                return [result]
+
+        logger.info(f"Downloading folder: {item['name']}")
+        return await self.download_folder(item, output_dir, recursive)
@@ -4,7 +4,6 @@ import sys
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 import logging
-import requests
 
 # Add parent directory for session imports
 sys.path.append(str(Path(__file__).parent.parent.parent))
@@ -14,6 +13,12 @@ from session.auth_manager import AuthManager
 logger = logging.getLogger(__name__)
 
 
+def _requests():
+    """Import requests on first use (only the synchronous OneDrive path needs it)."""
+    import requests
+    return requests
+
+
 class OneDriveClient:
     """OneDrive API client."""
 
@@ -48,7 +53,7 @@ class OneDriveClient:
             Item metadata
         """
         url = f"{self.base_url}/me/drive/root:/{path}"
-        response = requests.get(url, headers=self._get_headers())
+        response = _requests().get(url, headers=self._get_headers())
         response.raise_for_status()
         return response.json()
 
@@ -62,7 +67,7 @@ class OneDriveClient:
             Item metadata
         """
         url = f"{self.base_url}/me/drive/items/{item_id}"
-        response = requests.get(url, headers=self._get_headers())
+        response = _requests().get(url, headers=self._get_headers())
         response.raise_for_status()
         return response.json()
 
@@ -83,7 +88,7 @@ class OneDriveClient:
         ).rstrip(b'=').decode('utf-8')
 
         url = f"{self.base_url}/shares/{encoded_url}/driveItem"
-        response = requests.get(url, headers=self._get_headers())
+        response = _requests().get(url, headers=self._get_headers())
         response.raise_for_status()
         return response.json()
 
@@ -96,10 +101,18 @@ class OneDriveClient:
         Returns:
             List of child items
         """
+        children = []
         url = f"{self.base_url}/me/drive/items/{item_id}/children"
-        response = requests.get(url, headers=self._get_headers())
-        response.raise_for_status()
-        return response.json().get('value', [])
+
+        # Follow @odata.nextLink; Graph pages children (200 items by default)
+        while url:
+            response = _requests().get(url, headers=self._get_headers())
+            response.raise_for_status()
+            data = response.json()
+            children.extend(data.get('value', []))
+            url = data.get('@odata.nextLink')
+
+        return children
 
     def download_file(self, item_id: str, output_path: str) -> str:
         """Download file by ID.
@@ -113,7 +126,7 @@ class OneDriveClient:
         """
         # Get download URL
         url = f"{self.base_url}/me/drive/items/{item_id}/content"
-        response = requests.get(
+        response = _requests().get(
             url,
             headers=self._get_headers(),
             allow_redirects=False
@@ -122,7 +135,7 @@ class OneDriveClient:
         if response.status_code == 302:
             # Follow redirect to download
             download_url = response.headers['Location']
-            download_response = requests.get(download_url, stream=True)
+            download_response = _requests().get(download_url, stream=True)
             download_response.raise_for_status()
 
             # Save file
@@ -149,6 +162,6 @@ class OneDriveClient:
             File content as bytes
         """
         url = f"{self.base_url}/me/drive/items/{item_id}/content"
-        response = requests.get(url, headers=self._get_headers())
+        response = _requests().get(url, headers=self._get_headers())
         response.raise_for_status()
         return response.content
\ No newline at end of file
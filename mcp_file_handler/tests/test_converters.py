@@ -1,10 +1,18 @@
 """Tests for file converters."""
 
+import io
 import unittest
 from pathlib import Path
+from unittest import mock
 import tempfile
 import os
+import stat
+import struct
+import zipfile
 
+from ..converters.pdf import pdf_engine
+from ..converters.excel.excel_converter import sample_sheet_rows, stream_sheet_rows
+from ..converters.image.ocr_service import OCRCache, OCRService, default_ocr_cache_path, otsu_threshold
 from ..converters import (
     PDFConverter,
     DOCXConverter,
@@ -12,6 +20,48 @@ from ..converters import (
     ExcelConverter,
     OCRConverter
 )
+from ..utils import FileDetector
+
+
+def build_ole(stream_names, sector_size=512):
+    """Build a minimal OLE compound file whose directory lists stream_names.
+
+    The root entry comes first, so with 512-byte sectors (4 entries each)
+    the fifth name lands in the second directory sector.
+    """
+    entries = []
+    for name in ['Root Entry'] + list(stream_names):
+        raw = (name + '\x00').encode('utf-16-le')
+        entry = bytearray(128)
+        entry[:len(raw)] = raw
+        struct.pack_into('<HB', entry, 64, len(raw), 5 if name == 'Root Entry' else 2)
+        entries.append(bytes(entry))
+    per_sector = sector_size // 128
+    dir_sectors = [b''.join(entries[i:i + per_sector]).ljust(sector_size, b'\x00')
+                   for i in range(0, len(entries), per_sector)]
+
+    # Sector 0 is the FAT, directory chain is sectors 1..n
+    fat = [-3] + [i + 2 for i in range(len(dir_sectors) - 1)] + [-2]
+    fat_sector = struct.pack(f'<{len(fat)}i', *fat).ljust(sector_size, b'\xff')
+
+    header = bytearray(b'\xff' * 512)
+    header[:0x4C] = b'\x00' * 0x4C
+    header[:8] = b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'
+    struct.pack_into('<HHHHH', header, 0x18, 0x3E, 3 if sector_size == 512 else 4, 0xFFFE,
+                     sector_size.bit_length() - 1, 6)
+    struct.pack_into('<iiiIiiii', header, 0x2C, 1, 1, 0, 4096, -2, 0, -2, 0)
+    struct.pack_into('<i', header, 0x4C, 0)
+    header = bytes(header).ljust(sector_size, b'\x00')
+    return header + fat_sector + b''.join(dir_sectors)
+
+
+def build_zip(part_names):
+    """Build an in-memory ZIP archive holding the given part paths."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        for name in part_names:
+            archive.writestr(name, '<xml/>')
+    return buffer.getvalue()
 
 
 class TestPDFConverter(unittest.TestCase):
@@ -43,6 +93,77 @@ class TestPDFConverter(unittest.TestCase):
         except ImportError:
             self.skipTest("pdfplumber not installed")
 
+    def test_ocr_renders_page_runs_once(self):
+        """Consecutive scanned pages are rendered by one pdf2image call."""
+        from ..converters.pdf import pdf_converter
+
+        class FakeImage:
+            def __init__(self, page_number):
+                self.page_number = page_number
+
+            def save(self, buffer, format):
+                buffer.write(str(self.page_number).encode())
+
+        def convert_from_path(file_path, dpi, first_page, last_page):
+            return [FakeImage(n) for n in range(first_page, last_page + 1)]
+
+        fake_pdf2image = mock.Mock(convert_from_path=mock.Mock(side_effect=convert_from_path))
+        fake_service = mock.Mock()
+        fake_service.recognize_many.side_effect = lambda images: [f"ocr {image.decode()}" for image in images]
+
+        with mock.patch.dict('sys.modules', {'pdf2image': fake_pdf2image}), \
+                mock.patch.object(pdf_converter, 'iter_pdf_pages', return_value=iter([(2, 'text 2')])), \
+                mock.patch.object(pdf_converter, 'count_pages', return_value=6), \
+                mock.patch.object(pdf_converter, 'ocr_service_from_config', return_value=fake_service):
+            text = self.converter.convert_with_ocr('scan.pdf')
+
+        ranges = [(c.kwargs['first_page'], c.kwargs['last_page'])
+                  for c in fake_pdf2image.convert_from_path.call_args_list]
+        self.assertEqual(ranges, [(1, 1), (3, 6)])
+        self.assertEqual(text.split('\n\n')[:2], ['--- Page 1 ---\nocr 1', '--- Page 2 ---\ntext 2'])
+        self.assertIn('--- Page 6 ---\nocr 6', text)
+
+
+class TestPDFEngine(unittest.TestCase):
+    """Test page streaming and early exit of the PDF engine."""
+
+    def setUp(self):
+        """Fake a 100-page document with 1000 chars per page."""
+        self.calls = []
+
+        def fake_extract(source, start, end, fast_path=True):
+            self.calls.append((start, end))
+            return [(i + 1, 'x' * 1000) for i in range(start, end)]
+
+        patches = [
+            mock.patch.object(pdf_engine, 'count_pages', return_value=100),
+            mock.patch.object(pdf_engine, 'extract_page_range', side_effect=fake_extract),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_stops_at_char_budget(self):
+        """Only the chunks needed to meet max_chars are extracted."""
+        pages = list(pdf_engine.iter_pdf_pages('doc.pdf', max_chars=2500, chunk_pages=2))
+
+        self.assertEqual([number for number, _ in pages], [1, 2, 3])
+        self.assertEqual(self.calls, [(0, 2), (2, 4)])
+
+    def test_page_range(self):
+        """Page range is 1-based and inclusive."""
+        pages = list(pdf_engine.iter_pdf_pages('doc.pdf', pages=(5, 7)))
+
+        self.assertEqual([number for number, _ in pages], [5, 6, 7])
+
+    def test_layout_heavy_detection(self):
+        """Many short text blocks are treated as a table/form page."""
+        table = [(0, 0, 10, 10, 'cell', i, 0) for i in range(50)]
+        prose = [(0, 0, 10, 10, 'A long paragraph of running text.', 0, 0)]
+
+        self.assertTrue(pdf_engine.is_layout_heavy(table))
+        self.assertFalse(pdf_engine.is_layout_heavy(prose))
+
 
 class TestDOCXConverter(unittest.TestCase):
     """Test DOCX converter."""
@@ -132,6 +253,30 @@ class TestExcelConverter(unittest.TestCase):
         except ImportError:
             self.skipTest("openpyxl not installed")
 
+    def test_stream_budgets(self):
+        """Per-sheet and global row budgets truncate the output."""
+        rows = [('id', 'value')] + [(i, i * 10) for i in range(1000)]
+        sheets = [('First', iter(rows)), ('Second', iter(rows))]
+
+        lines = list(stream_sheet_rows(sheets, max_rows_per_sheet=3, max_rows=5))
+
+        self.assertEqual(lines[:5], ['=== Sheet: First ===', 'id\tvalue', '0\t0', '1\t10',
+                                     '... (sheet truncated after 3 rows)'])
+        self.assertIn('=== Sheet: Second ===', lines)
+        self.assertEqual(lines[-1], '... (workbook truncated after 5 rows)')
+
+    def test_sample_mode(self):
+        """Sampling keeps header, first/last rows and column stats."""
+        rows = [('id', 'value'), (None, None)] + [(i, i * 10) for i in range(100)]
+
+        lines = sample_sheet_rows('Data', iter(rows), head_rows=2, tail_rows=2)
+
+        self.assertEqual(lines[0], '=== Sheet: Data (100 data rows) ===')
+        self.assertEqual(lines[1:4], ['id\tvalue', '0\t0', '1\t10'])
+        self.assertIn('... (96 rows omitted)', lines)
+        self.assertIn('99\t990', lines)
+        self.assertIn('value: non-empty=100, distinct=100, min=0 max=990 mean=495', lines)
+
 
 class TestOCRConverter(unittest.TestCase):
     """Test OCR converter."""
@@ -186,5 +331,124 @@ class TestOCRConverter(unittest.TestCase):
             self.skipTest("pytesseract or Pillow not installed")
 
 
+class TestOCRService(unittest.TestCase):
+    """Test OCR batching, caching and binarisation threshold."""
+
+    def test_otsu_threshold_bimodal(self):
+        """Threshold falls between the two grey-level peaks."""
+        histogram = [0] * 256
+        histogram[40] = 500
+        histogram[210] = 500
+
+        threshold = otsu_threshold(histogram)
+
+        self.assertGreaterEqual(threshold, 40)
+        self.assertLess(threshold, 210)
+
+    def test_cache_skips_repeated_images(self):
+        """Identical images are recognized once, then served from cache."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            service = OCRService(cache_path=os.path.join(tmp_dir, 'ocr.db'))
+            recognized = []
+
+            def fake_recognize(images):
+                recognized.extend(images)
+                return [image.decode() for image in images]
+
+            with mock.patch.object(service, '_recognize', side_effect=fake_recognize):
+                first = service.recognize_many([b'page-1', b'page-2', b'page-1'])
+                second = service.recognize_many([b'page-2'])
+
+            self.assertEqual(first, ['page-1', 'page-2', 'page-1'])
+            self.assertEqual(second, ['page-2'])
+            self.assertEqual(recognized, [b'page-1', b'page-2'])
+
+    def test_default_cache_is_private(self):
+        """The default cache lives in the user's cache directory, owner-only."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with mock.patch.dict(os.environ, {'XDG_CACHE_HOME': tmp_dir}):
+                cache_path = default_ocr_cache_path()
+            OCRCache(cache_path)
+
+            self.assertEqual(cache_path, os.path.join(tmp_dir, 'mcp_file_handler', 'ocr_cache.db'))
+            self.assertEqual(stat.S_IMODE(os.stat(os.path.dirname(cache_path)).st_mode), 0o700)
+            self.assertEqual(stat.S_IMODE(os.stat(cache_path).st_mode), 0o600)
+
+
+
+class TestFileDetector(unittest.TestCase):
+    """Test content sniffing and converter dispatch."""
+
+    def setUp(self):
+        """Setup test fixtures."""
+        self.detector = FileDetector()
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """Remove temporary files."""
+        self.tmp.cleanup()
+
+    def write(self, name: str, content: bytes) -> str:
+        path = os.path.join(self.tmp.name, name)
+        with open(path, 'wb') as f:
+            f.write(content)
+        return path
+
+    def test_pdf_without_extension(self):
+        """PDFs are detected from their magic bytes."""
+        path = self.write('scan', b'%PDF-1.4\n')
+        self.assertEqual(self.detector.detect_type(path), 'pdf')
+        self.assertIsInstance(self.detector.get_converter(path), PDFConverter)
+
+    def test_pdf_header_position(self):
+        """%PDF- counts at the start or after a BOM / whitespace, not mid-file."""
+        padded = self.write('padded', b'\xef\xbb\xbf \r\n%PDF-1.7\n')
+        self.assertEqual(self.detector.detect_type(padded), 'pdf')
+        embedded = self.write('notes', b'see attached file: %PDF-1.4 header dump\n')
+        self.assertNotEqual(self.detector.detect_type(embedded), 'pdf')
+
+    def test_content_wins_over_extension(self):
+        """A PNG saved as .pdf goes to OCR, not the PDF converter."""
+        path = self.write('image.pdf', b'\x89PNG\r\n\x1a\n' + b'\x00' * 16)
+        self.assertEqual(self.detector.detect_type(path), 'image')
+        self.assertIsInstance(self.detector.get_converter(path), OCRConverter)
+
+    def test_hwp_stream_beyond_first_directory_sector(self):
+        """OLE files are classified by streams in later directory sectors."""
+        path = self.write('report.doc', build_ole(
+            ['\x05HwpSummaryInformation', 'BodyText', 'DocInfo', 'FileHeader']))
+        self.assertEqual(self.detector.detect_type(path), 'hwp')
+        self.assertIsInstance(self.detector.get_converter(path), HWPConverter)
+
+    def test_ole_kinds(self):
+        """OLE stream names map to the legacy Office kinds."""
+        path = self.write('legacy', build_ole(['Workbook'], sector_size=4096))
+        self.assertEqual(self.detector.detect_type(path), 'excel')
+        path = self.write('unknown.hwp', build_ole(['Contents', 'Data']))
+        self.assertEqual(self.detector.detect_type(path), 'hwp')  # generic OLE: extension decides
+
+    def test_ooxml_from_central_directory(self):
+        """OOXML kinds come from ZIP part paths, not the extension."""
+        path = self.write('upload.bin', build_zip(['[Content_Types].xml', 'word/document.xml']))
+        self.assertEqual(self.detector.detect_type(path), 'docx')
+        self.assertIsInstance(self.detector.get_converter(path), DOCXConverter)
+
+        path = self.write('sheet.docx', build_zip(['[Content_Types].xml', 'xl/workbook.xml']))
+        self.assertEqual(self.detector.detect_type(path), 'excel')
+        self.assertIsInstance(self.detector.get_converter(path), ExcelConverter)
+
+    def test_extension_fallback(self):
+        """Unsniffable content falls back to the extension."""
+        path = self.write('notes.docx', b'not really a zip')
+        self.assertIsInstance(self.detector.get_converter(path), DOCXConverter)
+        self.assertIsNone(self.detector.get_converter(self.write('notes.txt', b'text')))
+
+    def test_onedrive_url(self):
+        """OneDrive and SharePoint hosts are recognised."""
+        self.assertTrue(self.detector.is_onedrive_url('https://1drv.ms/u/s!abc'))
+        self.assertTrue(self.detector.is_onedrive_url('https://contoso.sharepoint.com/x'))
+        self.assertFalse(self.detector.is_onedrive_url('https://example.com/file.pdf'))
+
+
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
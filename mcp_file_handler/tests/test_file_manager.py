@@ -0,0 +1,263 @@
+"""Tests for FileManager directory processing and metadata storage."""
+
+import asyncio
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+from ..async_file_manager import AsyncFileManager
+from ..config import Settings
+from ..file_manager import plan_directory_files
+from ..metadata import JSONStorage, MetadataManager, SQLiteStorage
+
+MB = 1024 * 1024
+
+
+class TestPlanDirectoryFiles(unittest.TestCase):
+    """Test size limits and scheduling order for batch conversion."""
+
+    def test_largest_first(self):
+        """Accepted files are scheduled largest-first."""
+        files = [('a.txt', 1 * MB), ('b.pdf', 5 * MB), ('c.docx', 3 * MB)]
+        scheduled, skipped = plan_directory_files(files)
+
+        self.assertEqual([path for path, _ in scheduled], ['b.pdf', 'c.docx', 'a.txt'])
+        self.assertEqual(skipped, [])
+
+    def test_max_file_size(self):
+        """Files over the per-file limit are reported, not scheduled."""
+        files = [('small.txt', 1 * MB), ('big.pdf', 20 * MB)]
+        scheduled, skipped = plan_directory_files(files, max_file_size=10)
+
+        self.assertEqual([path for path, _ in scheduled], ['small.txt'])
+        self.assertEqual(len(skipped), 1)
+        self.assertEqual(skipped[0]['file'], 'big.pdf')
+        self.assertFalse(skipped[0]['success'])
+
+    def test_max_total_size(self):
+        """Files past the total budget are skipped in discovery order."""
+        files = [('a.txt', 4 * MB), ('b.txt', 4 * MB), ('c.txt', 1 * MB)]
+        scheduled, skipped = plan_directory_files(files, max_total_size=6)
+
+        self.assertEqual(sorted(path for path, _ in scheduled), ['a.txt', 'c.txt'])
+        self.assertEqual([r['file'] for r in skipped], ['b.txt'])
+
+
+class TestAsyncFileManager(unittest.IsolatedAsyncioTestCase):
+    """Test concurrency limit and request timeout of the async facade."""
+
+    def make_manager(self, **config):
+        settings = Settings(config)
+        return AsyncFileManager(file_manager=SimpleNamespace(settings=settings, auth_manager=None))
+
+    async def test_timeout_returns_error_result(self):
+        """A slow operation is cut off with an error result."""
+        manager = self.make_manager(request_timeout=0.05)
+
+        async def slow():
+            await asyncio.sleep(1)
+
+        result = await manager._run('process', slow)
+
+        self.assertFalse(result['success'])
+        self.assertIn('timed out', result['errors'][0])
+
+    async def test_concurrency_limit(self):
+        """No more than max_concurrent_requests operations run at once."""
+        manager = self.make_manager(max_concurrent_requests=2)
+        running = 0
+        peak = 0
+
+        async def work():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return {'success': True}
+
+        results = await asyncio.gather(*(manager._run('process', work) for _ in range(6)))
+
+        self.assertEqual(peak, 2)
+        self.assertTrue(all(r['success'] for r in results))
+
+    async def test_timed_out_work_keeps_its_slot(self):
+        """A timed-out operation still counts against the limit until it finishes."""
+        manager = self.make_manager(max_concurrent_requests=1, request_timeout=0.05)
+        running = 0
+        peak = 0
+
+        async def work(duration):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(duration)
+            running -= 1
+            return {'success': True}
+
+        result = await manager._run('process', lambda: work(0.2))
+        self.assertIn('timed out', result['errors'][0])
+
+        # The slot is still taken, so the next request times out waiting for it
+        result = await manager._run('process', lambda: work(0.01))
+        self.assertIn('timed out', result['errors'][0])
+        self.assertEqual(peak, 1)
+
+        await asyncio.sleep(0.2)
+        result = await manager._run('process', lambda: work(0.01))
+        self.assertTrue(result['success'])
+        self.assertEqual(peak, 1)
+
+
+def seed_storage(storage):
+    """Save the two files the storage tests search over."""
+    storage.save('a.pdf', ['AI', 'report'], {'title': 'Quarterly mail summary'})
+    storage.save('b.pdf', ['mail', 'budget'], {'title': 'AI budget plan', 'tags': ['finance']})
+
+
+def search_urls(storage, **criteria):
+    return [entry['file_url'] for entry in storage.search(**criteria)]
+
+
+class TestSQLiteStorage(unittest.TestCase):
+    """SQLite keyword table and FTS5 trigram index."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.storage = SQLiteStorage(str(Path(self._tmp.name) / 'metadata.db'))
+        seed_storage(self.storage)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_keyword_is_exact(self):
+        """'ai' no longer matches 'mail'; matching is case-insensitive."""
+        self.assertEqual(search_urls(self.storage, keyword='ai'), ['a.pdf'])
+        self.assertEqual(search_urls(self.storage, keyword='MAIL'), ['b.pdf'])
+        self.assertEqual(search_urls(self.storage, keywords=['mail', 'budget']), ['b.pdf'])
+
+    def test_query_searches_metadata_values(self):
+        """Full-text query covers keywords and metadata values, ranked by bm25."""
+        results = self.storage.search(query='finance plan')
+        self.assertEqual([entry['file_url'] for entry in results], ['b.pdf'])
+        self.assertIn('score', results[0])
+        self.assertEqual(search_urls(self.storage, query='title'), [])
+
+    def test_query_matches_substrings(self):
+        """Query terms match inside words, so Korean particles do not block a match."""
+        self.storage.save('c.hwp', ['보고서를'], {'title': '3분기 실적 보고서를 제출합니다'})
+        self.assertEqual(search_urls(self.storage, query='보고서'), ['c.hwp'])
+        self.assertEqual(search_urls(self.storage, query='실적 보고'), ['c.hwp'])
+        self.assertEqual(search_urls(self.storage, query='QUARTER'), ['a.pdf'])
+        self.assertEqual(sorted(search_urls(self.storage, query='ai')), ['a.pdf', 'b.pdf'])
+
+    def test_pagination_and_delete(self):
+        """limit/offset page through results; delete removes index entries."""
+        self.assertEqual(search_urls(self.storage, limit=1, offset=1), ['b.pdf'])
+        self.storage.delete('a.pdf')
+        self.assertEqual(search_urls(self.storage, keyword='ai'), [])
+        self.assertEqual(search_urls(self.storage, query='quarterly'), [])
+
+    def test_save_many(self):
+        """Bulk saves replace keywords and full-text rows of existing files."""
+        saved = self.storage.save_many([('a.pdf', ['new'], {}), ('c.pdf', ['new'], {})])
+        self.assertEqual(saved, 2)
+        self.assertEqual(search_urls(self.storage, keyword='new'), ['a.pdf', 'c.pdf'])
+        self.assertEqual(search_urls(self.storage, keyword='report'), [])
+        self.assertEqual(search_urls(self.storage, query='quarterly'), [])
+
+    def test_backfills_existing_database(self):
+        """Databases created before the search tables are indexed on open."""
+        db_path = str(Path(self._tmp.name) / 'legacy.db')
+        conn = sqlite3.connect(db_path)
+        conn.execute('CREATE TABLE metadata (file_url TEXT PRIMARY KEY, keywords TEXT, '
+                     'metadata TEXT, created_at TEXT, updated_at TEXT)')
+        conn.execute("INSERT INTO metadata VALUES ('old.pdf', 'legacy', '{\"t\": \"hello\"}', '', '')")
+        conn.commit()
+        conn.close()
+
+        storage = SQLiteStorage(db_path)
+        self.assertEqual(search_urls(storage, keyword='legacy'), ['old.pdf'])
+        self.assertEqual(search_urls(storage, query='hello'), ['old.pdf'])
+
+        # The FTS rowid is an explicit id column, not the implicit rowid
+        conn = sqlite3.connect(db_path)
+        primary_keys = [row[1] for row in conn.execute('PRAGMA table_info(metadata)') if row[5]]
+        conn.close()
+        self.assertEqual(primary_keys, ['id'])
+
+
+class TestJSONStorage(unittest.TestCase):
+    """JSON storage with its in-memory keyword index."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.json_path = str(Path(self._tmp.name) / 'metadata.json')
+        self.storage = JSONStorage(self.json_path)
+        seed_storage(self.storage)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_keyword_is_exact(self):
+        """'ai' no longer matches 'mail'; matching is case-insensitive."""
+        self.assertEqual(search_urls(self.storage, keyword='ai'), ['a.pdf'])
+        self.assertEqual(search_urls(self.storage, keyword='MAIL'), ['b.pdf'])
+        self.assertEqual(search_urls(self.storage, keywords=['mail', 'budget']), ['b.pdf'])
+
+    def test_query_searches_metadata_values(self):
+        """Query covers keywords and metadata values, ranked by occurrences."""
+        results = self.storage.search(query='finance plan')
+        self.assertEqual([entry['file_url'] for entry in results], ['b.pdf'])
+        self.assertIn('score', results[0])
+        self.assertEqual(search_urls(self.storage, query='title'), [])
+
+    def test_query_matches_substrings(self):
+        """Query terms match inside words, as in the SQLite storage."""
+        self.storage.save('c.hwp', ['보고서를'], {'title': '3분기 실적 보고서를 제출합니다'})
+        self.assertEqual(search_urls(self.storage, query='보고서'), ['c.hwp'])
+        self.assertEqual(search_urls(self.storage, query='실적 보고'), ['c.hwp'])
+        self.assertEqual(search_urls(self.storage, query='QUARTER'), ['a.pdf'])
+        self.assertEqual(sorted(search_urls(self.storage, query='ai')), ['a.pdf', 'b.pdf'])
+
+    def test_pagination_and_delete(self):
+        """limit/offset page through results; delete removes index entries."""
+        self.assertEqual(search_urls(self.storage, limit=1, offset=1), ['b.pdf'])
+        self.storage.delete('a.pdf')
+        self.assertEqual(search_urls(self.storage, keyword='ai'), [])
+
+    def test_save_many(self):
+        """Bulk saves replace keywords of existing files."""
+        saved = self.storage.save_many([('a.pdf', ['new'], {}), ('c.pdf', ['new'], {})])
+        self.assertEqual(saved, 2)
+        self.assertEqual(search_urls(self.storage, keyword='new'), ['a.pdf', 'c.pdf'])
+        self.assertEqual(search_urls(self.storage, keyword='report'), [])
+
+    def test_keyword_index_reloaded(self):
+        """The keyword index is rebuilt when the JSON file is reopened."""
+        reopened = JSONStorage(self.json_path)
+        self.assertEqual(search_urls(reopened, keyword='budget'), ['b.pdf'])
+
+
+class TestMetadataManagerBulkSave(unittest.TestCase):
+    """bulk_save goes through a single storage batch."""
+
+    def test_bulk_save(self):
+        with tempfile.TemporaryDirectory() as directory:
+            settings = {'metadata_storage': 'sqlite', 'metadata_path': str(Path(directory) / 'm.db')}
+            manager = MetadataManager(settings)
+            results = manager.bulk_save([
+                {'file_url': 'a.pdf', 'keywords': ['x']},
+                {'file_url': 'https://host/b.pdf', 'keywords': ['x']},
+                {'keywords': ['missing url']},
+            ])
+
+            self.assertEqual(results['successful'], 2)
+            self.assertEqual(results['failed'], 1)
+            self.assertEqual(manager.get('https://host/b.pdf')['metadata']['source'], 'url')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,10 +1,12 @@
 """Tests for OneDrive integration."""
 
+import tempfile
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
 
 from ..onedrive import OneDriveClient, OneDriveDownloader, OneDriveProcessor
+from ..onedrive.async_downloader import AsyncOneDriveDownloader, load_manifest
 
 
 class TestOneDriveClient(unittest.TestCase):
@@ -54,6 +56,23 @@ class TestOneDriveClient(unittest.TestCase):
         self.assertEqual(len(result), 2)
         self.assertEqual(result[0]['name'], 'file1.pdf')
 
+    @patch('requests.get')
+    def test_list_children_follows_next_link(self, mock_get):
+        """Test listing folder children across pages."""
+        first = Mock()
+        first.json.return_value = {
+            'value': [{'id': '1', 'name': 'file1.pdf'}],
+            '@odata.nextLink': 'https://graph.microsoft.com/v1.0/next'
+        }
+        second = Mock()
+        second.json.return_value = {'value': [{'id': '2', 'name': 'file2.docx'}]}
+        mock_get.side_effect = [first, second]
+
+        result = self.client.list_children('folder_id')
+
+        self.assertEqual([item['id'] for item in result], ['1', '2'])
+        self.assertEqual(mock_get.call_args_list[1][0][0], 'https://graph.microsoft.com/v1.0/next')
+
 
 class TestOneDriveDownloader(unittest.TestCase):
     """Test OneDrive downloader."""
@@ -155,5 +174,55 @@ class TestOneDriveProcessor(unittest.TestCase):
         mock_download.assert_called_once()
 
 
+class TestAsyncOneDriveDownloader(unittest.IsolatedAsyncioTestCase):
+    """Test async folder walk and manifest-based skipping."""
+
+    def setUp(self):
+        """Fake a tree: root/{a.pdf, sub/{b.docx}}."""
+        self.tree = {
+            'root': [
+                {'id': 'a', 'name': 'a.pdf', 'size': 3, 'cTag': 'c1', 'file': {}},
+                {'id': 'sub', 'name': 'sub', 'folder': {}},
+            ],
+            'sub': [
+                {'id': 'b', 'name': 'b.docx', 'size': 3, 'cTag': 'c2', 'file': {}},
+            ],
+        }
+        self.downloads = []
+        self.downloader = AsyncOneDriveDownloader(Mock())
+
+        async def fake_list_children(session, folder):
+            return [dict(child) for child in self.tree[folder['id']]]
+
+        async def fake_download_file(session, item, output_path):
+            self.downloads.append(item['id'])
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            output_path.write_bytes(b'abc')
+            return str(output_path)
+
+        self.downloader.list_children = fake_list_children
+        self.downloader.download_file = fake_download_file
+
+        patcher = patch('aiohttp.ClientSession', MagicMock())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_download_folder_and_skip_unchanged(self):
+        """Files are downloaded once; re-sync only lists the folders."""
+        with tempfile.TemporaryDirectory() as output_dir:
+            results = await self.downloader.download_folder({'id': 'root'}, output_dir)
+
+            self.assertEqual(sorted(self.downloads), ['a', 'b'])
+            self.assertTrue((Path(output_dir) / 'sub' / 'b.docx').exists())
+            self.assertEqual(set(load_manifest(output_dir)), {'a', 'b'})
+
+            self.tree['sub'][0]['cTag'] = 'c3'
+            results = await self.downloader.download_folder({'id': 'root'}, output_dir)
+
+            self.assertEqual(sorted(self.downloads), ['a', 'b', 'b'])
+            unchanged = {r['id'] for r in results if r.get('unchanged')}
+            self.assertEqual(unchanged, {'a'})
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
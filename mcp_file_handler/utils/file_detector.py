@@ -1,9 +1,10 @@
 """File type detection utility."""
 
 from pathlib import Path
-from typing import Optional, Type
+from typing import Dict, Optional, Type
 import mimetypes
 import logging
+import re
 
 from ..base_converter import BaseConverter
 from ..converters import (
@@ -13,50 +14,81 @@ from ..converters import (
     ExcelConverter,
     OCRConverter
 )
+from core.file_sniffer import sniff_file
 
 logger = logging.getLogger(__name__)
 
+# File extension -> detected type
+EXTENSION_TYPES: Dict[str, str] = {
+    '.pdf': 'pdf',
+    '.docx': 'docx',
+    '.doc': 'docx',
+    '.hwp': 'hwp',
+    '.xlsx': 'excel',
+    '.xls': 'excel',
+    '.xlsm': 'excel',
+    '.xlsb': 'excel',
+    '.png': 'image',
+    '.jpg': 'image',
+    '.jpeg': 'image',
+    '.gif': 'image',
+    '.bmp': 'image',
+    '.tiff': 'image',
+    '.tif': 'image',
+}
+
+# Sniffed content kind (core.file_sniffer) -> detected type; content wins
+# over the extension for these kinds
+SNIFFED_TYPES: Dict[str, str] = {
+    'pdf': 'pdf',
+    'hwp': 'hwp',
+    'docx': 'docx',
+    'xlsx': 'excel',
+    'xls': 'excel',
+    'png': 'image',
+    'jpeg': 'image',
+    'gif': 'image',
+    'bmp': 'image',
+    'tiff': 'image',
+}
+
+ONEDRIVE_URL_PATTERN = re.compile(r'onedrive\.live\.com|1drv\.ms|sharepoint\.com|office\.com')
+
 
 class FileDetector:
     """Detect file types and return appropriate converter."""
 
     def __init__(self):
         """Initialize file detector with converter mappings."""
-        self.converters = [
+        pdf, docx, hwp, excel, ocr = (
             PDFConverter(),
             DOCXConverter(),
             HWPConverter(),
             ExcelConverter(),
             OCRConverter()
-        ]
-
-    def detect_type(self, file_path: str) -> Optional[str]:
-        """Detect file type using extension and mime type.
-
-        Args:
-            file_path: Path to the file
-
-        Returns:
-            File type string or None
-        """
-        path = Path(file_path)
-
-        if not path.exists():
-            logger.error(f"File does not exist: {file_path}")
-            return None
-
-        # First try by extension
-        ext = path.suffix.lower()
-        if ext == '.pdf':
-            return 'pdf'
-        elif ext in ['.docx', '.doc']:
-            return 'docx'
-        elif ext == '.hwp':
-            return 'hwp'
-        elif ext in ['.xlsx', '.xls', '.xlsm', '.xlsb']:
-            return 'excel'
-        elif ext in ['.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff', '.tif']:
-            return 'image'
+        )
+        self.converters = [pdf, docx, hwp, excel, ocr]
+        self._dispatch: Dict[str, BaseConverter] = {
+            'pdf': pdf,
+            'docx': docx,
+            'hwp': hwp,
+            'excel': excel,
+            'image': ocr
+        }
+
+    def _classify(self, file_path: str) -> Optional[str]:
+        """Classify by magic bytes, then extension, then mime type."""
+        kind = sniff_file(file_path)
+        ext = Path(file_path).suffix.lower()
+
+        if kind in SNIFFED_TYPES:
+            detected = SNIFFED_TYPES[kind]
+            if ext in EXTENSION_TYPES and EXTENSION_TYPES[ext] != detected:
+                logger.info(f"{file_path}: content is {kind}, not {ext}")
+            return detected
+
+        if ext in EXTENSION_TYPES:
+            return EXTENSION_TYPES[ext]
 
         # Try mime type detection
         mime_type, _ = mimetypes.guess_type(file_path)
@@ -70,9 +102,28 @@ class FileDetector:
             elif mime_type.startswith('image/'):
                 return 'image'
 
-        logger.warning(f"Unknown file type for: {file_path}")
         return None
 
+    def detect_type(self, file_path: str) -> Optional[str]:
+        """Detect file type from content (magic bytes), extension and mime type.
+
+        Content sniffing results are cached by (path, mtime, size).
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            File type string or None
+        """
+        if not Path(file_path).exists():
+            logger.error(f"File does not exist: {file_path}")
+            return None
+
+        file_type = self._classify(file_path)
+        if not file_type:
+            logger.warning(f"Unknown file type for: {file_path}")
+        return file_type
+
     def get_converter(self, file_path: str) -> Optional[BaseConverter]:
         """Get appropriate converter for file.
 
@@ -82,10 +133,10 @@ class FileDetector:
         Returns:
             Converter instance or None
         """
-        for converter in self.converters:
-            if converter.supports(file_path):
-                logger.info(f"Using {converter.__class__.__name__} for {file_path}")
-                return converter
+        converter = self._dispatch.get(self._classify(file_path))
+        if converter and converter.supports(file_path):
+            logger.info(f"Using {converter.__class__.__name__} for {file_path}")
+            return converter
 
         logger.warning(f"No converter found for: {file_path}")
         return None
@@ -110,10 +161,4 @@ class FileDetector:
         Returns:
             True if it's a OneDrive URL
         """
-        onedrive_domains = [
-            'onedrive.live.com',
-            '1drv.ms',
-            'sharepoint.com',
-            'office.com'
-        ]
-        return any(domain in url for domain in onedrive_domains)
\ No newline at end of file
+        return ONEDRIVE_URL_PATTERN.search(url) is not None
@@ -5,6 +5,7 @@ Microsoft Graph API를 사용한 OneDrive 서비스 (mcp_outlook 구조 참조)
 
 from .onedrive_service import OneDriveService
 from .graph_onedrive_client import GraphOneDriveClient
+from .onedrive_item_index import OneDriveItemIndex
 from .onedrive_types import (
     FileInfo,
     FolderInfo,
@@ -20,6 +21,8 @@ __all__ = [
     "OneDriveService",
     # Client
     "GraphOneDriveClient",
+    # Index
+    "OneDriveItemIndex",
     # Types
     "FileInfo",
     "FolderInfo",
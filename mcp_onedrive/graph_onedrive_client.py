@@ -4,14 +4,17 @@ Microsoft Graph API를 사용한 OneDrive 작업 처리
 session 모듈을 통한 인증 관리
 """
 
+import asyncio
 import base64
+import codecs
 import logging
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Awaitable, Callable, Tuple
 import aiohttp
 
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.metrics import graph_trace_configs, track_auth
 
 from session import AuthManager
 from .onedrive_types import (
@@ -22,9 +25,114 @@ from .onedrive_types import (
     ItemType,
     ConflictBehavior,
 )
+from .onedrive_item_index import OneDriveItemIndex, DELTA_SELECT_FIELDS
 
 logger = logging.getLogger(__name__)
 
+# 단일 PUT으로 업로드할 수 있는 최대 크기 (초과 시 업로드 세션 사용)
+SIMPLE_UPLOAD_MAX_BYTES = 4 * 1024 * 1024
+
+# 업로드 세션 조각 크기는 320KiB의 배수여야 함
+UPLOAD_CHUNK_UNIT = 320 * 1024
+UPLOAD_CHUNK_SIZE = 32 * UPLOAD_CHUNK_UNIT  # 10MiB
+UPLOAD_MAX_RETRIES = 3
+
+READ_CHUNK_SIZE = 1024 * 1024
+
+# read_file 1회로 메모리에 올리는 최대 크기 (더 큰 파일은 offset/length로 나눠 읽기)
+READ_MAX_BYTES = 4 * 1024 * 1024
+
+
+class QuickXorHash:
+    """
+    OneDrive quickXorHash
+
+    160비트 상태에 바이트마다 11비트씩 회전한 위치로 XOR하고,
+    마지막에 전체 길이를 XOR한다. 바이트 위치는 160 주기로 반복되므로
+    160바이트 블록 단위로 XOR을 접은 뒤 digest 시점에 회전을 적용한다.
+    """
+
+    WIDTH_IN_BITS = 160
+    SHIFT = 11
+    BLOCK = 160  # 회전 위치가 반복되는 바이트 주기
+
+    def __init__(self):
+        self._folded = 0  # 위치(i mod 160)별 XOR 누적, little-endian 정수
+        self._length = 0
+
+    def update(self, data: bytes):
+        """데이터 추가"""
+        view = memoryview(data)
+        position = self._length % self.BLOCK
+        self._length += len(view)
+
+        # 블록 경계까지 정렬
+        head = min(len(view), (self.BLOCK - position) % self.BLOCK)
+        if head:
+            self._folded ^= int.from_bytes(view[:head], "little") << (position * 8)
+            view = view[head:]
+
+        folded = 0
+        full = len(view) // self.BLOCK * self.BLOCK
+        for start in range(0, full, self.BLOCK):
+            folded ^= int.from_bytes(view[start:start + self.BLOCK], "little")
+        if full < len(view):
+            folded ^= int.from_bytes(view[full:], "little")
+        self._folded ^= folded
+
+    def digest(self) -> bytes:
+        """20바이트 해시"""
+        mask = (1 << self.WIDTH_IN_BITS) - 1
+        result = 0
+        folded = self._folded.to_bytes(self.BLOCK, "little")
+        for index, value in enumerate(folded):
+            if value:
+                shifted = value << ((index * self.SHIFT) % self.WIDTH_IN_BITS)
+                result ^= (shifted | (shifted >> self.WIDTH_IN_BITS)) & mask
+
+        digest = bytearray(result.to_bytes(self.WIDTH_IN_BITS // 8, "little"))
+        for index, value in enumerate(self._length.to_bytes(8, "little")):
+            digest[self.WIDTH_IN_BITS // 8 - 8 + index] ^= value
+        return bytes(digest)
+
+    def b64digest(self) -> str:
+        """Graph API file.hashes.quickXorHash 형식 (base64)"""
+        return base64.b64encode(self.digest()).decode("ascii")
+
+
+def _parse_total_size(response) -> Optional[int]:
+    """Content-Range (bytes a-b/total) 또는 Content-Length에서 전체 크기 추출"""
+    content_range = response.headers.get("Content-Range", "")
+    if "/" in content_range:
+        total = content_range.rsplit("/", 1)[1]
+        return int(total) if total.isdigit() else None
+    content_length = response.headers.get("Content-Length")
+    return int(content_length) if content_length and content_length.isdigit() else None
+
+
+def _decode_utf8_window(data: bytes, skip_leading: bool, has_more: bool) -> Optional[Tuple[str, int]]:
+    """
+    바이트 구간을 UTF-8로 디코딩
+
+    구간 앞의 이어지는 바이트(0x80-0xBF)는 버리고, 뒤에 더 읽을 내용이 있으면
+    끝에 잘린 문자는 다음 구간으로 넘긴다.
+
+    Returns:
+        (텍스트, 소비한 바이트 수) 또는 디코딩 불가 시 None
+    """
+    start = 0
+    if skip_leading:
+        while start < min(len(data), 3) and 0x80 <= data[start] <= 0xBF:
+            start += 1
+
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    try:
+        text = decoder.decode(data[start:], final=not has_more)
+    except UnicodeDecodeError:
+        return None
+    pending = len(decoder.getstate()[0])
+    return text, len(data) - pending
+
 
 class GraphOneDriveClient:
     """OneDrive Graph API 클라이언트"""
@@ -47,7 +155,7 @@ class GraphOneDriveClient:
         if self._initialized:
             return True
 
-        self._session = aiohttp.ClientSession()
+        self._session = aiohttp.ClientSession(trace_configs=graph_trace_configs())
         self._initialized = True
         logger.info("GraphOneDriveClient initialized")
         return True
@@ -70,7 +178,8 @@ class GraphOneDriveClient:
             유효한 액세스 토큰 또는 None
         """
         try:
-            token = await self.auth_manager.validate_and_refresh_token(user_email)
+            with track_auth():
+                token = await self.auth_manager.validate_and_refresh_token(user_email)
             return token
         except Exception as e:
             logger.error(f"토큰 조회 실패: {str(e)}")
@@ -91,7 +200,7 @@ class GraphOneDriveClient:
 
         Args:
             method: HTTP 메서드 (GET, POST, PUT, PATCH, DELETE)
-            endpoint: API 엔드포인트
+            endpoint: API 엔드포인트 (또는 nextLink/deltaLink 전체 URL)
             user_email: 사용자 이메일
             json_data: JSON 데이터
             data: 바이너리 데이터
@@ -113,7 +222,7 @@ class GraphOneDriveClient:
             "Content-Type": content_type,
         }
 
-        url = f"{self.GRAPH_BASE_URL}{endpoint}"
+        url = endpoint if endpoint.startswith("https://") else f"{self.GRAPH_BASE_URL}{endpoint}"
 
         try:
             async with self._session.request(
@@ -135,6 +244,7 @@ class GraphOneDriveClient:
                     return {
                         "success": False,
                         "error": f"API 요청 실패: {response.status}",
+                        "status": response.status,
                         "details": error_text,
                     }
         except Exception as e:
@@ -211,18 +321,83 @@ class GraphOneDriveClient:
             # 폴더 목록 모드
             endpoint = self._build_path(folder_path) + f"?$top={limit}"
 
-        result = await self._make_request("GET", endpoint, user_email)
+        items_data: List[Dict[str, Any]] = []
+        while endpoint and len(items_data) < limit:
+            result = await self._make_request("GET", endpoint, user_email)
+            if not result.get("success"):
+                return result
+            data = result.get("data", {})
+            items_data.extend(data.get("value", []))
+            # $top은 페이지 크기일 뿐이므로 nextLink를 따라 limit까지 조회
+            endpoint = data.get("@odata.nextLink")
+
+        items = [DriveItem.from_dict(item) for item in items_data[:limit]]
+        return {
+            "success": True,
+            "files": [item.__dict__ for item in items],
+            "count": len(items),
+        }
 
-        if result.get("success"):
-            items_data = result.get("data", {}).get("value", [])
-            items = [DriveItem.from_dict(item) for item in items_data]
-            return {
-                "success": True,
-                "files": [item.__dict__ for item in items],
-                "count": len(items),
-            }
+    async def sync_delta(
+        self,
+        user_email: str,
+        index: OneDriveItemIndex,
+    ) -> Dict[str, Any]:
+        """
+        /drive/root/delta 변경 피드로 로컬 아이템 인덱스 동기화
 
-        return result
+        저장된 delta 링크가 없으면 전체 크롤을 수행하고, 있으면 변경분만 가져온다.
+        페이지마다 nextLink를 저장하므로 중단된 크롤은 이어서 진행된다.
+        delta 링크가 만료되면 (410 Gone) 인덱스를 비우고 전체 크롤을 다시 수행한다.
+
+        Args:
+            user_email: 사용자 이메일
+            index: 로컬 아이템 인덱스
+
+        Returns:
+            동기화 결과 (변경 아이템 수, 페이지 수, 전체 크롤 여부)
+        """
+        state = await index.get_sync_state(user_email)
+        full_sync = not state["complete"]
+        endpoint = state["delta_link"]
+        reset = endpoint is None
+        if reset:
+            endpoint = f"/me/drive/root/delta?$select={DELTA_SELECT_FIELDS}"
+
+        changes = 0
+        pages = 0
+        while endpoint:
+            result = await self._make_request("GET", endpoint, user_email)
+            if not result.get("success"):
+                if result.get("status") == 410 and not reset:
+                    logger.warning("delta 링크 만료, 전체 재동기화")
+                    endpoint = f"/me/drive/root/delta?$select={DELTA_SELECT_FIELDS}"
+                    reset = full_sync = True
+                    continue
+                return result
+
+            data = result.get("data", {})
+            next_link = data.get("@odata.nextLink")
+            changes += await index.apply_delta(
+                user_email,
+                data.get("value", []),
+                next_link=next_link,
+                delta_link=data.get("@odata.deltaLink"),
+                reset=reset,
+            )
+            reset = False
+            pages += 1
+            endpoint = next_link
+
+        item_count = await index.count_items(user_email)
+        logger.info(f"delta 동기화 완료: {changes}개 변경, {pages}페이지, 인덱스 {item_count}개")
+        return {
+            "success": True,
+            "changes": changes,
+            "pages": pages,
+            "full_sync": full_sync,
+            "item_count": item_count,
+        }
 
     async def get_item(
         self,
@@ -257,18 +432,32 @@ class GraphOneDriveClient:
         user_email: str,
         file_path: str,
         as_text: bool = True,
+        offset: int = 0,
+        length: Optional[int] = None,
     ) -> Dict[str, Any]:
         """
-        파일 내용 읽기
+        파일 내용 읽기 (바이트 범위 지정 가능)
+
+        offset/length를 지정하면 Range 요청으로 해당 구간만 내려받는다.
+        한 번에 READ_MAX_BYTES까지만 읽으며, 구간 없이 그보다 큰 파일을 읽으면
+        실패를 반환한다. 큰 파일은 응답의 next_offset으로 이어서 읽을 수 있다.
+        텍스트 모드에서는 구간 경계에 걸친 UTF-8 문자를 다음 구간으로 넘긴다.
 
         Args:
             user_email: 사용자 이메일
             file_path: 파일 경로
             as_text: True면 텍스트로, False면 base64로 반환
+            offset: 읽기 시작 바이트 위치
+            length: 읽을 최대 바이트 수 (1 이상, 없으면 끝까지; READ_MAX_BYTES로 제한)
 
         Returns:
-            파일 내용
+            파일 내용 (구간 읽기 시 offset, length, total_size, has_more, next_offset 포함)
         """
+        if offset < 0:
+            return {"success": False, "error": "offset은 0 이상이어야 합니다."}
+        if length is not None and length <= 0:
+            return {"success": False, "error": "length는 1 이상이어야 합니다."}
+
         if not self._initialized:
             await self.initialize()
 
@@ -277,6 +466,11 @@ class GraphOneDriveClient:
             return {"success": False, "error": "액세스 토큰이 없습니다."}
 
         headers = {"Authorization": f"Bearer {access_token}"}
+        ranged = offset > 0 or length is not None
+        limit = min(length, READ_MAX_BYTES) if length is not None else READ_MAX_BYTES
+        if ranged:
+            headers["Range"] = f"bytes={offset}-{offset + limit - 1}"
+
         endpoint = f"/me/drive/root:/{file_path}:/content"
         url = f"{self.GRAPH_BASE_URL}{endpoint}"
 
@@ -284,48 +478,134 @@ class GraphOneDriveClient:
             async with self._session.get(
                 url,
                 headers=headers,
-                timeout=aiohttp.ClientTimeout(total=60),
+                timeout=aiohttp.ClientTimeout(total=None, sock_read=60),
             ) as response:
-                if response.status == 200:
-                    content_bytes = await response.read()
-
-                    if as_text:
-                        try:
-                            content = content_bytes.decode("utf-8")
-                            return {
-                                "success": True,
-                                "file_path": file_path,
-                                "content": content,
-                                "content_type": "text",
-                            }
-                        except UnicodeDecodeError:
-                            # UTF-8 디코딩 실패 시 base64로 반환
-                            content = base64.b64encode(content_bytes).decode("ascii")
-                            return {
-                                "success": True,
-                                "file_path": file_path,
-                                "content": content,
-                                "content_type": "base64",
-                            }
-                    else:
-                        content = base64.b64encode(content_bytes).decode("ascii")
-                        return {
-                            "success": True,
-                            "file_path": file_path,
-                            "content": content,
-                            "content_type": "base64",
-                        }
-                else:
+                if response.status not in (200, 206):
                     error_text = await response.text()
                     return {
                         "success": False,
                         "error": f"파일 읽기 실패: {response.status}",
                         "details": error_text,
                     }
+
+                total_size = _parse_total_size(response)
+                if not ranged and total_size is not None and total_size > READ_MAX_BYTES:
+                    return self._read_too_large(file_path, total_size)
+                # Range를 무시하고 200으로 전체를 보낸 경우 앞부분을 건너뜀
+                skip = offset if ranged and response.status == 200 else 0
+                buffer = bytearray()
+                async for chunk in response.content.iter_chunked(READ_CHUNK_SIZE):
+                    if skip:
+                        dropped = min(skip, len(chunk))
+                        chunk = chunk[dropped:]
+                        skip -= dropped
+                    buffer.extend(chunk)
+                    if len(buffer) > limit and not ranged:
+                        # 크기를 알리지 않은 응답
+                        return self._read_too_large(file_path, total_size)
+                    if len(buffer) >= limit and ranged:
+                        del buffer[limit:]
+                        break
+                content_bytes = bytes(buffer)
         except Exception as e:
             logger.error(f"파일 읽기 오류: {str(e)}")
             return {"success": False, "error": str(e)}
 
+        has_more = total_size is not None and offset + len(content_bytes) < total_size
+        content_type = "base64"
+        consumed = len(content_bytes)
+        content = None
+        if as_text:
+            decoded = _decode_utf8_window(content_bytes, offset > 0, has_more)
+            if decoded is not None:
+                content, consumed = decoded
+                content_type = "text"
+        if content is None:
+            # UTF-8 디코딩 실패 또는 바이너리 요청 시 base64로 반환
+            content = base64.b64encode(content_bytes).decode("ascii")
+
+        result = {
+            "success": True,
+            "file_path": file_path,
+            "content": content,
+            "content_type": content_type,
+        }
+        if ranged:
+            result.update({
+                "offset": offset,
+                "length": consumed,
+                "total_size": total_size,
+                "has_more": has_more,
+                "next_offset": offset + consumed if has_more else None,
+            })
+        return result
+
+    @staticmethod
+    def _read_too_large(file_path: str, total_size: Optional[int]) -> Dict[str, Any]:
+        size = f"{total_size} bytes" if total_size is not None else f"{READ_MAX_BYTES} bytes 초과"
+        return {
+            "success": False,
+            "error": f"파일이 너무 큽니다 ({size}). offset/length로 {READ_MAX_BYTES} bytes 이하씩 나눠 읽으세요.",
+            "file_path": file_path,
+            "total_size": total_size,
+            "max_bytes": READ_MAX_BYTES,
+        }
+
+    async def download_file(
+        self,
+        user_email: str,
+        file_path: str,
+        local_path: str,
+    ) -> Dict[str, Any]:
+        """
+        파일을 로컬 경로로 스트리밍 다운로드 (.part에 기록 후 이름 변경)
+
+        Args:
+            user_email: 사용자 이메일
+            file_path: OneDrive 파일 경로
+            local_path: 저장할 로컬 경로
+
+        Returns:
+            저장 경로와 크기
+        """
+        if not self._initialized:
+            await self.initialize()
+
+        access_token = await self._get_access_token(user_email)
+        if not access_token:
+            return {"success": False, "error": "액세스 토큰이 없습니다."}
+
+        url = f"{self.GRAPH_BASE_URL}/me/drive/root:/{file_path}:/content"
+        part_path = f"{local_path}.part"
+        size = 0
+
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(local_path)), exist_ok=True)
+            async with self._session.get(
+                url,
+                headers={"Authorization": f"Bearer {access_token}"},
+                timeout=aiohttp.ClientTimeout(total=None, sock_read=60),
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    return {
+                        "success": False,
+                        "error": f"파일 다운로드 실패: {response.status}",
+                        "details": error_text,
+                    }
+                with open(part_path, "wb") as f:
+                    async for chunk in response.content.iter_chunked(READ_CHUNK_SIZE):
+                        f.write(chunk)
+                        size += len(chunk)
+            os.replace(part_path, local_path)
+        except Exception as e:
+            logger.error(f"파일 다운로드 오류: {str(e)}")
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            return {"success": False, "error": str(e)}
+
+        return {"success": True, "file_path": file_path, "local_path": local_path, "size": size}
+
     async def write_file(
         self,
         user_email: str,
@@ -337,6 +617,8 @@ class GraphOneDriveClient:
         """
         파일 작성/업로드
 
+        4MB를 넘는 내용은 업로드 세션으로 나누어 올린다.
+
         Args:
             user_email: 사용자 이메일
             file_path: 파일 경로
@@ -347,6 +629,72 @@ class GraphOneDriveClient:
         Returns:
             작성된 파일 정보
         """
+        data = content.encode("utf-8")
+        if len(data) > SIMPLE_UPLOAD_MAX_BYTES:
+            view = memoryview(data)
+
+            async def read_chunk(start: int, size: int) -> bytes:
+                return bytes(view[start:start + size])
+
+            return await self._upload_with_session(
+                user_email, file_path, len(data), read_chunk, conflict_behavior
+            )
+        return await self._simple_upload(user_email, file_path, data, content_type, conflict_behavior)
+
+    async def upload_file(
+        self,
+        user_email: str,
+        file_path: str,
+        local_path: str,
+        conflict_behavior: ConflictBehavior = ConflictBehavior.REPLACE,
+        chunk_size: int = UPLOAD_CHUNK_SIZE,
+    ) -> Dict[str, Any]:
+        """
+        로컬 파일 업로드 (업로드 세션으로 조각 단위 스트리밍)
+
+        파일 전체를 메모리에 올리지 않고 chunk_size씩 읽어 전송한다.
+
+        Args:
+            user_email: 사용자 이메일
+            file_path: OneDrive 파일 경로
+            local_path: 업로드할 로컬 파일 경로
+            conflict_behavior: 충돌 시 동작
+            chunk_size: 조각 크기 (320KiB 배수로 맞춤)
+
+        Returns:
+            업로드된 파일 정보
+        """
+        if not os.path.isfile(local_path):
+            return {"success": False, "error": f"로컬 파일이 없습니다: {local_path}"}
+
+        total_size = os.path.getsize(local_path)
+        if total_size == 0:
+            # 업로드 세션은 빈 파일을 받지 않음
+            return await self._simple_upload(
+                user_email, file_path, b"", "application/octet-stream", conflict_behavior
+            )
+
+        with open(local_path, "rb") as f:
+            def read_at(start: int, size: int) -> bytes:
+                f.seek(start)
+                return f.read(size)
+
+            async def read_chunk(start: int, size: int) -> bytes:
+                return await asyncio.to_thread(read_at, start, size)
+
+            return await self._upload_with_session(
+                user_email, file_path, total_size, read_chunk, conflict_behavior, chunk_size
+            )
+
+    async def _simple_upload(
+        self,
+        user_email: str,
+        file_path: str,
+        data: bytes,
+        content_type: str,
+        conflict_behavior: ConflictBehavior,
+    ) -> Dict[str, Any]:
+        """단일 PUT 업로드 (4MB 이하)"""
         if not self._initialized:
             await self.initialize()
 
@@ -365,7 +713,6 @@ class GraphOneDriveClient:
         url = f"{self.GRAPH_BASE_URL}{endpoint}"
 
         try:
-            data = content.encode("utf-8")
             async with self._session.put(
                 url,
                 headers=headers,
@@ -390,6 +737,137 @@ class GraphOneDriveClient:
             logger.error(f"파일 쓰기 오류: {str(e)}")
             return {"success": False, "error": str(e)}
 
+    async def _upload_with_session(
+        self,
+        user_email: str,
+        file_path: str,
+        total_size: int,
+        read_chunk: Callable[[int, int], Awaitable[bytes]],
+        conflict_behavior: ConflictBehavior,
+        chunk_size: int = UPLOAD_CHUNK_SIZE,
+    ) -> Dict[str, Any]:
+        """
+        업로드 세션으로 조각 업로드 후 quickXorHash 검증
+
+        Graph는 조각을 순서대로만 받으므로 전송은 순차로 하되,
+        다음 조각 읽기를 현재 조각 전송과 겹쳐 수행한다.
+        조각 전송 실패는 UPLOAD_MAX_RETRIES회 재시도하고, 최종 실패 시 세션을 취소한다.
+        """
+        # 320KiB 배수가 아니면 Graph가 조각을 거부함
+        chunk_size = max(UPLOAD_CHUNK_UNIT, chunk_size // UPLOAD_CHUNK_UNIT * UPLOAD_CHUNK_UNIT)
+
+        session_result = await self._make_request(
+            "POST",
+            f"/me/drive/root:/{file_path}:/createUploadSession",
+            user_email,
+            json_data={"item": {"@microsoft.graph.conflictBehavior": conflict_behavior.value}},
+        )
+        if not session_result.get("success"):
+            return session_result
+        upload_url = session_result["data"]["uploadUrl"]
+
+        hasher = QuickXorHash()
+        offset = 0
+        chunks = 0
+        item_data: Optional[Dict[str, Any]] = None
+        pending = asyncio.ensure_future(read_chunk(0, min(chunk_size, total_size)))
+
+        try:
+            while offset < total_size:
+                chunk = await pending
+                if not chunk:
+                    raise IOError(f"업로드 원본이 예상보다 짧습니다 ({offset}/{total_size} bytes)")
+                next_offset = offset + len(chunk)
+                if next_offset < total_size:
+                    pending = asyncio.ensure_future(
+                        read_chunk(next_offset, min(chunk_size, total_size - next_offset))
+                    )
+                hasher.update(chunk)
+                item_data = await self._put_upload_chunk(upload_url, chunk, offset, total_size)
+                offset = next_offset
+                chunks += 1
+        except Exception as e:
+            logger.error(f"업로드 세션 오류 ({file_path}): {str(e)}")
+            if not pending.done():
+                pending.cancel()
+            await self._cancel_upload_session(upload_url)
+            return {"success": False, "error": str(e)}
+
+        item = DriveItem.from_dict(item_data or {})
+        local_hash = hasher.b64digest()
+        remote_hash = ((item_data or {}).get("file") or {}).get("hashes", {}).get("quickXorHash")
+        if remote_hash and remote_hash != local_hash:
+            logger.error(f"업로드 체크섬 불일치: {file_path} (local={local_hash}, remote={remote_hash})")
+            return {
+                "success": False,
+                "error": "업로드 체크섬 불일치",
+                "file": item.__dict__,
+                "local_hash": local_hash,
+                "remote_hash": remote_hash,
+            }
+
+        logger.info(f"업로드 세션 완료: {file_path} ({total_size} bytes, {chunks}개 조각)")
+        return {
+            "success": True,
+            "file": item.__dict__,
+            "upload": {
+                "size": total_size,
+                "chunks": chunks,
+                "quick_xor_hash": local_hash,
+                "checksum_verified": bool(remote_hash),
+            },
+        }
+
+    async def _put_upload_chunk(
+        self,
+        upload_url: str,
+        chunk: bytes,
+        offset: int,
+        total_size: int,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        업로드 세션에 조각 하나 전송 (재시도 포함)
+
+        uploadUrl은 사전 인증된 URL이므로 Authorization 헤더를 보내지 않는다.
+
+        Returns:
+            마지막 조각이면 생성된 아이템 JSON, 아니면 None
+        """
+        headers = {
+            "Content-Length": str(len(chunk)),
+            "Content-Range": f"bytes {offset}-{offset + len(chunk) - 1}/{total_size}",
+        }
+        for attempt in range(UPLOAD_MAX_RETRIES + 1):
+            try:
+                async with self._session.put(
+                    upload_url,
+                    headers=headers,
+                    data=chunk,
+                    timeout=aiohttp.ClientTimeout(total=300),
+                ) as response:
+                    if response.status == 202:
+                        return None
+                    if response.status in (200, 201):
+                        return await response.json()
+                    error_text = await response.text()
+                    if response.status < 500 and response.status != 429:
+                        raise IOError(f"조각 업로드 실패: {response.status} - {error_text}")
+                    error = IOError(f"조각 업로드 실패: {response.status}")
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error = e
+            if attempt < UPLOAD_MAX_RETRIES:
+                logger.warning(f"조각 업로드 재시도 ({offset}, {attempt + 1}/{UPLOAD_MAX_RETRIES}): {error}")
+                await asyncio.sleep(0.5 * 2 ** attempt)
+        raise error
+
+    async def _cancel_upload_session(self, upload_url: str):
+        """실패한 업로드 세션 취소"""
+        try:
+            async with self._session.delete(upload_url, timeout=aiohttp.ClientTimeout(total=30)):
+                pass
+        except Exception as e:
+            logger.warning(f"업로드 세션 취소 실패: {str(e)}")
+
     async def delete_file(
         self,
         user_email: str,
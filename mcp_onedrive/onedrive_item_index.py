@@ -0,0 +1,433 @@
+"""
+OneDrive Item Index
+사용자별 드라이브 아이템 로컬 인덱스 (SQLite)
+/drive/root/delta 변경 피드로 갱신하며 delta 링크를 영속화
+"""
+
+import json
+import sqlite3
+import os
+import logging
+from datetime import datetime, timezone
+from typing import Optional, List, Dict, Any
+
+logger = logging.getLogger(__name__)
+
+# delta 조회 시 요청할 필드
+DELTA_SELECT_FIELDS = (
+    "id,name,size,eTag,cTag,file,folder,root,deleted,parentReference,"
+    "createdDateTime,lastModifiedDateTime,webUrl"
+)
+
+_UPSERT_ITEM_SQL = """
+    INSERT INTO onedrive_items (
+        user_id, item_id, parent_id, name, path, is_folder, size,
+        e_tag, c_tag, last_modified_datetime, item_json
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(user_id, item_id) DO UPDATE SET
+        parent_id = excluded.parent_id,
+        name = excluded.name,
+        path = excluded.path,
+        is_folder = excluded.is_folder,
+        size = excluded.size,
+        e_tag = excluded.e_tag,
+        c_tag = excluded.c_tag,
+        last_modified_datetime = excluded.last_modified_datetime,
+        item_json = excluded.item_json
+"""
+
+
+def normalize_path(path: Optional[str]) -> str:
+    """경로 정규화 (앞뒤 '/' 제거, 루트는 빈 문자열)"""
+    return (path or "").strip("/")
+
+
+def _graph_parent_path(path: str) -> str:
+    """인덱스 경로의 부모를 Graph parentReference.path 형식으로 변환"""
+    parent = path.rsplit("/", 1)[0] if "/" in path else ""
+    return f"/drive/root:/{parent}" if parent else "/drive/root:"
+
+
+class OneDriveItemIndex:
+    """
+    OneDrive 드라이브 아이템 인덱스
+
+    - onedrive_items: (user_id, item_id) 단위 아이템, 루트 기준 경로(path) 유지
+    - onedrive_items_fts: 이름/경로 검색용 FTS5 trigram (트리거로 동기화)
+    - onedrive_delta_state: 사용자별 delta 링크 / 초기 크롤 완료 여부
+    """
+
+    def __init__(self, db_path: str = "database/auth.db"):
+        """
+        데이터베이스 초기화
+
+        Args:
+            db_path: 데이터베이스 파일 경로
+        """
+        resolved_path = os.path.expanduser(db_path)
+        if not os.path.isabs(resolved_path):
+            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            resolved_path = os.path.join(base_dir, resolved_path)
+
+        self.db_path = resolved_path
+        self._fts_enabled = False
+        self._ensure_tables()
+
+    def _ensure_tables(self):
+        """인덱스 테이블 생성"""
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.executescript("""
+                -- OneDrive 아이템 테이블
+                CREATE TABLE IF NOT EXISTS onedrive_items (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    user_id TEXT NOT NULL,
+                    item_id TEXT NOT NULL,
+                    parent_id TEXT,
+                    name TEXT NOT NULL,
+                    path TEXT NOT NULL,
+                    is_folder INTEGER NOT NULL DEFAULT 0,
+                    size INTEGER DEFAULT 0,
+                    e_tag TEXT,
+                    c_tag TEXT,
+                    last_modified_datetime TEXT,
+                    item_json TEXT NOT NULL,
+                    UNIQUE (user_id, item_id)
+                );
+
+                -- delta 동기화 상태 테이블
+                CREATE TABLE IF NOT EXISTS onedrive_delta_state (
+                    user_id TEXT PRIMARY KEY,
+                    delta_link TEXT,
+                    complete INTEGER NOT NULL DEFAULT 0,
+                    last_sync_at TEXT
+                );
+
+                -- 인덱스 생성
+                CREATE INDEX IF NOT EXISTS idx_onedrive_items_parent
+                    ON onedrive_items(user_id, parent_id);
+                CREATE INDEX IF NOT EXISTS idx_onedrive_items_path
+                    ON onedrive_items(user_id, path COLLATE NOCASE);
+            """)
+            self._ensure_fts(conn)
+            conn.commit()
+        except Exception as e:
+            logger.error(f"[ERROR] Failed to create OneDrive index tables: {e}")
+            raise
+        finally:
+            conn.close()
+
+    def _ensure_fts(self, conn: sqlite3.Connection):
+        """
+        이름/경로 검색용 FTS5 trigram 인덱스 생성
+
+        onedrive_items를 content 테이블로 사용하며 트리거로 동기화한다.
+        FTS5 trigram 토크나이저가 없으면 LIKE 검색으로 대체한다.
+        """
+        try:
+            conn.executescript("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS onedrive_items_fts USING fts5(
+                    name, path, content='onedrive_items', content_rowid='id', tokenize='trigram'
+                );
+
+                CREATE TRIGGER IF NOT EXISTS onedrive_items_ai AFTER INSERT ON onedrive_items BEGIN
+                    INSERT INTO onedrive_items_fts (rowid, name, path) VALUES (new.id, new.name, new.path);
+                END;
+                CREATE TRIGGER IF NOT EXISTS onedrive_items_ad AFTER DELETE ON onedrive_items BEGIN
+                    INSERT INTO onedrive_items_fts (onedrive_items_fts, rowid, name, path)
+                    VALUES ('delete', old.id, old.name, old.path);
+                END;
+                CREATE TRIGGER IF NOT EXISTS onedrive_items_au AFTER UPDATE OF name, path ON onedrive_items BEGIN
+                    INSERT INTO onedrive_items_fts (onedrive_items_fts, rowid, name, path)
+                    VALUES ('delete', old.id, old.name, old.path);
+                    INSERT INTO onedrive_items_fts (rowid, name, path) VALUES (new.id, new.name, new.path);
+                END;
+            """)
+            self._fts_enabled = True
+        except sqlite3.OperationalError as e:
+            logger.warning(f"[WARN] FTS5 trigram 미지원, LIKE 검색 사용: {e}")
+
+    # ========================================================================
+    # 동기화 상태
+    # ========================================================================
+
+    async def get_sync_state(self, user_id: str) -> Dict[str, Any]:
+        """
+        사용자의 delta 동기화 상태 조회
+
+        Args:
+            user_id: 사용자 ID (이메일)
+
+        Returns:
+            {"delta_link": str|None, "complete": bool, "last_sync_at": str|None}
+        """
+        conn = sqlite3.connect(self.db_path)
+        try:
+            row = conn.execute(
+                "SELECT delta_link, complete, last_sync_at FROM onedrive_delta_state WHERE user_id = ?",
+                (user_id,)
+            ).fetchone()
+            if not row:
+                return {"delta_link": None, "complete": False, "last_sync_at": None}
+            return {"delta_link": row[0], "complete": bool(row[1]), "last_sync_at": row[2]}
+        finally:
+            conn.close()
+
+    async def mark_stale(self, user_id: str):
+        """
+        로컬 변경(쓰기/삭제/이동) 후 다음 조회 시 delta 동기화가 일어나도록 표시
+
+        Args:
+            user_id: 사용자 ID (이메일)
+        """
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.execute(
+                "UPDATE onedrive_delta_state SET last_sync_at = NULL WHERE user_id = ?",
+                (user_id,)
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    # ========================================================================
+    # delta 반영
+    # ========================================================================
+
+    async def apply_delta(
+        self,
+        user_id: str,
+        items: List[Dict[str, Any]],
+        next_link: Optional[str] = None,
+        delta_link: Optional[str] = None,
+        reset: bool = False,
+    ) -> int:
+        """
+        delta 페이지 하나를 반영 (단일 트랜잭션)
+
+        nextLink는 크롤 재개 지점으로, deltaLink는 다음 증분 동기화 시작점으로
+        저장된다. deltaLink를 받으면 초기 크롤이 완료된 것으로 표시한다.
+
+        Args:
+            user_id: 사용자 ID (이메일)
+            items: delta 응답의 value
+            next_link: @odata.nextLink (페이지가 더 있는 경우)
+            delta_link: @odata.deltaLink (마지막 페이지)
+            reset: True면 기존 인덱스를 비우고 시작 (전체 재동기화)
+
+        Returns:
+            반영된 아이템 수
+        """
+        conn = sqlite3.connect(self.db_path)
+        try:
+            cursor = conn.cursor()
+            if reset:
+                cursor.execute("DELETE FROM onedrive_items WHERE user_id = ?", (user_id,))
+                cursor.execute("DELETE FROM onedrive_delta_state WHERE user_id = ?", (user_id,))
+
+            for item in items:
+                self._apply_item(cursor, user_id, item)
+
+            now = datetime.now(timezone.utc).isoformat()
+            cursor.execute(
+                """
+                INSERT INTO onedrive_delta_state (user_id, delta_link, complete, last_sync_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(user_id) DO UPDATE SET
+                    delta_link = excluded.delta_link,
+                    complete = MAX(onedrive_delta_state.complete, excluded.complete),
+                    last_sync_at = excluded.last_sync_at
+                """,
+                (user_id, delta_link or next_link, 1 if delta_link else 0, now)
+            )
+            conn.commit()
+            return len(items)
+
+        except Exception as e:
+            logger.error(f"[ERROR] delta 반영 오류: {str(e)}")
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def _lookup_path(self, cursor: sqlite3.Cursor, user_id: str, item_id: Optional[str]) -> Optional[str]:
+        """아이템 ID로 인덱스 경로 조회"""
+        if not item_id:
+            return None
+        row = cursor.execute(
+            "SELECT path FROM onedrive_items WHERE user_id = ? AND item_id = ?",
+            (user_id, item_id)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _apply_item(self, cursor: sqlite3.Cursor, user_id: str, item: Dict[str, Any]):
+        """delta 아이템 하나 반영 (삭제/추가/변경, 폴더 이동 시 하위 경로 갱신)"""
+        item_id = item.get("id")
+        if not item_id:
+            return
+        old_path = self._lookup_path(cursor, user_id, item_id)
+
+        if "deleted" in item or "@removed" in item:
+            if old_path is not None:
+                cursor.execute(
+                    "DELETE FROM onedrive_items WHERE user_id = ? AND (item_id = ? OR substr(path, 1, ?) = ?)",
+                    (user_id, item_id, len(old_path) + 1, old_path + "/")
+                )
+            return
+
+        parent_id = item.get("parentReference", {}).get("id")
+        if "root" in item:
+            path = ""
+        else:
+            parent_path = self._lookup_path(cursor, user_id, parent_id)
+            if parent_path is None:
+                logger.warning(f"[WARN] 부모 아이템 없음 ({item.get('name')}), 루트 기준으로 저장")
+                parent_path = ""
+            path = f"{parent_path}/{item['name']}" if parent_path else item.get("name", "")
+
+        cursor.execute(_UPSERT_ITEM_SQL, (
+            user_id, item_id, parent_id, item.get("name", ""), path,
+            1 if "folder" in item or "root" in item else 0, item.get("size", 0),
+            item.get("eTag"), item.get("cTag"), item.get("lastModifiedDateTime"),
+            json.dumps(item, ensure_ascii=False),
+        ))
+
+        # 폴더 이름 변경/이동: 하위 아이템 경로 일괄 갱신
+        if old_path is not None and old_path != path and "folder" in item:
+            cursor.execute(
+                """
+                UPDATE onedrive_items SET path = ? || substr(path, ?)
+                WHERE user_id = ? AND substr(path, 1, ?) = ?
+                """,
+                (path + "/", len(old_path) + 2, user_id, len(old_path) + 1, old_path + "/")
+            )
+
+    # ========================================================================
+    # 조회
+    # ========================================================================
+
+    @staticmethod
+    def _row_to_item(item_json: str, path: str) -> Dict[str, Any]:
+        """저장된 아이템 JSON에 parentReference.path 복원 (delta 응답에는 없음)"""
+        item = json.loads(item_json)
+        item.setdefault("parentReference", {})["path"] = _graph_parent_path(path)
+        return item
+
+    async def get_item_by_path(self, user_id: str, path: str) -> Optional[Dict[str, Any]]:
+        """
+        경로로 아이템 조회 (대소문자 무시)
+
+        Args:
+            user_id: 사용자 ID (이메일)
+            path: 루트 기준 경로 (예: Documents/report.docx)
+
+        Returns:
+            Graph DriveItem 형식 dict 또는 None
+        """
+        conn = sqlite3.connect(self.db_path)
+        try:
+            row = conn.execute(
+                "SELECT item_json, path FROM onedrive_items WHERE user_id = ? AND path = ? COLLATE NOCASE",
+                (user_id, normalize_path(path))
+            ).fetchone()
+            return self._row_to_item(*row) if row else None
+        finally:
+            conn.close()
+
+    async def list_children(
+        self,
+        user_id: str,
+        folder_path: Optional[str] = None,
+        limit: int = 50,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        폴더의 하위 아이템 조회 (폴더 우선, 이름순)
+
+        Args:
+            user_id: 사용자 ID (이메일)
+            folder_path: 폴더 경로 (없으면 루트)
+            limit: 조회할 아이템 개수
+
+        Returns:
+            Graph DriveItem 형식 dict 목록, 폴더가 인덱스에 없으면 None
+        """
+        conn = sqlite3.connect(self.db_path)
+        try:
+            folder = conn.execute(
+                """
+                SELECT item_id FROM onedrive_items
+                WHERE user_id = ? AND path = ? COLLATE NOCASE AND is_folder = 1
+                """,
+                (user_id, normalize_path(folder_path))
+            ).fetchone()
+            if not folder:
+                return None
+
+            rows = conn.execute(
+                """
+                SELECT item_json, path FROM onedrive_items
+                WHERE user_id = ? AND parent_id = ?
+                ORDER BY is_folder DESC, name COLLATE NOCASE
+                LIMIT ?
+                """,
+                (user_id, folder[0], limit)
+            ).fetchall()
+            return [self._row_to_item(*row) for row in rows]
+        finally:
+            conn.close()
+
+    async def search(self, user_id: str, query: str, limit: int = 50) -> List[Dict[str, Any]]:
+        """
+        이름/경로 검색 (이름 일치 우선)
+
+        3자 이상은 FTS5 trigram, 그 외에는 LIKE로 검색한다.
+
+        Args:
+            user_id: 사용자 ID (이메일)
+            query: 검색어
+            limit: 최대 반환 개수
+
+        Returns:
+            Graph DriveItem 형식 dict 목록
+        """
+        query = query.strip()
+        if not query:
+            return []
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            if self._fts_enabled and len(query) >= 3:
+                rows = conn.execute(
+                    """
+                    SELECT i.item_json, i.path FROM onedrive_items_fts f
+                    JOIN onedrive_items i ON i.id = f.rowid
+                    WHERE onedrive_items_fts MATCH ? AND i.user_id = ? AND i.path != ''
+                    ORDER BY (i.name LIKE ?) DESC, bm25(onedrive_items_fts, 5.0, 1.0)
+                    LIMIT ?
+                    """,
+                    ('"' + query.replace('"', '""') + '"', user_id, f"%{query}%", limit)
+                ).fetchall()
+            else:
+                rows = conn.execute(
+                    """
+                    SELECT item_json, path FROM onedrive_items
+                    WHERE user_id = ? AND path != '' AND (name LIKE ? OR path LIKE ?)
+                    ORDER BY (name LIKE ?) DESC, length(path)
+                    LIMIT ?
+                    """,
+                    (user_id, f"%{query}%", f"%{query}%", f"%{query}%", limit)
+                ).fetchall()
+            return [self._row_to_item(*row) for row in rows]
+        finally:
+            conn.close()
+
+    async def count_items(self, user_id: str) -> int:
+        """사용자의 인덱스 아이템 수"""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return conn.execute(
+                "SELECT COUNT(*) FROM onedrive_items WHERE user_id = ?", (user_id,)
+            ).fetchone()[0]
+        finally:
+            conn.close()
@@ -4,13 +4,24 @@ OneDrive Service - GraphOneDriveClient Facade
 (mcp_outlook/outlook_service.py 구조 참조)
 """
 
+import os
+from datetime import datetime, timezone
+from pathlib import Path
 from typing import Dict, Any, Optional, List
 
 from .graph_onedrive_client import GraphOneDriveClient
+from .onedrive_item_index import OneDriveItemIndex
 from .onedrive_types import (
     ConflictBehavior,
+    DriveItem,
 )
 
+# 로컬 인덱스 응답 전 증분 delta 동기화를 수행하는 기준 경과 시간 (초)
+INDEX_MAX_AGE_SECONDS = 300
+
+# download_file / upload_file 이 접근할 수 있는 로컬 디렉터리 (ONEDRIVE_LOCAL_DIR 로 변경)
+DEFAULT_LOCAL_DIR = Path.home() / "onedrive_files"
+
 # Default user email helper
 def _get_default_user_email() -> Optional[str]:
     """
@@ -46,11 +57,18 @@ class OneDriveService:
 
     - 동일 시그니처로 위임
     - 일부 값만 조정/하드코딩
+    - 목록/검색/경로 조회는 delta로 동기화된 로컬 인덱스가 있으면 인덱스에서 응답
     """
 
-    def __init__(self):
+    def __init__(self, local_dir: Optional[str] = None):
+        """
+        Args:
+            local_dir: 로컬 파일 기준 디렉터리 (기본: ONEDRIVE_LOCAL_DIR 또는 ~/onedrive_files)
+        """
         self._client: Optional[GraphOneDriveClient] = None
+        self._index: Optional[OneDriveItemIndex] = None
         self._initialized = False
+        self._local_dir = Path(local_dir or os.environ.get("ONEDRIVE_LOCAL_DIR") or DEFAULT_LOCAL_DIR).resolve()
 
     async def initialize(self) -> bool:
         """서비스 초기화"""
@@ -58,6 +76,7 @@ class OneDriveService:
             return True
 
         self._client = GraphOneDriveClient()
+        self._index = OneDriveItemIndex()
 
         if await self._client.initialize():
             self._initialized = True
@@ -76,6 +95,58 @@ class OneDriveService:
             self._client = None
         self._initialized = False
 
+    async def _index_ready(self, user_email: str) -> bool:
+        """
+        로컬 인덱스로 응답 가능한지 확인
+
+        초기 크롤이 끝난 인덱스만 사용하며, 마지막 동기화 후 INDEX_MAX_AGE_SECONDS가
+        지났거나 로컬 변경이 있었으면 먼저 증분 delta 동기화를 수행한다.
+        """
+        if not self._index:
+            return False
+        state = await self._index.get_sync_state(user_email)
+        if not state["complete"]:
+            return False
+
+        last_sync = state["last_sync_at"]
+        age = (
+            (datetime.now(timezone.utc) - datetime.fromisoformat(last_sync)).total_seconds()
+            if last_sync else None
+        )
+        if age is None or age > INDEX_MAX_AGE_SECONDS:
+            result = await self._client.sync_delta(user_email, self._index)
+            if not result.get("success"):
+                # 동기화 실패 시 Graph API로 직접 조회
+                return False
+        return True
+
+    async def _mark_index_stale(self, user_email: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """변경 작업 성공 시 다음 조회에서 delta 동기화가 일어나도록 표시"""
+        if self._index and result.get("success"):
+            await self._index.mark_stale(user_email)
+        return result
+
+    def _resolve_local_path(self, local_path: str) -> Optional[str]:
+        """
+        로컬 경로를 기준 디렉터리 아래의 절대 경로로 변환
+
+        상대 경로는 기준 디렉터리 기준으로 해석하고, 심볼릭 링크/.. 를 풀어낸 결과가
+        기준 디렉터리 밖이면 None.
+        """
+        resolved = (self._local_dir / os.path.expanduser(local_path)).resolve()
+        if resolved == self._local_dir or self._local_dir not in resolved.parents:
+            return None
+        return str(resolved)
+
+    def _local_path_error(self, local_path: str) -> Dict[str, Any]:
+        return {"success": False, "error": f"로컬 경로는 {self._local_dir} 아래여야 합니다: {local_path}"}
+
+    @staticmethod
+    def _index_items(items: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """인덱스 아이템을 list_files 응답 형식으로 변환"""
+        files = [DriveItem.from_dict(item).__dict__ for item in items]
+        return {"success": True, "files": files, "count": len(files), "source": "index"}
+
     # ========================================================================
     # 드라이브 정보 메서드
     # ========================================================================
@@ -127,6 +198,18 @@ class OneDriveService:
             user_email = _get_default_user_email()
         if not user_email:
             return {"success": False, "error": "user_email이 필요합니다. 등록된 사용자가 없습니다."}
+
+        if await self._index_ready(user_email):
+            if search:
+                # 인덱스는 이름/경로만 검색 → 일치가 없으면 내용/메타데이터까지 보는 Graph search 로
+                items = await self._index.search(user_email, search, limit)
+                if items:
+                    return self._index_items(items)
+                return await self._client.list_files(user_email, folder_path, search, limit)
+            items = await self._index.list_children(user_email, folder_path, limit)
+            if items is not None:
+                return self._index_items(items)
+
         return await self._client.list_files(user_email, folder_path, search, limit)
 
     @mcp_service(
@@ -149,8 +232,35 @@ class OneDriveService:
             user_email = _get_default_user_email()
         if not user_email:
             return {"success": False, "error": "user_email이 필요합니다. 등록된 사용자가 없습니다."}
+
+        if await self._index_ready(user_email):
+            item = await self._index.get_item_by_path(user_email, file_path)
+            if item:
+                return {"success": True, "item": DriveItem.from_dict(item).__dict__, "source": "index"}
+
         return await self._client.get_item(user_email, file_path)
 
+    @mcp_service(
+        tool_name="handler_onedrive_sync_drive_index",
+        server_name="onedrive",
+        service_name="sync_drive_index",
+        category="onedrive_drive",
+        tags=["sync", "drive", "index"],
+        priority=5,
+        description="OneDrive 로컬 아이템 인덱스 delta 동기화",
+    )
+    async def sync_drive_index(
+        self,
+        user_email: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """로컬 아이템 인덱스 동기화 (최초 전체 크롤, 이후 변경분만)"""
+        self._ensure_initialized()
+        if not user_email:
+            user_email = _get_default_user_email()
+        if not user_email:
+            return {"success": False, "error": "user_email이 필요합니다. 등록된 사용자가 없습니다."}
+        return await self._client.sync_delta(user_email, self._index)
+
     # ========================================================================
     # 파일 읽기/쓰기 메서드
     # ========================================================================
@@ -169,14 +279,42 @@ class OneDriveService:
         file_path: str,
         user_email: Optional[str] = None,
         as_text: bool = True,
+        offset: int = 0,
+        length: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """파일 내용 읽기 (offset/length로 구간 읽기, next_offset으로 이어 읽기)"""
+        self._ensure_initialized()
+        if not user_email:
+            user_email = _get_default_user_email()
+        if not user_email:
+            return {"success": False, "error": "user_email이 필요합니다. 등록된 사용자가 없습니다."}
+        return await self._client.read_file(user_email, file_path, as_text, offset, length)
+
+    @mcp_service(
+        tool_name="handler_onedrive_download_file",
+        server_name="onedrive",
+        service_name="download_file",
+        category="onedrive_file",
+        tags=["read", "file", "download"],
+        priority=5,
+        description="OneDrive 파일을 로컬 경로로 다운로드",
+    )
+    async def download_file(
+        self,
+        file_path: str,
+        local_path: str,
+        user_email: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """파일 내용 읽기"""
+        """파일을 로컬 경로(ONEDRIVE_LOCAL_DIR 아래)로 스트리밍 다운로드"""
         self._ensure_initialized()
         if not user_email:
             user_email = _get_default_user_email()
         if not user_email:
             return {"success": False, "error": "user_email이 필요합니다. 등록된 사용자가 없습니다."}
-        return await self._client.read_file(user_email, file_path, as_text)
+        resolved = self._resolve_local_path(local_path)
+        if resolved is None:
+            return self._local_path_error(local_path)
+        return await self._client.download_file(user_email, file_path, resolved)
 
     @mcp_service(
         tool_name="handler_onedrive_write_file",
@@ -204,13 +342,51 @@ class OneDriveService:
 
         conflict_behavior = ConflictBehavior.REPLACE if overwrite else ConflictBehavior.FAIL
 
-        return await self._client.write_file(
+        result = await self._client.write_file(
             user_email=user_email,
             file_path=file_path,
             content=content,
             content_type=content_type,
             conflict_behavior=conflict_behavior,
         )
+        return await self._mark_index_stale(user_email, result)
+
+    @mcp_service(
+        tool_name="handler_onedrive_upload_file",
+        server_name="onedrive",
+        service_name="upload_file",
+        category="onedrive_file",
+        tags=["write", "file", "upload"],
+        priority=5,
+        description="로컬 파일을 OneDrive에 업로드 (대용량은 업로드 세션 사용)",
+    )
+    async def upload_file(
+        self,
+        file_path: str,
+        local_path: str,
+        user_email: Optional[str] = None,
+        overwrite: bool = True,
+    ) -> Dict[str, Any]:
+        """로컬 파일(ONEDRIVE_LOCAL_DIR 아래) 업로드 (조각 단위 스트리밍, quickXorHash 검증)"""
+        self._ensure_initialized()
+        if not user_email:
+            user_email = _get_default_user_email()
+        if not user_email:
+            return {"success": False, "error": "user_email이 필요합니다. 등록된 사용자가 없습니다."}
+
+        resolved = self._resolve_local_path(local_path)
+        if resolved is None:
+            return self._local_path_error(local_path)
+
+        conflict_behavior = ConflictBehavior.REPLACE if overwrite else ConflictBehavior.FAIL
+
+        result = await self._client.upload_file(
+            user_email=user_email,
+            file_path=file_path,
+            local_path=resolved,
+            conflict_behavior=conflict_behavior,
+        )
+        return await self._mark_index_stale(user_email, result)
 
     @mcp_service(
         tool_name="handler_onedrive_delete_file",
@@ -232,7 +408,7 @@ class OneDriveService:
             user_email = _get_default_user_email()
         if not user_email:
             return {"success": False, "error": "user_email이 필요합니다. 등록된 사용자가 없습니다."}
-        return await self._client.delete_file(user_email, file_path)
+        return await self._mark_index_stale(user_email, await self._client.delete_file(user_email, file_path))
 
     # ========================================================================
     # 폴더 관리 메서드
@@ -259,7 +435,7 @@ class OneDriveService:
             user_email = _get_default_user_email()
         if not user_email:
             return {"success": False, "error": "user_email이 필요합니다. 등록된 사용자가 없습니다."}
-        return await self._client.create_folder(user_email, folder_name, parent_path)
+        return await self._mark_index_stale(user_email, await self._client.create_folder(user_email, folder_name, parent_path))
 
     # ========================================================================
     # 파일 복사/이동 메서드
@@ -287,7 +463,7 @@ class OneDriveService:
             user_email = _get_default_user_email()
         if not user_email:
             return {"success": False, "error": "user_email이 필요합니다. 등록된 사용자가 없습니다."}
-        return await self._client.copy_file(user_email, source_path, dest_path, new_name)
+        return await self._mark_index_stale(user_email, await self._client.copy_file(user_email, source_path, dest_path, new_name))
 
     @mcp_service(
         tool_name="handler_onedrive_move_file",
@@ -311,4 +487,4 @@ class OneDriveService:
             user_email = _get_default_user_email()
         if not user_email:
             return {"success": False, "error": "user_email이 필요합니다. 등록된 사용자가 없습니다."}
-        return await self._client.move_file(user_email, source_path, dest_path, new_name)
+        return await self._mark_index_stale(user_email, await self._client.move_file(user_email, source_path, dest_path, new_name))
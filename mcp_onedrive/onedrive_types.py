@@ -183,6 +183,8 @@ class ReadFileRequest:
     """파일 읽기 요청"""
     file_path: str
     as_text: bool = True  # True면 텍스트로, False면 바이너리(base64)로 반환
+    offset: int = 0  # 읽기 시작 바이트 위치
+    length: Optional[int] = None  # 읽을 최대 바이트 수 (없으면 끝까지)
 
 
 @dataclass
@@ -5,6 +5,7 @@ OneDrive Service Tests
 
 import pytest
 import asyncio
+import base64
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import sys
@@ -12,6 +13,13 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from mcp_onedrive.onedrive_service import OneDriveService
+from mcp_onedrive.onedrive_item_index import OneDriveItemIndex
+from mcp_onedrive.graph_onedrive_client import (
+    GraphOneDriveClient,
+    QuickXorHash,
+    READ_MAX_BYTES,
+    _decode_utf8_window,
+)
 from mcp_onedrive.onedrive_types import (
     ItemType,
     ConflictBehavior,
@@ -305,6 +313,33 @@ class TestOneDriveService:
 
         assert result["success"] is True
 
+    @pytest.mark.asyncio
+    async def test_local_paths_limited_to_local_dir(self, tmp_path, mock_client):
+        """download/upload 는 기준 디렉터리 밖의 로컬 경로를 거부"""
+        base = tmp_path / "files"
+        base.mkdir()
+        (tmp_path / "secret.txt").write_text("secret")
+        (base / "link").symlink_to(tmp_path)
+
+        service = OneDriveService(local_dir=str(base))
+        mock_client.download_file = AsyncMock(return_value={"success": True})
+        mock_client.upload_file = AsyncMock(return_value={"success": True})
+        service._client = mock_client
+        service._initialized = True
+
+        for local_path in (str(tmp_path / "secret.txt"), "../secret.txt", "link/secret.txt", str(base), "/etc/passwd"):
+            assert (await service.download_file("a.txt", local_path, "test@example.com"))["success"] is False
+            assert (await service.upload_file("a.txt", local_path, "test@example.com"))["success"] is False
+        mock_client.download_file.assert_not_called()
+        mock_client.upload_file.assert_not_called()
+
+        result = await service.download_file("a.txt", "sub/a.txt", "test@example.com")
+        assert result["success"] is True
+        mock_client.download_file.assert_awaited_once_with("test@example.com", "a.txt", str(base / "sub" / "a.txt"))
+
+        await service.upload_file("a.txt", str(base / "a.txt"), "test@example.com")
+        assert mock_client.upload_file.await_args.kwargs["local_path"] == str(base / "a.txt")
+
     @pytest.mark.asyncio
     async def test_not_initialized_error(self, service):
         """초기화되지 않은 상태에서 호출 시 에러 테스트"""
@@ -312,5 +347,270 @@ class TestOneDriveService:
             await service.list_files("test@example.com")
 
 
+class TestOneDriveItemIndex:
+    """delta 기반 로컬 아이템 인덱스 테스트"""
+
+    USER = "test@example.com"
+
+    @pytest.fixture
+    def index(self, tmp_path):
+        """임시 DB 인덱스"""
+        return OneDriveItemIndex(str(tmp_path / "index.db"))
+
+    async def _sync(self, index):
+        """초기 크롤 완료 상태로 만들기"""
+        await index.apply_delta(self.USER, [
+            {"id": "root", "name": "root", "root": {}, "folder": {}},
+            {"id": "d1", "name": "Documents", "folder": {}, "parentReference": {"id": "root"}},
+            {"id": "d2", "name": "Sub", "folder": {}, "parentReference": {"id": "d1"}},
+            {"id": "f1", "name": "Report.docx", "file": {}, "parentReference": {"id": "d1"}},
+            {"id": "f2", "name": "notes.txt", "file": {}, "parentReference": {"id": "d2"}},
+        ], delta_link="https://graph/delta?token=1", reset=True)
+        return index
+
+    @pytest.mark.asyncio
+    async def test_paths_and_children(self, index):
+        """부모 체인으로 경로 계산 및 하위 목록 조회"""
+        synced_index = await self._sync(index)
+        children = await synced_index.list_children(self.USER, "/documents/")
+        assert [c["name"] for c in children] == ["Sub", "Report.docx"]
+
+        item = await synced_index.get_item_by_path(self.USER, "Documents/Sub/notes.txt")
+        assert item["parentReference"]["path"] == "/drive/root:/Documents/Sub"
+
+        assert await synced_index.list_children(self.USER, "Missing") is None
+
+    @pytest.mark.asyncio
+    async def test_folder_rename_and_delete(self, index):
+        """폴더 이름 변경 시 하위 경로 갱신, 삭제 시 하위 아이템 제거"""
+        synced_index = await self._sync(index)
+        await synced_index.apply_delta(self.USER, [
+            {"id": "d1", "name": "Docs", "folder": {}, "parentReference": {"id": "root"}},
+        ], delta_link="https://graph/delta?token=2")
+        assert await synced_index.get_item_by_path(self.USER, "Docs/Sub/notes.txt")
+        assert await synced_index.get_item_by_path(self.USER, "Documents/Sub/notes.txt") is None
+
+        await synced_index.apply_delta(self.USER, [{"id": "d2", "deleted": {}}],
+                                       delta_link="https://graph/delta?token=3")
+        assert await synced_index.search(self.USER, "notes") == []
+        assert await synced_index.count_items(self.USER) == 3
+
+    @pytest.mark.asyncio
+    async def test_sync_state(self, index):
+        """nextLink는 재개 지점, deltaLink 수신 시 완료 처리"""
+        await index.apply_delta(self.USER, [], next_link="https://graph/next", reset=True)
+        state = await index.get_sync_state(self.USER)
+        assert state["delta_link"] == "https://graph/next"
+        assert state["complete"] is False
+
+        await index.apply_delta(self.USER, [], delta_link="https://graph/delta")
+        await index.mark_stale(self.USER)
+        state = await index.get_sync_state(self.USER)
+        assert state["complete"] is True
+        assert state["last_sync_at"] is None
+
+    @pytest.mark.asyncio
+    async def test_service_answers_from_index(self, index):
+        """동기화된 인덱스가 있으면 Graph API 호출 없이 응답"""
+        synced_index = await self._sync(index)
+        service = OneDriveService()
+        mock_client = AsyncMock()
+        mock_client.sync_delta = AsyncMock(return_value={"success": True})
+        service._client = mock_client
+        service._index = synced_index
+        service._initialized = True
+
+        result = await service.list_files(self.USER, search="report")
+        assert result["source"] == "index"
+        assert [f["name"] for f in result["files"]] == ["Report.docx"]
+
+        result = await service.get_item("Documents/Report.docx", user_email=self.USER)
+        assert result["item"]["parent_path"] == "/drive/root:/Documents"
+        mock_client.list_files.assert_not_called()
+        mock_client.get_item.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_service_search_index_miss_falls_back(self, index):
+        """인덱스 이름 검색에 일치가 없으면 Graph search(내용/메타데이터) 결과 반환"""
+        synced_index = await self._sync(index)
+        service = OneDriveService()
+        mock_client = AsyncMock()
+        mock_client.sync_delta = AsyncMock(return_value={"success": True})
+        mock_client.list_files = AsyncMock(return_value={
+            "success": True, "files": [{"name": "budget.xlsx"}], "count": 1,
+        })
+        service._client = mock_client
+        service._index = synced_index
+        service._initialized = True
+
+        result = await service.list_files(self.USER, search="quarterly revenue")
+        assert result["files"] == [{"name": "budget.xlsx"}]
+        mock_client.list_files.assert_called_once_with(self.USER, None, "quarterly revenue", 50)
+
+
+class TestLargeFileTransfer:
+    """구간 읽기 / 업로드 세션 테스트"""
+
+    @staticmethod
+    def _reference_quick_xor(data: bytes) -> str:
+        """바이트 단위 quickXorHash 참조 구현"""
+        cells = [0, 0, 0]
+        shift = 0
+        for value in data:
+            index, offset = divmod(shift, 64)
+            bits = 32 if index == 2 else 64
+            cells[index] ^= (value << offset) & ((1 << 64) - 1)
+            if offset > bits - 8:
+                cells[0 if index == 2 else index + 1] ^= value >> (bits - offset)
+            shift = (shift + 11) % 160
+        digest = bytearray(
+            cells[0].to_bytes(8, "little") + cells[1].to_bytes(8, "little")
+            + (cells[2] & 0xFFFFFFFF).to_bytes(4, "little")
+        )
+        for i, value in enumerate(len(data).to_bytes(8, "little")):
+            digest[12 + i] ^= value
+        return base64.b64encode(bytes(digest)).decode("ascii")
+
+    def test_quick_xor_hash(self):
+        """블록 단위 계산이 참조 구현과 일치 (임의 분할 update 포함)"""
+        data = bytes((i * 37 + 11) % 256 for i in range(1000))
+        hasher = QuickXorHash()
+        for start in range(0, len(data), 97):
+            hasher.update(data[start:start + 97])
+        assert hasher.b64digest() == self._reference_quick_xor(data)
+        assert QuickXorHash().b64digest() == "AAAAAAAAAAAAAAAAAAAAAAAAAAA="
+
+    def test_decode_utf8_window(self):
+        """구간 경계에 걸친 UTF-8 문자는 다음 구간으로 넘김"""
+        data = "가나다".encode("utf-8")
+        assert _decode_utf8_window(data[:4], False, True) == ("가", 3)
+        assert _decode_utf8_window(data[1:7], True, True) == ("나", 5)
+        assert _decode_utf8_window(b"\xff\xfe", False, False) is None
+
+    @staticmethod
+    def _read_client(data: bytes, content_length: bool = True):
+        """Range 요청을 처리하는 가짜 Graph 응답을 쓰는 클라이언트"""
+
+        class FakeContent:
+            def __init__(self, body):
+                self.body = body
+
+            async def iter_chunked(self, size):
+                for start in range(0, len(self.body), size):
+                    yield self.body[start:start + size]
+
+        class FakeResponse:
+            def __init__(self, headers):
+                range_header = headers.get("Range")
+                if range_header:
+                    start, end = (int(v) for v in range_header[len("bytes="):].split("-"))
+                    body = data[start:end + 1]
+                    self.status = 206
+                    self.headers = {"Content-Range": f"bytes {start}-{start + len(body) - 1}/{len(data)}"}
+                else:
+                    body = data
+                    self.status = 200
+                    self.headers = {"Content-Length": str(len(data))} if content_length else {}
+                self.content = FakeContent(body)
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+        client = GraphOneDriveClient(auth_manager=MagicMock())
+        client._initialized = True
+        client._get_access_token = AsyncMock(return_value="token")
+        client._session = MagicMock()
+        client._session.get = MagicMock(side_effect=lambda url, headers, timeout: FakeResponse(headers))
+        return client
+
+    @pytest.mark.asyncio
+    async def test_read_file_size_limit(self):
+        """구간 없는 읽기는 READ_MAX_BYTES 까지, 구간 읽기는 READ_MAX_BYTES 씩"""
+        data = b"x" * (READ_MAX_BYTES + 10)
+
+        for content_length in (True, False):
+            client = self._read_client(data, content_length)
+            result = await client.read_file("test@example.com", "big.bin", as_text=False)
+            assert result["success"] is False
+            assert result["max_bytes"] == READ_MAX_BYTES
+
+        client = self._read_client(data)
+        result = await client.read_file("test@example.com", "big.bin", as_text=False, length=len(data))
+        assert len(base64.b64decode(result["content"])) == READ_MAX_BYTES
+        assert result["next_offset"] == READ_MAX_BYTES
+        result = await client.read_file("test@example.com", "big.bin", as_text=False, offset=result["next_offset"])
+        assert len(base64.b64decode(result["content"])) == 10
+        assert result["has_more"] is False
+
+        small = self._read_client(b"hello")
+        assert (await small.read_file("test@example.com", "a.txt"))["content"] == "hello"
+
+    @pytest.mark.asyncio
+    async def test_read_file_rejects_empty_range(self):
+        """length=0 / 음수 offset 은 요청 없이 실패"""
+        client = self._read_client(b"hello")
+
+        assert (await client.read_file("test@example.com", "a.txt", length=0))["success"] is False
+        assert (await client.read_file("test@example.com", "a.txt", offset=-1))["success"] is False
+        client._session.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_upload_session_chunks_and_checksum(self):
+        """조각을 순서대로 전송하고 quickXorHash로 검증"""
+        data = bytes(range(256)) * 3000  # 768,000 bytes -> 320KiB 조각 3개
+        hasher = QuickXorHash()
+        hasher.update(data)
+
+        client = GraphOneDriveClient(auth_manager=MagicMock())
+        client._make_request = AsyncMock(return_value={
+            "success": True, "data": {"uploadUrl": "https://upload/session"},
+        })
+        ranges = []
+
+        async def put_chunk(url, chunk, offset, total_size):
+            ranges.append((offset, len(chunk), total_size))
+            if offset + len(chunk) < total_size:
+                return None
+            return {"id": "f1", "name": "big.bin", "file": {"hashes": {"quickXorHash": hasher.b64digest()}}}
+
+        client._put_upload_chunk = put_chunk
+
+        async def read_chunk(start, size):
+            return data[start:start + size]
+
+        result = await client._upload_with_session(
+            "test@example.com", "big.bin", len(data), read_chunk,
+            ConflictBehavior.REPLACE, chunk_size=320 * 1024,
+        )
+
+        assert result["success"] is True
+        assert result["upload"]["checksum_verified"] is True
+        assert ranges == [(0, 327680, 768000), (327680, 327680, 768000), (655360, 112640, 768000)]
+
+    @pytest.mark.asyncio
+    async def test_upload_session_checksum_mismatch(self):
+        """서버 해시와 다르면 실패 반환"""
+        client = GraphOneDriveClient(auth_manager=MagicMock())
+        client._make_request = AsyncMock(return_value={
+            "success": True, "data": {"uploadUrl": "https://upload/session"},
+        })
+        client._put_upload_chunk = AsyncMock(return_value={
+            "id": "f1", "name": "a.bin", "file": {"hashes": {"quickXorHash": "bogus"}},
+        })
+
+        async def read_chunk(start, size):
+            return b"x" * size
+
+        result = await client._upload_with_session(
+            "test@example.com", "a.bin", 10, read_chunk, ConflictBehavior.REPLACE,
+        )
+
+        assert result["success"] is False
+        assert "체크섬" in result["error"]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
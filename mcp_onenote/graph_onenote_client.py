@@ -12,6 +12,7 @@ import aiohttp
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.metrics import graph_trace_configs, track_auth
 
 from session import AuthManager
 from session.auth_database import AuthDatabase
@@ -66,7 +67,7 @@ class GraphOneNoteClient:
         if self._initialized:
             return True
 
-        self._session = aiohttp.ClientSession()
+        self._session = aiohttp.ClientSession(trace_configs=graph_trace_configs())
         self._initialized = True
         logger.info("GraphOneNoteClient initialized")
         return True
@@ -123,7 +124,8 @@ class GraphOneNoteClient:
                     return None
                 logger.info(f"기본 사용자 사용: {user_email}")
 
-            token = await self.auth_manager.validate_and_refresh_token(user_email)
+            with track_auth():
+                token = await self.auth_manager.validate_and_refresh_token(user_email)
             return token
         except Exception as e:
             logger.error(f"토큰 조회 실패: {str(e)}")
@@ -5,11 +5,12 @@ HTML 파싱, Claude Code SDK 호출, 요약/키워드 추출, 관련 페이지 
 
 import os
 import re
+import json
 import hashlib
 import asyncio
 import logging
 from html.parser import HTMLParser
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 
 import yaml
@@ -159,6 +160,13 @@ def _default_config() -> Dict[str, Any]:
                 "prompt": "다음 내용에서 키워드를 {keyword_count}개 추출해 주세요. 쉼표로 구분.\n\n{page_title}\n\n{page_content}\n\n키워드:",
             },
         },
+        "search": {
+            "relevance_batch": {
+                "max_chars": 24000,
+                "per_page_chars": 3000,
+                "max_pages": 8,
+            },
+        },
         "claude_sdk": {
             "model": "claude-sonnet-4-5-20250929",
             "max_turns": 1,
@@ -219,7 +227,10 @@ async def _run_summarize(
     config: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
     """
-    전체 요약 파이프라인: 페이지 요약 + 키워드 추출 (SDK 호출 2회, 병렬)
+    전체 요약 파이프라인: 페이지 요약 + 키워드 추출
+
+    page_summary_with_keywords 프롬프트가 설정되어 있으면 SDK 1회 호출로
+    요약과 키워드를 함께 받고, 없으면 기존처럼 2회 병렬 호출한다.
 
     Returns:
         {"summary": str, "keywords": [str, ...], "content_hash": str}
@@ -233,27 +244,38 @@ async def _run_summarize(
     plain_text = html_to_plain_text(html_content)
     content_hash = compute_content_hash(html_content)
 
-    # 2. 전체 페이지 요약 + 키워드 추출 (병렬 SDK 호출)
     page_summary_config = summarization_config.get("page_summary", {})
-    page_prompt = page_summary_config.get("prompt", "").format(
-        page_title=page_title,
-        page_content=plain_text[:8000],
-    )
-
+    max_length = page_summary_config.get("max_length", 500)
     keyword_config = summarization_config.get("keyword_extraction", {})
     keyword_count = keyword_config.get("count", 10)
-    keyword_prompt = keyword_config.get("prompt", "").format(
-        page_title=page_title,
-        page_content=plain_text[:8000],
-        keyword_count=keyword_count,
-    )
 
-    summary_raw, keywords_raw = await asyncio.gather(
-        _call_claude_sdk(page_prompt, config),
-        _call_claude_sdk(keyword_prompt, config),
-    )
+    combined_config = summarization_config.get("page_summary_with_keywords", {})
+    if combined_config.get("prompt"):
+        # 2-a. 요약 + 키워드 단일 SDK 호출
+        prompt = combined_config["prompt"].format(
+            page_title=page_title,
+            page_content=plain_text[:8000],
+            keyword_count=keyword_count,
+            max_length=max_length,
+        )
+        response = await _call_claude_sdk(prompt, config)
+        summary_raw, keywords_raw = _parse_summary_response(response)
+    else:
+        # 2-b. 전체 페이지 요약 + 키워드 추출 (병렬 SDK 호출)
+        page_prompt = page_summary_config.get("prompt", "").format(
+            page_title=page_title,
+            page_content=plain_text[:8000],
+        )
+        keyword_prompt = keyword_config.get("prompt", "").format(
+            page_title=page_title,
+            page_content=plain_text[:8000],
+            keyword_count=keyword_count,
+        )
+        summary_raw, keywords_raw = await asyncio.gather(
+            _call_claude_sdk(page_prompt, config),
+            _call_claude_sdk(keyword_prompt, config),
+        )
 
-    max_length = page_summary_config.get("max_length", 500)
     summary = summary_raw[:max_length]
     keywords = [kw.strip() for kw in keywords_raw.split(",") if kw.strip()][:keyword_count]
 
@@ -264,6 +286,126 @@ async def _run_summarize(
     }
 
 
+def _parse_summary_response(response: str) -> Tuple[str, str]:
+    """
+    "요약: ... / 키워드: ..." 형식 응답 파싱 (요약은 여러 줄 가능)
+
+    Returns:
+        (summary, keywords_csv)
+    """
+    summary_lines: List[str] = []
+    keywords = ""
+    in_summary = False
+    for line in response.strip().split("\n"):
+        stripped = line.strip()
+        if stripped.startswith("키워드:"):
+            keywords = stripped[len("키워드:"):].strip()
+            in_summary = False
+        elif stripped.startswith("요약:"):
+            in_summary = True
+            rest = stripped[len("요약:"):].strip()
+            if rest:
+                summary_lines.append(rest)
+        elif in_summary and stripped:
+            summary_lines.append(stripped)
+    return " ".join(summary_lines).strip(), keywords
+
+
+# ============================================================================
+# 배치 관련성 판단
+# ============================================================================
+
+def normalize_query(query: str) -> str:
+    """관련성 캐시 키용 질의 정규화 (공백 정리 + 소문자)"""
+    return " ".join(query.split()).lower()
+
+
+def pack_relevance_batches(
+    items: List[Dict[str, Any]],
+    max_chars: int = 24000,
+    per_page_chars: int = 3000,
+    max_pages: int = 8,
+) -> List[List[Dict[str, Any]]]:
+    """
+    페이지 본문을 글자 수 예산 안에서 배치로 묶음 (입력 순서 유지)
+
+    Args:
+        items: [{"page_id", "page_title", "plain_text", ...}, ...]
+        max_chars: 배치당 본문 총 글자 수
+        per_page_chars: 페이지당 본문 최대 글자 수 (초과분은 잘라냄)
+        max_pages: 배치당 최대 페이지 수
+
+    Returns:
+        배치 목록 (각 항목의 plain_text는 per_page_chars로 잘린 상태)
+    """
+    batches: List[List[Dict[str, Any]]] = []
+    current: List[Dict[str, Any]] = []
+    current_chars = 0
+
+    for item in items:
+        text = item.get("plain_text", "")[:per_page_chars]
+        if current and (current_chars + len(text) > max_chars or len(current) >= max_pages):
+            batches.append(current)
+            current, current_chars = [], 0
+        current.append({**item, "plain_text": text})
+        current_chars += len(text)
+
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _build_relevance_prompt(query: str, batch: List[Dict[str, Any]]) -> str:
+    """배치 관련성 판단 프롬프트 (페이지별 번호 부여, JSON 응답 요구)"""
+    sections = [
+        f"[페이지 {idx}]\n제목: {item.get('page_title', '')}\n내용:\n{item.get('plain_text', '')}"
+        for idx, item in enumerate(batch, start=1)
+    ]
+    return (
+        f"다음 {len(batch)}개 페이지 각각이 질의와 관련이 있는지 판단하고, "
+        f"관련이 있으면 핵심 내용을 3줄 이내로 요약해 주세요.\n\n"
+        f"[질의]\n{query}\n\n"
+        + "\n\n".join(sections)
+        + "\n\n반드시 아래 JSON 배열 형식으로만 응답하세요 (모든 페이지 번호 포함):\n"
+        '[{"page": 1, "relevant": true, "summary": "요약"}, {"page": 2, "relevant": false, "summary": ""}]\n'
+    )
+
+
+def _parse_relevance_response(response: str, batch_size: int) -> Dict[int, Dict[str, Any]]:
+    """
+    배치 관련성 응답 파싱
+
+    Returns:
+        {페이지 번호(1부터): {"is_relevant": bool, "summary": str}} - 파싱 실패한 번호는 누락
+    """
+    match = re.search(r"\[.*\]", response, flags=re.DOTALL)
+    if not match:
+        return {}
+    try:
+        entries = json.loads(match.group(0))
+    except json.JSONDecodeError:
+        return {}
+
+    verdicts: Dict[int, Dict[str, Any]] = {}
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        try:
+            page_no = int(entry.get("page"))
+        except (TypeError, ValueError):
+            continue
+        if not 1 <= page_no <= batch_size:
+            continue
+        relevant = entry.get("relevant")
+        if isinstance(relevant, str):
+            relevant = relevant.strip().lower() in ("true", "yes", "예")
+        verdicts[page_no] = {
+            "is_relevant": bool(relevant),
+            "summary": str(entry.get("summary") or "").strip(),
+        }
+    return verdicts
+
+
 # ============================================================================
 # OneNoteAgent 클래스
 # ============================================================================
@@ -337,9 +479,17 @@ class OneNoteAgent:
                     "summarized_at": existing.get("summarized_at"),
                 }
 
-        # 3. AI 요약 실행
-        config = load_config()
-        summary_result = await _run_summarize(html_content, page_title, config)
+        # 3. 같은 사용자의 같은 콘텐츠 요약이 있으면 재사용, 없으면 AI 요약 실행
+        reused = None if force_refresh else self._db_service.get_summary_by_hash(user_email, content_hash)
+        if reused:
+            summary_result = {
+                "summary": reused["summary"],
+                "keywords": reused.get("keywords", []),
+                "content_hash": content_hash,
+            }
+        else:
+            config = load_config()
+            summary_result = await _run_summarize(html_content, page_title, config)
 
         # 4. DB 저장
         self._db_service.save_summary(
@@ -354,7 +504,7 @@ class OneNoteAgent:
 
         return {
             "success": True,
-            "cached": False,
+            "cached": reused is not None,
             "page_id": page_id,
             "page_title": page_title,
             "summary": summary_result["summary"],
@@ -385,21 +535,79 @@ class OneNoteAgent:
             "count": len(summaries),
         }
 
+    async def _sync_page_contents(
+        self,
+        user_email: str,
+        pages: List[Dict[str, Any]],
+        concurrency: int = 5,
+    ) -> Dict[str, int]:
+        """
+        페이지 콘텐츠 캐시 동기화
+
+        lastModifiedDateTime이 캐시와 같은 페이지는 다운로드하지 않고,
+        새 페이지/변경된 페이지만 HTML을 받아 평문으로 변환해 저장한다.
+
+        Returns:
+            {"downloaded": int, "cached": int, "failed": int}
+        """
+        states = self._db_service.get_page_content_states(user_email, [p.get("id") for p in pages])
+        stale = [
+            p for p in pages
+            if p.get("id") not in states
+            or not p.get("last_modified_datetime")
+            or states[p["id"]].get("last_modified_datetime") != p.get("last_modified_datetime")
+        ]
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _fetch(page: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                content_result = await self._client.get_page_content(page.get("id"), user_email)
+            if not content_result.get("success"):
+                return None
+            html_content = content_result.get("content", "")
+            return {
+                "page_id": page.get("id"),
+                "page_title": page.get("title", ""),
+                "section_id": page.get("parent_section_id"),
+                "web_url": page.get("web_url"),
+                "last_modified_datetime": page.get("last_modified_datetime"),
+                "content_hash": compute_content_hash(html_content),
+                "plain_text": html_to_plain_text(html_content),
+            }
+
+        fetched = await asyncio.gather(*(_fetch(p) for p in stale), return_exceptions=True)
+        contents = [c for c in fetched if isinstance(c, dict)]
+        self._db_service.save_page_contents(user_email, contents)
+
+        return {
+            "downloaded": len(contents),
+            "cached": len(pages) - len(stale),
+            "failed": len(stale) - len(contents),
+        }
+
     async def search_pages(
         self,
         user_email: str,
         query: str,
         section_id: Optional[str] = None,
         concurrency: int = 5,
+        top_k: int = 20,
     ) -> Dict[str, Any]:
         """
-        섹션 내 페이지를 병렬로 순회하며 질의와 관련된 페이지를 찾아 요약 반환
+        질의와 관련된 페이지를 찾아 요약 반환
+
+        1. 페이지 목록 조회 후 변경된 페이지만 다운로드하여 로컬 캐시/FTS 인덱스 갱신
+        2. FTS(BM25) 어휘 필터로 상위 top_k 후보 선정 (FTS를 쓸 수 없으면 전체 페이지)
+        3. 후보 페이지만 AI로 관련성 판단 + 요약 - (질의, 콘텐츠 해시) 캐시에 없는
+           페이지들을 글자 수 예산 내에서 묶어 배치당 SDK 1회 호출
 
         Args:
             user_email: 사용자 이메일
             query: 검색 질의 (예: "디지털트윈 관련 내용")
             section_id: 섹션 ID (없으면 전체 페이지 대상)
-            concurrency: 동시 처리 수 (기본 5)
+            concurrency: 동시 처리 수 (다운로드/SDK 배치 호출, 기본 5)
+            top_k: AI 관련성 판단에 넘길 최대 후보 수 (기본 20)
 
         Returns:
             관련 페이지 목록과 요약
@@ -430,97 +638,84 @@ class OneNoteAgent:
                 "message": "페이지가 없습니다.",
             }
 
+        # 2. 변경된 페이지만 다운로드 (콘텐츠 캐시 + FTS 인덱스)
+        sync_stats = await self._sync_page_contents(user_email, pages, concurrency)
+
+        # 3. 어휘 필터로 후보 선정
+        pages_by_id = {p.get("id"): p for p in pages}
+        candidates = self._db_service.search_page_contents(
+            user_email, query, page_ids=list(pages_by_id), limit=top_k
+        )
+        if candidates is None:
+            # 어휘 필터 불가(FTS 미지원/질의 오류) → 전체 페이지를 AI 판단 대상으로
+            candidates = [{"page_id": page_id} for page_id in pages_by_id]
+        texts = self._db_service.get_page_plain_texts(user_email, [c["page_id"] for c in candidates])
+
+        # 4. 후보 페이지 관련성 판단 (사용자+질의+해시 캐시 → 미캐시분만 배치 SDK 호출)
+        query_key = normalize_query(query)
+        items = []
+        for c in candidates:
+            cached = texts.get(c["page_id"], {})
+            plain_text = cached.get("plain_text", "")
+            if not plain_text or len(plain_text.strip()) < 30:
+                continue
+            items.append({
+                "page_id": c["page_id"],
+                "page_title": pages_by_id[c["page_id"]].get("title", ""),
+                "plain_text": plain_text,
+                "content_hash": cached.get("content_hash"),
+            })
+
+        verdicts = self._db_service.get_relevance_verdicts(
+            user_email, query_key, [i["content_hash"] for i in items if i["content_hash"]]
+        )
+        pending = [i for i in items if i["content_hash"] not in verdicts]
+
         config = load_config()
+        batch_config = config.get("search", {}).get("relevance_batch", {})
+        batches = pack_relevance_batches(
+            pending,
+            max_chars=batch_config.get("max_chars", 24000),
+            per_page_chars=batch_config.get("per_page_chars", 3000),
+            max_pages=batch_config.get("max_pages", 8),
+        )
 
-        # 2. 각 페이지의 콘텐츠를 가져와서 관련성 판단 + 요약 (세마포어로 동시성 제한)
         semaphore = asyncio.Semaphore(concurrency)
 
-        async def _analyze_page(
-            page: Dict[str, Any],
-        ) -> Optional[Dict[str, Any]]:
-            page_id = page.get("id")
-            page_title = page.get("title", "")
-
+        async def _judge_batch(batch: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
             async with semaphore:
-                content_result = await self._client.get_page_content(
-                    page_id, user_email
-                )
-                if not content_result.get("success"):
-                    return None
-
-                html_content = content_result.get("content", "")
-                plain_text = html_to_plain_text(html_content)
-
-                if not plain_text or len(plain_text.strip()) < 30:
-                    return None
-
-                prompt = (
-                    f"다음 페이지 내용이 질의와 관련이 있는지 판단하고, "
-                    f"관련이 있으면 핵심 내용을 3줄 이내로 요약해 주세요.\n\n"
-                    f"[질의]\n{query}\n\n"
-                    f"[페이지 제목]\n{page_title}\n\n"
-                    f"[페이지 내용]\n{plain_text[:6000]}\n\n"
-                    f"반드시 아래 형식으로만 응답하세요:\n"
-                    f"관련여부: 예 또는 아니오\n"
-                    f"요약: (관련이 있는 경우만 요약 작성)\n"
-                )
-
-                response = await _call_claude_sdk(prompt, config)
-                if not response:
-                    return None
-
-                # 응답 파싱
-                lines = response.strip().split("\n")
-                is_relevant = False
-                summary = ""
-
-                for line in lines:
-                    line_stripped = line.strip()
-                    if line_stripped.startswith("관련여부:"):
-                        value = line_stripped.replace("관련여부:", "").strip()
-                        is_relevant = (
-                            "예" in value or "yes" in value.lower()
-                        )
-                    elif line_stripped.startswith("요약:"):
-                        summary = line_stripped.replace("요약:", "").strip()
-
-                # 요약이 여러 줄일 수 있음
-                if is_relevant and not summary:
-                    summary_lines = []
-                    found_summary = False
-                    for line in lines:
-                        if line.strip().startswith("요약:"):
-                            found_summary = True
-                            rest = line.strip().replace("요약:", "").strip()
-                            if rest:
-                                summary_lines.append(rest)
-                        elif found_summary:
-                            summary_lines.append(line.strip())
-                    summary = " ".join(summary_lines).strip()
-
-                if is_relevant:
-                    return {
-                        "page_id": page_id,
-                        "page_title": page_title,
-                        "summary": summary,
-                        "web_url": page.get("web_url"),
-                    }
-
-                return None
+                response = await _call_claude_sdk(_build_relevance_prompt(query, batch), config)
+            parsed = _parse_relevance_response(response, len(batch)) if response else {}
+            return {
+                batch[page_no - 1]["content_hash"]: verdict
+                for page_no, verdict in parsed.items()
+            }
 
-        # 3. 전체 페이지 병렬 분석
-        tasks = [_analyze_page(page) for page in pages]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        batch_results = await asyncio.gather(*(_judge_batch(b) for b in batches), return_exceptions=True)
 
-        # 4. 관련 페이지만 필터링
-        relevant_pages = []
-        errors = 0
-        for r in results:
+        # 5. 판단 결과 캐시 저장
+        errors = sync_stats["failed"]
+        new_verdicts: Dict[str, Dict[str, Any]] = {}
+        for r in batch_results:
             if isinstance(r, Exception):
                 errors += 1
-                logger.warning(f"페이지 분석 오류: {r}")
-            elif r is not None:
-                relevant_pages.append(r)
+                logger.warning(f"페이지 배치 분석 오류: {r}")
+            else:
+                new_verdicts.update(r)
+        self._db_service.save_relevance_verdicts(user_email, query_key, new_verdicts)
+        verdicts.update(new_verdicts)
+
+        # 6. 관련 페이지만 필터링 (어휘 점수 순서 유지)
+        relevant_pages = []
+        for item in items:
+            verdict = verdicts.get(item["content_hash"])
+            if verdict and verdict["is_relevant"]:
+                relevant_pages.append({
+                    "page_id": item["page_id"],
+                    "page_title": item["page_title"],
+                    "summary": verdict["summary"],
+                    "web_url": pages_by_id[item["page_id"]].get("web_url"),
+                })
 
         return {
             "success": True,
@@ -528,6 +723,10 @@ class OneNoteAgent:
             "results": relevant_pages,
             "count": len(relevant_pages),
             "total_pages_scanned": len(pages),
+            "candidates": len(candidates),
+            "pages_downloaded": sync_stats["downloaded"],
+            "pages_cached": sync_stats["cached"],
+            "llm_calls": len(batches),
             "errors": errors,
         }
 
@@ -5,6 +5,7 @@ OneNote DB Service
 """
 
 import json
+import re
 import sqlite3
 import os
 import logging
@@ -31,6 +32,7 @@ class OneNoteDBService:
             resolved_path = os.path.join(base_dir, resolved_path)
 
         self.db_path = resolved_path
+        self._fts_enabled = False
         os.makedirs(os.path.dirname(resolved_path), exist_ok=True)
         self._ensure_tables()
         logger.info("OneNoteDBService initialized")
@@ -122,6 +124,65 @@ class OneNoteDBService:
                     ON onenote_page_changes(user_id, created_at DESC);
             """)
 
+            # 사용자 구분 없는 관련성 캐시(구 스키마)는 버리고 새로 생성
+            cursor.execute("PRAGMA table_info(onenote_relevance_cache)")
+            relevance_columns = [row[1] for row in cursor.fetchall()]
+            if relevance_columns and "user_id" not in relevance_columns:
+                cursor.execute("DROP TABLE onenote_relevance_cache")
+
+            # page_id 만 고유 키인 구 콘텐츠 캐시는 공유 페이지를 한 사용자에게만 남기므로 버리고 새로 생성
+            cursor.execute(
+                "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'onenote_page_contents'"
+            )
+            contents_table = cursor.fetchone()
+            if contents_table and "UNIQUE(user_id, page_id)" not in contents_table[0]:
+                cursor.execute("DROP TABLE onenote_page_contents")
+                cursor.execute("DROP TABLE IF EXISTS onenote_page_fts")
+
+            # 페이지 콘텐츠 캐시 + 전문 검색 인덱스
+            cursor.executescript("""
+                CREATE TABLE IF NOT EXISTS onenote_page_contents (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    page_id TEXT NOT NULL,
+                    user_id TEXT NOT NULL,
+                    page_title TEXT,
+                    section_id TEXT,
+                    web_url TEXT,
+                    last_modified_datetime TEXT,
+                    content_hash TEXT,
+                    plain_text TEXT,
+                    fetched_at TEXT,
+                    UNIQUE(user_id, page_id)
+                );
+
+                CREATE INDEX IF NOT EXISTS idx_page_contents_user
+                    ON onenote_page_contents(user_id);
+
+                -- AI 관련성 판단 캐시 (사용자 + 질의 + 콘텐츠 해시)
+                CREATE TABLE IF NOT EXISTS onenote_relevance_cache (
+                    user_id TEXT NOT NULL,
+                    query_key TEXT NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    is_relevant INTEGER NOT NULL,
+                    summary TEXT,
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (user_id, query_key, content_hash)
+                );
+
+                DROP INDEX IF EXISTS idx_page_summaries_hash;
+                CREATE INDEX IF NOT EXISTS idx_page_summaries_user_hash
+                    ON onenote_page_summaries(user_id, content_hash);
+            """)
+            try:
+                cursor.execute(
+                    "CREATE VIRTUAL TABLE IF NOT EXISTS onenote_page_fts "
+                    "USING fts5(page_title, plain_text, tokenize='unicode61 remove_diacritics 2')"
+                )
+                self._fts_enabled = True
+            except sqlite3.OperationalError as e:
+                logger.warning(f"[WARN] FTS5 미지원, 페이지 전문 검색 비활성화: {e}")
+                self._fts_enabled = False
+
             conn.commit()
             logger.info("onenote_items 테이블 확인/생성 완료")
         except Exception as e:
@@ -512,6 +573,32 @@ class OneNoteDBService:
         finally:
             conn.close()
 
+    def get_summary_by_hash(self, user_id: str, content_hash: str) -> Optional[Dict[str, Any]]:
+        """같은 사용자의 콘텐츠 해시가 같은 페이지 요약 조회 (복사/이동된 페이지 재사용)"""
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        try:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT summary, keywords, content_hash, summarized_at FROM onenote_page_summaries
+                WHERE user_id = ? AND content_hash = ? AND summary IS NOT NULL AND summary != ''
+                ORDER BY summarized_at DESC LIMIT 1
+                """,
+                (user_id, content_hash),
+            )
+            row = cursor.fetchone()
+            if not row:
+                return None
+            result = dict(row)
+            result["keywords"] = json.loads(result["keywords"]) if result.get("keywords") else []
+            return result
+        except Exception as e:
+            logger.error(f"[ERROR] 해시 기반 요약 조회 실패: {e}")
+            return None
+        finally:
+            conn.close()
+
     def list_summaries(self, user_id: str) -> List[Dict[str, Any]]:
         """사용자의 요약된 페이지 목록 조회"""
         conn = sqlite3.connect(self.db_path)
@@ -548,6 +635,286 @@ class OneNoteDBService:
         finally:
             conn.close()
 
+    # ========================================================================
+    # 페이지 콘텐츠 캐시 / 전문 검색
+    # ========================================================================
+
+    def get_page_content_states(self, user_id: str, page_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        사용자 캐시에 있는 페이지의 변경 감지 정보 조회
+
+        Args:
+            user_id: 사용자 ID
+            page_ids: 페이지 ID 목록
+
+        Returns:
+            {page_id: {"last_modified_datetime": str, "content_hash": str}}
+        """
+        if not page_ids:
+            return {}
+        conn = sqlite3.connect(self.db_path)
+        try:
+            cursor = conn.cursor()
+            states: Dict[str, Dict[str, Any]] = {}
+            # SQLite 바인딩 변수 개수 제한 대비 청크 단위 조회
+            for i in range(0, len(page_ids), 500):
+                chunk = page_ids[i:i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                cursor.execute(
+                    f"SELECT page_id, last_modified_datetime, content_hash "
+                    f"FROM onenote_page_contents WHERE user_id = ? AND page_id IN ({placeholders})",
+                    [user_id, *chunk],
+                )
+                for page_id, last_modified, content_hash in cursor.fetchall():
+                    states[page_id] = {
+                        "last_modified_datetime": last_modified,
+                        "content_hash": content_hash,
+                    }
+            return states
+        except Exception as e:
+            logger.error(f"[ERROR] 페이지 캐시 조회 실패: {e}")
+            return {}
+        finally:
+            conn.close()
+
+    def save_page_contents(self, user_id: str, contents: List[Dict[str, Any]]) -> int:
+        """
+        페이지 평문 콘텐츠를 캐시에 저장하고 전문 검색 인덱스 갱신 (단일 트랜잭션)
+
+        Args:
+            user_id: 사용자 ID
+            contents: [{"page_id", "page_title", "section_id", "web_url",
+                        "last_modified_datetime", "content_hash", "plain_text"}, ...]
+
+        Returns:
+            저장된 페이지 수
+        """
+        if not contents:
+            return 0
+        conn = sqlite3.connect(self.db_path)
+        try:
+            cursor = conn.cursor()
+            now = datetime.now(timezone.utc).isoformat()
+            cursor.executemany("""
+                INSERT INTO onenote_page_contents
+                    (page_id, user_id, page_title, section_id, web_url,
+                     last_modified_datetime, content_hash, plain_text, fetched_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(user_id, page_id) DO UPDATE SET
+                    page_title = excluded.page_title,
+                    section_id = excluded.section_id,
+                    web_url = excluded.web_url,
+                    last_modified_datetime = excluded.last_modified_datetime,
+                    content_hash = excluded.content_hash,
+                    plain_text = excluded.plain_text,
+                    fetched_at = excluded.fetched_at
+            """, [
+                (
+                    c["page_id"], user_id, c.get("page_title", ""), c.get("section_id"), c.get("web_url"),
+                    c.get("last_modified_datetime"), c.get("content_hash"), c.get("plain_text", ""), now,
+                )
+                for c in contents
+            ])
+
+            if self._fts_enabled:
+                page_keys = [(user_id, c["page_id"]) for c in contents]
+                cursor.executemany(
+                    "DELETE FROM onenote_page_fts WHERE rowid = "
+                    "(SELECT id FROM onenote_page_contents WHERE user_id = ? AND page_id = ?)",
+                    page_keys,
+                )
+                cursor.executemany("""
+                    INSERT INTO onenote_page_fts (rowid, page_title, plain_text)
+                    SELECT id, page_title, plain_text FROM onenote_page_contents
+                    WHERE user_id = ? AND page_id = ?
+                """, page_keys)
+
+            conn.commit()
+            return len(contents)
+        except Exception as e:
+            logger.error(f"[ERROR] 페이지 캐시 저장 실패: {e}")
+            conn.rollback()
+            return 0
+        finally:
+            conn.close()
+
+    def get_page_plain_texts(self, user_id: str, page_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        사용자 캐시의 페이지 평문/해시 조회
+
+        Returns:
+            {page_id: {"page_title", "plain_text", "content_hash", "web_url"}}
+        """
+        if not page_ids:
+            return {}
+        conn = sqlite3.connect(self.db_path)
+        try:
+            cursor = conn.cursor()
+            texts: Dict[str, Dict[str, Any]] = {}
+            for i in range(0, len(page_ids), 500):
+                chunk = page_ids[i:i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                cursor.execute(
+                    f"SELECT page_id, page_title, plain_text, content_hash, web_url "
+                    f"FROM onenote_page_contents WHERE user_id = ? AND page_id IN ({placeholders})",
+                    [user_id, *chunk],
+                )
+                for page_id, title, plain_text, content_hash, web_url in cursor.fetchall():
+                    texts[page_id] = {
+                        "page_title": title,
+                        "plain_text": plain_text or "",
+                        "content_hash": content_hash,
+                        "web_url": web_url,
+                    }
+            return texts
+        except Exception as e:
+            logger.error(f"[ERROR] 페이지 평문 조회 실패: {e}")
+            return {}
+        finally:
+            conn.close()
+
+    def get_relevance_verdicts(
+        self,
+        user_id: str,
+        query_key: str,
+        content_hashes: List[str],
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        캐시된 AI 관련성 판단 조회
+
+        Args:
+            user_id: 사용자 ID
+            query_key: 정규화된 검색 질의
+            content_hashes: 페이지 콘텐츠 해시 목록
+
+        Returns:
+            {content_hash: {"is_relevant": bool, "summary": str}}
+        """
+        if not content_hashes:
+            return {}
+        conn = sqlite3.connect(self.db_path)
+        try:
+            cursor = conn.cursor()
+            verdicts: Dict[str, Dict[str, Any]] = {}
+            for i in range(0, len(content_hashes), 500):
+                chunk = content_hashes[i:i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                cursor.execute(
+                    f"SELECT content_hash, is_relevant, summary FROM onenote_relevance_cache "
+                    f"WHERE user_id = ? AND query_key = ? AND content_hash IN ({placeholders})",
+                    [user_id, query_key, *chunk],
+                )
+                for content_hash, is_relevant, summary in cursor.fetchall():
+                    verdicts[content_hash] = {"is_relevant": bool(is_relevant), "summary": summary or ""}
+            return verdicts
+        except Exception as e:
+            logger.error(f"[ERROR] 관련성 캐시 조회 실패: {e}")
+            return {}
+        finally:
+            conn.close()
+
+    def save_relevance_verdicts(
+        self,
+        user_id: str,
+        query_key: str,
+        verdicts: Dict[str, Dict[str, Any]],
+    ) -> int:
+        """
+        AI 관련성 판단 결과 캐시 저장
+
+        Args:
+            user_id: 사용자 ID
+            query_key: 정규화된 검색 질의
+            verdicts: {content_hash: {"is_relevant": bool, "summary": str}}
+
+        Returns:
+            저장된 판단 수
+        """
+        if not verdicts:
+            return 0
+        conn = sqlite3.connect(self.db_path)
+        try:
+            cursor = conn.cursor()
+            cursor.executemany("""
+                INSERT OR REPLACE INTO onenote_relevance_cache
+                    (user_id, query_key, content_hash, is_relevant, summary, created_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, [
+                (user_id, query_key, content_hash, int(v["is_relevant"]), v.get("summary", ""),
+                 datetime.now(timezone.utc).isoformat())
+                for content_hash, v in verdicts.items()
+            ])
+            conn.commit()
+            return len(verdicts)
+        except Exception as e:
+            logger.error(f"[ERROR] 관련성 캐시 저장 실패: {e}")
+            return 0
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _build_fts_query(query: str) -> str:
+        """
+        검색 질의를 FTS5 MATCH 식으로 변환
+
+        단어별 prefix 검색을 OR로 결합한다. 한국어 조사가 붙은 토큰
+        ("디지털트윈을")도 "디지털트윈"* 로 매칭된다.
+        """
+        terms = re.findall(r"\w+", query, flags=re.UNICODE)
+        return " OR ".join(f'"{t}"*' for t in terms)
+
+    def search_page_contents(
+        self,
+        user_id: str,
+        query: str,
+        page_ids: Optional[List[str]] = None,
+        limit: int = 20,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        캐시된 페이지 평문에서 BM25 순위로 후보 페이지 검색
+
+        Args:
+            user_id: 사용자 ID
+            query: 검색 질의
+            page_ids: 검색 대상 페이지 ID (None이면 사용자의 전체 캐시)
+            limit: 최대 반환 개수
+
+        Returns:
+            [{"page_id", "page_title", "score"}, ...] (score가 높을수록 관련성 높음).
+            FTS를 쓸 수 없거나(미지원/검색어 없음/질의 오류) 어휘 필터를 적용할 수 없으면
+            None - 호출 측은 전체 후보를 대상으로 판단해야 함
+        """
+        match = self._build_fts_query(query)
+        if not self._fts_enabled or not match:
+            return None
+
+        scope = set(page_ids) if page_ids is not None else None
+        conn = sqlite3.connect(self.db_path)
+        try:
+            cursor = conn.cursor()
+            # 제목 가중치 3배
+            cursor.execute("""
+                SELECT c.page_id, c.page_title, bm25(onenote_page_fts, 3.0, 1.0) AS rank
+                FROM onenote_page_fts f
+                JOIN onenote_page_contents c ON c.id = f.rowid
+                WHERE onenote_page_fts MATCH ? AND c.user_id = ?
+                ORDER BY rank
+            """, (match, user_id))
+
+            results = []
+            for page_id, title, rank in cursor:
+                if scope is not None and page_id not in scope:
+                    continue
+                results.append({"page_id": page_id, "page_title": title, "score": round(-rank, 4)})
+                if len(results) >= limit:
+                    break
+            return results
+        except Exception as e:
+            logger.error(f"[ERROR] 페이지 전문 검색 실패: {e}")
+            return None
+        finally:
+            conn.close()
+
     # ========================================================================
     # 하위 호환성 메서드 (섹션/페이지 별도 API)
     # ========================================================================
@@ -694,5 +694,237 @@ class TestOneNoteService:
             _ = service.agent
 
 
+
+class TestOneNoteAgentSearch:
+    """OneNoteAgent.search_pages 캐시/어휘 필터 테스트"""
+
+    @pytest.fixture
+    def db_service(self, tmp_path):
+        from mcp_onenote.onenote_db_service import OneNoteDBService
+        return OneNoteDBService(db_path=str(tmp_path / "onenote.db"))
+
+    @pytest.fixture
+    def pages(self):
+        return [
+            {"id": "p1", "title": "디지털트윈 회의록", "last_modified_datetime": "2026-01-01T00:00:00Z"},
+            {"id": "p2", "title": "점심 메뉴", "last_modified_datetime": "2026-01-01T00:00:00Z"},
+            {"id": "p3", "title": "선박 설계", "last_modified_datetime": "2026-01-01T00:00:00Z"},
+        ]
+
+    @pytest.fixture
+    def client(self, pages):
+        bodies = {
+            "p1": "<p>디지털트윈을 활용한 선박 모니터링 시스템 구축 방안을 논의했습니다.</p>",
+            "p2": "<p>오늘 점심은 김치찌개와 된장찌개 중에서 고르기로 했습니다. 내일은 국수.</p>",
+            "p3": "<p>선박 선체 설계 검토 일정과 디지털트윈 적용 범위를 정리했습니다.</p>",
+        }
+        mock = AsyncMock()
+        mock.list_pages = AsyncMock(return_value={"success": True, "pages": pages})
+        mock.get_page_content = AsyncMock(
+            side_effect=lambda page_id, user_email: {"success": True, "content": bodies[page_id]}
+        )
+        return mock
+
+    @pytest.mark.asyncio
+    async def test_search_pages_uses_cache_and_prefilter(self, client, db_service, pages):
+        """변경 없는 페이지는 재다운로드하지 않고, 어휘 후보만 AI 판단"""
+        from mcp_onenote.onenote_agent import OneNoteAgent
+
+        agent = OneNoteAgent(client, db_service)
+        sdk = AsyncMock(return_value=(
+            '[{"page": 1, "relevant": true, "summary": "관련 요약"},'
+            ' {"page": 2, "relevant": true, "summary": "관련 요약"}]'
+        ))
+
+        with patch("mcp_onenote.onenote_agent.is_sdk_available", return_value=True), \
+                patch("mcp_onenote.onenote_agent._call_claude_sdk", sdk):
+            result = await agent.search_pages("test@example.com", "디지털트윈")
+
+            assert result["success"] is True
+            assert result["pages_downloaded"] == 3
+            assert {r["page_id"] for r in result["results"]} == {"p1", "p3"}
+            assert sdk.await_count == 1
+            assert result["llm_calls"] == 1
+
+            # 두 번째 검색: 다운로드 없음
+            client.get_page_content.reset_mock()
+            pages[2]["last_modified_datetime"] = "2026-02-01T00:00:00Z"
+            result = await agent.search_pages("test@example.com", "점심")
+
+            assert result["pages_cached"] == 2
+            assert result["pages_downloaded"] == 1
+            client.get_page_content.assert_awaited_once_with("p3", "test@example.com")
+            assert [r["page_id"] for r in result["results"]] == ["p2"]
+
+            # 같은 질의 + 같은 콘텐츠 해시는 SDK 재호출 없음
+            sdk.reset_mock()
+            result = await agent.search_pages("test@example.com", "  디지털트윈 ")
+            assert result["llm_calls"] == 0
+            assert sdk.await_count == 0
+            assert {r["page_id"] for r in result["results"]} == {"p1", "p3"}
+
+    @pytest.mark.asyncio
+    async def test_search_pages_without_fts_scans_all_pages(self, client, db_service):
+        """FTS를 쓸 수 없으면 어휘 필터 없이 전체 페이지를 AI 판단"""
+        from mcp_onenote.onenote_agent import OneNoteAgent
+
+        db_service._fts_enabled = False
+        assert db_service.search_page_contents("test@example.com", "디지털트윈") is None
+
+        agent = OneNoteAgent(client, db_service)
+        sdk = AsyncMock(return_value=(
+            '[{"page": 1, "relevant": true, "summary": "관련 요약"},'
+            ' {"page": 2, "relevant": false, "summary": ""},'
+            ' {"page": 3, "relevant": true, "summary": "관련 요약"}]'
+        ))
+
+        with patch("mcp_onenote.onenote_agent.is_sdk_available", return_value=True), \
+                patch("mcp_onenote.onenote_agent._call_claude_sdk", sdk):
+            result = await agent.search_pages("test@example.com", "디지털트윈")
+
+        assert result["success"] is True
+        assert result["candidates"] == 3
+        assert [r["page_id"] for r in result["results"]] == ["p1", "p3"]
+
+    @pytest.mark.asyncio
+    async def test_relevance_cache_is_per_user(self, client, db_service, pages):
+        """같은 질의 + 같은 콘텐츠라도 다른 사용자의 판단은 재사용하지 않음"""
+        from mcp_onenote.onenote_agent import OneNoteAgent
+
+        agent = OneNoteAgent(client, db_service)
+        sdk = AsyncMock(return_value=(
+            '[{"page": 1, "relevant": true, "summary": "관련 요약"},'
+            ' {"page": 2, "relevant": true, "summary": "관련 요약"}]'
+        ))
+
+        with patch("mcp_onenote.onenote_agent.is_sdk_available", return_value=True), \
+                patch("mcp_onenote.onenote_agent._call_claude_sdk", sdk):
+            await agent.search_pages("a@example.com", "디지털트윈")
+
+            # 다른 사용자의 노트북에 복사된 같은 내용의 페이지
+            bodies = client.get_page_content.side_effect
+            client.list_pages.return_value = {
+                "success": True, "pages": [{**p, "id": f"b-{p['id']}"} for p in pages]
+            }
+            client.get_page_content.side_effect = lambda page_id, user_email: bodies(page_id[2:], user_email)
+            result = await agent.search_pages("b@example.com", "디지털트윈")
+
+        assert sdk.await_count == 2
+        assert result["llm_calls"] == 1
+
+    @pytest.mark.asyncio
+    async def test_shared_pages_are_searchable_by_each_user(self, client, db_service):
+        """공유 페이지는 사용자마다 캐시되어 두 사용자 모두 검색 가능"""
+        from mcp_onenote.onenote_agent import OneNoteAgent
+
+        agent = OneNoteAgent(client, db_service)
+        sdk = AsyncMock(return_value=(
+            '[{"page": 1, "relevant": true, "summary": "관련 요약"},'
+            ' {"page": 2, "relevant": true, "summary": "관련 요약"}]'
+        ))
+
+        with patch("mcp_onenote.onenote_agent.is_sdk_available", return_value=True), \
+                patch("mcp_onenote.onenote_agent._call_claude_sdk", sdk):
+            first = await agent.search_pages("a@example.com", "디지털트윈")
+            second = await agent.search_pages("b@example.com", "디지털트윈")
+
+        assert {r["page_id"] for r in first["results"]} == {"p1", "p3"}
+        assert second["pages_downloaded"] == 3
+        assert second["candidates"] == 2
+        assert {r["page_id"] for r in second["results"]} == {"p1", "p3"}
+
+    def test_page_contents_are_cached_per_user(self, db_service):
+        """같은 page_id 를 두 사용자가 저장해도 각자의 캐시/검색 결과 유지"""
+        page = {"page_id": "p1", "page_title": "디지털트윈 회의록", "plain_text": "선박 모니터링",
+                "last_modified_datetime": "2026-01-01T00:00:00Z", "content_hash": "h1"}
+
+        db_service.save_page_contents("a@example.com", [page])
+        assert db_service.get_page_content_states("b@example.com", ["p1"]) == {}
+        assert db_service.get_page_plain_texts("b@example.com", ["p1"]) == {}
+        assert db_service.search_page_contents("b@example.com", "디지털트윈") == []
+
+        db_service.save_page_contents("b@example.com", [page])
+        for user in ("a@example.com", "b@example.com"):
+            assert db_service.get_page_content_states(user, ["p1"])["p1"]["content_hash"] == "h1"
+            assert db_service.get_page_plain_texts(user, ["p1"])["p1"]["plain_text"] == "선박 모니터링"
+            assert [r["page_id"] for r in db_service.search_page_contents(user, "디지털트윈")] == ["p1"]
+
+    def test_legacy_page_contents_are_rebuilt(self, tmp_path):
+        """page_id 만 고유 키인 구 콘텐츠 캐시는 (user_id, page_id) 키로 다시 생성"""
+        import sqlite3
+        from mcp_onenote.onenote_db_service import OneNoteDBService
+
+        db_path = str(tmp_path / "legacy.db")
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "CREATE TABLE onenote_page_contents (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "page_id TEXT NOT NULL UNIQUE, user_id TEXT NOT NULL, page_title TEXT, section_id TEXT, "
+            "web_url TEXT, last_modified_datetime TEXT, content_hash TEXT, plain_text TEXT, fetched_at TEXT)"
+        )
+        conn.execute("INSERT INTO onenote_page_contents (page_id, user_id) VALUES ('p1', 'a@example.com')")
+        conn.commit()
+        conn.close()
+
+        db_service = OneNoteDBService(db_path=db_path)
+        page = {"page_id": "p1", "page_title": "회의록", "plain_text": "본문", "content_hash": "h1"}
+
+        assert db_service.get_page_content_states("a@example.com", ["p1"]) == {}
+        assert db_service.save_page_contents("a@example.com", [page]) == 1
+        assert db_service.save_page_contents("b@example.com", [page]) == 1
+        assert set(db_service.get_page_plain_texts("b@example.com", ["p1"])) == {"p1"}
+
+    def test_summary_by_hash_is_per_user(self, db_service):
+        """해시가 같은 요약은 같은 사용자의 페이지에서만 재사용"""
+        db_service.save_summary(
+            page_id="p1", user_id="a@example.com", page_title="회의록", summary="요약",
+            paragraph_summaries=[], keywords=["회의"], content_hash="h1",
+        )
+
+        assert db_service.get_summary_by_hash("a@example.com", "h1")["summary"] == "요약"
+        assert db_service.get_summary_by_hash("b@example.com", "h1") is None
+
+    def test_legacy_relevance_cache_is_rebuilt(self, tmp_path):
+        """user_id 없는 구 관련성 캐시 테이블은 새 키로 다시 생성"""
+        import sqlite3
+        from mcp_onenote.onenote_db_service import OneNoteDBService
+
+        db_path = str(tmp_path / "legacy.db")
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "CREATE TABLE onenote_relevance_cache (query_key TEXT NOT NULL, content_hash TEXT NOT NULL, "
+            "is_relevant INTEGER NOT NULL, summary TEXT, created_at TEXT, PRIMARY KEY (query_key, content_hash))"
+        )
+        conn.execute("INSERT INTO onenote_relevance_cache VALUES ('q', 'h1', 1, '요약', '')")
+        conn.commit()
+        conn.close()
+
+        db_service = OneNoteDBService(db_path=db_path)
+
+        assert db_service.get_relevance_verdicts("a@example.com", "q", ["h1"]) == {}
+        db_service.save_relevance_verdicts("a@example.com", "q", {"h1": {"is_relevant": True, "summary": "요약"}})
+        assert db_service.get_relevance_verdicts("a@example.com", "q", ["h1"])["h1"]["is_relevant"] is True
+        assert db_service.get_relevance_verdicts("b@example.com", "q", ["h1"]) == {}
+
+    def test_pack_relevance_batches_budget(self):
+        """글자 수 예산/페이지 수 제한에 따른 배치 분할"""
+        from mcp_onenote.onenote_agent import pack_relevance_batches
+
+        items = [{"page_id": f"p{i}", "plain_text": "가" * 5000} for i in range(5)]
+        batches = pack_relevance_batches(items, max_chars=7000, per_page_chars=3000, max_pages=8)
+
+        assert [len(b) for b in batches] == [2, 2, 1]
+        assert all(len(i["plain_text"]) == 3000 for b in batches for i in b)
+
+    def test_parse_relevance_response(self):
+        """JSON 배열 응답 파싱 (범위 밖 번호 무시)"""
+        from mcp_onenote.onenote_agent import _parse_relevance_response
+
+        response = '결과:\n[{"page": 1, "relevant": "예", "summary": "요약"}, {"page": 9, "relevant": true}]'
+        verdicts = _parse_relevance_response(response, 2)
+
+        assert verdicts == {1: {"is_relevant": True, "summary": "요약"}}
+        assert _parse_relevance_response("형식 오류", 2) == {}
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
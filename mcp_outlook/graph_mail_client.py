@@ -13,6 +13,7 @@ if TYPE_CHECKING:
 from .graph_mail_query import GraphMailQuery
 from .graph_mail_id_batch import GraphMailIdBatch
 from .outlook_types import FilterParams, ExcludeParams, SelectParams
+from core.tracing import traced
 
 
 class QueryMethod(Enum):
@@ -106,6 +107,7 @@ class GraphMailClient:
         if not self._initialized:
             raise Exception("GraphMailClient not initialized. Call initialize() first.")
 
+    @traced()
     async def build_and_fetch(
         self,
         user_email: str,
@@ -190,6 +192,7 @@ class GraphMailClient:
         except Exception as e:
             return {"error": str(e), "status": "error", "value": [], "query_method": query_method.value}
 
+    @traced()
     async def fetch_and_process(
         self,
         user_email: str,
@@ -348,6 +351,7 @@ class GraphMailClient:
             "query_method": query_method.value,
         }
 
+    @traced()
     async def batch_and_fetch(
         self, user_email: str, message_ids: List[str], select_params: Optional[SelectParams] = None
     ) -> Dict[str, Any]:
@@ -403,6 +407,7 @@ class GraphMailClient:
         except Exception as e:
             return {"status": "error", "error": str(e), "value": [], "query_method": QueryMethod.BATCH_ID.value}
 
+    @traced()
     async def fetch_attachments_metadata(
         self,
         user_email: str,
@@ -453,6 +458,7 @@ class GraphMailClient:
         except Exception as e:
             return {"status": "error", "error": str(e), "value": []}
 
+    @traced()
     async def download_attachments(
         self,
         user_email: str,
@@ -570,6 +576,7 @@ class GraphMailClient:
         except Exception as e:
             return {"status": "error", "error": str(e)}
 
+    @traced()
     async def batch_and_process(
         self,
         user_email: str,
@@ -645,6 +652,7 @@ class GraphMailClient:
             f"Only ProcessingMode.FETCH_ONLY is currently supported."
         )
 
+    @traced()
     async def delete_messages(
         self,
         user_email: str,
@@ -700,6 +708,7 @@ class GraphMailClient:
         except Exception as e:
             return {"status": "error", "error": str(e), "deleted": 0}
 
+    @traced()
     async def report_not_junk_messages(
         self,
         user_email: str,
@@ -758,6 +767,7 @@ class GraphMailClient:
         except Exception as e:
             return {"status": "error", "error": str(e), "reported": 0}
 
+    @traced()
     async def move_messages(
         self,
         user_email: str,
@@ -5,6 +5,7 @@ Microsoft Graph API의 $batch 기능을 활용하여 여러 메일을 효율적
 
 import asyncio
 import aiohttp
+import logging
 from typing import Dict, Any, List, Optional
 
 import sys
@@ -12,6 +13,9 @@ import os
 from typing import TYPE_CHECKING
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.metrics import graph_trace_configs, track_auth
+from core.structured_log import get_logger
+from core.tracing import set_span_attribute, traced
 
 if TYPE_CHECKING:
     from core.protocols import TokenProviderProtocol
@@ -19,6 +23,9 @@ if TYPE_CHECKING:
 from .outlook_types import SelectParams, build_select_query
 
 
+log = get_logger(__name__)
+
+
 class GraphMailIdBatch:
     """
     메일 ID 기반 배치 조회 클래스
@@ -62,7 +69,8 @@ class GraphMailIdBatch:
             액세스 토큰 또는 None
         """
         try:
-            access_token = await self.token_provider.validate_and_refresh_token(user_email)
+            with track_auth():
+                access_token = await self.token_provider.validate_and_refresh_token(user_email)
 
             if not access_token:
                 print(f"Failed to get access token for {user_email}")
@@ -107,6 +115,7 @@ class GraphMailIdBatch:
         # SelectParams가 객체인 경우 (build_select_query 사용)
         return build_select_query(select_params)
 
+    @traced()
     async def fetch_single_by_id(
         self, user_email: str, message_id: str, select_params: Optional[SelectParams] = None
     ) -> Dict[str, Any]:
@@ -137,7 +146,7 @@ class GraphMailIdBatch:
         headers = {"Authorization": f"Bearer {access_token}", "Content-Type": "application/json"}
 
         try:
-            async with aiohttp.ClientSession() as session:
+            async with aiohttp.ClientSession(trace_configs=graph_trace_configs()) as session:
                 async with session.get(url, headers=headers) as response:
                     if response.status == 200:
                         data = await response.json()
@@ -153,6 +162,7 @@ class GraphMailIdBatch:
         except Exception as e:
             return {"success": False, "error": f"Request failed: {str(e)}"}
 
+    @traced()
     async def batch_fetch_by_ids(
         self, user_email: str, message_ids: List[str], select_params: Optional[SelectParams] = None
     ) -> Dict[str, Any]:
@@ -177,79 +187,86 @@ class GraphMailIdBatch:
 
         # 20개씩 배치로 분할
         batches = self._split_into_batches(message_ids, self.max_batch_size)
+        set_span_attribute("messages", len(message_ids))
+        set_span_attribute("batches", len(batches))
+
+        # 배치별 로그는 샘플링/rate limit, 작업 종료 시 요약 1회
+        with log.operation("mail.batch_fetch", requested=len(message_ids), batches=len(batches)) as op:
+            # 선택 필드 준비
+            select_fields = self._build_select_fields(select_params)
+            select_query = f"?$select={select_fields}" if select_fields else ""
+
+            all_results = []
+            errors = []
+
+            headers = {"Authorization": f"Bearer {access_token}", "Content-Type": "application/json"}
+
+            # 각 배치 처리
+            async with aiohttp.ClientSession(trace_configs=graph_trace_configs()) as session:
+                for batch_num, batch_ids in enumerate(batches, 1):
+                    # 배치 요청 본문 생성
+                    requests = []
+                    for i, mail_id in enumerate(batch_ids):
+                        requests.append(
+                            {
+                                "id": str(i + 1),
+                                "method": "GET",
+                                "url": f"/users/{user_email}/messages/{mail_id}{select_query}",
+                            }
+                        )
+
+                    batch_body = {"requests": requests}
+
+                    try:
+                        # $batch API 호출
+                        async with session.post(self.batch_url, headers=headers, json=batch_body) as response:
+                            if response.status == 200:
+                                batch_data = await response.json()
+                                responses = batch_data.get("responses", [])
+
+                                # 각 응답 처리
+                                for resp in responses:
+                                    if resp.get("status") == 200:
+                                        mail_data = resp.get("body", {})
+                                        all_results.append(mail_data)
+                                    else:
+                                        # 에러 처리
+                                        req_id = resp.get("id")
+                                        mail_id = batch_ids[int(req_id) - 1] if req_id else "unknown"
+                                        errors.append(
+                                            {
+                                                "mail_id": mail_id,
+                                                "status": resp.get("status"),
+                                                "error": resp.get("body", {})
+                                                .get("error", {})
+                                                .get("message", "Unknown error"),
+                                            }
+                                        )
+
+                                success_count = len([r for r in responses if r.get("status") == 200])
+                                fail_count = len([r for r in responses if r.get("status") != 200])
+                                op.item("batch", batch=batch_num, ok=success_count, failed=fail_count)
+                                op.count("failed_items", fail_count)
+                            else:
+                                error_text = await response.text()
+                                op.item("batch_failed", level=logging.WARNING, batch=batch_num, status=response.status)
+                                op.count("failed_batches")
+                                errors.append(
+                                    {"batch": batch_num, "status": response.status, "error": error_text[:500]}
+                                )
 
-        print(f"Processing {len(message_ids)} mail IDs in {len(batches)} batch(es)")
-
-        # 선택 필드 준비
-        select_fields = self._build_select_fields(select_params)
-        select_query = f"?$select={select_fields}" if select_fields else ""
-
-        all_results = []
-        errors = []
-
-        headers = {"Authorization": f"Bearer {access_token}", "Content-Type": "application/json"}
-
-        # 각 배치 처리
-        async with aiohttp.ClientSession() as session:
-            for batch_num, batch_ids in enumerate(batches, 1):
-                print(f"  Processing batch {batch_num}/{len(batches)} ({len(batch_ids)} mails)...")
-
-                # 배치 요청 본문 생성
-                requests = []
-                for i, mail_id in enumerate(batch_ids):
-                    requests.append(
-                        {
-                            "id": str(i + 1),
-                            "method": "GET",
-                            "url": f"/users/{user_email}/messages/{mail_id}{select_query}",
-                        }
-                    )
-
-                batch_body = {"requests": requests}
-
-                try:
-                    # $batch API 호출
-                    async with session.post(self.batch_url, headers=headers, json=batch_body) as response:
-                        if response.status == 200:
-                            batch_data = await response.json()
-                            responses = batch_data.get("responses", [])
-
-                            # 각 응답 처리
-                            for resp in responses:
-                                if resp.get("status") == 200:
-                                    mail_data = resp.get("body", {})
-                                    all_results.append(mail_data)
-                                else:
-                                    # 에러 처리
-                                    req_id = resp.get("id")
-                                    mail_id = batch_ids[int(req_id) - 1] if req_id else "unknown"
-                                    errors.append(
-                                        {
-                                            "mail_id": mail_id,
-                                            "status": resp.get("status"),
-                                            "error": resp.get("body", {})
-                                            .get("error", {})
-                                            .get("message", "Unknown error"),
-                                        }
-                                    )
-
-                            success_count = len([r for r in responses if r.get("status") == 200])
-                            fail_count = len([r for r in responses if r.get("status") != 200])
-                            print(f"    Batch {batch_num}: {success_count} successful, {fail_count} failed")
-                        else:
-                            error_text = await response.text()
-                            print(f"    Batch {batch_num}: Request failed with status {response.status}")
-                            errors.append({"batch": batch_num, "status": response.status, "error": error_text[:500]})
-
-                except Exception as e:
-                    print(f"    Batch {batch_num}: Exception - {str(e)}")
-                    errors.append({"batch": batch_num, "error": str(e)})
+                    except Exception as e:
+                        op.item("batch_failed", level=logging.WARNING, batch=batch_num, error=str(e))
+                        op.count("failed_batches")
+                        errors.append({"batch": batch_num, "error": str(e)})
 
-        # 결과 정리
-        success_count = len(all_results)
-        total_count = len(message_ids)
+            # 결과 정리
+            success_count = len(all_results)
+            total_count = len(message_ids)
 
-        print(f"Fetched {success_count}/{total_count} mails successfully")
+            op.set(fetched=success_count)
+            if success_count == 0:
+                op.fail("no mails fetched")
 
         return {
             "success": success_count > 0,
@@ -261,6 +278,7 @@ class GraphMailIdBatch:
             "batches_processed": len(batches),
         }
 
+    @traced()
     async def batch_fetch_with_details(
         self, user_email: str, message_ids: List[str], include_attachments: bool = False, include_headers: bool = False
     ) -> Dict[str, Any]:
@@ -314,6 +332,7 @@ class GraphMailIdBatch:
 
         return result
 
+    @traced()
     async def batch_delete_by_ids(
         self, user_email: str, message_ids: List[str]
     ) -> Dict[str, Any]:
@@ -348,7 +367,7 @@ class GraphMailIdBatch:
 
         headers = {"Authorization": f"Bearer {access_token}", "Content-Type": "application/json"}
 
-        async with aiohttp.ClientSession() as session:
+        async with aiohttp.ClientSession(trace_configs=graph_trace_configs()) as session:
             for batch_num, batch_ids in enumerate(batches, 1):
                 print(f"  Processing batch {batch_num}/{len(batches)} ({len(batch_ids)} mails)...")
 
@@ -415,6 +434,7 @@ class GraphMailIdBatch:
             "batches_processed": len(batches),
         }
 
+    @traced()
     async def batch_report_not_junk_by_ids(
         self, user_email: str, message_ids: List[str]
     ) -> Dict[str, Any]:
@@ -450,7 +470,7 @@ class GraphMailIdBatch:
 
         headers = {"Authorization": f"Bearer {access_token}", "Content-Type": "application/json"}
 
-        async with aiohttp.ClientSession() as session:
+        async with aiohttp.ClientSession(trace_configs=graph_trace_configs()) as session:
             for batch_num, batch_ids in enumerate(batches, 1):
                 print(f"  Processing batch {batch_num}/{len(batches)} ({len(batch_ids)} mails)...")
 
@@ -520,6 +540,7 @@ class GraphMailIdBatch:
             "batches_processed": len(batches),
         }
 
+    @traced()
     async def batch_move_by_ids(
         self, user_email: str, message_ids: List[str], destination_id: str = "inbox"
     ) -> Dict[str, Any]:
@@ -553,7 +574,7 @@ class GraphMailIdBatch:
 
         headers = {"Authorization": f"Bearer {access_token}", "Content-Type": "application/json"}
 
-        async with aiohttp.ClientSession() as session:
+        async with aiohttp.ClientSession(trace_configs=graph_trace_configs()) as session:
             for batch_num, batch_ids in enumerate(batches, 1):
                 print(f"  Processing batch {batch_num}/{len(batches)} ({len(batch_ids)} mails)...")
 
@@ -13,12 +13,15 @@ URL 빌드는 graph_mail_url.py에서 담당
 
 import asyncio
 import aiohttp
+import logging
 import sys
 import os
 from typing import Dict, Any, List, Optional, TYPE_CHECKING
 from datetime import datetime
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.metrics import graph_trace_configs, track_auth
+from core.structured_log import get_logger
 
 if TYPE_CHECKING:
     from core.protocols import TokenProviderProtocol
@@ -33,6 +36,9 @@ from .outlook_types import (
 from .graph_mail_url import GraphMailUrlBuilder
 
 
+log = get_logger(__name__)
+
+
 class GraphMailQuery:
     """
     Graph API 메일 조회 클래스
@@ -78,7 +84,8 @@ class GraphMailQuery:
         """
         try:
             # TokenProvider handles all token caching and refresh logic
-            access_token = await self.token_provider.validate_and_refresh_token(user_email)
+            with track_auth():
+                access_token = await self.token_provider.validate_and_refresh_token(user_email)
 
             if not access_token:
                 print(f"Failed to get access token for {user_email}")
@@ -474,7 +481,7 @@ class GraphMailQuery:
         try:
             import aiohttp
 
-            async with aiohttp.ClientSession() as session:
+            async with aiohttp.ClientSession(trace_configs=graph_trace_configs()) as session:
                 headers = {"Authorization": f"Bearer {access_token}", "Content-Type": "application/json"}
                 async with session.get(base_url, headers=headers) as response:
                     if response.status == 200:
@@ -532,72 +539,69 @@ class GraphMailQuery:
         # Calculate number of pages (even for small requests)
         num_pages = (total_items + page_size - 1) // page_size
 
-        # For single page requests, still use parallel structure for consistency
-        if num_pages == 1:
-            print(f"\n[MAIL] Fetching {total_items} emails (single page)")
-        else:
-            print(f"\n[MAIL] Fetching {total_items} emails in {num_pages} pages ({page_size} per page)")
-
-        tasks = []
-        semaphore = asyncio.Semaphore(max_concurrent)
-
-        # Create headers with the provided access token
-        headers = {"Authorization": f"Bearer {access_token}", "Content-Type": "application/json"}
-
-        async def fetch_page(session, url, page_num):
-            async with semaphore:
-                try:
-                    async with session.get(url, headers=headers) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            emails = data.get("value", [])
-
-                            # Apply client-side filtering immediately if provided
-                            if client_filter and emails:
-                                filtered_emails = self._apply_client_side_filter(emails, client_filter)
-                                data["value"] = filtered_emails
-                                print(
-                                    f"  [OK] Page {page_num}: Retrieved {len(emails)} emails, kept {len(filtered_emails)} after filtering"
-                                )
+        # 페이지별 로그는 샘플링/rate limit, 작업 종료 시 요약 1회
+        with log.operation("mail.fetch_pages", requested=total_items, pages=num_pages, page_size=page_size) as op:
+            tasks = []
+            semaphore = asyncio.Semaphore(max_concurrent)
+
+            # Create headers with the provided access token
+            headers = {"Authorization": f"Bearer {access_token}", "Content-Type": "application/json"}
+
+            async def fetch_page(session, url, page_num):
+                async with semaphore:
+                    try:
+                        async with session.get(url, headers=headers) as response:
+                            if response.status == 200:
+                                data = await response.json()
+                                emails = data.get("value", [])
+
+                                # Apply client-side filtering immediately if provided
+                                if client_filter and emails:
+                                    filtered_emails = self._apply_client_side_filter(emails, client_filter)
+                                    data["value"] = filtered_emails
+                                    op.item("page", page=page_num, retrieved=len(emails), kept=len(filtered_emails))
+                                else:
+                                    op.item("page", page=page_num, retrieved=len(emails))
+                                op.count("retrieved", len(emails))
+
+                                return data
                             else:
-                                print(f"  [OK] Page {page_num}: Retrieved {len(emails)} emails")
-
-                            return data
-                        else:
-                            print(f"  [FAIL] Page {page_num}: Error {response.status}")
-                            return {"value": []}
-                except Exception as e:
-                    print(f"  [FAIL] Page {page_num}: {str(e)}")
-                    return {"value": []}
-
-        async with aiohttp.ClientSession() as session:
-            start_time = datetime.now()
-
-            for page in range(num_pages):
-                skip = page * page_size
-                # Always use page_size of 150, except for the last page
-                top = min(page_size, total_items - skip)
-
-                separator = "&" if "?" in base_url else "?"
-                page_url = f"{base_url}{separator}$top={top}&$skip={skip}"
-
-                tasks.append(fetch_page(session, page_url, page + 1))
-
-            results = await asyncio.gather(*tasks)
-            elapsed = (datetime.now() - start_time).total_seconds()
-
-        # Collect all emails and errors
-        all_emails = []
-        errors = []
-        for result in results:
-            all_emails.extend(result.get("value", []))
-            # Collect error information if present
-            if result.get("error"):
-                errors.append(result)
-
-        print(f"[DONE] Fetched {len(all_emails)} emails in {elapsed:.2f}s")
-        if errors:
-            print(f"[WARN] {len(errors)} page(s) had errors")
+                                op.item("page_failed", level=logging.WARNING, page=page_num, status=response.status)
+                                op.count("failed_pages")
+                                return {"value": []}
+                    except Exception as e:
+                        op.item("page_failed", level=logging.WARNING, page=page_num, error=str(e))
+                        op.count("failed_pages")
+                        return {"value": []}
+
+            async with aiohttp.ClientSession(trace_configs=graph_trace_configs()) as session:
+                start_time = datetime.now()
+
+                for page in range(num_pages):
+                    skip = page * page_size
+                    # Always use page_size of 150, except for the last page
+                    top = min(page_size, total_items - skip)
+
+                    separator = "&" if "?" in base_url else "?"
+                    page_url = f"{base_url}{separator}$top={top}&$skip={skip}"
+
+                    tasks.append(fetch_page(session, page_url, page + 1))
+
+                results = await asyncio.gather(*tasks)
+                elapsed = (datetime.now() - start_time).total_seconds()
+
+            # Collect all emails and errors
+            all_emails = []
+            errors = []
+            for result in results:
+                all_emails.extend(result.get("value", []))
+                # Collect error information if present
+                if result.get("error"):
+                    errors.append(result)
+
+            op.set(emails=len(all_emails))
+            if op.counters.get("failed_pages"):
+                op.fail(f"{op.counters['failed_pages']} page(s) failed")
 
         return_data = {
             "value": all_emails,
@@ -21,6 +21,7 @@ import os
 import re
 import json
 import base64
+import logging
 import asyncio
 import aiohttp
 from typing import Dict, Any, List, Optional
@@ -31,6 +32,9 @@ import sys
 from typing import TYPE_CHECKING
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.metrics import graph_trace_configs, track_auth
+from core.structured_log import get_logger
+from core.tracing import span, traced
 
 if TYPE_CHECKING:
     from core.protocols import TokenProviderProtocol
@@ -45,6 +49,9 @@ from .mail_attachment_processor import (
 )
 
 
+log = get_logger(__name__)
+
+
 class MailMetadataManager:
     """
     메일 메타데이터 관리
@@ -197,7 +204,8 @@ class BatchAttachmentHandler:
             액세스 토큰 또는 None
         """
         try:
-            return await self.token_provider.validate_and_refresh_token(user_email)
+            with track_auth():
+                return await self.token_provider.validate_and_refresh_token(user_email)
         except Exception as e:
             print(f"토큰 획득 실패: {e}")
             return None
@@ -257,6 +265,7 @@ class BatchAttachmentHandler:
 
         return requests
 
+    @traced()
     async def fetch_metadata_only(
         self,
         user_email: str,
@@ -306,7 +315,7 @@ class BatchAttachmentHandler:
 
         print(f"\n[META] Fetching metadata for {len(message_ids)} emails ({len(batches)} batches)")
 
-        async with aiohttp.ClientSession() as session:
+        async with aiohttp.ClientSession(trace_configs=graph_trace_configs()) as session:
             for batch_num, batch_ids in enumerate(batches, 1):
                 print(f"\n=== Batch {batch_num}/{len(batches)} ({len(batch_ids)} emails) ===")
 
@@ -382,6 +391,7 @@ class BatchAttachmentHandler:
 
         return result
 
+    @traced()
     async def fetch_and_save(
         self,
         user_email: str,
@@ -477,55 +487,70 @@ class BatchAttachmentHandler:
             for i in range(0, len(message_ids), self.max_batch_size)
         ]
 
-        storage_label = "메모리 반환" if not save_file else ("OneDrive" if storage_type == "onedrive" else "Local")
-        convert_label = " + TXT변환" if convert_to_txt else ""
-        body_label = " + 본문" if include_body else ""
-        print(f"\n처리할 메일: {len(message_ids)}개 ({len(batches)} 배치) [{storage_label}{convert_label}{body_label}]")
+        # 배치/메일/첨부파일별 로그는 샘플링/rate limit, 작업 종료 시 요약 1회
+        with log.operation(
+            "attachment.fetch_and_save",
+            requested=len(message_ids),
+            batches=len(batches),
+            storage=storage_type if save_file else "memory",
+            convert_to_txt=convert_to_txt,
+            include_body=include_body,
+        ) as op:
+            async with aiohttp.ClientSession(trace_configs=graph_trace_configs()) as session:
+                for batch_num, batch_ids in enumerate(batches, 1):
+                    op.item("batch", batch=batch_num, mails=len(batch_ids))
+
+                    # 배치 요청 생성
+                    requests = self._build_batch_requests(user_email, batch_ids, select_params)
+                    batch_body = {"requests": requests}
 
-        async with aiohttp.ClientSession() as session:
-            for batch_num, batch_ids in enumerate(batches, 1):
-                print(f"\n=== 배치 {batch_num}/{len(batches)} ({len(batch_ids)}개) ===")
+                    try:
+                        async with session.post(
+                            self.batch_url, headers=headers, json=batch_body
+                        ) as response:
+                            if response.status != 200:
+                                error_text = await response.text()
+                                result["errors"].append(f"배치 {batch_num} 실패: {error_text[:200]}")
+                                op.item("batch_failed", level=logging.WARNING, batch=batch_num, status=response.status)
+                                continue
 
-                # 배치 요청 생성
-                requests = self._build_batch_requests(user_email, batch_ids, select_params)
-                batch_body = {"requests": requests}
+                            batch_response = await response.json()
 
-                try:
-                    async with session.post(
-                        self.batch_url, headers=headers, json=batch_body
-                    ) as response:
-                        if response.status != 200:
-                            error_text = await response.text()
-                            result["errors"].append(f"배치 {batch_num} 실패: {error_text[:200]}")
-                            continue
+                            # 각 응답 처리
+                            for resp in batch_response.get("responses", []):
+                                req_id = int(resp.get("id", 0)) - 1
+                                if req_id < 0 or req_id >= len(batch_ids):
+                                    continue
 
-                        batch_response = await response.json()
+                                message_id = batch_ids[req_id]
 
-                        # 각 응답 처리
-                        for resp in batch_response.get("responses", []):
-                            req_id = int(resp.get("id", 0)) - 1
-                            if req_id < 0 or req_id >= len(batch_ids):
-                                continue
-
-                            message_id = batch_ids[req_id]
+                                if resp.get("status") != 200:
+                                    error_msg = resp.get("body", {}).get("error", {}).get("message", "Unknown")
+                                    result["errors"].append(f"메일 {message_id[:20]}...: {error_msg}")
+                                    continue
 
-                            if resp.get("status") != 200:
-                                error_msg = resp.get("body", {}).get("error", {}).get("message", "Unknown")
-                                result["errors"].append(f"메일 {message_id[:20]}...: {error_msg}")
-                                continue
+                                mail_data = resp.get("body", {})
+                                await self._process_mail_with_options(
+                                    mail_data, result, storage, converter,
+                                    save_file=save_file, include_body=include_body,
+                                    flat_folder=flat_folder
+                                )
 
-                            mail_data = resp.get("body", {})
-                            await self._process_mail_with_options(
-                                mail_data, result, storage, converter,
-                                save_file=save_file, include_body=include_body,
-                                flat_folder=flat_folder
-                            )
+                    except Exception as e:
+                        result["errors"].append(f"배치 {batch_num} 예외: {str(e)}")
+                        op.item("batch_failed", level=logging.WARNING, batch=batch_num, error=str(e))
 
-                except Exception as e:
-                    result["errors"].append(f"배치 {batch_num} 예외: {str(e)}")
+            result["success"] = result["processed"] > 0
+            result["message"] = f"{result['processed']}개 메일 처리 완료"
 
-        result["success"] = result["processed"] > 0
-        result["message"] = f"{result['processed']}개 메일 처리 완료"
+            op.set(
+                processed=result["processed"],
+                attachments=len(result["saved_attachments"]) + len(result["attachment_contents"]),
+                converted=len(result["converted_files"]),
+                errors=len(result["errors"]),
+            )
+            if not result["success"]:
+                op.fail(result["errors"][0] if result["errors"] else "no mails processed")
 
         return result
 
@@ -572,6 +597,7 @@ class BatchAttachmentHandler:
         except Exception as e:
             result["errors"].append(f"메일 처리 실패 ({subject[:30]}...): {str(e)}")
 
+    @traced()
     async def _process_mail_with_options(
         self,
         mail_data: Dict[str, Any],
@@ -598,8 +624,7 @@ class BatchAttachmentHandler:
         message_id = mail_data.get("id", "")
         subject = mail_data.get("subject", "제목 없음")
 
-        mode_label = "저장" if save_file else "반환"
-        print(f"\n[{mode_label}] {subject[:50]}...")
+        log.item("attachment.mail", message_id=message_id[:20], attachments=len(mail_data.get("attachments", [])))
 
         try:
             folder_path = None
@@ -641,7 +666,9 @@ class BatchAttachmentHandler:
 
         except Exception as e:
             result["errors"].append(f"메일 처리 실패 ({subject[:30]}...): {str(e)}")
+            log.item("attachment.mail_failed", level=logging.WARNING, message_id=message_id[:20], error=str(e))
 
+    @traced()
     async def fetch_specific_attachments(
         self,
         user_email: str,
@@ -730,7 +757,7 @@ class BatchAttachmentHandler:
                 if not flat_folder and message_id not in mail_info_cache:
                     try:
                         mail_url = f"https://graph.microsoft.com/v1.0/users/{user_email}/messages/{message_id}?$select=subject,from,receivedDateTime"
-                        async with aiohttp.ClientSession() as session:
+                        async with aiohttp.ClientSession(trace_configs=graph_trace_configs()) as session:
                             async with session.get(mail_url, headers=handler.headers) as resp:
                                 if resp.status == 200:
                                     mail_info_cache[message_id] = await resp.json()
@@ -757,7 +784,8 @@ class BatchAttachmentHandler:
                                 f"{storage.base_folder}/{message_id[:8]}"
                             )
 
-                    file_content = base64.b64decode(content_bytes)
+                    with span("base64.decode", bytes=len(content_bytes)):
+                        file_content = base64.b64decode(content_bytes)
                     saved_path = await storage.save_file(
                         folder_path_str, file_name, file_content,
                         attachment_data.get("contentType")
@@ -776,7 +804,8 @@ class BatchAttachmentHandler:
                         folder_path = dir_path / folder_name
 
                     folder_path.mkdir(parents=True, exist_ok=True)
-                    file_content = base64.b64decode(content_bytes)
+                    with span("base64.decode", bytes=len(content_bytes)):
+                        file_content = base64.b64decode(content_bytes)
                     save_file_path = folder_path / file_name
                     with open(save_file_path, "wb") as f:
                         f.write(file_content)
@@ -851,7 +880,7 @@ class SingleAttachmentHandler:
         """
         url = f"{self.base_url}/users/{user_id}/messages/{message_id}/attachments"
 
-        async with aiohttp.ClientSession() as session:
+        async with aiohttp.ClientSession(trace_configs=graph_trace_configs()) as session:
             async with session.get(url, headers=self.headers) as response:
                 if response.status == 200:
                     data = await response.json()
@@ -895,7 +924,7 @@ class SingleAttachmentHandler:
         """
         url = f"{self.base_url}/users/{user_id}/messages/{message_id}/attachments/{attachment_id}"
 
-        async with aiohttp.ClientSession() as session:
+        async with aiohttp.ClientSession(trace_configs=graph_trace_configs()) as session:
             async with session.get(url, headers=self.headers) as response:
                 if response.status == 200:
                     return await response.json()
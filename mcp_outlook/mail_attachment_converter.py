@@ -15,15 +15,31 @@ Classes:
     - HwpConverter: 한글 문서 변환
     - ExcelConverter: Excel 변환
     - PowerPointConverter: PowerPoint 변환
-    - ConversionPipeline: 변환기 라우팅
+    - ConversionPipeline: 변환기 라우팅 (확장자 디스패치 테이블 + 매직 바이트 판별)
 """
 
 import re
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import Dict, Optional, List, Tuple
 from io import BytesIO
 
+from core.file_sniffer import KIND_EXTENSIONS, sniff_bytes
+
+
+# PDF 추출 문자 예산 여유분: mail_attachment_processor의 토큰 제한
+# (DEFAULT_MAX_TOKENS * CHARS_PER_TOKEN)보다 약간 크게 잡아 truncate가 적용되도록 함
+PDF_MAX_CHARS_MARGIN = 4000
+_DEFAULT_PDF_MAX_CHARS = object()
+
+
+def default_pdf_max_chars() -> int:
+    """PDF 추출 문자 예산 기본값 (processor 토큰 제한 + 여유분)"""
+    # processor가 이 모듈을 import하므로 순환 import를 피해 호출 시점에 import
+    from mcp_outlook.mail_attachment_processor import CHARS_PER_TOKEN, DEFAULT_MAX_TOKENS
+
+    return DEFAULT_MAX_TOKENS * CHARS_PER_TOKEN + PDF_MAX_CHARS_MARGIN
+
 
 class FileConverter(ABC):
     """
@@ -73,9 +89,17 @@ class PdfConverter(FileConverter):
     """
     PDF → TXT 변환
 
-    pdfplumber 사용
+    pdfplumber 사용, 페이지 단위로 추출하며 문자 예산(max_chars)에
+    도달하면 나머지 페이지는 읽지 않는다
     """
 
+    def __init__(self, max_chars: Optional[int] = _DEFAULT_PDF_MAX_CHARS):
+        """
+        Args:
+            max_chars: 추출 문자 예산 (생략 시 default_pdf_max_chars(), None이면 전체 페이지 추출)
+        """
+        self.max_chars = default_pdf_max_chars() if max_chars is _DEFAULT_PDF_MAX_CHARS else max_chars
+
     @property
     def supported_extensions(self) -> List[str]:
         return [".pdf"]
@@ -92,7 +116,7 @@ class PdfConverter(FileConverter):
             filename: 파일명
 
         Returns:
-            추출된 텍스트
+            추출된 텍스트 (예산 초과 시 해당 페이지까지)
         """
         try:
             import pdfplumber
@@ -100,13 +124,20 @@ class PdfConverter(FileConverter):
             raise ImportError("pdfplumber가 필요합니다: pip install pdfplumber")
 
         text_parts = []
+        extracted = 0
 
         with pdfplumber.open(BytesIO(content)) as pdf:
             for i, page in enumerate(pdf.pages, 1):
                 page_text = page.extract_text()
+                # 파싱된 레이아웃 객체 해제 (대용량 문서 메모리 절감)
+                if hasattr(page, "close"):
+                    page.close()
                 if page_text:
                     text_parts.append(f"--- Page {i} ---")
                     text_parts.append(page_text)
+                    extracted += len(page_text)
+                if self.max_chars and extracted >= self.max_chars:
+                    break
 
         return "\n\n".join(text_parts)
 
@@ -437,7 +468,9 @@ class ConversionPipeline:
     """
     파일 변환 파이프라인
 
-    확장자에 따라 적절한 변환기 선택 및 실행
+    확장자 → 변환기 디스패치 테이블로 변환기를 선택하고,
+    내용이 주어지면 매직 바이트로 실제 형식을 판별해
+    확장자가 잘못되었거나 없는 첨부파일도 맞는 변환기로 보낸다.
     """
 
     def __init__(self):
@@ -450,6 +483,11 @@ class ConversionPipeline:
             PowerPointConverter(),
             PlainTextConverter(),
         ]
+        # 확장자 → 변환기 (먼저 등록된 변환기 우선)
+        self._by_extension: Dict[str, FileConverter] = {}
+        for converter in self.converters:
+            for extension in converter.supported_extensions:
+                self._by_extension.setdefault(extension, converter)
 
     def get_supported_extensions(self) -> List[str]:
         """
@@ -463,34 +501,56 @@ class ConversionPipeline:
             extensions.extend(converter.supported_extensions)
         return extensions
 
-    def can_convert(self, filename: str) -> bool:
+    def resolve(self, filename: str, content: Optional[bytes] = None) -> Tuple[Optional[FileConverter], str]:
+        """
+        변환기와 변환에 사용할 파일명 결정
+
+        내용의 실제 형식이 확장자와 다른 변환기를 가리키면 (예: HWP인 .doc,
+        확장자 없는 PDF) 실제 형식의 변환기와 확장자를 바로잡은 파일명을 반환한다.
+
+        Args:
+            filename: 파일명
+            content: 파일 내용 (없으면 확장자만 사용)
+
+        Returns:
+            (변환기 또는 None, 변환에 사용할 파일명) 튜플
+        """
+        path = Path(filename)
+        converter = self._by_extension.get(path.suffix.lower())
+
+        if content:
+            sniffed_extension = KIND_EXTENSIONS.get(sniff_bytes(content))
+            sniffed = self._by_extension.get(sniffed_extension)
+            if sniffed is not None and sniffed is not converter:
+                return sniffed, f"{path.stem or path.name}{sniffed_extension}"
+
+        return converter, filename
+
+    def can_convert(self, filename: str, content: Optional[bytes] = None) -> bool:
         """
         파일 변환 가능 여부 확인
 
         Args:
             filename: 파일명
+            content: 파일 내용 (주어지면 매직 바이트로 형식 판별)
 
         Returns:
             변환 가능 여부
         """
-        ext = Path(filename).suffix.lower()
-        return any(c.supports(ext) for c in self.converters)
+        return self.resolve(filename, content)[0] is not None
 
-    def get_converter(self, filename: str) -> Optional[FileConverter]:
+    def get_converter(self, filename: str, content: Optional[bytes] = None) -> Optional[FileConverter]:
         """
         파일에 맞는 변환기 반환
 
         Args:
             filename: 파일명
+            content: 파일 내용 (주어지면 매직 바이트로 형식 판별)
 
         Returns:
             변환기 또는 None
         """
-        ext = Path(filename).suffix.lower()
-        for converter in self.converters:
-            if converter.supports(ext):
-                return converter
-        return None
+        return self.resolve(filename, content)[0]
 
     def convert(self, content: bytes, filename: str) -> Tuple[Optional[str], Optional[str]]:
         """
@@ -505,13 +565,13 @@ class ConversionPipeline:
             성공 시: (text, None)
             실패 시: (None, error_message)
         """
-        converter = self.get_converter(filename)
+        converter, effective_filename = self.resolve(filename, content)
 
         if not converter:
             return None, f"지원하지 않는 파일 형식: {Path(filename).suffix}"
 
         try:
-            text = converter.convert(content, filename)
+            text = converter.convert(content, effective_filename)
             return text, None
         except ImportError as e:
             return None, f"필요한 라이브러리 없음: {e}"
@@ -11,12 +11,18 @@ Functions:
     - process_attachment_original: 첨부파일 원본 저장 처리
 """
 
+import os
 import re
 import base64
+import logging
 from typing import Dict, Any, List, Optional, Tuple
 
 from .mail_attachment_storage import StorageBackend
 from .mail_attachment_converter import ConversionPipeline
+from core.structured_log import get_logger
+from core.tracing import span
+
+log = get_logger(__name__)
 
 
 # 토큰 제한 상수
@@ -123,7 +129,7 @@ async def process_body_content(
             "subject": subject,
             "content": body_content
         })
-        print(f"  [BODY] 본문 메모리 반환 ({len(body_content)} chars)")
+        log.item("attachment.body", mode="memory", chars=len(body_content))
 
     return None
 
@@ -159,14 +165,15 @@ async def process_attachments(
         content_bytes = attachment.get("contentBytes")
 
         if not content_bytes:
-            print(f"  [SKIP] {att_name} - contentBytes 없음 (대용량 파일)")
+            log.item("attachment.skipped", name=att_name, reason="no contentBytes")
             continue
 
         # Base64 디코딩
-        file_content = base64.b64decode(content_bytes)
+        with span("base64.decode", bytes=len(content_bytes)):
+            file_content = base64.b64decode(content_bytes)
 
         # 변환 가능 여부에 따라 처리
-        if converter and converter.can_convert(att_name):
+        if converter and converter.can_convert(att_name, file_content):
             saved = await process_attachment_with_conversion(
                 message_id, attachment, file_content, result, storage, converter, folder_path, save_file
             )
@@ -210,7 +217,8 @@ async def process_attachment_with_conversion(
     att_name = attachment.get("name", "attachment")
 
     # TXT 변환 시도
-    text, error = converter.convert(file_content, att_name)
+    with span("ConversionPipeline.convert", bytes=len(file_content), extension=os.path.splitext(att_name)[1].lower()):
+        text, error = converter.convert(file_content, att_name)
 
     if text:
         txt_filename = converter.convert_to_txt_filename(att_name)
@@ -234,8 +242,7 @@ async def process_attachment_with_conversion(
                     converted_info["truncated"] = True
                     converted_info["original_tokens"] = original_tokens
                 result["converted_files"].append(converted_info)
-                truncate_msg = f" (truncated: {original_tokens:,} → {DEFAULT_MAX_TOKENS:,} tokens)" if was_truncated else ""
-                print(f"  [CONVERTED] {att_name} → {txt_filename}{truncate_msg}")
+                log.item("attachment.converted", name=att_name, mode="saved", truncated=was_truncated)
                 return att_file
         else:
             # 메모리 반환
@@ -251,11 +258,10 @@ async def process_attachment_with_conversion(
                 content_info["truncated"] = True
                 content_info["original_tokens"] = original_tokens
             result["attachment_contents"].append(content_info)
-            truncate_msg = f" (truncated: {original_tokens:,} → {DEFAULT_MAX_TOKENS:,} tokens)" if was_truncated else ""
-            print(f"  [CONVERTED] {att_name} → 메모리 반환{truncate_msg}")
+            log.item("attachment.converted", name=att_name, mode="memory", truncated=was_truncated)
     else:
         # 변환 실패 시 원본 처리
-        print(f"  [WARN] {att_name} 변환 실패: {error}, 원본 처리")
+        log.item("attachment.convert_failed", level=logging.WARNING, name=att_name, error=error)
         return await process_attachment_original(
             message_id, attachment, file_content, result, storage, folder_path, save_file
         )
@@ -304,6 +310,6 @@ async def process_attachment_original(
             "content_bytes": base64.b64encode(file_content).decode("ascii"),
             "size": len(file_content)
         })
-        print(f"  [ORIGINAL] {att_name} → 메모리 반환 ({len(file_content)} bytes)")
+        log.item("attachment.original", name=att_name, mode="memory", bytes=len(file_content))
 
     return None
@@ -16,6 +16,7 @@ import re
 import base64
 import asyncio
 import aiohttp
+import logging
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Dict, Any, Optional
@@ -23,9 +24,14 @@ from datetime import datetime
 
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.metrics import graph_trace_configs, track_auth
+from core.structured_log import Operation, get_logger
+from core.tracing import traced
 
 from session.auth_manager import AuthManager
 
+log = get_logger(__name__)
+
 
 class StorageBackend(ABC):
     """
@@ -178,6 +184,7 @@ class LocalStorageBackend(StorageBackend):
         self.base_directory = path
         self.base_directory.mkdir(parents=True, exist_ok=True)
 
+    @traced()
     async def create_folder(self, mail_data: Dict[str, Any]) -> str:
         """
         메일에 해당하는 로컬 폴더 생성
@@ -193,6 +200,7 @@ class LocalStorageBackend(StorageBackend):
         folder_path.mkdir(parents=True, exist_ok=True)
         return str(folder_path)
 
+    @traced()
     async def create_folder_flat(self, base_path: Optional[str] = None) -> str:
         """
         flat_folder 모드: base_directory만 사용 (하위폴더 없음)
@@ -213,6 +221,7 @@ class LocalStorageBackend(StorageBackend):
         path.mkdir(parents=True, exist_ok=True)
         return str(path)
 
+    @traced()
     async def save_file(
         self,
         folder_path: str,
@@ -253,13 +262,14 @@ class LocalStorageBackend(StorageBackend):
             with open(file_path, "wb") as f:
                 f.write(content)
 
-            print(f"  [LOCAL] {file_path.name} ({len(content):,} bytes)")
+            log.item("storage.saved", backend="local", name=file_path.name, bytes=len(content))
             return str(file_path)
 
         except Exception as e:
-            print(f"  [ERROR] {filename} 저장 실패: {e}")
+            log.item("storage.save_failed", level=logging.WARNING, backend="local", name=filename, error=str(e))
             return None
 
+    @traced()
     async def save_mail_content(
         self,
         folder_path: str,
@@ -308,11 +318,12 @@ class LocalStorageBackend(StorageBackend):
             with open(file_path, "w", encoding="utf-8") as f:
                 f.write("\n".join(content_lines))
 
-            print(f"  [LOCAL] mail_content.txt")
+            log.item("storage.saved", backend="local", name="mail_content.txt")
             return str(file_path)
 
         except Exception as e:
-            print(f"  [ERROR] 메일 본문 저장 실패: {e}")
+            log.item("storage.save_failed", level=logging.WARNING, backend="local", name="mail_content.txt",
+                     error=str(e))
             return None
 
 
@@ -363,7 +374,8 @@ class OneDriveStorageBackend(StorageBackend):
         """
         for attempt in range(retry + 1):
             try:
-                return await self.auth_manager.validate_and_refresh_token(self.user_email)
+                with track_auth():
+                    return await self.auth_manager.validate_and_refresh_token(self.user_email)
             except Exception as e:
                 if attempt < retry:
                     print(f"토큰 획득 실패, 재시도 ({attempt + 1}/{retry}): {e}")
@@ -372,6 +384,7 @@ class OneDriveStorageBackend(StorageBackend):
                     print(f"토큰 획득 최종 실패: {e}")
                     return None
 
+    @traced()
     async def _ensure_folder_exists(
         self,
         session: aiohttp.ClientSession,
@@ -423,6 +436,7 @@ class OneDriveStorageBackend(StorageBackend):
 
         return True
 
+    @traced()
     async def create_folder(self, mail_data: Dict[str, Any]) -> str:
         """
         OneDrive에 메일별 폴더 생성
@@ -453,13 +467,14 @@ class OneDriveStorageBackend(StorageBackend):
             "Content-Type": "application/json",
         }
 
-        async with aiohttp.ClientSession() as session:
+        async with aiohttp.ClientSession(trace_configs=graph_trace_configs()) as session:
             success = await self._ensure_folder_exists(session, headers, folder_path)
             if not success:
                 raise Exception(f"Failed to create folder: {folder_path}")
 
         return folder_path
 
+    @traced()
     async def create_folder_flat(self, base_path: Optional[str] = None) -> str:
         """
         flat_folder 모드: base_folder만 생성 (하위폴더 없음)
@@ -481,13 +496,14 @@ class OneDriveStorageBackend(StorageBackend):
             "Content-Type": "application/json",
         }
 
-        async with aiohttp.ClientSession() as session:
+        async with aiohttp.ClientSession(trace_configs=graph_trace_configs()) as session:
             success = await self._ensure_folder_exists(session, headers, folder_path)
             if not success:
                 raise Exception(f"Failed to create folder: {folder_path}")
 
         return folder_path
 
+    @traced()
     async def _upload_simple(
         self,
         session: aiohttp.ClientSession,
@@ -515,13 +531,15 @@ class OneDriveStorageBackend(StorageBackend):
             if response.status in [200, 201]:
                 result = await response.json()
                 web_url = result.get("webUrl", file_path)
-                print(f"  [ONEDRIVE] {filename} ({len(content):,} bytes)")
+                log.item("storage.saved", backend="onedrive", name=filename, bytes=len(content))
                 return web_url
             else:
                 error_text = await response.text()
-                print(f"  [ERROR] {filename} 업로드 실패: {error_text[:100]}")
+                log.item("storage.save_failed", level=logging.WARNING, backend="onedrive", name=filename,
+                         status=response.status, error=error_text[:100])
                 return None
 
+    @traced()
     async def _upload_large(
         self,
         session: aiohttp.ClientSession,
@@ -533,6 +551,8 @@ class OneDriveStorageBackend(StorageBackend):
         """
         Upload Session을 사용한 대용량 파일 업로드 (4MB 초과)
 
+        청크별 로그는 샘플링/rate limit, 업로드 1회당 요약 이벤트 1개
+
         Args:
             session: aiohttp 세션
             access_token: 액세스 토큰
@@ -543,8 +563,24 @@ class OneDriveStorageBackend(StorageBackend):
         Returns:
             저장된 파일 URL 또는 None
         """
+        with log.operation("onedrive.upload_large", name=filename, bytes=len(content),
+                           chunk_size=self.CHUNK_SIZE) as op:
+            web_url = await self._upload_session_chunks(op, session, access_token, file_path, content, filename)
+            if web_url is None and not op.failed:
+                op.fail("upload failed")
+            return web_url
+
+    async def _upload_session_chunks(
+        self,
+        op: Operation,
+        session: aiohttp.ClientSession,
+        access_token: str,
+        file_path: str,
+        content: bytes,
+        filename: str
+    ) -> Optional[str]:
+        """Upload Session 생성 후 청크 업로드 (_upload_large 본체)"""
         file_size = len(content)
-        print(f"  [ONEDRIVE] 대용량 업로드 시작: {filename} ({file_size:,} bytes)")
 
         # Step 1: Upload Session 생성
         create_session_url = f"{self.graph_url}/users/{self.user_email}/drive/root:/{file_path}:/createUploadSession"
@@ -564,14 +600,14 @@ class OneDriveStorageBackend(StorageBackend):
         async with session.post(create_session_url, headers=headers, json=session_body) as response:
             if response.status not in [200, 201]:
                 error_text = await response.text()
-                print(f"  [ERROR] Upload Session 생성 실패: {error_text[:100]}")
+                op.fail(f"createUploadSession {response.status}: {error_text[:100]}")
                 return None
 
             session_data = await response.json()
             upload_url = session_data.get("uploadUrl")
 
             if not upload_url:
-                print(f"  [ERROR] Upload URL을 받지 못함")
+                op.fail("no uploadUrl in createUploadSession response")
                 return None
 
         # Step 2: 청크 단위로 업로드
@@ -599,27 +635,29 @@ class OneDriveStorageBackend(StorageBackend):
                     # 업로드 완료 (마지막 청크에서만 200/201 반환)
                     result = await response.json()
                     web_url = result.get("webUrl", file_path)
-                    print(f"  [ONEDRIVE] 업로드 완료: {filename} ({file_size:,} bytes)")
+                    op.count("chunks")
                     return web_url
                 elif response.status == 202:
                     # 계속 업로드 중
                     uploaded = end
-                    progress = (uploaded / file_size) * 100
-                    print(f"    청크 {chunk_num + 1}/{total_chunks} 완료 ({progress:.1f}%)")
+                    op.count("chunks")
+                    op.item("chunk", chunk=chunk_num + 1, total=total_chunks, uploaded=uploaded)
 
                     # 마지막 청크인데 202가 반환된 경우 (비정상)
                     if is_last_chunk:
-                        print(f"  [WARN] 마지막 청크인데 202 반환됨, 업로드 세션 상태 확인 필요")
+                        op.item("last_chunk_202", level=logging.WARNING, chunk=chunk_num + 1)
                         # 마지막 청크 202: 세션 상태 확인
                         async with session.get(upload_url) as status_resp:
                             if status_resp.status in [200, 201]:
                                 status_data = await status_resp.json()
                                 web_url = status_data.get("webUrl", file_path)
-                                print(f"  [ONEDRIVE] 업로드 완료 (지연): {filename}")
+                                op.set(completed="deferred")
                                 return web_url
                 else:
                     error_text = await response.text()
-                    print(f"  [ERROR] 청크 업로드 실패: {error_text[:100]}")
+                    op.item("chunk_failed", level=logging.WARNING, chunk=chunk_num + 1, status=response.status,
+                            error=error_text[:100])
+                    op.count("retries")
 
                     # 1회 재시도
                     await asyncio.sleep(2)
@@ -628,24 +666,25 @@ class OneDriveStorageBackend(StorageBackend):
                             if retry_resp.status in [200, 201]:
                                 result = await retry_resp.json()
                                 web_url = result.get("webUrl", file_path)
-                                print(f"  [ONEDRIVE] 업로드 완료 (재시도): {filename}")
+                                op.count("chunks")
                                 return web_url
                             # 202면 계속 진행
                             uploaded = end
-                            print(f"    청크 {chunk_num + 1}/{total_chunks} 재시도 성공")
+                            op.count("chunks")
                             continue
                         else:
                             retry_error = await retry_resp.text()
-                            print(f"  [ERROR] 청크 재시도도 실패: {retry_error[:100]}")
+                            op.fail(f"chunk {chunk_num + 1} retry {retry_resp.status}: {retry_error[:100]}")
 
                     # Upload Session 취소
                     await session.delete(upload_url)
                     return None
 
         # 모든 청크가 202로 끝난 경우 (비정상 - 마지막 청크는 200/201이어야 함)
-        print(f"  [ERROR] 업로드 완료 응답(200/201)을 받지 못함")
+        op.fail("no 200/201 after last chunk")
         return None
 
+    @traced()
     async def save_file(
         self,
         folder_path: str,
@@ -672,7 +711,7 @@ class OneDriveStorageBackend(StorageBackend):
 
             # 최대 파일 크기 확인
             if file_size > self.MAX_FILE_SIZE:
-                print(f"  [SKIP] {filename} - 250GB 초과 (OneDrive 제한)")
+                log.item("storage.skipped", level=logging.WARNING, backend="onedrive", name=filename, reason="over 250GB")
                 return None
 
             access_token = await self._get_access_token()
@@ -683,7 +722,7 @@ class OneDriveStorageBackend(StorageBackend):
             safe_name = self.sanitize_filename(filename, max_length=100)
             file_path = f"{folder_path}/{safe_name}"
 
-            async with aiohttp.ClientSession() as session:
+            async with aiohttp.ClientSession(trace_configs=graph_trace_configs()) as session:
                 if file_size <= self.SIMPLE_UPLOAD_MAX_SIZE:
                     # 4MB 이하: 단순 PUT 업로드
                     headers = {
@@ -696,9 +735,10 @@ class OneDriveStorageBackend(StorageBackend):
                     return await self._upload_large(session, access_token, file_path, content, safe_name)
 
         except Exception as e:
-            print(f"  [ERROR] {filename} 업로드 예외: {e}")
+            log.item("storage.save_failed", level=logging.WARNING, backend="onedrive", name=filename, error=str(e))
             return None
 
+    @traced()
     async def save_mail_content(
         self,
         folder_path: str,
@@ -751,7 +791,8 @@ class OneDriveStorageBackend(StorageBackend):
             )
 
         except Exception as e:
-            print(f"  [ERROR] 메일 본문 저장 실패: {e}")
+            log.item("storage.save_failed", level=logging.WARNING, backend="onedrive", name="mail_content.txt",
+                     error=str(e))
             return None
 
 
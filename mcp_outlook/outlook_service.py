@@ -7,6 +7,7 @@ from typing import Dict, Any, Optional, List, Union
 from datetime import datetime, timedelta
 
 from .graph_mail_client import GraphMailClient, QueryMethod, ProcessingMode
+from core.tracing import traced
 from .outlook_types import (
     FilterParams, ExcludeParams, SelectParams,
     build_filter_query, build_select_query
@@ -62,6 +63,7 @@ class MailService:
         priority=5,  # 선택: 우선순위 (1-10)
         description="메일 리스트 조회 기능",  # 필수: 기능 설명
     )
+    @traced()
     async def query_mail_list(
         self,
         user_email: str,
@@ -113,6 +115,7 @@ class MailService:
         priority=5,  # 선택: 우선순위 (1-10)
         description="메일 조회 및 처리 기능",  # 필수: 기능 설명
     )
+    @traced()
     async def fetch_and_process(
         self,
         user_email: str,
@@ -167,6 +170,7 @@ class MailService:
         priority=5,  # 선택: 우선순위 (1-10)
         description="필터 방식 메일 조회 기능",  # 필수: 기능 설명
     )
+    @traced()
     async def fetch_filter(
         self,
         user_email: str,
@@ -197,6 +201,7 @@ class MailService:
         priority=5,  # 선택: 우선순위 (1-10)
         description="검색 방식 메일 조회 기능",  # 필수: 기능 설명
     )
+    @traced()
     async def fetch_search(
         self,
         user_email: str,
@@ -225,6 +230,7 @@ class MailService:
         priority=5,  # 선택: 우선순위 (1-10)
         description="URL 방식 메일 조회 기능",  # 필수: 기능 설명
     )
+    @traced()
     async def fetch_url(
         self,
         user_email: str,
@@ -266,6 +272,7 @@ class MailService:
         priority=5,  # 선택: 우선순위 (1-10)
         description="첨부파일 다운로드 포함 메일 처리 기능",  # 필수: 기능 설명
     )
+    @traced()
     async def process_with_download(
         self,
         user_email: str,
@@ -297,6 +304,7 @@ class MailService:
         priority=5,  # 선택: 우선순위 (1-10)
         description="첨부파일 변환 포함 메일 처리 기능",  # 필수: 기능 설명
     )
+    @traced()
     async def process_with_convert(
         self,
         user_email: str,
@@ -328,6 +336,7 @@ class MailService:
         priority=5,  # 선택: 우선순위 (1-10)
         description="메일 ID 배치 조회 및 처리 기능",  # 필수: 기능 설명
     )
+    @traced()
     async def batch_and_process(
         self,
         user_email: str,
@@ -380,6 +389,7 @@ class MailService:
         priority=5,  # 선택: 우선순위 (1-10)
         description="메일 ID 배치 조회 기능",  # 필수: 기능 설명
     )
+    @traced()
     async def batch_and_fetch(
         self, user_email: str, message_ids: List[str], select_params: Optional[SelectParams] = None
     ) -> Dict[str, Any]:
@@ -409,6 +419,7 @@ class MailService:
         priority=5,  # 선택: 우선순위 (1-10)
         description="이도구 호출하기 전에 메일 리스트를 조회해야함. 메일과 첨부파일의 메타데이터만 조회 (다운로드 없음)",  # 필수: 기능 설명
     )
+    @traced()
     async def fetch_attachments_metadata(
         self,
         user_email: str,
@@ -443,6 +454,7 @@ class MailService:
         priority=5,  # 선택: 우선순위 (1-10)
         description="첨부파일 다운로드 (메일ID 또는 첨부파일ID 지정)",  # 필수: 기능 설명
     )
+    @traced()
     async def download_attachments(
         self,
         user_email: str,
@@ -503,6 +515,7 @@ class MailService:
         priority=5,
         description="메일 액션: delete(휴지통), move(폴더 이동), report_not_junk(Safe Senders), list_blocked(차단 메일 조회)",
     )
+    @traced()
     async def mail_action(
         self,
         user_email: str,
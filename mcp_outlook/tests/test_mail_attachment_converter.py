@@ -125,6 +125,30 @@ class TestConversionPipeline:
         assert self.pipeline.can_convert("file.xyz") is False
         assert self.pipeline.can_convert("file.exe") is False
 
+    def test_resolve_by_magic_bytes(self):
+        """확장자가 없거나 잘못된 첨부파일은 내용으로 변환기 선택"""
+        pdf_bytes = b"%PDF-1.4\n%..."
+        converter, filename = self.pipeline.resolve("scan", pdf_bytes)
+        assert isinstance(converter, PdfConverter)
+        assert filename == "scan.pdf"
+
+        converter, filename = self.pipeline.resolve("report.txt", pdf_bytes)
+        assert isinstance(converter, PdfConverter)
+        assert filename == "report.pdf"
+
+        assert self.pipeline.can_convert("scan", pdf_bytes) is True
+        assert self.pipeline.can_convert("scan") is False
+
+    def test_resolve_keeps_matching_extension(self):
+        """내용을 판별할 수 없거나 확장자와 일치하면 파일명 유지"""
+        converter, filename = self.pipeline.resolve("notes.txt", b"plain text")
+        assert isinstance(converter, PlainTextConverter)
+        assert filename == "notes.txt"
+
+        converter, filename = self.pipeline.resolve("doc.pdf", b"%PDF-1.7")
+        assert isinstance(converter, PdfConverter)
+        assert filename == "doc.pdf"
+
     def test_get_converter_txt(self):
         """TXT 파일 변환기 조회"""
         converter = self.pipeline.get_converter("file.txt")
@@ -173,6 +197,13 @@ class TestPdfConverter:
         """지원 확장자 확인"""
         assert self.converter.supported_extensions == [".pdf"]
 
+    def test_default_budget_follows_token_limit(self):
+        """기본 문자 예산은 processor 토큰 제한보다 크고, None이면 전체 추출"""
+        from mcp_outlook.mail_attachment_processor import CHARS_PER_TOKEN, DEFAULT_MAX_TOKENS
+
+        assert self.converter.max_chars > DEFAULT_MAX_TOKENS * CHARS_PER_TOKEN
+        assert PdfConverter(max_chars=None).max_chars is None
+
     def test_supports_pdf(self):
         """PDF 확장자 지원"""
         assert self.converter.supports(".pdf") is True
@@ -196,6 +227,37 @@ class TestPdfConverter:
             with pytest.raises(ImportError):
                 self.converter.convert(sample_pdf_content, "test.pdf")
 
+    def test_convert_stops_at_char_budget(self, monkeypatch):
+        """문자 예산 도달 시 이후 페이지는 추출하지 않음"""
+        extracted = []
+
+        class FakePage:
+            def __init__(self, number):
+                self.number = number
+
+            def extract_text(self):
+                extracted.append(self.number)
+                return "x" * 100
+
+        class FakePdf:
+            pages = [FakePage(i) for i in range(1, 11)]
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *args):
+                return False
+
+        fake_module = type(sys)("pdfplumber")
+        fake_module.open = lambda stream: FakePdf()
+        monkeypatch.setitem(sys.modules, "pdfplumber", fake_module)
+
+        text = PdfConverter(max_chars=250).convert(b"%PDF", "big.pdf")
+
+        assert extracted == [1, 2, 3]
+        assert "--- Page 3 ---" in text
+        assert "--- Page 4 ---" not in text
+
 
 class TestWordConverter:
     """WordConverter 테스트"""
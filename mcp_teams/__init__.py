@@ -6,6 +6,7 @@ Microsoft Graph API를 사용한 Teams 서비스 (mcp_outlook 구조 참조)
 from .teams_service import TeamsService
 from .graph_teams_client import GraphTeamsClient
 from .teams_db_manager import TeamsDBManager
+from .teams_message_store import TeamsMessageStore
 from .teams_types import (
     ChatInfo,
     MessageInfo,
@@ -22,6 +23,7 @@ __all__ = [
     "GraphTeamsClient",
     # DB Manager
     "TeamsDBManager",
+    "TeamsMessageStore",
     # Types
     "ChatInfo",
     "MessageInfo",
@@ -4,13 +4,16 @@ Microsoft Graph API를 사용한 Teams 작업 처리
 session 모듈을 통한 인증 관리
 """
 
+import asyncio
 import logging
+from dataclasses import asdict
 from typing import Optional, List, Dict, Any
 import aiohttp
 
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.metrics import graph_trace_configs, track_auth
 
 from session import AuthManager
 from .teams_types import (
@@ -47,7 +50,7 @@ class GraphTeamsClient:
         if self._initialized:
             return True
 
-        self._session = aiohttp.ClientSession()
+        self._session = aiohttp.ClientSession(trace_configs=graph_trace_configs())
         self._initialized = True
         logger.info("GraphTeamsClient initialized")
         return True
@@ -70,7 +73,8 @@ class GraphTeamsClient:
             유효한 액세스 토큰 또는 None
         """
         try:
-            token = await self.auth_manager.validate_and_refresh_token(user_email)
+            with track_auth():
+                token = await self.auth_manager.validate_and_refresh_token(user_email)
             return token
         except Exception as e:
             logger.error(f"토큰 조회 실패: {str(e)}")
@@ -89,7 +93,7 @@ class GraphTeamsClient:
 
         Args:
             method: HTTP 메서드 (GET, POST, PATCH, DELETE)
-            endpoint: API 엔드포인트
+            endpoint: API 엔드포인트 (또는 @odata.nextLink 등 전체 URL)
             user_email: 사용자 이메일
             json_data: JSON 데이터
             timeout: 타임아웃 (초)
@@ -109,7 +113,7 @@ class GraphTeamsClient:
             "Content-Type": "application/json",
         }
 
-        url = f"{self.GRAPH_BASE_URL}{endpoint}"
+        url = endpoint if endpoint.startswith("https://") else f"{self.GRAPH_BASE_URL}{endpoint}"
 
         try:
             async with self._session.request(
@@ -130,12 +134,63 @@ class GraphTeamsClient:
                     return {
                         "success": False,
                         "error": f"API 요청 실패: {response.status}",
+                        "status": response.status,
                         "details": error_text,
                     }
         except Exception as e:
             logger.error(f"API 요청 오류: {str(e)}")
             return {"success": False, "error": str(e)}
 
+    async def _fetch_pages(
+        self,
+        endpoint: str,
+        user_email: str,
+        max_items: Optional[int] = None,
+        stop_at: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        @odata.nextLink를 따라 여러 페이지 조회
+
+        Args:
+            endpoint: 첫 페이지 엔드포인트
+            user_email: 사용자 이메일
+            max_items: 최대 항목 수 (None이면 끝까지)
+            stop_at: createdDateTime 내림차순 조회에서 이 시각 이전의 항목을 만나면 중단
+                (같은 시각의 항목은 포함하고, 중복 ID는 한 번만 반환)
+
+        Returns:
+            {"success": True, "items": [...], "delta_link": str|None, "pages": int}
+        """
+        items: List[Dict[str, Any]] = []
+        seen_ids = set()
+        pages = 0
+        next_url: Optional[str] = endpoint
+
+        while next_url:
+            result = await self._make_request("GET", next_url, user_email)
+            if not result.get("success"):
+                return result
+            pages += 1
+            data = result.get("data", {})
+
+            for item in data.get("value", []):
+                if stop_at and (item.get("createdDateTime") or "") < stop_at:
+                    return {"success": True, "items": items, "delta_link": None, "pages": pages}
+                item_id = item.get("id")
+                if item_id is not None:
+                    if item_id in seen_ids:
+                        continue
+                    seen_ids.add(item_id)
+                items.append(item)
+                if max_items is not None and len(items) >= max_items:
+                    return {"success": True, "items": items, "delta_link": None, "pages": pages}
+
+            if data.get("@odata.deltaLink"):
+                return {"success": True, "items": items, "delta_link": data["@odata.deltaLink"], "pages": pages}
+            next_url = data.get("@odata.nextLink")
+
+        return {"success": True, "items": items, "delta_link": None, "pages": pages}
+
     # ========================================================================
     # 채팅 관련 메서드
     # ========================================================================
@@ -229,6 +284,45 @@ class GraphTeamsClient:
 
         return result
 
+    async def fetch_chat_messages_since(
+        self,
+        user_email: str,
+        chat_id: Optional[str] = None,
+        since: Optional[str] = None,
+        max_messages: Optional[int] = 200,
+        page_size: int = 50,
+    ) -> Dict[str, Any]:
+        """
+        워터마크 이후의 채팅 메시지만 페이지 단위로 조회
+
+        createdDateTime 내림차순으로 조회하다가 since 이하의 메시지를 만나면 중단한다.
+
+        Args:
+            user_email: 사용자 이메일
+            chat_id: 채팅 ID (없으면 Notes 채팅 사용)
+            since: 마지막으로 저장된 createdDateTime (없으면 최근 max_messages개)
+            max_messages: 한 번에 가져올 최대 메시지 수 (None이면 since까지 전부)
+            page_size: 페이지 크기 ($top)
+
+        Returns:
+            {"success": True, "chat_id": str, "messages": [MessageInfo dict], "count": int, "pages": int}
+        """
+        chat_id = chat_id or self.NOTES_CHAT_ID
+        endpoint = f"/me/chats/{chat_id}/messages?$top={page_size}&$orderby=createdDateTime desc"
+        result = await self._fetch_pages(endpoint, user_email, max_items=max_messages, stop_at=since)
+
+        if result.get("success"):
+            messages = [asdict(MessageInfo.from_dict(m)) for m in result["items"]]
+            return {
+                "success": True,
+                "chat_id": chat_id,
+                "messages": messages,
+                "count": len(messages),
+                "pages": result["pages"],
+            }
+
+        return result
+
     async def send_chat_message(
         self,
         user_email: str,
@@ -371,6 +465,62 @@ class GraphTeamsClient:
 
         return result
 
+    async def fetch_channel_messages_delta(
+        self,
+        user_email: str,
+        team_id: str,
+        channel_id: str,
+        delta_link: Optional[str] = None,
+        page_size: int = 50,
+    ) -> Dict[str, Any]:
+        """
+        채널 메시지 delta 조회 (/messages/delta)
+
+        delta_link가 있으면 이전 동기화 이후 변경분만, 없으면 전체 루트 메시지를 조회한다.
+        delta_link가 만료되었으면(410 / syncStateNotFound) 전체 재동기화하고
+        결과에 delta_expired=True를 표시한다.
+
+        Args:
+            user_email: 사용자 이메일
+            team_id: 팀 ID
+            channel_id: 채널 ID
+            delta_link: 이전 조회의 @odata.deltaLink
+            page_size: 페이지 크기 ($top, 최초 조회에만 적용)
+
+        Returns:
+            {"success": True, "messages": [MessageInfo dict], "count": int, "delta_link": str|None,
+             "delta_expired": bool}
+        """
+        full_endpoint = f"/teams/{team_id}/channels/{channel_id}/messages/delta?$top={page_size}"
+        result = await self._fetch_pages(delta_link or full_endpoint, user_email)
+
+        delta_expired = bool(delta_link) and self._is_delta_expired(result)
+        if delta_expired:
+            logger.warning(f"delta 링크 만료, 전체 재동기화: {team_id}/{channel_id}")
+            result = await self._fetch_pages(full_endpoint, user_email)
+
+        if result.get("success"):
+            messages = [asdict(MessageInfo.from_dict(m)) for m in result["items"]]
+            return {
+                "success": True,
+                "messages": messages,
+                "count": len(messages),
+                "delta_link": result["delta_link"],
+                "delta_expired": delta_expired,
+                "pages": result["pages"],
+            }
+
+        if delta_expired:
+            result["delta_expired"] = True
+        return result
+
+    @staticmethod
+    def _is_delta_expired(result: Dict[str, Any]) -> bool:
+        """delta 조회 실패가 만료된 delta_link 때문인지 확인 (410 Gone / syncStateNotFound)"""
+        if result.get("success"):
+            return False
+        return result.get("status") == 410 or "syncStateNotFound" in (result.get("details") or "")
+
     async def send_channel_message(
         self,
         user_email: str,
@@ -444,3 +594,48 @@ class GraphTeamsClient:
             }
 
         return result
+
+    async def get_replies_for_messages(
+        self,
+        user_email: str,
+        team_id: str,
+        channel_id: str,
+        message_ids: List[str],
+        concurrency: int = 5,
+    ) -> Dict[str, Any]:
+        """
+        여러 메시지의 답글을 동시 조회 (동시 요청 수 제한, 답글 페이지 전체 조회)
+
+        Args:
+            user_email: 사용자 이메일
+            team_id: 팀 ID
+            channel_id: 채널 ID
+            message_ids: 상위 메시지 ID 목록
+            concurrency: 최대 동시 요청 수
+
+        Returns:
+            {"success": True, "replies": {message_id: [MessageInfo dict]}, "failed": {message_id: error}}
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def fetch(message_id: str) -> Dict[str, Any]:
+            async with semaphore:
+                endpoint = f"/teams/{team_id}/channels/{channel_id}/messages/{message_id}/replies"
+                return await self._fetch_pages(endpoint, user_email)
+
+        results = await asyncio.gather(*(fetch(mid) for mid in message_ids))
+
+        replies: Dict[str, List[Dict[str, Any]]] = {}
+        failed: Dict[str, str] = {}
+        for message_id, result in zip(message_ids, results):
+            if result.get("success"):
+                replies[message_id] = [asdict(MessageInfo.from_dict(r)) for r in result["items"]]
+            else:
+                failed[message_id] = result.get("error", "unknown error")
+
+        return {
+            "success": not failed or bool(replies),
+            "replies": replies,
+            "failed": failed,
+            "count": sum(len(r) for r in replies.values()),
+        }
@@ -8,11 +8,44 @@ import json
 import sqlite3
 import os
 import logging
+import time
 from datetime import datetime, timezone
 from typing import Optional, List, Dict, Any
 
+from .teams_name_index import ChatNameIndex, contains_hangul, name_key, normalize_name
+
 logger = logging.getLogger(__name__)
 
+# teams_chats UPSERT (sync_chats_to_db에서 executemany로 사용)
+_UPSERT_CHAT_SQL = """
+    INSERT INTO teams_chats (
+        user_id, chat_id, chat_type, topic, topic_kr,
+        member_count, members_json, peer_user_name, peer_user_email,
+        last_message_preview, last_message_time,
+        created_at, updated_at, last_sync_at, is_active
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, TRUE)
+    ON CONFLICT(user_id, chat_id) DO UPDATE SET
+        chat_type = excluded.chat_type,
+        topic = excluded.topic,
+        topic_kr = COALESCE(teams_chats.topic_kr, excluded.topic_kr),
+        member_count = excluded.member_count,
+        members_json = excluded.members_json,
+        peer_user_name = excluded.peer_user_name,
+        peer_user_email = excluded.peer_user_email,
+        last_message_preview = excluded.last_message_preview,
+        last_message_time = excluded.last_message_time,
+        updated_at = excluded.updated_at,
+        last_sync_at = excluded.last_sync_at,
+        is_active = TRUE
+"""
+
+
+def _rows_per_sec(rows: int, elapsed: float) -> float:
+    """초당 기록 행 수 계산 (elapsed가 0이면 rows 그대로 반환)"""
+    if elapsed <= 0:
+        return float(rows)
+    return round(rows / elapsed, 1)
+
 
 class TeamsDBManager:
     """Teams 채팅 DB 관리"""
@@ -31,6 +64,9 @@ class TeamsDBManager:
             resolved_path = os.path.join(base_dir, resolved_path)
 
         self.db_path = resolved_path
+        # 사용자별 인메모리 이름 인덱스 (sync 시 재구성)
+        self._name_indexes: Dict[str, ChatNameIndex] = {}
+        self._fts_enabled = False
         self._ensure_tables()
 
     def _ensure_tables(self):
@@ -69,6 +105,7 @@ class TeamsDBManager:
                 CREATE INDEX IF NOT EXISTS idx_teams_chats_is_active ON teams_chats(is_active);
             """)
             conn.commit()
+            self._ensure_name_fts(conn)
             logger.info("Teams tables created successfully")
         except Exception as e:
             logger.error(f"[ERROR] Failed to create Teams tables: {e}")
@@ -76,59 +113,222 @@ class TeamsDBManager:
         finally:
             conn.close()
 
-    def _contains_hangul(self, text: str) -> bool:
-        """한글 포함 여부 확인"""
+    def _ensure_name_fts(self, conn: sqlite3.Connection):
+        """
+        이름 검색용 FTS5 trigram 인덱스 생성
+
+        rowid는 teams_chats.id와 동일하며, name_key에는 정규화된
+        peer_user_name/topic/topic_kr이 저장된다. SQLite에 FTS5 trigram
+        토크나이저가 없으면 인메모리 인덱스만 사용한다.
+        """
+        cursor = conn.cursor()
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'teams_chats_fts'")
+        existed = cursor.fetchone() is not None
         try:
-            return any("\uac00" <= ch <= "\ud7a3" for ch in text)
-        except Exception:
-            return False
+            cursor.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS teams_chats_fts "
+                "USING fts5(name_key, tokenize='trigram')"
+            )
+        except sqlite3.OperationalError as e:
+            logger.warning(f"[WARN] FTS5 trigram 미지원, 인메모리 이름 인덱스만 사용: {e}")
+            return
+
+        self._fts_enabled = True
+        if not existed:
+            # 기존 데이터 백필
+            conn.create_function("teams_name_key", 3, name_key, deterministic=True)
+            cursor.execute(
+                """
+                INSERT INTO teams_chats_fts (rowid, name_key)
+                SELECT id, teams_name_key(peer_user_name, topic, topic_kr) FROM teams_chats
+                """
+            )
+            conn.commit()
 
-    async def find_chat_by_name(self, user_id: str, recipient_name: str) -> Optional[str]:
+    def _refresh_name_index(self, conn: sqlite3.Connection, user_id: str):
         """
-        사용자 이름으로 chat_id 검색 (활성/비활성 모두 검색, 활성 우선)
+        사용자의 FTS 행과 인메모리 이름 인덱스를 재구성 (호출자가 commit)
 
         Args:
+            conn: 열린 DB 연결
             user_id: 사용자 ID (이메일)
-            recipient_name: 검색할 상대방 이름
+        """
+        cursor = conn.cursor()
+        if self._fts_enabled:
+            conn.create_function("teams_name_key", 3, name_key, deterministic=True)
+            cursor.execute(
+                "DELETE FROM teams_chats_fts WHERE rowid IN (SELECT id FROM teams_chats WHERE user_id = ?)",
+                (user_id,)
+            )
+            cursor.execute(
+                """
+                INSERT INTO teams_chats_fts (rowid, name_key)
+                SELECT id, teams_name_key(peer_user_name, topic, topic_kr)
+                FROM teams_chats WHERE user_id = ?
+                """,
+                (user_id,)
+            )
+        self._name_indexes[user_id] = self._load_name_index(cursor, user_id)
+
+    def _load_name_index(self, cursor: sqlite3.Cursor, user_id: str) -> ChatNameIndex:
+        """DB에서 사용자의 채팅 이름을 읽어 인메모리 인덱스 생성"""
+        cursor.execute(
+            """
+            SELECT chat_id, peer_user_name, topic, topic_kr, is_active, last_message_time
+            FROM teams_chats WHERE user_id = ?
+            """,
+            (user_id,)
+        )
+        columns = [col[0] for col in cursor.description]
+        return ChatNameIndex(dict(zip(columns, row)) for row in cursor.fetchall())
+
+    def _search_name_fts(
+        self, cursor: sqlite3.Cursor, user_id: str, recipient_name: str, limit: int
+    ) -> List[Dict[str, Any]]:
+        """FTS5 trigram 인덱스로 채팅 후보 검색 (3자 이상 검색어만 가능)"""
+        query = normalize_name(recipient_name)
+        if not self._fts_enabled or len(query) < 3:
+            return []
+        cursor.execute(
+            """
+            SELECT c.chat_id, c.is_active, c.last_message_time
+            FROM teams_chats_fts f
+            JOIN teams_chats c ON c.id = f.rowid
+            WHERE f.name_key MATCH ? AND c.user_id = ?
+            ORDER BY c.is_active DESC, bm25(teams_chats_fts), c.last_message_time DESC
+            LIMIT ?
+            """,
+            ('"' + query.replace('"', '""') + '"', user_id, limit)
+        )
+        return [
+            {"chat_id": row[0], "score": 1, "is_active": bool(row[1]), "last_message_time": row[2] or ""}
+            for row in cursor.fetchall()
+        ]
+
+    def _lookup_chat_id_by_topic_en(
+        self, cursor: sqlite3.Cursor, user_id: str, topic_en: str
+    ) -> Optional[str]:
+        """영문 이름으로 활성 채팅의 chat_id 검색 (기존 커서/트랜잭션 재사용)"""
+        cursor.execute(
+            """
+            SELECT chat_id FROM teams_chats
+            WHERE user_id = ?
+            AND is_active = TRUE
+            AND (
+                LOWER(peer_user_name) LIKE LOWER(?)
+                OR LOWER(topic) LIKE LOWER(?)
+            )
+            ORDER BY last_message_time DESC
+            LIMIT 1
+            """,
+            (user_id, f"%{topic_en}%", f"%{topic_en}%")
+        )
+        row = cursor.fetchone()
+        return row[0] if row else None
+
+    def _chat_to_row(self, user_id: str, chat: Dict[str, Any], now: str) -> tuple:
+        """Graph API 채팅 정보를 teams_chats UPSERT 파라미터로 변환"""
+        chat_id = chat.get("id")
+        chat_type = chat.get("chatType") or chat.get("chat_type", "unknown")
+        topic = chat.get("topic", "")
+
+        # 멤버 정보 추출
+        members = chat.get("members", [])
+        member_count = len(members)
+        members_json = json.dumps(members, ensure_ascii=False)
+
+        # 1:1 채팅인 경우 상대방 정보 추출
+        peer_user_name = None
+        peer_user_email = None
+        if chat_type == "oneOnOne" and len(members) >= 2:
+            peer_member = members[1] if len(members) > 1 else members[0]
+            peer_user_name = peer_member.get("displayName", "")
+            peer_user_email = peer_member.get("email", "")
+
+        # 한글 이름(topic_kr) 추정
+        topic_kr = None
+        if chat_type == "oneOnOne" and peer_user_name:
+            if contains_hangul(peer_user_name):
+                topic_kr = peer_user_name
+        if not topic_kr and topic:
+            if contains_hangul(topic):
+                topic_kr = topic
+
+        # 마지막 메시지 정보
+        last_message_preview = ""
+        if chat.get("lastMessagePreview"):
+            body = chat["lastMessagePreview"].get("body", {})
+            last_message_preview = body.get("content", "") if isinstance(body, dict) else ""
+        last_message_time = chat.get("lastUpdatedDateTime", "")
+
+        return (
+            user_id, chat_id, chat_type, topic, topic_kr,
+            member_count, members_json, peer_user_name, peer_user_email,
+            last_message_preview, last_message_time,
+            now, now, now
+        )
+
+    async def find_chat_candidates(
+        self, user_id: str, recipient_name: str, limit: int = 5
+    ) -> List[Dict[str, Any]]:
+        """
+        이름으로 채팅 후보를 순위대로 검색 (활성/비활성 모두 검색)
+
+        인메모리 인덱스(prefix bisect + trigram)를 먼저 사용하고, 결과가 없으면
+        FTS5 trigram 인덱스를 조회한다 (다른 프로세스에서 동기화된 경우 대비).
+
+        Args:
+            user_id: 사용자 ID (이메일)
+            recipient_name: 검색할 상대방 이름 (한글/영문)
+            limit: 최대 후보 개수
 
         Returns:
-            chat_id 또는 None
+            [{"chat_id", "score", "is_active", "last_message_time"}, ...]
         """
+        index = self._name_indexes.get(user_id)
+        if index is not None:
+            candidates = index.search(recipient_name, limit)
+            if candidates:
+                return candidates
+
         conn = sqlite3.connect(self.db_path)
         try:
             cursor = conn.cursor()
-            cursor.execute(
-                """
-                SELECT chat_id FROM teams_chats
-                WHERE user_id = ?
-                AND (
-                    LOWER(peer_user_name) LIKE LOWER(?)
-                    OR LOWER(topic) LIKE LOWER(?)
-                    OR LOWER(topic_kr) LIKE LOWER(?)
-                )
-                ORDER BY
-                    is_active DESC,
-                    last_message_time DESC
-                LIMIT 1
-                """,
-                (user_id, f"%{recipient_name}%", f"%{recipient_name}%", f"%{recipient_name}%")
-            )
+            if index is None:
+                index = self._load_name_index(cursor, user_id)
+                self._name_indexes[user_id] = index
+                candidates = index.search(recipient_name, limit)
+                if candidates:
+                    return candidates
 
-            row = cursor.fetchone()
-            if row:
-                chat_id = row[0]
-                logger.info(f"사용자 '{recipient_name}' 채팅 찾음: {chat_id}")
-                return chat_id
-            else:
-                logger.warning(f"[WARN] 사용자 '{recipient_name}' 채팅을 찾을 수 없습니다")
-                return None
+            return self._search_name_fts(cursor, user_id, recipient_name, limit)
 
         except Exception as e:
             logger.error(f"[ERROR] 채팅 검색 오류: {str(e)}")
-            return None
+            return []
         finally:
             conn.close()
 
+    async def find_chat_by_name(self, user_id: str, recipient_name: str) -> Optional[str]:
+        """
+        사용자 이름으로 chat_id 검색 (활성/비활성 모두 검색, 활성 우선)
+
+        Args:
+            user_id: 사용자 ID (이메일)
+            recipient_name: 검색할 상대방 이름
+
+        Returns:
+            chat_id 또는 None
+        """
+        candidates = await self.find_chat_candidates(user_id, recipient_name, limit=1)
+        if candidates:
+            chat_id = candidates[0]["chat_id"]
+            logger.info(f"사용자 '{recipient_name}' 채팅 찾음: {chat_id}")
+            return chat_id
+
+        logger.warning(f"[WARN] 사용자 '{recipient_name}' 채팅을 찾을 수 없습니다")
+        return None
+
     async def save_korean_name(
         self,
         user_id: str,
@@ -157,24 +357,8 @@ class TeamsDBManager:
 
             # chat_id가 없으면 topic_en으로 검색
             if not chat_id and topic_en:
-                cursor.execute(
-                    """
-                    SELECT chat_id FROM teams_chats
-                    WHERE user_id = ?
-                    AND is_active = TRUE
-                    AND (
-                        LOWER(peer_user_name) LIKE LOWER(?)
-                        OR LOWER(topic) LIKE LOWER(?)
-                    )
-                    ORDER BY last_message_time DESC
-                    LIMIT 1
-                    """,
-                    (user_id, f"%{topic_en}%", f"%{topic_en}%")
-                )
-
-                row = cursor.fetchone()
-                if row:
-                    chat_id = row[0]
+                chat_id = self._lookup_chat_id_by_topic_en(cursor, user_id, topic_en)
+                if chat_id:
                     logger.info(f"영문 이름 '{topic_en}'으로 채팅 찾음: {chat_id}")
                 else:
                     return {"success": False, "message": f"영문 이름 '{topic_en}'으로 채팅을 찾을 수 없습니다"}
@@ -189,9 +373,12 @@ class TeamsDBManager:
                     """,
                     (topic_kr, datetime.now(timezone.utc).isoformat(), user_id, chat_id)
                 )
+                updated = cursor.rowcount
+                if updated > 0:
+                    self._refresh_name_index(conn, user_id)
                 conn.commit()
 
-                if cursor.rowcount > 0:
+                if updated > 0:
                     logger.info(f"한글 이름 저장: {chat_id} -> {topic_kr}")
                     return {
                         "success": True,
@@ -224,41 +411,78 @@ class TeamsDBManager:
         Returns:
             {"success": True, "saved": 3, "failed": 1, "results": [...]}
         """
-        results = []
-        saved_count = 0
-        failed_count = 0
+        start = time.perf_counter()
+        results: List[Optional[Dict[str, Any]]] = [None] * len(names)
+        updates = []
+        now = datetime.now(timezone.utc).isoformat()
 
-        for item in names:
-            topic_en = item.get("topic_en", "")
-            topic_kr = item.get("topic_kr", "")
+        conn = sqlite3.connect(self.db_path)
+        try:
+            cursor = conn.cursor()
+
+            # 하나의 트랜잭션에서 chat_id를 찾고 UPDATE는 executemany로 일괄 처리
+            for idx, item in enumerate(names):
+                topic_en = item.get("topic_en", "")
+                topic_kr = item.get("topic_kr", "")
+
+                if not topic_en or not topic_kr:
+                    results[idx] = {
+                        "topic_en": topic_en,
+                        "topic_kr": topic_kr,
+                        "success": False,
+                        "message": "topic_en과 topic_kr이 모두 필요합니다"
+                    }
+                    continue
+
+                chat_id = self._lookup_chat_id_by_topic_en(cursor, user_id, topic_en)
+                if not chat_id:
+                    results[idx] = {
+                        "topic_en": topic_en,
+                        "topic_kr": topic_kr,
+                        "success": False,
+                        "message": f"영문 이름 '{topic_en}'으로 채팅을 찾을 수 없습니다"
+                    }
+                    continue
 
-            if not topic_en or not topic_kr:
-                results.append({
+                updates.append((topic_kr, now, user_id, chat_id))
+                results[idx] = {
                     "topic_en": topic_en,
                     "topic_kr": topic_kr,
-                    "success": False,
-                    "message": "topic_en과 topic_kr이 모두 필요합니다"
-                })
-                failed_count += 1
-                continue
-
-            result = await self.save_korean_name(user_id, topic_kr, None, topic_en)
-            results.append({
-                "topic_en": topic_en,
-                "topic_kr": topic_kr,
-                **result
-            })
-
-            if result.get("success"):
-                saved_count += 1
-            else:
-                failed_count += 1
+                    "success": True,
+                    "message": f"한글 이름 '{topic_kr}' 저장 완료",
+                    "chat_id": chat_id
+                }
+
+            if updates:
+                cursor.executemany(
+                    """
+                    UPDATE teams_chats
+                    SET topic_kr = ?, updated_at = ?
+                    WHERE user_id = ? AND chat_id = ?
+                    """,
+                    updates
+                )
+                self._refresh_name_index(conn, user_id)
+            conn.commit()
+
+        except Exception as e:
+            logger.error(f"[ERROR] 한글 이름 배치 저장 오류: {str(e)}")
+            conn.rollback()
+            return {"success": False, "error": str(e)}
+        finally:
+            conn.close()
+
+        elapsed = time.perf_counter() - start
+        saved_count = len(updates)
+        logger.info(f"한글 이름 배치 저장: {saved_count}/{len(names)}건 ({elapsed * 1000:.1f}ms)")
 
         return {
             "success": True,
             "saved": saved_count,
-            "failed": failed_count,
+            "failed": len(names) - saved_count,
             "total": len(names),
+            "elapsed_ms": round(elapsed * 1000, 1),
+            "rows_per_sec": _rows_per_sec(saved_count, elapsed),
             "results": results
         }
 
@@ -273,102 +497,51 @@ class TeamsDBManager:
         Returns:
             동기화 결과
         """
+        start = time.perf_counter()
         conn = sqlite3.connect(self.db_path)
         try:
             cursor = conn.cursor()
             now = datetime.now(timezone.utc).isoformat()
+            rows = [self._chat_to_row(user_id, chat, now) for chat in chats]
 
-            # 현재 조회된 chat_id들
-            current_chat_ids = {chat.get("id") for chat in chats}
-
-            # 기존 DB의 활성 chat_id들 조회
+            # 현재 조회된 chat_id들을 임시 테이블에 적재
             cursor.execute(
-                "SELECT chat_id FROM teams_chats WHERE user_id = ? AND is_active = TRUE",
-                (user_id,)
+                "CREATE TEMP TABLE IF NOT EXISTS sync_chat_ids (chat_id TEXT PRIMARY KEY)"
+            )
+            cursor.execute("DELETE FROM sync_chat_ids")
+            cursor.executemany(
+                "INSERT OR IGNORE INTO sync_chat_ids (chat_id) VALUES (?)",
+                [(row[1],) for row in rows]
             )
-            existing_chat_ids = {row[0] for row in cursor.fetchall()}
 
-            # 삭제된 채팅 비활성화
-            deleted_chat_ids = existing_chat_ids - current_chat_ids
-            for chat_id in deleted_chat_ids:
-                cursor.execute(
-                    "UPDATE teams_chats SET is_active = FALSE, updated_at = ? WHERE user_id = ? AND chat_id = ?",
-                    (now, user_id, chat_id)
-                )
+            # 임시 테이블에 없는 기존 활성 채팅 비활성화 (단일 UPDATE)
+            cursor.execute(
+                """
+                UPDATE teams_chats SET is_active = FALSE, updated_at = ?
+                WHERE user_id = ? AND is_active = TRUE
+                AND chat_id NOT IN (SELECT chat_id FROM sync_chat_ids)
+                """,
+                (now, user_id)
+            )
+            deactivated = cursor.rowcount
 
             # 각 채팅 정보를 DB에 UPSERT
-            for chat in chats:
-                chat_id = chat.get("id")
-                chat_type = chat.get("chatType") or chat.get("chat_type", "unknown")
-                topic = chat.get("topic", "")
-
-                # 멤버 정보 추출
-                members = chat.get("members", [])
-                member_count = len(members)
-                members_json = json.dumps(members, ensure_ascii=False)
-
-                # 1:1 채팅인 경우 상대방 정보 추출
-                peer_user_name = None
-                peer_user_email = None
-                if chat_type == "oneOnOne" and len(members) >= 2:
-                    peer_member = members[1] if len(members) > 1 else members[0]
-                    peer_user_name = peer_member.get("displayName", "")
-                    peer_user_email = peer_member.get("email", "")
-
-                # 한글 이름(topic_kr) 추정
-                topic_kr = None
-                if chat_type == "oneOnOne" and peer_user_name:
-                    if self._contains_hangul(peer_user_name):
-                        topic_kr = peer_user_name
-                if not topic_kr and topic:
-                    if self._contains_hangul(topic):
-                        topic_kr = topic
-
-                # 마지막 메시지 정보
-                last_message_preview = ""
-                if chat.get("lastMessagePreview"):
-                    body = chat["lastMessagePreview"].get("body", {})
-                    last_message_preview = body.get("content", "") if isinstance(body, dict) else ""
-                last_message_time = chat.get("lastUpdatedDateTime", "")
-
-                # DB에 UPSERT
-                cursor.execute(
-                    """
-                    INSERT INTO teams_chats (
-                        user_id, chat_id, chat_type, topic, topic_kr,
-                        member_count, members_json, peer_user_name, peer_user_email,
-                        last_message_preview, last_message_time,
-                        created_at, updated_at, last_sync_at, is_active
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, TRUE)
-                    ON CONFLICT(user_id, chat_id) DO UPDATE SET
-                        chat_type = excluded.chat_type,
-                        topic = excluded.topic,
-                        topic_kr = COALESCE(teams_chats.topic_kr, excluded.topic_kr),
-                        member_count = excluded.member_count,
-                        members_json = excluded.members_json,
-                        peer_user_name = excluded.peer_user_name,
-                        peer_user_email = excluded.peer_user_email,
-                        last_message_preview = excluded.last_message_preview,
-                        last_message_time = excluded.last_message_time,
-                        updated_at = excluded.updated_at,
-                        last_sync_at = excluded.last_sync_at,
-                        is_active = TRUE
-                    """,
-                    (
-                        user_id, chat_id, chat_type, topic, topic_kr,
-                        member_count, members_json, peer_user_name, peer_user_email,
-                        last_message_preview, last_message_time,
-                        now, now, now
-                    )
-                )
+            cursor.executemany(_UPSERT_CHAT_SQL, rows)
+            self._refresh_name_index(conn, user_id)
 
             conn.commit()
-            logger.info(f"DB 동기화 완료: {len(chats)}개 채팅, {len(deleted_chat_ids)}개 비활성화")
+            elapsed = time.perf_counter() - start
+            logger.info(
+                f"DB 동기화 완료: {len(chats)}개 채팅, {deactivated}개 비활성화 "
+                f"({elapsed * 1000:.1f}ms)"
+            )
 
             return {
                 "success": True,
                 "synced": len(chats),
-                "deactivated": len(deleted_chat_ids),
+                "deactivated": deactivated,
+                "elapsed_ms": round(elapsed * 1000, 1),
+                "rows_per_sec": _rows_per_sec(len(rows) + deactivated, elapsed),
             }
 
         except Exception as e:
@@ -0,0 +1,276 @@
+"""
+Teams Message Store
+채팅/채널 메시지의 로컬 SQLite 저장소
+증분 동기화 워터마크(createdDateTime) 및 채널 delta 링크 관리
+"""
+
+import json
+import sqlite3
+import os
+import logging
+from datetime import datetime, timezone
+from typing import Optional, List, Dict, Any
+
+logger = logging.getLogger(__name__)
+
+
+def channel_container_id(team_id: str, channel_id: str) -> str:
+    """채널 메시지 저장용 컨테이너 ID"""
+    return f"{team_id}/{channel_id}"
+
+
+class TeamsMessageStore:
+    """
+    Teams 메시지 로컬 저장소
+
+    - teams_messages: (user_id, container_id, message_id) 단위 메시지 저장
+      container_id는 채팅이면 chat_id, 채널이면 "team_id/channel_id"
+    - teams_message_sync: 컨테이너별 워터마크 / delta 링크
+    """
+
+    def __init__(self, db_path: str = "database/auth.db"):
+        """
+        데이터베이스 초기화
+
+        Args:
+            db_path: 데이터베이스 파일 경로
+        """
+        resolved_path = os.path.expanduser(db_path)
+        if not os.path.isabs(resolved_path):
+            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            resolved_path = os.path.join(base_dir, resolved_path)
+
+        self.db_path = resolved_path
+        self._ensure_tables()
+
+    def _ensure_tables(self):
+        """메시지 저장 테이블 생성"""
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.executescript("""
+                -- Teams 메시지 테이블
+                CREATE TABLE IF NOT EXISTS teams_messages (
+                    user_id TEXT NOT NULL,
+                    container_id TEXT NOT NULL,
+                    message_id TEXT NOT NULL,
+                    parent_id TEXT,
+                    created_datetime TEXT,
+                    last_modified_datetime TEXT,
+                    message_json TEXT NOT NULL,
+                    stored_at TEXT,
+                    PRIMARY KEY (user_id, container_id, message_id)
+                );
+
+                -- 동기화 상태 테이블
+                CREATE TABLE IF NOT EXISTS teams_message_sync (
+                    user_id TEXT NOT NULL,
+                    container_id TEXT NOT NULL,
+                    watermark TEXT,
+                    delta_link TEXT,
+                    last_sync_at TEXT,
+                    PRIMARY KEY (user_id, container_id)
+                );
+
+                -- 인덱스 생성
+                CREATE INDEX IF NOT EXISTS idx_teams_messages_created
+                    ON teams_messages(user_id, container_id, created_datetime DESC, message_id DESC);
+                CREATE INDEX IF NOT EXISTS idx_teams_messages_parent
+                    ON teams_messages(user_id, container_id, parent_id);
+            """)
+            conn.commit()
+        except Exception as e:
+            logger.error(f"[ERROR] Failed to create Teams message tables: {e}")
+            raise
+        finally:
+            conn.close()
+
+    async def get_sync_state(self, user_id: str, container_id: str) -> Dict[str, Any]:
+        """
+        컨테이너의 동기화 상태 조회
+
+        Args:
+            user_id: 사용자 ID (이메일)
+            container_id: chat_id 또는 "team_id/channel_id"
+
+        Returns:
+            {"watermark": str|None, "delta_link": str|None, "last_sync_at": str|None}
+        """
+        conn = sqlite3.connect(self.db_path)
+        try:
+            row = conn.execute(
+                """
+                SELECT watermark, delta_link, last_sync_at FROM teams_message_sync
+                WHERE user_id = ? AND container_id = ?
+                """,
+                (user_id, container_id)
+            ).fetchone()
+            if not row:
+                return {"watermark": None, "delta_link": None, "last_sync_at": None}
+            return {"watermark": row[0], "delta_link": row[1], "last_sync_at": row[2]}
+        finally:
+            conn.close()
+
+    async def clear_delta_link(self, user_id: str, container_id: str) -> None:
+        """
+        만료된 delta 링크 삭제 (다음 동기화는 전체 재동기화)
+
+        Args:
+            user_id: 사용자 ID (이메일)
+            container_id: "team_id/channel_id"
+        """
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.execute(
+                "UPDATE teams_message_sync SET delta_link = NULL WHERE user_id = ? AND container_id = ?",
+                (user_id, container_id)
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    async def save_messages(
+        self,
+        user_id: str,
+        container_id: str,
+        messages: List[Dict[str, Any]],
+        parent_id: Optional[str] = None,
+        delta_link: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        메시지를 저장하고 워터마크/delta 링크를 갱신 (단일 트랜잭션)
+
+        워터마크는 저장된 메시지 중 가장 늦은 created_datetime으로 유지된다.
+        답글(parent_id 지정)은 워터마크를 갱신하지 않는다.
+
+        Args:
+            user_id: 사용자 ID (이메일)
+            container_id: chat_id 또는 "team_id/channel_id"
+            messages: MessageInfo dict 목록 (asdict 결과)
+            parent_id: 답글인 경우 상위 메시지 ID
+            delta_link: 채널 delta 조회의 @odata.deltaLink
+
+        Returns:
+            {"saved": int, "watermark": str|None}
+        """
+        now = datetime.now(timezone.utc).isoformat()
+        rows = [
+            (
+                user_id, container_id, m.get("id"), parent_id,
+                m.get("created_datetime"), m.get("last_modified_datetime"),
+                json.dumps(m, ensure_ascii=False), now,
+            )
+            for m in messages
+            if m.get("id")
+        ]
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            cursor = conn.cursor()
+            cursor.executemany(
+                """
+                INSERT INTO teams_messages (
+                    user_id, container_id, message_id, parent_id,
+                    created_datetime, last_modified_datetime, message_json, stored_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(user_id, container_id, message_id) DO UPDATE SET
+                    parent_id = COALESCE(excluded.parent_id, teams_messages.parent_id),
+                    created_datetime = excluded.created_datetime,
+                    last_modified_datetime = excluded.last_modified_datetime,
+                    message_json = excluded.message_json,
+                    stored_at = excluded.stored_at
+                """,
+                rows
+            )
+
+            watermark = None
+            if parent_id is None:
+                watermark = max((r[4] for r in rows if r[4]), default=None)
+            cursor.execute(
+                """
+                INSERT INTO teams_message_sync (user_id, container_id, watermark, delta_link, last_sync_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(user_id, container_id) DO UPDATE SET
+                    watermark = MAX(COALESCE(teams_message_sync.watermark, ''), COALESCE(excluded.watermark, '')),
+                    delta_link = COALESCE(excluded.delta_link, teams_message_sync.delta_link),
+                    last_sync_at = excluded.last_sync_at
+                """,
+                (user_id, container_id, watermark, delta_link, now)
+            )
+            conn.commit()
+
+            state = cursor.execute(
+                "SELECT watermark FROM teams_message_sync WHERE user_id = ? AND container_id = ?",
+                (user_id, container_id)
+            ).fetchone()
+            return {"saved": len(rows), "watermark": (state[0] or None) if state else None}
+
+        except Exception as e:
+            logger.error(f"[ERROR] 메시지 저장 오류: {str(e)}")
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    async def get_recent_messages(
+        self,
+        user_id: str,
+        container_id: str,
+        limit: int = 50,
+    ) -> List[Dict[str, Any]]:
+        """
+        최근 메시지 N개 조회 (답글 제외, 최신순)
+
+        Args:
+            user_id: 사용자 ID (이메일)
+            container_id: chat_id 또는 "team_id/channel_id"
+            limit: 조회할 메시지 개수
+
+        Returns:
+            MessageInfo dict 목록
+        """
+        conn = sqlite3.connect(self.db_path)
+        try:
+            rows = conn.execute(
+                """
+                SELECT message_json FROM teams_messages
+                WHERE user_id = ? AND container_id = ? AND parent_id IS NULL
+                ORDER BY created_datetime DESC, message_id DESC
+                LIMIT ?
+                """,
+                (user_id, container_id, limit)
+            ).fetchall()
+            return [json.loads(row[0]) for row in rows]
+        finally:
+            conn.close()
+
+    async def get_replies(
+        self,
+        user_id: str,
+        container_id: str,
+        parent_id: str,
+    ) -> List[Dict[str, Any]]:
+        """
+        저장된 답글 조회 (작성순)
+
+        Args:
+            user_id: 사용자 ID (이메일)
+            container_id: "team_id/channel_id"
+            parent_id: 상위 메시지 ID
+
+        Returns:
+            MessageInfo dict 목록
+        """
+        conn = sqlite3.connect(self.db_path)
+        try:
+            rows = conn.execute(
+                """
+                SELECT message_json FROM teams_messages
+                WHERE user_id = ? AND container_id = ? AND parent_id = ?
+                ORDER BY created_datetime ASC, message_id ASC
+                """,
+                (user_id, container_id, parent_id)
+            ).fetchall()
+            return [json.loads(row[0]) for row in rows]
+        finally:
+            conn.close()
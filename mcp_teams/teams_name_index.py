@@ -0,0 +1,157 @@
+"""
+Teams Name Index
+채팅 상대방/채팅방 이름 검색용 인메모리 인덱스
+- 정규화된 이름 키의 정렬 리스트 (bisect 기반 prefix 검색)
+- trigram posting list (부분 문자열 검색)
+"""
+
+import unicodedata
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+# 한글 호칭 접미사 (검색어 끝에 붙은 경우 제거)
+HANGUL_SUFFIXES = ("님", "씨")
+
+# 매칭 점수 (높을수록 우선)
+SCORE_EXACT = 3
+SCORE_PREFIX = 2
+SCORE_SUBSTRING = 1
+
+
+def contains_hangul(text: Optional[str]) -> bool:
+    """한글 음절 포함 여부 확인"""
+    if not text:
+        return False
+    return any("\uac00" <= ch <= "\ud7a3" for ch in text)
+
+
+def normalize_name(text: Optional[str]) -> str:
+    """
+    검색용 이름 정규화
+
+    - NFKC 정규화 (전각 문자, 호환 자모를 표준 형태로)
+    - casefold (대소문자 무시)
+    - 공백 제거 ("홍 길동" == "홍길동", "John Doe" -> "johndoe")
+    - 한글 이름은 끝의 호칭(님/씨) 제거
+
+    Args:
+        text: 원본 이름
+
+    Returns:
+        정규화된 검색 키 (빈 문자열 가능)
+    """
+    if not text:
+        return ""
+    key = "".join(unicodedata.normalize("NFKC", text).casefold().split())
+    if contains_hangul(key):
+        for suffix in HANGUL_SUFFIXES:
+            if len(key) > len(suffix) + 1 and key.endswith(suffix):
+                key = key[: -len(suffix)]
+                break
+    return key
+
+
+def name_key(*names: Optional[str]) -> str:
+    """여러 이름 컬럼을 FTS 인덱싱용 단일 문자열로 결합"""
+    return " ".join(key for key in (normalize_name(n) for n in names) if key)
+
+
+def trigrams(key: str) -> Set[str]:
+    """정규화된 키의 trigram 집합"""
+    return {key[i:i + 3] for i in range(len(key) - 2)}
+
+
+class ChatNameIndex:
+    """
+    사용자 한 명의 채팅 이름 인덱스
+
+    entries는 (chat_id, is_active, last_message_time, 이름 키 목록) 형태이며,
+    prefix 검색은 정렬된 키 리스트의 bisect로, 부분 문자열 검색은
+    trigram posting list 교집합으로 후보를 좁힌 뒤 검증한다.
+    """
+
+    def __init__(self, rows: Iterable[Dict[str, Any]]):
+        """
+        Args:
+            rows: chat_id, peer_user_name, topic, topic_kr, is_active,
+                  last_message_time 키를 가진 채팅 행 목록
+        """
+        self._entries: List[Tuple[str, bool, str, Tuple[str, ...]]] = []
+        self._sorted_keys: List[Tuple[str, int]] = []
+        self._trigrams: Dict[str, Set[int]] = {}
+
+        for idx, row in enumerate(rows):
+            keys = tuple(
+                {k for k in (normalize_name(row.get(col)) for col in ("peer_user_name", "topic", "topic_kr")) if k}
+            )
+            self._entries.append(
+                (row["chat_id"], bool(row.get("is_active")), row.get("last_message_time") or "", keys)
+            )
+            for key in keys:
+                self._sorted_keys.append((key, idx))
+                for gram in trigrams(key):
+                    self._trigrams.setdefault(gram, set()).add(idx)
+
+        self._sorted_keys.sort()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _prefix_matches(self, query: str) -> Dict[int, int]:
+        """prefix/완전 일치 후보 (bisect로 시작 위치 탐색)"""
+        matches: Dict[int, int] = {}
+        pos = bisect_left(self._sorted_keys, (query, -1))
+        while pos < len(self._sorted_keys):
+            key, idx = self._sorted_keys[pos]
+            if not key.startswith(query):
+                break
+            score = SCORE_EXACT if key == query else SCORE_PREFIX
+            matches[idx] = max(matches.get(idx, 0), score)
+            pos += 1
+        return matches
+
+    def _substring_matches(self, query: str) -> Set[int]:
+        """부분 문자열 후보 (trigram 교집합 후 검증, 3자 미만은 전체 검증)"""
+        grams = trigrams(query)
+        if grams:
+            postings = sorted((self._trigrams.get(g, set()) for g in grams), key=len)
+            candidates = set.intersection(*postings) if postings else set()
+        else:
+            candidates = set(range(len(self._entries)))
+        return {idx for idx in candidates if any(query in key for key in self._entries[idx][3])}
+
+    def search(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
+        """
+        이름으로 채팅 후보 검색
+
+        정렬 기준: 매칭 점수(완전 > prefix > 부분) → 활성 여부 → 마지막 메시지 시간
+
+        Args:
+            query: 검색어 (정규화 전)
+            limit: 최대 반환 개수
+
+        Returns:
+            [{"chat_id", "score", "is_active", "last_message_time"}, ...]
+        """
+        q = normalize_name(query)
+        if not q:
+            return []
+
+        scores = self._prefix_matches(q)
+        for idx in self._substring_matches(q):
+            scores.setdefault(idx, SCORE_SUBSTRING)
+
+        ranked = sorted(
+            scores.items(),
+            key=lambda item: (item[1], self._entries[item[0]][1], self._entries[item[0]][2]),
+            reverse=True,
+        )
+        return [
+            {
+                "chat_id": self._entries[idx][0],
+                "score": score,
+                "is_active": self._entries[idx][1],
+                "last_message_time": self._entries[idx][2],
+            }
+            for idx, score in ranked[:limit]
+        ]
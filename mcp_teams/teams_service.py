@@ -8,6 +8,7 @@ from typing import Dict, Any, Optional, List
 
 from .graph_teams_client import GraphTeamsClient
 from .teams_db_manager import TeamsDBManager
+from .teams_message_store import TeamsMessageStore, channel_container_id
 from .teams_types import (
     ChatType,
     MessageImportance,
@@ -51,6 +52,7 @@ class TeamsService:
     def __init__(self):
         self._client: Optional[GraphTeamsClient] = None
         self._db_manager: Optional[TeamsDBManager] = None
+        self._message_store: Optional[TeamsMessageStore] = None
         self._initialized = False
 
     async def initialize(self) -> bool:
@@ -60,6 +62,7 @@ class TeamsService:
 
         self._client = GraphTeamsClient()
         self._db_manager = TeamsDBManager()
+        self._message_store = TeamsMessageStore()
 
         if await self._client.initialize():
             self._initialized = True
@@ -310,6 +313,176 @@ class TeamsService:
             return {"success": False, "error": "사용자 이메일이 필요합니다. 로그인이 필요합니다."}
         return await self._client.get_message_replies(user_email, team_id, channel_id, message_id)
 
+    # ========================================================================
+    # 메시지 히스토리 (로컬 저장소 + 증분 동기화)
+    # ========================================================================
+
+    @mcp_service(
+        tool_name="handler_teams_get_chat_history",
+        server_name="teams",
+        service_name="get_chat_history",
+        category="teams_message",
+        tags=["query", "message", "sync"],
+        priority=5,
+        description="채팅 최근 메시지 조회 (워터마크 이후 새 메시지만 가져와 로컬 저장소에서 응답)",
+    )
+    async def get_chat_history(
+        self,
+        chat_id: Optional[str] = None,
+        limit: int = 50,
+        refresh: bool = True,
+        user_email: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        채팅의 최근 N개 메시지를 로컬 저장소에서 조회
+
+        Args:
+            chat_id: 채팅 ID (없으면 Notes 채팅)
+            limit: 조회할 메시지 개수
+            refresh: True면 저장된 워터마크 이후 메시지를 먼저 동기화
+            user_email: 사용자 이메일 (선택, 없으면 기본 사용자)
+
+        Returns:
+            메시지 목록 (최신순)
+        """
+        self._ensure_initialized()
+        if not user_email:
+            user_email = _get_default_user_email()
+        if not user_email:
+            return {"success": False, "error": "사용자 이메일이 필요합니다. 로그인이 필요합니다."}
+
+        chat_id = chat_id or self._client.NOTES_CHAT_ID
+        fetched = 0
+        if refresh:
+            state = await self._message_store.get_sync_state(user_email, chat_id)
+            # 최초 동기화는 최근 메시지만, 이후에는 워터마크까지 빠짐없이 조회
+            watermark = state.get("watermark")
+            result = await self._client.fetch_chat_messages_since(
+                user_email,
+                chat_id,
+                since=watermark,
+                max_messages=None if watermark else max(limit, 200),
+            )
+            if not result.get("success"):
+                return result
+            fetched = result.get("count", 0)
+            await self._message_store.save_messages(user_email, chat_id, result.get("messages", []))
+
+        messages = await self._message_store.get_recent_messages(user_email, chat_id, limit)
+        return {
+            "success": True,
+            "messages": messages,
+            "count": len(messages),
+            "fetched": fetched,
+        }
+
+    @mcp_service(
+        tool_name="handler_teams_get_channel_history",
+        server_name="teams",
+        service_name="get_channel_history",
+        category="teams_message",
+        tags=["query", "channel", "message", "sync"],
+        priority=5,
+        description="채널 최근 메시지 조회 (delta 동기화 후 로컬 저장소에서 응답)",
+    )
+    async def get_channel_history(
+        self,
+        team_id: str,
+        channel_id: str,
+        limit: int = 50,
+        refresh: bool = True,
+        include_replies: bool = False,
+        concurrency: int = 5,
+        user_email: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        채널의 최근 N개 메시지를 로컬 저장소에서 조회
+
+        Args:
+            team_id: 팀 ID
+            channel_id: 채널 ID
+            limit: 조회할 메시지 개수
+            refresh: True면 /messages/delta로 변경분을 먼저 동기화
+            include_replies: True면 변경된 메시지의 답글을 동시 조회하여 저장하고 결과에 포함
+            concurrency: 답글 조회 최대 동시 요청 수
+            user_email: 사용자 이메일 (선택, 없으면 기본 사용자)
+
+        Returns:
+            메시지 목록 (최신순, include_replies면 각 메시지에 replies 포함)
+        """
+        self._ensure_initialized()
+        if not user_email:
+            user_email = _get_default_user_email()
+        if not user_email:
+            return {"success": False, "error": "사용자 이메일이 필요합니다. 로그인이 필요합니다."}
+
+        container_id = channel_container_id(team_id, channel_id)
+        fetched = 0
+        if refresh:
+            state = await self._message_store.get_sync_state(user_email, container_id)
+            result = await self._client.fetch_channel_messages_delta(
+                user_email, team_id, channel_id, delta_link=state.get("delta_link")
+            )
+            if result.get("delta_expired"):
+                await self._message_store.clear_delta_link(user_email, container_id)
+            if not result.get("success"):
+                return result
+            changed = result.get("messages", [])
+            fetched = len(changed)
+            await self._message_store.save_messages(
+                user_email, container_id, changed, delta_link=result.get("delta_link")
+            )
+
+            if include_replies and changed:
+                replies_result = await self._client.get_replies_for_messages(
+                    user_email, team_id, channel_id, [m["id"] for m in changed], concurrency=concurrency
+                )
+                for parent_id, replies in replies_result.get("replies", {}).items():
+                    await self._message_store.save_messages(
+                        user_email, container_id, replies, parent_id=parent_id
+                    )
+
+        messages = await self._message_store.get_recent_messages(user_email, container_id, limit)
+        if include_replies:
+            for message in messages:
+                message["replies"] = await self._message_store.get_replies(
+                    user_email, container_id, message["id"]
+                )
+
+        return {
+            "success": True,
+            "messages": messages,
+            "count": len(messages),
+            "fetched": fetched,
+        }
+
+    @mcp_service(
+        tool_name="handler_teams_get_replies_batch",
+        server_name="teams",
+        service_name="get_replies_batch",
+        category="teams_message",
+        tags=["query", "reply", "batch"],
+        priority=5,
+        description="여러 채널 메시지의 답글을 동시 조회",
+    )
+    async def get_replies_batch(
+        self,
+        team_id: str,
+        channel_id: str,
+        message_ids: List[str],
+        concurrency: int = 5,
+        user_email: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """여러 메시지의 답글을 동시 조회 (동시 요청 수 제한)"""
+        self._ensure_initialized()
+        if not user_email:
+            user_email = _get_default_user_email()
+        if not user_email:
+            return {"success": False, "error": "사용자 이메일이 필요합니다. 로그인이 필요합니다."}
+        return await self._client.get_replies_for_messages(
+            user_email, team_id, channel_id, message_ids, concurrency=concurrency
+        )
+
     # ========================================================================
     # 한글 이름 관련 메서드 (DB 연동)
     # ========================================================================
@@ -470,6 +643,7 @@ class TeamsService:
             "chats_count": len(chats),
             "synced": sync_result.get("synced", 0),
             "deactivated": sync_result.get("deactivated", 0),
+            "rows_per_sec": sync_result.get("rows_per_sec", 0),
         }
 
     @mcp_service(
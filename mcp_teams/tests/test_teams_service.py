@@ -5,6 +5,7 @@ Teams Service Tests
 
 import pytest
 import asyncio
+import sqlite3
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import sys
@@ -234,6 +235,123 @@ class TestTeamsService:
         assert result["success"] is True
         assert result["count"] == 1
 
+    @pytest.mark.asyncio
+    async def test_get_chat_history_incremental(self, service, mock_client, tmp_path):
+        """채팅 히스토리 증분 동기화 테스트 (워터마크 전달, 로컬 저장소 응답)"""
+        from mcp_teams.teams_message_store import TeamsMessageStore
+
+        mock_client.NOTES_CHAT_ID = "48:notes"
+        mock_client.fetch_chat_messages_since = AsyncMock(return_value={
+            "success": True,
+            "messages": [
+                {"id": "m2", "body_content": "World", "created_datetime": "2026-01-01T00:00:02Z"},
+                {"id": "m1", "body_content": "Hello", "created_datetime": "2026-01-01T00:00:01Z"},
+            ],
+            "count": 2,
+        })
+
+        service._client = mock_client
+        service._message_store = TeamsMessageStore(db_path=str(tmp_path / "teams.db"))
+        service._initialized = True
+
+        result = await service.get_chat_history(chat_id="c1", limit=1, user_email="test@example.com")
+        assert result["success"] is True
+        assert [m["id"] for m in result["messages"]] == ["m2"]
+        assert mock_client.fetch_chat_messages_since.call_args.kwargs["since"] is None
+
+        mock_client.fetch_chat_messages_since.return_value = {"success": True, "messages": [], "count": 0}
+        result = await service.get_chat_history(chat_id="c1", user_email="test@example.com")
+        assert result["count"] == 2
+        assert result["fetched"] == 0
+        assert mock_client.fetch_chat_messages_since.call_args.kwargs["since"] == "2026-01-01T00:00:02Z"
+
+    @pytest.mark.asyncio
+    async def test_fetch_pages_stops_at_watermark(self):
+        """nextLink 페이지 조회가 워터마크에서 중단되는지 테스트"""
+        from mcp_teams.graph_teams_client import GraphTeamsClient
+
+        client = GraphTeamsClient(auth_manager=MagicMock())
+        client._make_request = AsyncMock(side_effect=[
+            {"success": True, "data": {
+                "value": [{"id": "m3", "createdDateTime": "3"}, {"id": "m2", "createdDateTime": "2"}],
+                "@odata.nextLink": "https://graph.microsoft.com/v1.0/next",
+            }},
+            {"success": True, "data": {"value": [{"id": "m1", "createdDateTime": "1"}]}},
+        ])
+
+        result = await client.fetch_chat_messages_since("test@example.com", "c1", since="2")
+
+        assert [m["id"] for m in result["messages"]] == ["m3", "m2"]
+        assert result["pages"] == 2
+        assert client._make_request.call_args_list[1].args[1] == "https://graph.microsoft.com/v1.0/next"
+
+    @pytest.mark.asyncio
+    async def test_fetch_pages_keeps_watermark_ties(self):
+        """워터마크와 같은 시각의 메시지는 포함하고 페이지 간 중복 ID는 한 번만 반환"""
+        from mcp_teams.graph_teams_client import GraphTeamsClient
+
+        client = GraphTeamsClient(auth_manager=MagicMock())
+        client._make_request = AsyncMock(side_effect=[
+            {"success": True, "data": {
+                "value": [{"id": "m3", "createdDateTime": "2"}, {"id": "m2", "createdDateTime": "2"}],
+                "@odata.nextLink": "https://graph.microsoft.com/v1.0/next",
+            }},
+            {"success": True, "data": {"value": [
+                {"id": "m2", "createdDateTime": "2"}, {"id": "m1", "createdDateTime": "1"},
+            ]}},
+        ])
+
+        result = await client.fetch_chat_messages_since("test@example.com", "c1", since="2")
+
+        assert [m["id"] for m in result["messages"]] == ["m3", "m2"]
+        assert result["pages"] == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_delta_link_resyncs(self):
+        """만료된 delta 링크(410)는 전체 재동기화로 대체"""
+        from mcp_teams.graph_teams_client import GraphTeamsClient
+
+        client = GraphTeamsClient(auth_manager=MagicMock())
+        client._make_request = AsyncMock(side_effect=[
+            {"success": False, "error": "API 요청 실패: 410", "status": 410,
+             "details": '{"error": {"code": "syncStateNotFound"}}'},
+            {"success": True, "data": {
+                "value": [{"id": "m1", "createdDateTime": "1"}],
+                "@odata.deltaLink": "https://graph.microsoft.com/v1.0/delta-new",
+            }},
+        ])
+
+        result = await client.fetch_channel_messages_delta(
+            "test@example.com", "t1", "ch1", delta_link="https://graph.microsoft.com/v1.0/delta-old"
+        )
+
+        assert result["success"] is True
+        assert result["delta_expired"] is True
+        assert result["delta_link"] == "https://graph.microsoft.com/v1.0/delta-new"
+        assert [m["id"] for m in result["messages"]] == ["m1"]
+        assert client._make_request.call_args_list[1].args[1] == "/teams/t1/channels/ch1/messages/delta?$top=50"
+
+    @pytest.mark.asyncio
+    async def test_channel_history_clears_expired_delta_link(self, service, mock_client, tmp_path):
+        """delta 링크가 만료되면 재동기화가 실패해도 저장된 링크를 삭제"""
+        from mcp_teams.teams_message_store import TeamsMessageStore
+
+        store = TeamsMessageStore(db_path=str(tmp_path / "teams.db"))
+        await store.save_messages("test@example.com", "t1/ch1", [], delta_link="https://graph.microsoft.com/v1.0/delta-old")
+        mock_client.fetch_channel_messages_delta = AsyncMock(return_value={
+            "success": False, "error": "API 요청 실패: 503", "delta_expired": True,
+        })
+
+        service._client = mock_client
+        service._message_store = store
+        service._initialized = True
+
+        result = await service.get_channel_history("t1", "ch1", user_email="test@example.com")
+        assert result["success"] is False
+        assert mock_client.fetch_channel_messages_delta.call_args.kwargs["delta_link"] == \
+            "https://graph.microsoft.com/v1.0/delta-old"
+        assert (await store.get_sync_state("test@example.com", "t1/ch1"))["delta_link"] is None
+
     @pytest.mark.asyncio
     async def test_not_initialized_error(self, service):
         """초기화되지 않은 상태에서 호출 시 에러 테스트"""
@@ -385,5 +503,89 @@ class TestTeamsService:
         assert result["count"] == 2
 
 
+
+class TestTeamsDBManager:
+    """TeamsDBManager 일괄 처리 테스트 (실제 SQLite 사용)"""
+
+    @pytest.fixture
+    def db_manager(self, tmp_path):
+        """임시 DB를 사용하는 TeamsDBManager"""
+        from mcp_teams.teams_db_manager import TeamsDBManager
+        return TeamsDBManager(db_path=str(tmp_path / "teams.db"))
+
+    @staticmethod
+    def _make_chat(idx: int, name: str) -> dict:
+        return {
+            "id": f"c{idx}",
+            "chatType": "oneOnOne",
+            "topic": "",
+            "members": [{"displayName": "Me"}, {"displayName": name, "email": f"u{idx}@example.com"}],
+            "lastUpdatedDateTime": f"2026-01-01T00:00:{idx % 60:02d}Z",
+        }
+
+    @pytest.mark.asyncio
+    async def test_sync_chats_to_db_bulk(self, db_manager):
+        """대량 동기화 및 임시 테이블 기반 비활성화 테스트"""
+        chats = [self._make_chat(i, f"User {i}") for i in range(2000)]
+        result = await db_manager.sync_chats_to_db("test@example.com", chats)
+
+        assert result["success"] is True
+        assert result["synced"] == 2000
+        assert result["deactivated"] == 0
+        assert result["rows_per_sec"] > 0
+
+        result = await db_manager.sync_chats_to_db("test@example.com", chats[:1500])
+        assert result["deactivated"] == 500
+
+        active = await db_manager.get_chats_with_korean_names("test@example.com")
+        assert len(active) == 1500
+
+    @pytest.mark.asyncio
+    async def test_save_korean_names_batch_single_transaction(self, db_manager):
+        """한글 이름 배치 저장 테스트"""
+        chats = [self._make_chat(1, "Hangro"), self._make_chat(2, "Test User")]
+        await db_manager.sync_chats_to_db("test@example.com", chats)
+
+        result = await db_manager.save_korean_names_batch(
+            "test@example.com",
+            [
+                {"topic_en": "Hangro", "topic_kr": "한그로"},
+                {"topic_en": "Test User", "topic_kr": "테스트"},
+                {"topic_en": "Nobody", "topic_kr": "없음"},
+                {"topic_en": "", "topic_kr": "빈값"},
+            ],
+        )
+
+        assert result["saved"] == 2
+        assert result["failed"] == 2
+        assert [r["success"] for r in result["results"]] == [True, True, False, False]
+        assert await db_manager.find_chat_by_name("test@example.com", "한그로") == "c1"
+
+    @pytest.mark.asyncio
+    async def test_find_chat_candidates_ranked(self, db_manager):
+        """이름 인덱스 기반 후보 검색 (완전 > prefix > 부분 일치, 한글 정규화)"""
+        chats = [
+            self._make_chat(1, "홍 길동"),
+            self._make_chat(2, "John Doe"),
+            self._make_chat(3, "John"),
+            self._make_chat(4, "Johnny Kim"),
+        ]
+        await db_manager.sync_chats_to_db("test@example.com", chats)
+
+        candidates = await db_manager.find_chat_candidates("test@example.com", "john")
+        assert [c["chat_id"] for c in candidates] == ["c3", "c4", "c2"]
+        assert candidates[0]["score"] > candidates[-1]["score"]
+
+        assert await db_manager.find_chat_by_name("test@example.com", "홍길동님") == "c1"
+        assert await db_manager.find_chat_by_name("test@example.com", "길동") == "c1"
+        assert await db_manager.find_chat_by_name("test@example.com", "nobody") is None
+
+        # 인메모리 인덱스가 없어도 FTS로 조회
+        db_manager._name_indexes.clear()
+        cursor = sqlite3.connect(db_manager.db_path).cursor()
+        fts = db_manager._search_name_fts(cursor, "test@example.com", "ohn d", 5)
+        assert [c["chat_id"] for c in fts] == ["c2"]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
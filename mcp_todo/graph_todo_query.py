@@ -13,6 +13,8 @@ import aiohttp
 from typing import Dict, Any, List, Optional, TYPE_CHECKING, Union
 from urllib.parse import quote
 
+from core.metrics import graph_trace_configs, track_auth
+
 if TYPE_CHECKING:
     from core.protocols import TokenProviderProtocol
 
@@ -88,7 +90,8 @@ class GraphTodoQuery:
 
     async def _get_access_token(self, user_email: str) -> Optional[str]:
         try:
-            return await self.token_provider.validate_and_refresh_token(user_email)
+            with track_auth():
+                return await self.token_provider.validate_and_refresh_token(user_email)
         except Exception as e:
             print(f"Token retrieval error for {user_email}: {e}")
             return None
@@ -104,7 +107,7 @@ class GraphTodoQuery:
 
     async def _fetch(self, access_token: str, url: str) -> Dict[str, Any]:
         try:
-            async with aiohttp.ClientSession() as session:
+            async with aiohttp.ClientSession(trace_configs=graph_trace_configs()) as session:
                 headers = {
                     "Authorization": f"Bearer {access_token}",
                     "Content-Type": "application/json",
@@ -127,7 +130,7 @@ class GraphTodoQuery:
 
     async def _post(self, access_token: str, url: str, body: Dict[str, Any]) -> Dict[str, Any]:
         try:
-            async with aiohttp.ClientSession() as session:
+            async with aiohttp.ClientSession(trace_configs=graph_trace_configs()) as session:
                 headers = {
                     "Authorization": f"Bearer {access_token}",
                     "Content-Type": "application/json",
@@ -155,7 +158,7 @@ class GraphTodoQuery:
 
     async def _patch(self, access_token: str, url: str, body: Dict[str, Any]) -> Dict[str, Any]:
         try:
-            async with aiohttp.ClientSession() as session:
+            async with aiohttp.ClientSession(trace_configs=graph_trace_configs()) as session:
                 headers = {
                     "Authorization": f"Bearer {access_token}",
                     "Content-Type": "application/json",
@@ -183,7 +186,7 @@ class GraphTodoQuery:
 
     async def _delete(self, access_token: str, url: str) -> Dict[str, Any]:
         try:
-            async with aiohttp.ClientSession() as session:
+            async with aiohttp.ClientSession(trace_configs=graph_trace_configs()) as session:
                 headers = {
                     "Authorization": f"Bearer {access_token}",
                     "Content-Type": "application/json",
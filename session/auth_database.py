@@ -5,12 +5,18 @@ Azure AD 인증 관련 데이터(앱, 사용자, 토큰)의 CRUD 작업을 담
 
 import sqlite3
 import os
+import time
 from datetime import datetime, timezone
 from typing import Optional, Dict, Any, List
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 멀티 워커(server_stream 멀티 프로세스 모드)에서 여러 프로세스가 같은 auth.db를 공유하므로
+# WAL 모드(읽기와 쓰기가 서로 막지 않음) + busy timeout(쓰기 잠금 대기)을 사용한다.
+BUSY_TIMEOUT_SECONDS = 10.0
+REFRESH_LEASE_SECONDS = 30.0
+
 
 class AuthDatabase:
     """인증 데이터베이스 - Azure AD 앱, 사용자, 토큰 정보 저장"""
@@ -39,9 +45,13 @@ class AuthDatabase:
         self.ensure_tables()
         self.ensure_default_app()
 
+    def _connect(self) -> sqlite3.Connection:
+        """DB 연결 (busy timeout 적용, 프로세스 간 공유용)"""
+        return sqlite3.connect(self.db_path, timeout=BUSY_TIMEOUT_SECONDS)
+
     def ensure_tables(self):
         """필요한 테이블 생성 (azure_* 테이블 사용)"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
 
@@ -109,6 +119,19 @@ class AuthDatabase:
                 conn.commit()
                 logger.info("Database tables created directly")
 
+            # WAL 모드는 DB 파일에 기록되므로 한 번만 설정하면 모든 연결에 적용됨
+            cursor.execute("PRAGMA journal_mode=WAL")
+
+            # 토큰 갱신 lease (여러 프로세스가 같은 refresh_token을 동시에 쓰지 않도록)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS azure_token_refresh_lease (
+                    user_email TEXT PRIMARY KEY,
+                    owner TEXT NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+            """)
+            conn.commit()
+
         except Exception as e:
             logger.error(f"[ERROR] Failed to create tables: {e}")
             raise
@@ -120,7 +143,7 @@ class AuthDatabase:
         if not self.default_client_id:
             return
 
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
 
@@ -164,7 +187,7 @@ class AuthDatabase:
         Returns:
             성공 여부
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
 
@@ -221,7 +244,7 @@ class AuthDatabase:
         Returns:
             성공 여부
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
 
@@ -295,7 +318,7 @@ class AuthDatabase:
         Returns:
             토큰 정보 또는 None
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         try:
             cursor = conn.cursor()
@@ -342,6 +365,58 @@ class AuthDatabase:
         """
         return self.save_token(email, token_info)
 
+    def acquire_refresh_lease(self, email: str, owner: str, ttl: float = REFRESH_LEASE_SECONDS) -> bool:
+        """
+        토큰 갱신 lease 획득 (프로세스 간 refresh 직렬화)
+
+        만료된 lease는 다른 owner가 가져갈 수 있으므로 갱신 중 프로세스가 죽어도 막히지 않는다.
+
+        Args:
+            email: 사용자 이메일
+            owner: lease 소유자 식별자 (예: "pid:12345")
+            ttl: lease 유효 시간(초)
+
+        Returns:
+            획득(또는 이미 보유) 여부
+        """
+        conn = self._connect()
+        try:
+            now = time.time()
+            cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.execute("""
+                DELETE FROM azure_token_refresh_lease
+                WHERE user_email = ? AND (expires_at < ? OR owner = ?)
+            """, (email, now, owner))
+            cursor.execute("""
+                INSERT OR IGNORE INTO azure_token_refresh_lease (user_email, owner, expires_at)
+                VALUES (?, ?, ?)
+            """, (email, owner, now + ttl))
+            acquired = cursor.rowcount == 1
+            conn.commit()
+            return acquired
+
+        except Exception as e:
+            logger.error(f"[ERROR] Failed to acquire refresh lease: {e}")
+            conn.rollback()
+            return False
+        finally:
+            conn.close()
+
+    def release_refresh_lease(self, email: str, owner: str) -> None:
+        """토큰 갱신 lease 해제 (owner가 보유한 경우에만)"""
+        conn = self._connect()
+        try:
+            conn.execute(
+                "DELETE FROM azure_token_refresh_lease WHERE user_email = ? AND owner = ?",
+                (email, owner)
+            )
+            conn.commit()
+        except Exception as e:
+            logger.error(f"[ERROR] Failed to release refresh lease: {e}")
+        finally:
+            conn.close()
+
     def delete_token(self, email: str) -> bool:
         """
         토큰 삭제 (로그아웃)
@@ -352,7 +427,7 @@ class AuthDatabase:
         Returns:
             성공 여부
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
 
@@ -385,7 +460,7 @@ class AuthDatabase:
         Returns:
             사용자 정보 또는 None
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         try:
             cursor = conn.cursor()
@@ -410,7 +485,7 @@ class AuthDatabase:
         Returns:
             사용자 리스트
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         try:
             cursor = conn.cursor()
@@ -455,7 +530,7 @@ class AuthDatabase:
         Returns:
             정리된 토큰 수
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
             # ISO format with timezone을 처리하기 위해 Python에서 비교
@@ -489,7 +564,7 @@ class AuthDatabase:
         Returns:
             성공 여부
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         try:
             cursor = conn.cursor()
 
@@ -6,6 +6,7 @@ Authentication Manager
 import os
 import logging
 import asyncio
+import time
 import webbrowser
 from typing import Optional, Dict, Any, List
 from datetime import datetime, timezone
@@ -17,11 +18,15 @@ _env_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file_
 load_dotenv(_env_path, encoding="utf-8-sig")
 
 from .auth_service import AuthService
-from .auth_database import AuthDatabase
+from .auth_database import AuthDatabase, REFRESH_LEASE_SECONDS
 from .azure_config import AzureConfig
+from core.tracing import traced
 
 logger = logging.getLogger(__name__)
 
+# 다른 프로세스가 토큰 갱신 lease를 보유 중일 때 DB 재조회 간격
+REFRESH_LEASE_POLL_SECONDS = 0.2
+
 
 def get_default_user_email() -> Optional[str]:
     """
@@ -122,6 +127,7 @@ class AuthManager:
             'is_expired': self.auth_service.is_token_expired(token_info['expires_at'])
         }
 
+    @traced()
     async def refresh_token(self, email: Optional[str] = None) -> Dict[str, Any]:
         """
         특정 사용자의 토큰 갱신
@@ -201,6 +207,7 @@ class AuthManager:
                 'error': str(e)
             }
 
+    @traced()
     async def validate_and_refresh_token(self, email: Optional[str] = None, auto_reauth: bool = False) -> Optional[str]:
         """
         토큰 유효성 확인 및 필요시 자동 갱신
@@ -209,6 +216,9 @@ class AuthManager:
         동일 user_email에 대한 동시 호출은 per-email lock으로 직렬화하여
         같은 refresh_token을 두 번 사용해 invalid_grant가 나는 race를 방지한다.
         lock 획득 후 DB를 재조회해, 다른 코루틴이 이미 갱신한 토큰이 유효하면 그대로 사용한다.
+        여러 프로세스(멀티 워커 stream 서버)가 auth.db를 공유하는 경우 DB의 refresh lease로
+        프로세스 간에도 한 곳에서만 갱신하고, 나머지는 갱신된 토큰을 DB에서 읽는다.
+        lease 없이 갱신하지 않으며, 대기 시간 안에 lease도 새 토큰도 얻지 못하면 None을 반환한다.
 
         Args:
             email: 사용자 이메일. None이면 auth.db에서 첫 번째 사용자를 자동으로 가져옴
@@ -238,9 +248,32 @@ class AuthManager:
             if not self.auth_service.is_token_expired(token_info['expires_at']):
                 return token_info['access_token']
 
-            # 토큰 갱신 시도
-            logger.info(f"Token expired for {email}, attempting refresh")
-            refresh_result = await self.refresh_token(email)
+            # 다른 프로세스(멀티 워커)가 갱신 중이면 끝날 때까지 기다렸다가 DB의 새 토큰 사용
+            # lease/토큰 조회는 busy timeout 동안 블로킹될 수 있으므로 스레드에서 실행
+            # 갱신은 lease를 보유한 경우에만 한다 (보유자가 죽었으면 lease TTL 만료 후 인계됨)
+            owner = f"pid:{os.getpid()}"
+            deadline = time.monotonic() + REFRESH_LEASE_SECONDS + REFRESH_LEASE_POLL_SECONDS
+            while not await asyncio.to_thread(self.auth_db.acquire_refresh_lease, email, owner):
+                await asyncio.sleep(REFRESH_LEASE_POLL_SECONDS)
+                token_info = await asyncio.to_thread(self.auth_db.get_token, email)
+                if token_info and not self.auth_service.is_token_expired(token_info['expires_at']):
+                    return token_info['access_token']
+                if time.monotonic() > deadline:
+                    logger.error(f"Token refresh lease for {email} not acquired within "
+                                 f"{REFRESH_LEASE_SECONDS}s, skipping refresh")
+                    return None
+
+            try:
+                # lease 획득 직전에 다른 프로세스가 갱신을 끝내고 lease를 풀었을 수 있음
+                token_info = await asyncio.to_thread(self.auth_db.get_token, email)
+                if token_info and not self.auth_service.is_token_expired(token_info['expires_at']):
+                    return token_info['access_token']
+
+                # 토큰 갱신 시도
+                logger.info(f"Token expired for {email}, attempting refresh")
+                refresh_result = await self.refresh_token(email)
+            finally:
+                await asyncio.to_thread(self.auth_db.release_refresh_lease, email, owner)
 
             if refresh_result['status'] == 'success':
                 return refresh_result['access_token']